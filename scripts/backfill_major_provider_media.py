@@ -28,9 +28,14 @@ from typing import Any, Literal, cast
 from redis.asyncio import Redis
 
 from src.adapters.config import load_env
+from src.adapters.document_patch import queue_document_patch
 from src.adapters.media_manager_client import MediaManagerClient
 from src.ai.microgenre_batch import build_microgenre_input_from_document
-from src.ai.microgenre_document import microgenre_result_to_redis, valid_microgenres_value
+from src.ai.microgenre_document import (
+    attach_microgenre_vector,
+    microgenre_result_to_redis,
+    valid_microgenres_value,
+)
 from src.ai.prompts.microgenre_classifier import score_microgenres
 from src.api.tmdb.core import TMDBService
 from src.api.tmdb.models import MCMovieItem, MCTvItem
@@ -42,6 +47,9 @@ from src.etl.rt_enrichment import enrich_from_algolia, enrich_from_local
 from src.utils.genre_mapping import get_genre_mapping_with_fallback
 from src.utils.get_logger import get_logger
 
+# Unprefixed: the API clients register their sessions in utils.http_session
+from utils.http_session import run_with_http_sessions
+
 logger = get_logger(__name__)
 
 BATCH_SIZE = 15
@@ -344,6 +352,8 @@ async def _flush_batch(
             for (_key, redis_doc), existing in zip(prepared, existing_docs, strict=True)
         ]
     )
+    for _key, redis_doc in prepared:
+        attach_microgenre_vector(redis_doc)
 
     # 4. Timestamp resolution + pipeline write
     write_pipe = redis.pipeline()
@@ -353,7 +363,7 @@ async def _flush_batch(
         redis_doc["created_at"] = ca
         redis_doc["modified_at"] = ma
         redis_doc["_source"] = src
-        write_pipe.json().set(key, "$", redis_doc)
+        queue_document_patch(write_pipe, key, existing_dict, redis_doc)
     await write_pipe.execute()
 
     if mm_client is not None:
@@ -640,7 +650,7 @@ def main() -> None:
     if not data_root.exists():
         raise FileNotFoundError(f"Data root not found: {data_root}")
 
-    asyncio.run(
+    run_with_http_sessions(
         run_backfill(
             data_root=data_root,
             redis_host=args.redis_host,
@@ -9,7 +9,10 @@ strings:
 - ``first_air_yyyymmdd`` from ``first_air_date``
 - ``last_air_yyyymmdd`` from ``last_air_date``
 
-By default this is a dry run. Pass ``--apply`` to write changes.
+By default this is a dry run. Pass ``--apply`` to write changes.  Scanning,
+batching, throttling and ``--checkpoint``/``--resume`` come from
+``adapters.scan_backfill``; a date that no longer parses removes its derived
+field.
 """
 
 from __future__ import annotations
@@ -18,7 +21,6 @@ import argparse
 import asyncio
 import os
 import sys
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -32,6 +34,14 @@ load_env()
 
 from redis.asyncio import Redis  # noqa: E402
 
+from adapters.scan_backfill import (  # noqa: E402
+    BackfillConfig,
+    BackfillStats,
+    Transform,
+    add_backfill_arguments,
+    backfill_config_from_args,
+    run_backfill,
+)
 from core.normalize import date_string_to_yyyymmdd  # noqa: E402
 from utils.get_logger import get_logger  # noqa: E402
 
@@ -44,17 +54,6 @@ DATE_FIELD_MAP: tuple[tuple[str, str], ...] = (
 )
 
 
-@dataclass
-class BackfillStats:
-    scanned: int = 0
-    candidates: int = 0
-    would_update: int = 0
-    updated: int = 0
-    fields_set: int = 0
-    fields_cleared: int = 0
-    skipped_type: int = 0
-
-
 def _connect_redis() -> Redis:  # type: ignore[type-arg]
     return Redis(
         host=os.getenv("REDIS_HOST", "localhost"),
@@ -77,117 +76,35 @@ def _changed_fields(doc: dict[str, Any]) -> dict[str, int | None]:
     return changes
 
 
-async def backfill(
-    scan_count: int,
-    limit: int | None,
-    apply: bool,
-    mc_type_filter: str | None,
-) -> BackfillStats:
-    stats = BackfillStats()
-    redis = _connect_redis()
+def date_sort_transform(mc_type_filter: str | None) -> Transform:
+    """Build the transform that refreshes derived date fields on one document."""
 
+    def transform(key: str, doc: dict[str, Any]) -> dict[str, Any] | None:
+        if mc_type_filter and doc.get("mc_type") != mc_type_filter:
+            return None
+        changes = _changed_fields(doc)
+        if not changes:
+            return None
+        doc.update(changes)
+        return doc
+
+    return transform
+
+
+async def backfill(config: BackfillConfig, mc_type_filter: str | None) -> BackfillStats:
+    redis = _connect_redis()
     try:
         await redis.ping()  # type: ignore[misc]
-        logger.info(
-            "Media date-sort backfill start: scan_count=%d limit=%s apply=%s mc_type=%s",
-            scan_count,
-            limit,
-            apply,
-            mc_type_filter,
-        )
-
-        cursor = 0
-        processed_candidates = 0
-        while True:
-            cursor, keys = await redis.scan(cursor=cursor, match="media:*", count=scan_count)
-            if not keys:
-                if cursor == 0:
-                    break
-                continue
-
-            stats.scanned += len(keys)
-            pipe = redis.pipeline()
-            for key in keys:
-                pipe.json().get(key)
-            docs_raw: list[object] = await pipe.execute()
-
-            write_pipe = redis.pipeline()
-            writes_in_batch = 0
-            for key, raw_doc in zip(keys, docs_raw, strict=True):
-                if not isinstance(raw_doc, dict):
-                    continue
-
-                mc_type = raw_doc.get("mc_type")
-                if mc_type_filter and mc_type != mc_type_filter:
-                    stats.skipped_type += 1
-                    continue
-
-                changes = _changed_fields(raw_doc)
-                if not changes:
-                    continue
-
-                if limit is not None and processed_candidates >= limit:
-                    break
-
-                stats.candidates += 1
-                processed_candidates += 1
-                if apply:
-                    for field_name, value in changes.items():
-                        write_pipe.json().set(str(key), f"$.{field_name}", value)
-                        if value is None:
-                            stats.fields_cleared += 1
-                        else:
-                            stats.fields_set += 1
-                    writes_in_batch += 1
-                else:
-                    stats.would_update += 1
-
-            if apply and writes_in_batch:
-                await write_pipe.execute()
-                stats.updated += writes_in_batch
-
-            if limit is not None and processed_candidates >= limit:
-                break
-            if cursor == 0:
-                break
-
-        logger.info(
-            "Media date-sort backfill complete: scanned=%d candidates=%d updated=%d would_update=%d",
-            stats.scanned,
-            stats.candidates,
-            stats.updated,
-            stats.would_update,
-        )
-        return stats
+        logger.info("Media date-sort backfill start: mc_type=%s", mc_type_filter)
+        return await run_backfill(redis, date_sort_transform(mc_type_filter), config)
     finally:
         await redis.aclose()
 
 
-def _print_stats(stats: BackfillStats, apply: bool) -> None:
-    mode = "APPLY" if apply else "DRY RUN"
-    print(f"\nMedia Date Sort Field Backfill ({mode})")
-    print("=" * 48)
-    print(f"  scanned:        {stats.scanned:,}")
-    print(f"  candidates:     {stats.candidates:,}")
-    print(f"  would_update:   {stats.would_update:,}")
-    print(f"  updated:        {stats.updated:,}")
-    print(f"  fields_set:     {stats.fields_set:,}")
-    print(f"  fields_cleared: {stats.fields_cleared:,}")
-    print(f"  skipped_type:   {stats.skipped_type:,}")
-    print()
-
-
 async def main() -> None:
     parser = argparse.ArgumentParser(
         description="Backfill derived numeric date fields on Redis media documents"
     )
-    parser.add_argument(
-        "--scan-count",
-        type=int,
-        default=500,
-        help="Redis SCAN page size (default: 500)",
-    )
-    parser.add_argument("--limit", type=int, default=None, help="Max changed docs to process")
     parser.add_argument(
         "--mc-type",
         choices=["movie", "tv"],
@@ -199,15 +116,13 @@ async def main() -> None:
         action="store_true",
         help="Write derived fields. Omit for dry-run mode.",
     )
+    add_backfill_arguments(parser, dry_run_flag=False)
     args = parser.parse_args()
 
-    stats = await backfill(
-        scan_count=args.scan_count,
-        limit=args.limit,
-        apply=args.apply,
-        mc_type_filter=args.mc_type,
-    )
-    _print_stats(stats, apply=args.apply)
+    config = backfill_config_from_args(args, "media:*")
+    config.dry_run = not args.apply
+    stats = await backfill(config, mc_type_filter=args.mc_type)
+    stats.log_summary("Media Date Sort Field Backfill", config.dry_run)
 
 
 if __name__ == "__main__":
@@ -39,6 +39,8 @@ sys.path.insert(0, str(_project_root / "src"))
 sys.path.insert(0, str(_project_root))
 
 from adapters.config import load_env  # noqa: E402
+from adapters.document_patch import queue_document_patch  # noqa: E402
+from utils.http_session import run_with_http_sessions  # noqa: E402
 
 load_env()
 
@@ -337,7 +339,9 @@ async def backfill(
                                 redis_doc["created_at"] = ca
                                 redis_doc["modified_at"] = ma
                                 redis_doc["_source"] = src
-                                write_pipe.json().set(pkey, "$", redis_doc)
+                                queue_document_patch(
+                                    write_pipe, pkey, existing_dict, redis_doc
+                                )
                             await write_pipe.execute()
                             stats["written"] += len(prepared)
 
@@ -470,4 +474,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
@@ -0,0 +1,168 @@
+"""
+Backfill ``microgenre_vector`` on existing ``media:*`` Redis JSON documents.
+
+``microgenre_vector`` is the document's sparse ``microgenres.microgenre_scores``
+projected onto the taxonomy leaf order (``LEAF_IDS``) and L2-normalized.
+It backs the HNSW ``microgenre_vector`` field of ``idx:media`` that
+``/api/similar`` queries.  New and re-classified documents get it from the
+nightly ETL; this script covers documents written before the field existed,
+and re-projects every vector after a taxonomy change.
+
+A taxonomy change that adds or removes leaves changes the vector dimension.
+RediSearch cannot alter a vector field's DIM, so ``idx:media`` has to be
+rebuilt with the new schema before re-running this backfill.
+
+Optionally issues ``FT.ALTER`` to add the VECTOR field to the live
+``idx:media`` index before the data backfill.
+
+Usage:
+    # Dry run (no changes)
+    python scripts/backfill_microgenre_vectors.py --dry-run
+
+    # Alter index schema then backfill
+    python scripts/backfill_microgenre_vectors.py --alter-index
+
+    # Backfill only (index already altered)
+    python scripts/backfill_microgenre_vectors.py
+
+    # More workers, resumable after a crash
+    python scripts/backfill_microgenre_vectors.py --workers 8 --checkpoint /tmp/mg_vec.ckpt --resume
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from collections.abc import Awaitable
+from typing import Any, cast
+
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from adapters.scan_backfill import (
+    BackfillConfig,
+    add_backfill_arguments,
+    backfill_config_from_args,
+    run_backfill,
+)
+from ai.microgenre_document import MICROGENRE_VECTOR_DIM, microgenre_vector_for
+from utils.get_logger import get_logger
+
+env_file = os.getenv("ENV_FILE", "config/local.env")
+load_dotenv(env_file)
+
+logger = get_logger(__name__)
+
+
+async def alter_index(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Add the ``microgenre_vector`` HNSW field to the live ``idx:media`` index."""
+    try:
+        await redis.execute_command(
+            "FT.ALTER", "idx:media", "SCHEMA", "ADD",
+            "$.microgenre_vector", "AS", "microgenre_vector", "VECTOR", "HNSW", 6,
+            "TYPE", "FLOAT32", "DIM", MICROGENRE_VECTOR_DIM, "DISTANCE_METRIC", "COSINE",
+        )
+        logger.info(
+            f"FT.ALTER idx:media — added microgenre_vector VECTOR HNSW (DIM {MICROGENRE_VECTOR_DIM})"
+        )
+    except Exception as e:
+        msg = str(e)
+        if "Duplicate" in msg or "already exists" in msg.lower():
+            logger.info("microgenre_vector already present in idx:media schema — skipping ALTER")
+        else:
+            raise
+
+
+def microgenre_vector_transform(key: str, doc: dict[str, Any]) -> dict[str, Any] | None:
+    """Set (or drop) ``microgenre_vector`` from ``microgenres`` when stale."""
+    vector = microgenre_vector_for(doc.get("microgenres"))
+    if doc.get("microgenre_vector") == vector:
+        return None
+    if vector is None:
+        doc.pop("microgenre_vector", None)
+    else:
+        doc["microgenre_vector"] = vector
+    return doc
+
+
+async def run(
+    config: BackfillConfig,
+    redis_host: str = "localhost",
+    redis_port: int = 6380,
+    redis_password: str | None = None,
+    do_alter_index: bool = False,
+) -> None:
+    """Main entry point."""
+    redis = Redis(
+        host=redis_host,
+        port=redis_port,
+        password=redis_password,
+        decode_responses=True,
+    )
+
+    try:
+        ping_result = await cast(Awaitable[bool], redis.ping())
+        if not ping_result:
+            raise ConnectionError("Redis ping failed")
+        logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
+    except Exception as e:
+        logger.error(f"Failed to connect to Redis: {e}")
+        return
+
+    try:
+        if do_alter_index and not config.dry_run:
+            await alter_index(redis)
+
+        stats = await run_backfill(redis, microgenre_vector_transform, config)
+        stats.log_summary("microgenre_vector Backfill", config.dry_run)
+
+    finally:
+        await redis.aclose()
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Backfill microgenre_vector on media:* documents"
+    )
+    parser.add_argument(
+        "--redis-host",
+        default=os.getenv("REDIS_HOST", "localhost"),
+        help="Redis host (default: localhost)",
+    )
+    parser.add_argument(
+        "--redis-port",
+        type=int,
+        default=int(os.getenv("REDIS_PORT", "6380")),
+        help="Redis port (default: 6380)",
+    )
+    parser.add_argument(
+        "--redis-password",
+        default=os.getenv("REDIS_PASSWORD") or None,
+        help="Redis password",
+    )
+    parser.add_argument(
+        "--alter-index",
+        action="store_true",
+        help="Issue FT.ALTER to add microgenre_vector to idx:media before backfill",
+    )
+    add_backfill_arguments(parser)
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(
+            backfill_config_from_args(args, "media:*"),
+            redis_host=args.redis_host,
+            redis_port=args.redis_port,
+            redis_password=args.redis_password,
+            do_alter_index=args.alter_index,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,10 @@ load_env()
 from redis.asyncio import Redis  # noqa: E402
 
 from ai.microgenre_batch_models import MicroGenreBatchSidecarRecord  # noqa: E402
-from ai.microgenre_document import microgenre_sidecar_to_redis  # noqa: E402
+from ai.microgenre_document import (  # noqa: E402
+    microgenre_sidecar_to_redis,
+    microgenre_vector_for,
+)
 from utils.get_logger import get_logger  # noqa: E402
 
 logger = get_logger(__name__)
@@ -153,6 +156,11 @@ async def backfill_rows(
                 continue
 
             pipe.json().set(key, "$.microgenres", microgenres)
+            vector = microgenre_vector_for(microgenres)
+            if vector is not None:
+                pipe.json().set(key, "$.microgenre_vector", vector)
+            else:
+                pipe.json().delete(key, "$.microgenre_vector")
             pipe.json().set(key, "$.modified_at", now_ts)
             write_count += 1
 
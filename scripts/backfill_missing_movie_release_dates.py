@@ -29,6 +29,8 @@ sys.path.insert(0, str(_project_root / "src"))
 sys.path.insert(0, str(_project_root))
 
 from adapters.config import load_env  # noqa: E402
+from adapters.document_patch import queue_document_patch  # noqa: E402
+from utils.http_session import run_with_http_sessions  # noqa: E402
 
 load_env()
 
@@ -299,7 +301,7 @@ async def backfill(
                 redis_doc["created_at"] = created_at
                 redis_doc["modified_at"] = modified_at
                 redis_doc["_source"] = source_tag
-                write_pipe.json().set(key, "$", redis_doc)
+                queue_document_patch(write_pipe, key, existing_dict, redis_doc)
             await write_pipe.execute()
             stats["updated"] += len(prepared)
             if (
@@ -440,4 +442,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
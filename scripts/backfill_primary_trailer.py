@@ -30,6 +30,7 @@ sys.path.insert(0, str(_project_root / "src"))
 sys.path.insert(0, str(_project_root))
 
 from adapters.config import load_env  # noqa: E402
+from utils.http_session import run_with_http_sessions  # noqa: E402
 
 load_env()
 
@@ -415,4 +416,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
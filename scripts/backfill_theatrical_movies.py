@@ -30,6 +30,9 @@ from src.etl.documentary_filter import is_documentary, is_eligible_documentary
 from src.utils.genre_mapping import get_genre_mapping_with_fallback
 from src.utils.get_logger import get_logger
 
+# Unprefixed: the API clients register their sessions in utils.http_session
+from utils.http_session import run_with_http_sessions
+
 logger = get_logger(__name__)
 BATCH_SIZE = 15
 DOCUMENTARY_LOOKBACK_YEARS = 10
@@ -361,7 +364,7 @@ def main() -> None:
     except ValueError as e:
         parser.error(str(e))
 
-    asyncio.run(
+    run_with_http_sessions(
         run_backfill(
             start_date=args.start_date,
             months=args.months,
@@ -0,0 +1,588 @@
+"""
+Benchmark and load-test harness for the search service.
+
+Seeds a local Redis Stack with the TMDB sample documents (optionally scaled
+up with synthetic titles), replays a query mix against the in-process
+service functions behind the HTTP endpoints, and reports latency percentiles,
+throughput and per-source ``timed_task`` timings.  Results can be saved as a
+JSON baseline and compared against on later runs.
+
+Endpoints exercised (indexed sources only; brokered APIs are never called):
+    search                 search(q, sources=tv,movie,person,podcast,author,book)
+    autocomplete           autocomplete(q) on keystroke prefixes
+    autocomplete_minimal   autocomplete_minimal(q, tv+movie, default fields)
+    resolve                resolve(q, tv+movie)
+    details_batch          get_details_batch(10 mc_ids harvested from a warm-up search)
+
+Usage:
+    # Build indexes, then seed the sample data plus 1M synthetic media docs
+    python scripts/build_redis_index.py
+    python scripts/bench_search.py seed --scale 1000000
+
+    # Replay 5000 requests with 16 concurrent clients and save a baseline
+    python scripts/bench_search.py run --requests 5000 --concurrency 16 --out bench_baseline.json
+
+    # Later: compare against the baseline (exit code 1 on regression)
+    python scripts/bench_search.py run --requests 5000 --baseline bench_baseline.json
+
+    # Custom query log (JSONL with "q", or "title"/"name", and optional "endpoint")
+    python scripts/bench_search.py run --queries queries.jsonl
+
+    # Remove the synthetic documents again
+    python scripts/bench_search.py seed --scale 1000000 --clear
+
+The autocomplete response cache is part of what is measured; set
+AUTOCOMPLETE_CACHE_MAX_ENTRIES=0 to benchmark the uncached path.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+env_file = os.getenv("ENV_FILE", "config/local.env")
+load_dotenv(env_file)
+
+from adapters.index_generation import queue_index_generation_bump  # noqa: E402
+from adapters.redis_client import get_redis  # noqa: E402
+from core.normalize import (  # noqa: E402
+    compact_title,
+    document_to_redis,
+    normalize_document,
+    normalize_search_title,
+)
+from services import search_service  # noqa: E402
+from utils.get_logger import get_logger  # noqa: E402
+
+logger = get_logger(__name__)
+
+SEED_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "tmdb_seed.json")
+INDEXED_SOURCES = {"tv", "movie", "person", "podcast", "author", "book"}
+MEDIA_SOURCES = {"tv", "movie"}
+
+# Synthetic docs use source ids far above real TMDB ids, so they never collide
+# and can be deleted by recomputing their keys.
+SYNTHETIC_ID_BASE = 900_000_000
+WRITE_BATCH = 1_000
+DETAILS_BATCH_SIZE = 10
+
+DEFAULT_MIX = {
+    "autocomplete": 50,
+    "autocomplete_minimal": 20,
+    "search": 15,
+    "resolve": 10,
+    "details_batch": 5,
+}
+
+# Regressions smaller than this are treated as noise regardless of tolerance.
+MIN_REGRESSION_MS = 1.0
+
+_TITLE_WORDS = [
+    "office",
+    "night",
+    "star",
+    "war",
+    "house",
+    "dark",
+    "river",
+    "city",
+    "last",
+    "king",
+    "blue",
+    "love",
+    "dead",
+    "game",
+    "lost",
+    "secret",
+    "road",
+    "light",
+    "shadow",
+    "island",
+    "summer",
+    "winter",
+    "fire",
+    "iron",
+    "ghost",
+    "ocean",
+    "empire",
+    "family",
+    "code",
+    "hunter",
+    "wild",
+    "silent",
+    "broken",
+    "golden",
+    "black",
+    "first",
+    "little",
+    "world",
+    "girl",
+    "boy",
+    "man",
+    "woman",
+    "story",
+    "heart",
+    "time",
+    "moon",
+    "sun",
+    "sky",
+    "storm",
+]
+
+
+# ---------------------------------------------------------------------------
+# Seeding
+# ---------------------------------------------------------------------------
+
+
+def load_seed_documents() -> list[dict[str, Any]]:
+    """Normalize the TMDB sample file into Redis media documents."""
+    with open(SEED_PATH) as f:
+        items = json.load(f).get("tmdb", [])
+    docs = []
+    for item in items:
+        search_doc = normalize_document(item)
+        if search_doc is not None:
+            docs.append(document_to_redis(search_doc))
+    return docs
+
+
+def synthetic_title(rng: random.Random) -> str:
+    return " ".join(rng.choice(_TITLE_WORDS) for _ in range(rng.randint(1, 4))).title()
+
+
+def synthetic_documents(
+    templates: list[dict[str, Any]], count: int, seed: int
+) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` media docs cloned from ``templates`` with new titles and ids.
+
+    Deterministic for a given ``seed``, so ``run`` can regenerate the same
+    titles for its query mix without reading them back from Redis.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        template = templates[i % len(templates)]
+        title = synthetic_title(rng)
+        mc_type = template["mc_type"]
+        mc_id = f"tmdb_{mc_type}_{SYNTHETIC_ID_BASE + i}"
+        yield {
+            **template,
+            "id": mc_id,
+            "mc_id": mc_id,
+            "source_id": str(SYNTHETIC_ID_BASE + i),
+            "title": title,
+            "search_title": normalize_search_title(title),
+            "title_compact": compact_title(title),
+            "year": rng.randint(1950, 2025),
+            "popularity": round(rng.paretovariate(1.5), 3),
+        }
+
+
+def synthetic_keys(templates: list[dict[str, Any]], count: int) -> Iterator[str]:
+    for i in range(count):
+        mc_type = templates[i % len(templates)]["mc_type"]
+        yield f"media:tmdb_{mc_type}_{SYNTHETIC_ID_BASE + i}"
+
+
+async def seed(scale: int, clear: bool, rng_seed: int) -> None:
+    redis = get_redis()
+    templates = load_seed_documents()
+    if not templates:
+        raise SystemExit(f"No documents could be normalized from {SEED_PATH}")
+
+    if clear:
+        deleted = 0
+        batch: list[str] = []
+        for key in synthetic_keys(templates, scale):
+            batch.append(key)
+            if len(batch) >= WRITE_BATCH:
+                deleted += await redis.delete(*batch)
+                batch = []
+        if batch:
+            deleted += await redis.delete(*batch)
+        logger.info(f"Deleted {deleted:,} synthetic media documents")
+        return
+
+    start = time.perf_counter()
+    pipe = redis.pipeline(transaction=False)
+    for doc in templates:
+        pipe.json().set(f"media:{doc['mc_id']}", "$", doc)
+    queue_index_generation_bump(pipe)
+    await pipe.execute()
+    logger.info(f"Seeded {len(templates)} sample documents from {SEED_PATH}")
+
+    written = 0
+    pipe = redis.pipeline(transaction=False)
+    for doc in synthetic_documents(templates, scale, rng_seed):
+        pipe.json().set(f"media:{doc['mc_id']}", "$", doc)
+        written += 1
+        if written % WRITE_BATCH == 0:
+            queue_index_generation_bump(pipe)
+            await pipe.execute()
+            pipe = redis.pipeline(transaction=False)
+            if written % (WRITE_BATCH * 50) == 0:
+                logger.info(f"Seeded {written:,}/{scale:,} synthetic documents")
+    if written % WRITE_BATCH:
+        queue_index_generation_bump(pipe)
+        await pipe.execute()
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Seeding complete: {written:,} synthetic documents in {elapsed:.1f}s")
+
+
+# ---------------------------------------------------------------------------
+# Query mix
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BenchRequest:
+    endpoint: str
+    q: str
+
+
+def parse_mix(spec: str | None) -> dict[str, int]:
+    if not spec:
+        return dict(DEFAULT_MIX)
+    mix: dict[str, int] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown endpoint in --mix: {name}. Valid: {', '.join(DEFAULT_MIX)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def load_query_titles(path: str | None, scale: int, rng_seed: int) -> list[str]:
+    """Titles to derive queries from: a JSONL/text file, or the seeded corpus."""
+    if path:
+        titles = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("{"):
+                    row = json.loads(line)
+                    text = row.get("q") or row.get("title") or row.get("name")
+                    if text:
+                        titles.append(str(text))
+                else:
+                    titles.append(line)
+        return titles
+
+    templates = load_seed_documents()
+    titles = [doc["title"] for doc in templates if doc.get("title")]
+    sample = min(scale, 5_000)
+    titles += [doc["title"] for doc in synthetic_documents(templates, sample, rng_seed)]
+    return titles
+
+
+def build_requests(
+    titles: list[str], mix: dict[str, int], count: int, rng: random.Random
+) -> list[BenchRequest]:
+    endpoints = list(mix)
+    weights = [mix[name] for name in endpoints]
+    requests = []
+    for _ in range(count):
+        endpoint = rng.choices(endpoints, weights)[0]
+        title = rng.choice(titles)
+        if endpoint in ("autocomplete", "autocomplete_minimal"):
+            # Keystroke prefix of at least two characters
+            title = title[: rng.randint(min(2, len(title)), len(title))]
+        requests.append(BenchRequest(endpoint=endpoint, q=title))
+    return requests
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+# Per-request sink for timed_task spans; child tasks share the list object.
+_spans: contextvars.ContextVar[list[tuple[str, float]] | None] = contextvars.ContextVar(
+    "bench_spans", default=None
+)
+
+
+def install_span_recorder() -> None:
+    """Wrap ``search_service.timed_task`` so each request records its per-source timings."""
+    original = search_service.timed_task
+
+    async def recording_timed_task(
+        name: str, coro: Any, timeout_seconds: float | None = None
+    ) -> tuple[str, Any, float]:
+        result = await original(name, coro, timeout_seconds)
+        sink = _spans.get()
+        if sink is not None:
+            sink.append((name, result[2]))
+        return result
+
+    search_service.timed_task = recording_timed_task
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    sources_ms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+
+
+async def harvest_details_ids() -> tuple[str, list[str]]:
+    """Collect media mc_ids for ``details_batch`` from a broad filter search."""
+    for mc_type in ("movie", "tv"):
+        results = await search_service.search(
+            None, sources={mc_type}, limit=50, year_min=1900, media_sort="popularity"
+        )
+        ids = [item["mc_id"] for item in results.get(mc_type, []) if item.get("mc_id")]
+        if ids:
+            return mc_type, ids
+    return "movie", []
+
+
+def endpoint_calls(
+    details_type: str, details_ids: list[str], rng: random.Random
+) -> dict[str, Callable[[str], Awaitable[Any]]]:
+    minimal_fields = sorted(search_service.MINIMAL_DEFAULT_FIELDS)
+
+    async def details_batch(_q: str) -> Any:
+        ids = rng.sample(details_ids, min(DETAILS_BATCH_SIZE, len(details_ids)))
+        return await search_service.get_details_batch(ids, details_type)
+
+    return {
+        "search": lambda q: search_service.search(q, sources=set(INDEXED_SOURCES)),
+        "autocomplete": lambda q: search_service.autocomplete(q, sources=set(INDEXED_SOURCES)),
+        "autocomplete_minimal": lambda q: search_service.autocomplete_minimal(
+            q, set(MEDIA_SOURCES), minimal_fields
+        ),
+        "resolve": lambda q: search_service.resolve(q, set(MEDIA_SOURCES)),
+        "details_batch": details_batch,
+    }
+
+
+async def run_requests(
+    requests: list[BenchRequest],
+    calls: dict[str, Callable[[str], Awaitable[Any]]],
+    concurrency: int,
+    duration: float | None,
+) -> tuple[dict[str, EndpointStats], float]:
+    stats: dict[str, EndpointStats] = defaultdict(EndpointStats)
+    queue: asyncio.Queue[BenchRequest] = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker() -> None:
+        while not queue.empty():
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            request = queue.get_nowait()
+            spans: list[tuple[str, float]] = []
+            token = _spans.set(spans)
+            start = time.perf_counter()
+            try:
+                await calls[request.endpoint](request.q)
+            except Exception as e:
+                stats[request.endpoint].errors += 1
+                logger.warning(f"{request.endpoint}({request.q!r}) failed: {e}")
+                continue
+            finally:
+                _spans.reset(token)
+            endpoint_stats = stats[request.endpoint]
+            endpoint_stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+            for name, elapsed in spans:
+                endpoint_stats.sources_ms[name].append(elapsed)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return stats, time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "mean": round(sum(samples) / len(samples), 3) if samples else 0.0,
+        "max": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def build_report(
+    stats: dict[str, EndpointStats], wall_seconds: float, args: argparse.Namespace
+) -> dict[str, Any]:
+    endpoints = {}
+    all_latencies: list[float] = []
+    for name, endpoint_stats in sorted(stats.items()):
+        all_latencies += endpoint_stats.latencies_ms
+        endpoints[name] = {
+            "count": len(endpoint_stats.latencies_ms),
+            "errors": endpoint_stats.errors,
+            "throughput_rps": round(len(endpoint_stats.latencies_ms) / wall_seconds, 2),
+            "latency_ms": summarize(endpoint_stats.latencies_ms),
+            "sources_ms": {
+                source: summarize(samples)
+                for source, samples in sorted(endpoint_stats.sources_ms.items())
+            },
+        }
+    return {
+        "meta": {
+            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "duration_s": round(wall_seconds, 3),
+            "scale": args.scale,
+            "queries": args.queries,
+            "redis_host": os.getenv("REDIS_HOST", "localhost"),
+        },
+        "overall": {
+            "count": len(all_latencies),
+            "throughput_rps": round(len(all_latencies) / wall_seconds, 2),
+            "latency_ms": summarize(all_latencies),
+        },
+        "endpoints": endpoints,
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    header = f"{'endpoint':<22}{'count':>7}{'err':>5}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = [*report["endpoints"].items(), ("overall", report["overall"])]
+    for name, row in rows:
+        lat = row["latency_ms"]
+        print(
+            f"{name:<22}{row['count']:>7}{row.get('errors', 0):>5}{row['throughput_rps']:>9.1f}"
+            f"{lat['p50']:>9.1f}{lat['p95']:>9.1f}{lat['p99']:>9.1f}"
+        )
+    for name, row in report["endpoints"].items():
+        for source, lat in row["sources_ms"].items():
+            print(
+                f"  {name}/{source:<18} p50={lat['p50']:.1f}ms "
+                f"p95={lat['p95']:.1f}ms p99={lat['p99']:.1f}ms"
+            )
+
+
+def compare_to_baseline(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return human-readable regressions of endpoint percentiles versus ``baseline``."""
+    regressions = []
+    for name, row in report["endpoints"].items():
+        base_row = baseline.get("endpoints", {}).get(name)
+        if base_row is None:
+            continue
+        for pct in ("p50", "p95", "p99"):
+            current = row["latency_ms"][pct]
+            base = base_row["latency_ms"][pct]
+            if current > base * (1 + tolerance) and current - base > MIN_REGRESSION_MS:
+                regressions.append(
+                    f"{name} {pct}: {base:.1f}ms -> {current:.1f}ms "
+                    f"(+{(current / base - 1) * 100 if base else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> int:
+    install_span_recorder()
+    rng = random.Random(args.seed)
+    titles = load_query_titles(args.queries, args.scale, args.seed)
+    if not titles:
+        raise SystemExit("No queries to replay")
+    requests = build_requests(titles, parse_mix(args.mix), args.requests, rng)
+
+    details_type, details_ids = await harvest_details_ids()
+    if not details_ids:
+        logger.warning("No media ids found; dropping details_batch from the mix")
+        requests = [r for r in requests if r.endpoint != "details_batch"]
+    calls = endpoint_calls(details_type, details_ids, rng)
+
+    if args.warmup:
+        await run_requests(requests[: args.warmup], calls, args.concurrency, None)
+    stats, wall_seconds = await run_requests(requests, calls, args.concurrency, args.duration)
+
+    report = build_report(stats, wall_seconds, args)
+    print_report(report)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\nRegressions vs {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search service benchmark harness")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for data and query mix")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = sub.add_parser("seed", help="Load sample + synthetic media documents")
+    seed_parser.add_argument("--scale", type=int, default=0, help="Synthetic media docs to add")
+    seed_parser.add_argument("--clear", action="store_true", help="Delete synthetic docs instead")
+
+    run_parser = sub.add_parser("run", help="Replay a query mix and report latencies")
+    run_parser.add_argument("--requests", type=int, default=2_000)
+    run_parser.add_argument("--concurrency", type=int, default=8)
+    run_parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    run_parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests first")
+    run_parser.add_argument("--mix", help="Endpoint weights, e.g. search=30,autocomplete=70")
+    run_parser.add_argument("--queries", help="JSONL (q/title/name) or text file of queries")
+    run_parser.add_argument(
+        "--scale", type=int, default=0, help="Synthetic docs seeded (for the default query mix)"
+    )
+    run_parser.add_argument("--out", help="Write the JSON report here")
+    run_parser.add_argument("--baseline", help="Compare against this JSON report")
+    run_parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="Allowed fractional slowdown"
+    )
+    args = parser.parse_args()
+
+    # Per-request INFO logs from the service would dominate the measurement.
+    search_service.logger.setLevel(logging.WARNING)
+
+    if args.command == "seed":
+        asyncio.run(seed(args.scale, args.clear, args.seed))
+    else:
+        sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,12 +23,17 @@ Four indexes:
 
 import asyncio
 import os
+import sys
 
 from dotenv import load_dotenv
 from redis.asyncio import Redis
 from redis.commands.search.field import NumericField, TagField, TextField
 from redis.commands.search.index_definition import IndexDefinition, IndexType
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from adapters.key_prefix import is_bulk_loaded
+
 # Load env file (defaults to local.env for local development)
 env_file = os.getenv("ENV_FILE", "config/local.env")
 load_dotenv(env_file)
@@ -232,6 +237,11 @@ async def build_books_index():
     definition = IndexDefinition(prefix=["book:"], index_type=IndexType.JSON)
 
     try:
+        # After a --bulk rebuild idx:book is an alias over a generation
+        # prefix; a new index over book: would shadow it
+        if await is_bulk_loaded(r, "book:"):
+            print(f"{BOOKS_INDEX_NAME} is managed by the bulk loader; rebuild it with --bulk")
+            return
         await r.ft(BOOKS_INDEX_NAME).create_index(schema, definition=definition)
         print(f"Index '{BOOKS_INDEX_NAME}' created successfully")
         print("TEXT fields: search_title, title, author, description, subjects_search")
@@ -256,6 +266,9 @@ async def drop_books_index():
     )
 
     try:
+        if await is_bulk_loaded(r, "book:"):
+            print(f"{BOOKS_INDEX_NAME} is managed by the bulk loader; rebuild it with --bulk")
+            return
         await r.ft(BOOKS_INDEX_NAME).dropindex(delete_documents=False)
         print(f"Index '{BOOKS_INDEX_NAME}' dropped successfully")
     except Exception as e:
@@ -265,8 +278,6 @@ async def drop_books_index():
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1 and sys.argv[1] == "--drop":
         asyncio.run(drop_index())
     elif len(sys.argv) > 1 and sys.argv[1] == "--rebuild":
@@ -52,6 +52,7 @@ load_dotenv(env_file)
 _project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_project_root / "src"))
 
+from adapters.key_prefix import resolve_key_prefix  # noqa: E402
 from etl.etl_metadata import ETLMetadataStore, ETLStateConfig  # noqa: E402
 from utils.redis_search_index_info import (  # noqa: E402
     extract_index_prefix,
@@ -453,8 +454,20 @@ async def preflight_checks(
     target_name: str,
     confirm_replace: bool,
     skip_sibling_check: bool = False,
+    prefixes: list[str] | None = None,
 ) -> bool:
     """Run safety checks before transfer."""
+    # A --bulk rebuild moves documents to a generation prefix behind an
+    # index alias; cloning the base prefix would copy nothing
+    for prefix in prefixes or []:
+        live_prefix = await resolve_key_prefix(source_meta, prefix)
+        if live_prefix != prefix:
+            print(
+                f"   ERROR: {prefix} was rebuilt with --bulk on the source "
+                f"(documents live under {live_prefix}); cloning it is not supported"
+            )
+            return False
+
     if not skip_sibling_check:
         sibling_running, sibling_desc = _check_sibling_redis(target_name)
         if sibling_running and not _prompt_sibling_warning(sibling_desc):
@@ -570,7 +583,7 @@ async def main(
     # --- Preflight ---
     print("Running preflight checks...")
     ok = await preflight_checks(
-        source_meta, target_meta, target_name, confirm_replace, skip_sibling_check
+        source_meta, target_meta, target_name, confirm_replace, skip_sibling_check, prefixes
     )
     if not ok:
         await source_meta.aclose()
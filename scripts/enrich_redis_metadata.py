@@ -23,7 +23,6 @@ Usage:
 """
 
 import argparse
-import asyncio
 import os
 import sys
 from datetime import UTC, datetime
@@ -49,6 +48,7 @@ from src.utils.json_lookup import (  # noqa: E402
     get_enrichment_data,
     get_lookup_stats,
 )
+from utils.http_session import run_with_http_sessions  # noqa: E402
 
 logger = get_logger(__name__)
 
@@ -353,4 +353,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
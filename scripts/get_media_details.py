@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import os
 import sys
@@ -14,12 +13,17 @@ from typing import Any, Literal, cast
 from dotenv import load_dotenv
 
 from ai.microgenre_batch import build_microgenre_input_from_document
-from ai.microgenre_document import microgenre_result_to_redis, valid_microgenres_value
+from ai.microgenre_document import (
+    attach_microgenre_vector,
+    microgenre_result_to_redis,
+    valid_microgenres_value,
+)
 from ai.prompts.microgenre_classifier import score_microgenres
 from api.tmdb.core import TMDBService
 from contracts.models import MCType
 from core.normalize import prepare_media_redis_document
 from etl.rt_enrichment import enrich_from_algolia, enrich_from_local
+from utils.http_session import run_with_http_sessions
 
 # Load env after imports so E402 is satisfied; path setup is via PYTHONPATH in Makefile
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -134,6 +138,7 @@ async def main() -> None:
                 )
         except Exception as exc:
             print(f"Microgenre classification failed (non-fatal): {exc}", file=sys.stderr)
+    attach_microgenre_vector(redis_doc)
 
     if args.add:
         from redis.asyncio import Redis
@@ -158,4 +163,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
@@ -11,13 +11,20 @@ Migrates existing book documents to use:
 For ~782K books, this uses a hybrid approach:
 - Top 20% authors by quality score: fetch edition counts from API (~2-3 hours)
 - Other books: use author quality score as popularity proxy (instant)
+
+Scanning, batching, minimal patches and --limit/--checkpoint/--resume come
+from ``adapters.scan_backfill``; the index is recreated after a real run.
+
+Usage:
+    python scripts/migrate_book_tags.py --dry-run --limit 1000
+    python scripts/migrate_book_tags.py --workers 8 --checkpoint /tmp/book_tags.ckpt --resume
 """
 
+import argparse
 import asyncio
 import math
 import os
 import sys
-import time
 from collections.abc import Awaitable
 from typing import Any, cast
 
@@ -29,6 +36,14 @@ from redis.commands.search.index_definition import IndexDefinition, IndexType
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from adapters.key_prefix import is_bulk_loaded, resolve_key_prefix
+from adapters.scan_backfill import (
+    BackfillConfig,
+    Transform,
+    add_backfill_arguments,
+    backfill_config_from_args,
+    run_backfill,
+)
 from core.iptc import expand_keywords, normalize_tag
 from utils.get_logger import get_logger
 
@@ -44,50 +59,6 @@ REDIS_PASSWORD = os.getenv("REDIS_PASSWORD") or None
 
 # Constants
 INDEX_NAME = "idx:book"
-SCAN_BATCH = 10000
-MGET_BATCH = 2000
-WRITE_BATCH = 2000
-
-
-class MigrationStats:
-    """Track migration statistics."""
-
-    def __init__(self) -> None:
-        self.start_time = time.time()
-        self.total_docs = 0
-        self.processed_docs = 0
-        self.updated_docs = 0
-        self.skipped_docs = 0
-        self.api_calls = 0
-        self.cache_hits = 0
-        self.phase_times: dict[str, float] = {}
-
-    def log_progress(self, phase: str, current: int, total: int) -> None:
-        """Log progress at regular intervals."""
-        if (current % 10000 == 0) or (current == total):
-            elapsed = time.time() - self.start_time
-            rate = current / elapsed if elapsed > 0 else 0
-            logger.info(
-                f"[{phase}] {current:,}/{total:,} ({current / total:.1%}) "
-                f"Rate: {rate:.1f}/s Elapsed: {elapsed:.1f}s"
-            )
-
-    def log_summary(self) -> None:
-        """Log final summary."""
-        total_elapsed = time.time() - self.start_time
-        logger.info("=" * 60)
-        logger.info("Migration Summary:")
-        logger.info(f"Total documents scanned: {self.total_docs:,}")
-        logger.info(f"Documents processed: {self.processed_docs:,}")
-        logger.info(f"Documents updated: {self.updated_docs:,}")
-        logger.info(f"Documents skipped: {self.skipped_docs:,}")
-        logger.info(f"API calls made: {self.api_calls:,}")
-        logger.info(f"Cache hits: {self.cache_hits:,}")
-        logger.info(f"Total elapsed time: {total_elapsed:.2f}s")
-        logger.info("Phase timings:")
-        for phase, duration in self.phase_times.items():
-            logger.info(f"  {phase}: {duration:.2f}s")
-        logger.info("=" * 60)
 
 
 async def get_redis_connection() -> Redis:
@@ -170,8 +141,9 @@ async def load_author_quality_scores(redis: Redis) -> dict[str, float]:
     logger.info("[AUTHORS] Loading author quality scores...")
     author_scores: dict[str, float] = {}
 
-    # Scan all author documents
-    async for key in redis.scan_iter(match="author:*", count=10000):
+    # Scan all author documents (a bulk rebuild moves them to a new prefix)
+    author_prefix = await resolve_key_prefix(redis, "author:")
+    async for key in redis.scan_iter(match=f"{author_prefix}*", count=10000):
         try:
             doc = await redis.json().get(key, "$.openlibrary_key", "$.quality_score")
             if doc:
@@ -242,10 +214,37 @@ def transform_document(
     return doc
 
 
-async def migrate_book_tags(
-    dry_run: bool = False,
-    limit: int | None = None,
-) -> None:
+def book_tags_transform(author_scores: dict[str, float]) -> Transform:
+    """Build the scan-engine transform; documents that already match are left alone."""
+
+    def transform(key: str, doc: dict[str, Any]) -> dict[str, Any] | None:
+        return transform_document(doc, author_scores)
+
+    return transform
+
+
+async def recreate_index(redis: Redis) -> None:
+    """Drop and recreate ``idx:book`` with the new schema."""
+    logger.info("[INDEX] Recreating index with new schema...")
+
+    try:
+        await redis.ft(INDEX_NAME).dropindex(delete_documents=False)
+        logger.info(f"[INDEX] Dropped {INDEX_NAME}")
+    except Exception as e:
+        logger.warning(f"[INDEX] Could not drop index (may not exist): {e}")
+
+    schema = build_new_schema()
+    definition = IndexDefinition(prefix=["book:"], index_type=IndexType.JSON)
+
+    try:
+        await redis.ft(INDEX_NAME).create_index(schema, definition=definition)
+        logger.info(f"[INDEX] Created {INDEX_NAME} with new schema")
+    except Exception as e:
+        logger.error(f"[INDEX] Failed to create index: {e}")
+        raise
+
+
+async def migrate_book_tags(config: BackfillConfig) -> None:
     """
     Migrate existing book documents to include normalized TAG fields.
 
@@ -253,166 +252,48 @@ async def migrate_book_tags(
     are too strict for fetching edition counts at scale).
 
     Args:
-        dry_run: If True, don't write changes to Redis
-        limit: If set, only process this many documents (for testing)
+        config: Scan engine settings (``match`` is ``book:*``)
     """
     logger.info("=" * 60)
     logger.info("Book TAG Migration")
     logger.info("=" * 60)
     logger.info(f"Redis: {REDIS_HOST}:{REDIS_PORT}")
-    logger.info(f"Dry run: {dry_run}")
-    logger.info(f"Document limit: {limit or 'None'}")
+    logger.info(f"Dry run: {config.dry_run}")
+    logger.info(f"Document limit: {config.limit or 'None'}")
     logger.info("Popularity: Using author quality score (no API calls)")
 
     redis = await get_redis_connection()
-    stats = MigrationStats()
 
     try:
-        # Phase 1: Load author quality scores
-        phase_start = time.time()
-        author_scores = await load_author_quality_scores(redis)
-        stats.phase_times["load_authors"] = time.time() - phase_start
-
-        # Phase 2: Collect all book document keys
-        phase_start = time.time()
-        logger.info("[SCAN] Collecting all book:* keys...")
-        all_keys: list[str] = []
-        async for key in redis.scan_iter(match="book:*", count=SCAN_BATCH):
-            all_keys.append(key)
-            if limit and len(all_keys) >= limit:
-                break
-        stats.total_docs = len(all_keys)
-        stats.phase_times["scan"] = time.time() - phase_start
-        logger.info(
-            f"[SCAN] Found {len(all_keys):,} documents in {stats.phase_times['scan']:.2f}s"
-        )
-
-        if not all_keys:
-            logger.info("No book documents found to migrate.")
+        # An index rebuilt with --bulk is an alias over a generation prefix;
+        # recreating it over book: below would shadow it with an empty index
+        if await is_bulk_loaded(redis, "book:"):
+            logger.error(
+                f"{INDEX_NAME} is managed by the bulk loader; rebuild it with "
+                "load_book_index --bulk instead of migrating it in place"
+            )
             return
 
-        # Phase 3: Read existing documents in batches
-        phase_start = time.time()
-        logger.info("[READ] Reading existing documents...")
-        existing_docs: dict[str, dict] = {}
-        for i in range(0, len(all_keys), MGET_BATCH):
-            batch_keys = all_keys[i : i + MGET_BATCH]
-            raw_docs = await redis.json().mget(batch_keys, "$")
-            for key, doc_list in zip(batch_keys, raw_docs, strict=True):
-                if doc_list and doc_list[0]:
-                    existing_docs[key] = doc_list[0]
-            stats.log_progress("READ", min(i + MGET_BATCH, len(all_keys)), len(all_keys))
-        stats.phase_times["read"] = time.time() - phase_start
-        logger.info(
-            f"[READ] Read {len(existing_docs):,} documents in {stats.phase_times['read']:.2f}s"
-        )
-
-        # Phase 4: Transform documents
-        phase_start = time.time()
-        logger.info("[TRANSFORM] Transforming documents...")
-        transformed_docs: list[tuple[str, dict]] = []
-
-        for key, doc in existing_docs.items():
-            stats.processed_docs += 1
-            try:
-                transformed = transform_document(doc, author_scores)
-                transformed_docs.append((key, transformed))
-                stats.updated_docs += 1
-            except Exception as e:
-                logger.warning(f"Error transforming {key}: {e}")
-                stats.skipped_docs += 1
-
-            if stats.processed_docs % 50000 == 0:
-                stats.log_progress("TRANSFORM", stats.processed_docs, len(existing_docs))
-
-        stats.phase_times["transform"] = time.time() - phase_start
-        logger.info(
-            f"[TRANSFORM] Transformed {len(transformed_docs):,} documents "
-            f"in {stats.phase_times['transform']:.2f}s"
-        )
-
-        # Phase 5: Write transformed documents
-        if not dry_run:
-            phase_start = time.time()
-            logger.info("[WRITE] Writing transformed documents...")
-            for i in range(0, len(transformed_docs), WRITE_BATCH):
-                pipeline = redis.pipeline()
-                batch = transformed_docs[i : i + WRITE_BATCH]
-                for key, doc in batch:
-                    pipeline.json().set(key, "$", doc)
-                await pipeline.execute()
-                stats.log_progress(
-                    "WRITE", min(i + WRITE_BATCH, len(transformed_docs)), len(transformed_docs)
-                )
-            stats.phase_times["write"] = time.time() - phase_start
-            logger.info(
-                f"[WRITE] Wrote {len(transformed_docs):,} documents "
-                f"in {stats.phase_times['write']:.2f}s"
-            )
-        else:
-            logger.info(f"[DRY RUN] Would update {len(transformed_docs):,} documents.")
-            # Show sample transformations
-            for i, (key, doc) in enumerate(transformed_docs[:5]):
-                aq_score = doc.get("author_quality_score") or 0
-                pop_score = doc.get("popularity_score") or 0
-                logger.info(
-                    f"  Sample {i + 1}: {key}\n"
-                    f"    title: {doc.get('title', '')[:50]}\n"
-                    f"    author_normalized: {doc.get('author_normalized')}\n"
-                    f"    subjects_normalized: {doc.get('subjects_normalized', [])[:5]}...\n"
-                    f"    author_quality_score: {aq_score:.2f}\n"
-                    f"    popularity_score: {pop_score:.2f}"
-                )
-
-        # Phase 8: Recreate index with new schema
-        if not dry_run:
-            phase_start = time.time()
-            logger.info("[INDEX] Recreating index with new schema...")
-
-            # Drop existing index
-            try:
-                await redis.ft(INDEX_NAME).dropindex(delete_documents=False)
-                logger.info(f"[INDEX] Dropped {INDEX_NAME}")
-            except Exception as e:
-                logger.warning(f"[INDEX] Could not drop index (may not exist): {e}")
-
-            # Create new index
-            schema = build_new_schema()
-            definition = IndexDefinition(prefix=["book:"], index_type=IndexType.JSON)
-
-            try:
-                await redis.ft(INDEX_NAME).create_index(schema, definition=definition)
-                logger.info(f"[INDEX] Created {INDEX_NAME} with new schema")
-            except Exception as e:
-                logger.error(f"[INDEX] Failed to create index: {e}")
-                raise
-
-            stats.phase_times["index"] = time.time() - phase_start
-            logger.info(f"[INDEX] Index recreated in {stats.phase_times['index']:.2f}s")
+        author_scores = await load_author_quality_scores(redis)
+
+        stats = await run_backfill(redis, book_tags_transform(author_scores), config)
+        stats.log_summary("Book TAG Migration", config.dry_run)
+
+        if config.dry_run:
+            logger.info("[DRY RUN] Skipping index recreation")
+        elif stats.processed:
+            await recreate_index(redis)
 
     finally:
         await redis.aclose()
-        stats.log_summary()
         logger.info("Migration complete.")
 
 
 if __name__ == "__main__":
-    import argparse
-
     parser = argparse.ArgumentParser(
         description="Migrate book index with normalized TAGs and popularity scores"
     )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Run without making any changes to Redis.",
-    )
-    parser.add_argument(
-        "--limit",
-        type=int,
-        default=None,
-        help="Limit the number of documents to process (for testing).",
-    )
+    add_backfill_arguments(parser)
     args = parser.parse_args()
 
-    asyncio.run(migrate_book_tags(dry_run=args.dry_run, limit=args.limit))
+    asyncio.run(migrate_book_tags(backfill_config_from_args(args, "book:*")))
@@ -2,19 +2,26 @@
 Migrate watch_providers to add is_master_brand flag and filter platform IDs.
 
 This script:
-1. Scans all media:* documents in Redis
+1. Scans all media:* documents in Redis (adapters.scan_backfill workers)
 2. For each watch_providers entry, adds is_master_brand to provider objects
 3. Filters streaming_platform_ids and on_demand_platform_ids to master brands only
-4. Writes updated documents back to Redis
+4. Writes the changed fields back to Redis as minimal patches
 
 No TMDB API calls - uses local provider_map.json for master brand lookup.
+
+Usage:
+    # Preview changes
+    python scripts/migrate_watch_provider_master_brand.py --dry-run
+
+    # More workers, resumable after a crash
+    python scripts/migrate_watch_provider_master_brand.py --checkpoint /tmp/brand.ckpt --resume
 """
 
 import argparse
 import asyncio
 import os
 import sys
-import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +37,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 env_file = os.getenv("ENV_FILE", "config/local.env")
 load_dotenv(env_file)
 
+from adapters.scan_backfill import (  # noqa: E402
+    BackfillConfig,
+    add_backfill_arguments,
+    backfill_config_from_args,
+    run_backfill,
+)
 from api.tmdb.utils.provider_utils import (  # noqa: E402
     get_full_provider_map,
     get_provider_display_map,
@@ -38,44 +51,6 @@ from utils.get_logger import get_logger  # noqa: E402
 
 logger = get_logger(__name__)
 
-# Constants
-SCAN_BATCH = 10000
-MGET_BATCH = 500
-WRITE_BATCH = 500
-
-
-class MigrationStats:
-    """Track migration statistics."""
-
-    def __init__(self) -> None:
-        self.total_docs = 0
-        self.docs_with_watch_providers = 0
-        self.docs_updated = 0
-        self.docs_skipped = 0
-        self.errors = 0
-        self.error_messages: list[str] = []
-        self.start_time: float = 0
-        self.phase_times: dict[str, float] = {}
-
-    def log_summary(self) -> None:
-        """Log migration summary."""
-        elapsed = time.time() - self.start_time
-        logger.info("=" * 60)
-        logger.info("Migration Summary")
-        logger.info("=" * 60)
-        logger.info(f"Total documents scanned: {self.total_docs:,}")
-        logger.info(f"Documents with watch_providers: {self.docs_with_watch_providers:,}")
-        logger.info(f"Documents updated: {self.docs_updated:,}")
-        logger.info(f"Documents skipped (already migrated): {self.docs_skipped:,}")
-        logger.info(f"Errors: {self.errors:,}")
-        logger.info(f"Total time: {elapsed:.2f}s")
-        for phase, duration in self.phase_times.items():
-            logger.info(f"  {phase}: {duration:.2f}s")
-        if self.error_messages:
-            logger.info("First 5 errors:")
-            for msg in self.error_messages[:5]:
-                logger.info(f"  - {msg}")
-
 
 def build_master_brand_lookup() -> set[str]:
     """Build a set of provider IDs that are master brands."""
@@ -151,93 +126,30 @@ def migrate_watch_providers(
     return migrated, True
 
 
-async def migrate_documents(
-    redis: Redis,
-    stats: MigrationStats,
+def master_brand_transform(
     master_brand_ids: set[str],
-    dry_run: bool = False,
-) -> None:
-    """Migrate all media documents with is_master_brand flag."""
-    # Phase 1: Scan all keys
-    phase_start = time.time()
-    logger.info("[SCAN] Collecting all media:* keys...")
-
-    keys: list[str] = []
-    async for key in redis.scan_iter(match="media:*", count=SCAN_BATCH):
-        keys.append(key if isinstance(key, str) else key.decode())
-
-    stats.total_docs = len(keys)
-    stats.phase_times["scan"] = time.time() - phase_start
-    logger.info(f"[SCAN] Found {stats.total_docs:,} documents in {stats.phase_times['scan']:.2f}s")
-
-    # Phase 2: Process in batches
-    phase_start = time.time()
-    logger.info("[MIGRATE] Processing documents...")
-
-    for batch_start in range(0, len(keys), MGET_BATCH):
-        batch_keys = keys[batch_start : batch_start + MGET_BATCH]
-
-        # Read batch
-        pipe = redis.pipeline()
-        for key in batch_keys:
-            pipe.json().get(key)
-        docs = await pipe.execute()
-
-        # Process batch
-        updates: list[tuple[str, dict[str, Any]]] = []
-        for key, doc in zip(batch_keys, docs, strict=True):
-            if not isinstance(doc, dict):
-                continue
-
-            watch_providers = doc.get("watch_providers")
-            if not isinstance(watch_providers, dict):
-                continue
-
-            stats.docs_with_watch_providers += 1
-
-            try:
-                migrated_wp, was_changed = migrate_watch_providers(
-                    watch_providers, master_brand_ids
-                )
-                if was_changed:
-                    updates.append((key, migrated_wp))
-                    stats.docs_updated += 1
-                else:
-                    stats.docs_skipped += 1
-            except Exception as e:
-                stats.errors += 1
-                if len(stats.error_messages) < 10:
-                    stats.error_messages.append(f"{key}: {e}")
-
-        # Write batch
-        if updates and not dry_run:
-            write_pipe = redis.pipeline()
-            for key, migrated_wp in updates:
-                write_pipe.json().set(key, "$.watch_providers", migrated_wp)
-            await write_pipe.execute()
-
-        # Progress
-        processed = min(batch_start + MGET_BATCH, len(keys))
-        if processed % 10000 == 0 or processed == len(keys):
-            logger.info(
-                f"[MIGRATE] Processed {processed:,}/{stats.total_docs:,} "
-                f"({100 * processed / stats.total_docs:.1f}%) - "
-                f"updated: {stats.docs_updated:,}, skipped: {stats.docs_skipped:,}"
-            )
-
-    stats.phase_times["migrate"] = time.time() - phase_start
-    logger.info(f"[MIGRATE] Completed in {stats.phase_times['migrate']:.2f}s")
-
-
-async def main(dry_run: bool = False) -> None:
-    """Main migration entry point."""
-    stats = MigrationStats()
-    stats.start_time = time.time()
+) -> Callable[[str, dict[str, Any]], dict[str, Any] | None]:
+    """Build the backfill transform for a master brand lookup."""
 
+    def transform(key: str, doc: dict[str, Any]) -> dict[str, Any] | None:
+        watch_providers = doc.get("watch_providers")
+        if not isinstance(watch_providers, dict):
+            return None
+        migrated_wp, was_changed = migrate_watch_providers(watch_providers, master_brand_ids)
+        if not was_changed:
+            return None
+        doc["watch_providers"] = migrated_wp
+        return doc
+
+    return transform
+
+
+async def main(config: BackfillConfig) -> None:
+    """Main migration entry point."""
     logger.info("=" * 60)
     logger.info("Watch Provider Master Brand Migration")
     logger.info("=" * 60)
-    if dry_run:
+    if config.dry_run:
         logger.info("DRY RUN - no changes will be written")
 
     # Build master brand lookup
@@ -254,22 +166,18 @@ async def main(dry_run: bool = False) -> None:
     )
 
     try:
-        await migrate_documents(redis, stats, master_brand_ids, dry_run)
+        stats = await run_backfill(redis, master_brand_transform(master_brand_ids), config)
     finally:
         await redis.aclose()
 
-    stats.log_summary()
+    stats.log_summary("Watch Provider Master Brand Migration", config.dry_run)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Migrate watch_providers to add is_master_brand flag"
     )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Preview changes without writing to Redis",
-    )
+    add_backfill_arguments(parser)
     args = parser.parse_args()
 
-    asyncio.run(main(dry_run=args.dry_run))
+    asyncio.run(main(backfill_config_from_args(args, "media:*")))
@@ -24,7 +24,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import os
 import random
@@ -38,6 +37,7 @@ sys.path.insert(0, str(_project_root / "src"))
 sys.path.insert(0, str(_project_root))
 
 from adapters.config import load_env  # noqa: E402
+from utils.http_session import run_with_http_sessions  # noqa: E402
 
 load_env()
 
@@ -860,7 +860,7 @@ def main() -> None:
     parser.add_argument("--count", type=int, default=5, help="Sample items per type (default 5)")
     args = parser.parse_args()
 
-    exit_code = asyncio.run(run_tests(args))
+    exit_code = run_with_http_sessions(run_tests(args))
     sys.exit(exit_code)
 
 
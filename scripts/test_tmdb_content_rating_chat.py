@@ -8,10 +8,10 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
-import asyncio
 from typing import Literal
 
 from api.tmdb.wrappers import get_content_rating_async
+from utils.http_session import run_with_http_sessions
 
 
 def _normalize_media_type(raw: str) -> Literal["tv", "movie"]:
@@ -160,5 +160,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
 
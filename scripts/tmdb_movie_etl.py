@@ -27,6 +27,7 @@ from api.tmdb.core import TMDBService
 from api.tmdb.models import MCMovieItem
 from contracts.models import MCType
 from utils.get_logger import get_logger
+from utils.http_session import run_with_http_sessions
 
 logger = get_logger(__name__)
 BATCH_SIZE = 15
@@ -382,7 +383,7 @@ Examples:
         parser.error("--months-back must be at least 1")
 
     # Run the ETL
-    asyncio.run(run_etl(args.start_date, args.months_back, args.output_dir))
+    run_with_http_sessions(run_etl(args.start_date, args.months_back, args.output_dir))
 
 
 if __name__ == "__main__":
@@ -16,12 +16,13 @@ At the prompt:
 
 from __future__ import annotations
 
-import asyncio
 import json
 from typing import Any, Literal
 
 from api.tmdb.get_providers import get_streaming_platform_summary_for_title
 
+from utils.http_session import run_with_http_sessions
+
 ContentType = Literal["movie", "tv"]
 
 
@@ -183,4 +184,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_with_http_sessions(main())
@@ -34,6 +34,7 @@ from api.tmdb.core import TMDBService  # noqa: E402
 from api.tmdb.models import MCTvItem  # noqa: E402
 from contracts.models import MCType  # noqa: E402
 from utils.get_logger import get_logger  # noqa: E402
+from utils.http_session import run_with_http_sessions  # noqa: E402
 
 logger = get_logger(__name__)
 BATCH_SIZE = 15
@@ -385,7 +386,7 @@ Examples:
         parser.error("--months-back must be at least 1")
 
     # Run the ETL
-    asyncio.run(run_etl(args.start_date, args.months_back, args.output_dir))
+    run_with_http_sessions(run_etl(args.start_date, args.months_back, args.output_dir))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,344 @@
+"""
+Bulk Index Loader - Full rebuilds into a fresh key generation with an alias swap.
+
+Incremental loaders read each document before writing it and let RediSearch
+index every ``JSON.SET`` synchronously.  For a full rebuild that is the slow
+path.  ``bulk_load_index`` instead:
+
+1. Writes every document under a new key prefix (``book_g<timestamp>:``)
+   that no index covers yet, from N concurrent non-transactional pipelines.
+   The only read is ``created_at`` from the live generation (one
+   ``JSON.MGET`` per batch), so creation timestamps survive the rebuild.
+2. Creates ``<alias>:<timestamp>`` over the new prefix; RediSearch indexes
+   the existing keys in the background.
+3. Polls ``FT.INFO`` until ``percent_indexed`` reaches 1.
+4. In one MULTI: points the alias at the new index, records the new live
+   prefix (``adapters.key_prefix``) and bumps the index generation.
+   Searches switch over atomically.  If the alias name is still a plain
+   index from before bulk loading existed, that index is dropped (documents
+   kept) and the alias added in the same MULTI.
+5. After ``grace_seconds`` (longer than the key-prefix cache TTL) drops the
+   previous index and UNLINKs its documents.
+
+Writers that target the live generation during a rebuild would be lost at
+the swap, so run rebuilds while nightly jobs for the same index are idle
+(the ETL scheduler's resource groups serialize them).
+
+Usage:
+    from adapters.bulk_index_loader import bulk_load_index
+
+    stats = await bulk_load_index(
+        redis,
+        docs,                    # iterable of (doc_id, redis_doc)
+        alias="idx:book",
+        base_prefix="book:",
+        create_index=create_book_index,
+    )
+
+Tuning (environment):
+    BULK_LOAD_PIPELINES         concurrent pipelines (default 8)
+    BULK_LOAD_BATCH_SIZE        documents per pipeline (default 1000)
+    BULK_INDEX_TIMEOUT_SECONDS  max wait for the background build (default 3600)
+    BULK_OLD_GENERATION_GRACE_SECONDS  wait before deleting the old keys (default 90)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from adapters.index_generation import queue_index_generation_bump
+from adapters.key_prefix import (
+    KEY_PREFIX_CACHE_SECONDS,
+    clear_key_prefix_cache,
+    queue_key_prefix_update,
+    resolve_key_prefix,
+)
+from core.normalize import BACKFILL_DEFAULT_TS
+from utils.get_logger import get_logger
+from utils.redis_search_index_info import extract_index_prefix
+
+logger = get_logger(__name__)
+
+BULK_LOAD_PIPELINES = int(os.getenv("BULK_LOAD_PIPELINES", "8"))
+BULK_LOAD_BATCH_SIZE = int(os.getenv("BULK_LOAD_BATCH_SIZE", "1000"))
+BULK_INDEX_TIMEOUT_SECONDS = float(os.getenv("BULK_INDEX_TIMEOUT_SECONDS", "3600"))
+BULK_OLD_GENERATION_GRACE_SECONDS = float(
+    os.getenv("BULK_OLD_GENERATION_GRACE_SECONDS", str(max(90.0, KEY_PREFIX_CACHE_SECONDS * 3)))
+)
+
+# (redis, index_name, key_prefix) -> created
+CreateIndex = Callable[[Any, str, str], Awaitable[bool]]
+
+_DELETE_SCAN_COUNT = 1000
+
+
+class BulkLoadError(RuntimeError):
+    """The new generation could not be indexed; the live alias was left untouched."""
+
+
+@dataclass
+class BulkLoadConfig:
+    """Concurrency and timing for one bulk load."""
+
+    pipelines: int = BULK_LOAD_PIPELINES
+    batch_size: int = BULK_LOAD_BATCH_SIZE
+    index_timeout_seconds: float = BULK_INDEX_TIMEOUT_SECONDS
+    grace_seconds: float = BULK_OLD_GENERATION_GRACE_SECONDS
+    keep_previous: bool = False
+    poll_interval_seconds: float = 2.0
+
+
+@dataclass
+class BulkLoadStats:
+    """Counters for one bulk load."""
+
+    index_name: str = ""
+    key_prefix: str = ""
+    previous_index: str | None = None
+    loaded: int = 0
+    errors: int = 0
+    indexed: int = 0
+    index_failures: int = 0
+    previous_deleted: int = 0
+    load_seconds: float = 0.0
+    index_seconds: float = 0.0
+    error_messages: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["error_messages"] = self.error_messages[:10]
+        return data
+
+
+def new_generation(base_prefix: str, alias: str) -> tuple[str, str]:
+    """Return ``(key_prefix, index_name)`` for a fresh generation.
+
+    The key prefix must not start with ``base_prefix``; RediSearch prefixes
+    are plain string prefixes, so the live index would pick it up.
+    """
+    stamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+    return f"{base_prefix.rstrip(':')}_g{stamp}:", f"{alias}:{stamp}"
+
+
+def _first_value(value: Any) -> Any:
+    # JSONPath ($.field) reads come back as a one-element list
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+async def _write_batches(
+    redis: Any,
+    docs: Iterable[tuple[str, dict[str, Any]]],
+    key_prefix: str,
+    live_prefix: str,
+    config: BulkLoadConfig,
+    stats: BulkLoadStats,
+) -> None:
+    queue: asyncio.Queue[list[tuple[str, dict[str, Any]]] | None] = asyncio.Queue(
+        maxsize=config.pipelines * 2
+    )
+    started = time.time()
+    last_report = started
+
+    async def worker() -> None:
+        nonlocal last_report
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            try:
+                now_ts = int(datetime.now(UTC).timestamp())
+                created = await redis.json().mget(
+                    [f"{live_prefix}{doc_id}" for doc_id, _ in batch], "$.created_at"
+                )
+                pipe = redis.pipeline(transaction=False)
+                for (doc_id, doc), existing in zip(batch, created, strict=True):
+                    if existing is None:
+                        doc["created_at"] = now_ts
+                    else:
+                        created_at = _first_value(existing)
+                        doc["created_at"] = int(
+                            created_at if created_at is not None else BACKFILL_DEFAULT_TS
+                        )
+                    doc["modified_at"] = now_ts
+                    pipe.json().set(f"{key_prefix}{doc_id}", "$", doc)
+                await pipe.execute()
+                stats.loaded += len(batch)
+            except Exception as e:
+                stats.errors += len(batch)
+                if len(stats.error_messages) < 50:
+                    stats.error_messages.append(f"{type(e).__name__}: {e}")
+
+            now = time.time()
+            if now - last_report >= 10:
+                last_report = now
+                rate = stats.loaded / (now - started)
+                logger.info(f"  Bulk load: {stats.loaded:,} written ({rate:,.0f}/sec)")
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, config.pipelines))]
+    try:
+        batch: list[tuple[str, dict[str, Any]]] = []
+        for item in docs:
+            batch.append(item)
+            if len(batch) >= config.batch_size:
+                await queue.put(batch)
+                batch = []
+        if batch:
+            await queue.put(batch)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    stats.load_seconds = time.time() - started
+
+
+async def wait_for_indexing(
+    redis: Any, index_name: str, timeout_seconds: float, poll_interval_seconds: float = 2.0
+) -> dict[str, Any]:
+    """Poll ``FT.INFO`` until the background build finishes; returns the final info."""
+    deadline = time.monotonic() + timeout_seconds
+    last_logged = -1.0
+    while True:
+        info: dict[str, Any] = await redis.ft(index_name).info()
+        percent = float(info.get("percent_indexed", 1) or 0)
+        if str(info.get("indexing", 0)) == "0" and percent >= 1:
+            return info
+        if percent - last_logged >= 0.05:
+            last_logged = percent
+            logger.info(
+                f"  Indexing {index_name}: {percent:.0%} ({int(info.get('num_docs', 0)):,} docs)"
+            )
+        if time.monotonic() >= deadline:
+            raise BulkLoadError(
+                f"{index_name} still indexing after {timeout_seconds:.0f}s ({percent:.0%})"
+            )
+        await asyncio.sleep(poll_interval_seconds)
+
+
+async def _current_target(redis: Any, alias: str) -> tuple[str | None, str]:
+    """Return ``(index behind alias, its key prefix)``; ``(None, "")`` if absent."""
+    try:
+        info = await redis.ft(alias).info()
+    except Exception as e:
+        if "unknown index" in str(e).lower() or "no such index" in str(e).lower():
+            return None, ""
+        raise
+    return str(info.get("index_name", alias)), extract_index_prefix(
+        info.get("index_definition", [])
+    )
+
+
+async def _delete_prefix(redis: Any, prefix: str) -> int:
+    deleted = 0
+    cursor = 0
+    while True:
+        cursor, keys = await redis.scan(cursor=cursor, match=f"{prefix}*", count=_DELETE_SCAN_COUNT)
+        if keys:
+            deleted += await redis.unlink(*keys)
+        if int(cursor) == 0:
+            return deleted
+
+
+async def bulk_load_index(
+    redis: Any,
+    docs: Iterable[tuple[str, dict[str, Any]]],
+    alias: str,
+    base_prefix: str,
+    create_index: CreateIndex,
+    config: BulkLoadConfig | None = None,
+) -> BulkLoadStats:
+    """
+    Load ``docs`` into a fresh generation and swap ``alias`` onto it.
+
+    Args:
+        redis: Async Redis client.
+        docs: ``(doc_id, redis_doc)`` pairs; keys become ``<new prefix><doc_id>``.
+        alias: Name searches use (e.g. ``idx:book``).
+        base_prefix: Stable key prefix readers resolve (e.g. ``book:``).
+        create_index: Creates an index with the loader's schema for a given
+            name and key prefix.
+        config: Concurrency and timing (defaults from the environment).
+
+    Returns:
+        BulkLoadStats
+
+    Raises:
+        BulkLoadError: Nothing was loaded or the index build failed or
+            timed out.  The new generation is deleted and the alias is not
+            touched.
+    """
+    config = config or BulkLoadConfig()
+    key_prefix, index_name = new_generation(base_prefix, alias)
+    stats = BulkLoadStats(index_name=index_name, key_prefix=key_prefix)
+    live_prefix = await resolve_key_prefix(redis, base_prefix)
+
+    logger.info(f"Bulk load into {key_prefix}* ({config.pipelines} pipelines)")
+    try:
+        await _write_batches(redis, docs, key_prefix, live_prefix, config, stats)
+        logger.info(
+            f"Wrote {stats.loaded:,} documents in {stats.load_seconds:.1f}s "
+            f"({stats.errors:,} errors)"
+        )
+        if stats.loaded == 0:
+            raise BulkLoadError("No documents were written")
+
+        index_start = time.time()
+        if not await create_index(redis, index_name, key_prefix):
+            raise BulkLoadError(f"Could not create {index_name}")
+        info = await wait_for_indexing(
+            redis, index_name, config.index_timeout_seconds, config.poll_interval_seconds
+        )
+        stats.index_seconds = time.time() - index_start
+        stats.indexed = int(info.get("num_docs", 0))
+        stats.index_failures = int(info.get("hash_indexing_failures", 0) or 0)
+        logger.info(
+            f"Indexed {stats.indexed:,} documents in {stats.index_seconds:.1f}s "
+            f"({stats.index_failures:,} failures)"
+        )
+        if stats.indexed == 0:
+            raise BulkLoadError(f"{index_name} indexed no documents")
+    except Exception:
+        logger.error(f"Bulk load failed; removing {key_prefix}*")
+        try:
+            await redis.ft(index_name).dropindex(delete_documents=False)
+        except Exception:
+            pass
+        await _delete_prefix(redis, key_prefix)
+        raise
+
+    previous_index, previous_prefix = await _current_target(redis, alias)
+    stats.previous_index = previous_index
+    swap = redis.pipeline(transaction=True)
+    if previous_index is None:
+        swap.execute_command("FT.ALIASADD", alias, index_name)
+    elif previous_index == alias:
+        # Plain index from before bulk loading: replace it with the alias
+        swap.execute_command("FT.DROPINDEX", alias)
+        swap.execute_command("FT.ALIASADD", alias, index_name)
+    else:
+        swap.execute_command("FT.ALIASUPDATE", alias, index_name)
+    queue_key_prefix_update(swap, base_prefix, key_prefix)
+    queue_index_generation_bump(swap)
+    await swap.execute()
+    clear_key_prefix_cache()
+    logger.info(f"Alias {alias} -> {index_name} (was {previous_index or 'unset'})")
+
+    if previous_index and not config.keep_previous:
+        logger.info(f"Waiting {config.grace_seconds:.0f}s before deleting {previous_prefix}*")
+        await asyncio.sleep(config.grace_seconds)
+        if previous_index != alias:
+            await redis.ft(previous_index).dropindex(delete_documents=False)
+        if previous_prefix and previous_prefix != key_prefix:
+            stats.previous_deleted = await _delete_prefix(redis, previous_prefix)
+            logger.info(f"Deleted {stats.previous_deleted:,} documents from {previous_prefix}*")
+
+    return stats
@@ -0,0 +1,108 @@
+"""
+Document patches - minimal JSON updates for indexed documents.
+
+Enrichment passes and loaders usually hold both the existing Redis document
+and the freshly built one.  Rewriting the whole document with
+``JSON.SET key $`` ships every field over the wire and makes RediSearch
+re-index all of them; a patch ships only the fields that changed.
+
+``compute_merge_patch`` produces an RFC 7386 merge patch (changed keys,
+nested objects diffed recursively, removed keys as ``null``).  Applying it
+to the old document yields the new one, so patching is a drop-in
+replacement for a full SET when the caller has already read the old doc.
+
+Apply modes (``JSON_PATCH_MODE``):
+    merge  One ``JSON.MERGE key $ <patch>`` per document (default; RedisJSON 2.6+)
+    paths  ``JSON.SET key $.field`` / ``JSON.DEL`` per changed top-level field
+
+Usage:
+    from adapters.document_patch import queue_document_patch
+
+    write_pipe = redis.pipeline()
+    queue_document_patch(write_pipe, key, existing_doc, redis_doc)
+    await write_pipe.execute()
+"""
+
+import os
+import re
+from typing import Any
+
+JSON_PATCH_MODE = os.getenv("JSON_PATCH_MODE", "merge").lower()
+
+_SIMPLE_FIELD = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def compute_merge_patch(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the merge patch that turns ``old`` into ``new``.
+
+    A merge patch cannot store an explicit ``null`` (``null`` means delete),
+    so a key that is ``None`` in ``new`` and absent from ``old`` is treated
+    as unchanged, and one that becomes ``None`` is removed.
+    """
+    patch: dict[str, Any] = {}
+    for key, new_value in new.items():
+        if key not in old:
+            if new_value is not None:
+                patch[key] = new_value
+            continue
+        old_value = old[key]
+        if old_value == new_value:
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            nested = compute_merge_patch(old_value, new_value)
+            if nested:
+                patch[key] = nested
+        else:
+            patch[key] = new_value
+    for key in old:
+        if key not in new:
+            patch[key] = None
+    return patch
+
+
+def _field_path(field: str) -> str:
+    if _SIMPLE_FIELD.match(field):
+        return f"$.{field}"
+    escaped = field.replace("\\", "\\\\").replace('"', '\\"')
+    return f'$["{escaped}"]'
+
+
+def queue_document_patch(
+    pipe: Any,
+    key: str,
+    old: dict[str, Any] | None,
+    new: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Queue the minimal update that turns ``old`` into ``new`` on a pipeline.
+
+    Falls back to a full ``JSON.SET`` when there is no existing document.
+
+    Args:
+        pipe: Redis pipeline (sync or async).
+        key: Document key.
+        old: The document currently stored at ``key`` (None if absent).
+        new: The desired document.
+
+    Returns:
+        The patch that was queued (the full document for a new key); empty
+        when nothing changed and no command was queued.
+    """
+    if old is None:
+        pipe.json().set(key, "$", new)
+        return new
+
+    patch = compute_merge_patch(old, new)
+    if not patch:
+        return patch
+
+    if JSON_PATCH_MODE == "paths":
+        for field in patch:
+            if field in new and new[field] is not None:
+                pipe.json().set(key, _field_path(field), new[field])
+            else:
+                pipe.json().delete(key, _field_path(field))
+    else:
+        pipe.json().merge(key, "$", patch)
+    return patch
@@ -0,0 +1,34 @@
+"""
+Search index generation counter.
+
+ETL loaders bump one Redis counter whenever they write indexed documents.
+Read-side caches (e.g. the autocomplete response cache) fold the current
+generation into their keys, so a load invalidates them without an explicit
+purge.
+
+Usage:
+    from adapters.index_generation import queue_index_generation_bump
+
+    write_pipe = redis.pipeline()
+    ...  # JSON.SET calls
+    queue_index_generation_bump(write_pipe)
+    await write_pipe.execute()
+"""
+
+from typing import Any
+
+INDEX_GENERATION_KEY = "search:index_generation"
+
+
+def queue_index_generation_bump(pipe: Any) -> None:
+    """Queue an INCR of the generation counter on a write pipeline.
+
+    Rides the same round trip as the writes it follows.
+    """
+    pipe.incr(INDEX_GENERATION_KEY)
+
+
+async def get_index_generation(redis: Any) -> int:
+    """Return the current index generation (0 if never bumped)."""
+    value = await redis.get(INDEX_GENERATION_KEY)
+    return int(value) if value else 0
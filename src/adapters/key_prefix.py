@@ -0,0 +1,88 @@
+"""
+Live key prefixes for indexes rebuilt by the bulk loader.
+
+A bulk rebuild (``adapters.bulk_index_loader``) writes a fresh generation of
+documents under a new key prefix (``book_g20261016120000:``) and then swaps
+the index alias over to it.  Code that reads or writes documents by key
+resolves the base prefix (``book:``) to the live one first; until an index
+has been bulk-loaded the base prefix is returned unchanged.
+
+The mapping lives in one Redis hash and is cached per process for
+``KEY_PREFIX_CACHE_SECONDS`` (default 30).  The bulk loader waits longer
+than that before deleting the previous generation.
+
+Usage:
+    from adapters.key_prefix import resolve_key_prefix
+
+    prefix = await resolve_key_prefix(redis, "book:")
+    doc = await redis.json().get(f"{prefix}{mc_id}")
+
+    key = await resolve_document_key(redis, "book:", "book:openlibrary_book_OL1W")
+"""
+
+import os
+import re
+import time
+from typing import Any
+
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+KEY_PREFIXES_KEY = "search:key_prefixes"
+KEY_PREFIX_CACHE_SECONDS = float(os.getenv("KEY_PREFIX_CACHE_SECONDS", "30"))
+
+# base prefix -> (live prefix, expires at monotonic time)
+_cache: dict[str, tuple[str, float]] = {}
+
+# Prefix of a bulk-loaded generation, see bulk_index_loader.new_generation
+_GENERATION_PREFIX = re.compile(r"^[a-z]+_g\d{14}:")
+
+
+async def resolve_key_prefix(redis: Any, base_prefix: str) -> str:
+    """Return the key prefix currently holding documents for ``base_prefix``."""
+    cached = _cache.get(base_prefix)
+    now = time.monotonic()
+    if cached and cached[1] > now:
+        return cached[0]
+    try:
+        live = await redis.hget(KEY_PREFIXES_KEY, base_prefix)
+    except Exception as e:
+        logger.warning(f"Could not resolve key prefix for {base_prefix!r}: {e}")
+        return base_prefix
+    if isinstance(live, bytes):
+        live = live.decode()
+    prefix = live if isinstance(live, str) and live else base_prefix
+    _cache[base_prefix] = (prefix, now + KEY_PREFIX_CACHE_SECONDS)
+    return prefix
+
+
+async def resolve_document_key(redis: Any, base_prefix: str, doc_id: str) -> str:
+    """Return the live key for ``doc_id``, given bare or with ``base_prefix``.
+
+    Keys that already carry a generation prefix (``book_g20261016120000:``)
+    are returned unchanged.
+    """
+    if _GENERATION_PREFIX.match(doc_id):
+        return doc_id
+    prefix = await resolve_key_prefix(redis, base_prefix)
+    return f"{prefix}{doc_id.removeprefix(base_prefix)}"
+
+
+async def is_bulk_loaded(redis: Any, base_prefix: str) -> bool:
+    """True once a bulk rebuild has moved ``base_prefix`` documents elsewhere.
+
+    Code that scans or indexes the base prefix directly (migration scripts,
+    ``FT.CREATE`` over ``book:``) must not run against such an index.
+    """
+    return await resolve_key_prefix(redis, base_prefix) != base_prefix
+
+
+def queue_key_prefix_update(pipe: Any, base_prefix: str, live_prefix: str) -> None:
+    """Queue the mapping update on a (transactional) pipeline."""
+    pipe.hset(KEY_PREFIXES_KEY, base_prefix, live_prefix)
+
+
+def clear_key_prefix_cache() -> None:
+    """Forget cached prefixes (tests, or right after a swap in this process)."""
+    _cache.clear()
@@ -12,6 +12,7 @@ import google.auth.transport.requests
 import google.oauth2.id_token
 import httpx
 
+from core.microgenres import MICROGENRE_VECTOR_FIELD
 from utils.get_logger import get_logger
 
 logger = get_logger(__name__)
@@ -234,11 +235,15 @@ class MediaManagerClient:
         When *metadata_only* is True the Media Manager worker updates only
         the stored FAISS metadata, skipping wiki/LLM/embedding work.
         Documents not already in the index fall through to the full pipeline.
+        ``microgenre_vector`` is only used by the local KNN index and is not sent.
         """
         if len(documents) > 100:
             raise ValueError("Batch size must not exceed 100 documents")
 
-        body: dict[str, Any] = {"documents": documents, "dry_run": dry_run}
+        outgoing = [
+            {k: v for k, v in doc.items() if k != MICROGENRE_VECTOR_FIELD} for doc in documents
+        ]
+        body: dict[str, Any] = {"documents": outgoing, "dry_run": dry_run}
         if metadata_only:
             body["metadata_only"] = True
 
@@ -0,0 +1,271 @@
+"""
+Near Cache - Invalidation-driven in-process cache of Redis JSON documents.
+
+``get_details`` and ``get_details_batch`` read the same popular documents
+over and over.  With the near cache enabled those reads are answered from
+a bounded in-process LRU instead of a JSON.GET/JSON.MGET round trip.
+Redis server-assisted client tracking in broadcast mode
+(``CLIENT TRACKING ON BCAST PREFIX media PREFIX person ...``) announces
+every write to a tracked key prefix, and the affected entries are evicted
+as soon as the announcement arrives, so ETL writes show up without waiting
+for a TTL.
+
+One dedicated connection per process runs the tracking: it redirects
+invalidations to itself and subscribes to ``__redis__:invalidate``, which
+works over the same RESP2 connections the rest of the app uses.  While
+that connection is down the cache is emptied and bypassed (reads go
+straight to Redis) until tracking is re-established.  Entries also expire
+after ``NEAR_CACHE_TTL_SECONDS`` as a backstop.
+
+A key that is invalidated while it is being fetched is not stored, so a
+read racing an ETL write cannot pin the old document in the cache.
+Entries are kept as JSON text and decoded per hit, so callers can mutate
+the documents they get back.
+
+Usage:
+    from adapters.redis_manager import RedisManager
+
+    near_cache = RedisManager.get_near_cache()  # None unless NEAR_CACHE_ENABLED
+    if near_cache is not None:
+        docs = await near_cache.get_json_many(["media:tmdb_movie_603"])
+
+Tuning (environment variables):
+    NEAR_CACHE_ENABLED       Serve detail reads from the near cache (default: false)
+    NEAR_CACHE_MAX_ENTRIES   LRU capacity in documents (default: 20000)
+    NEAR_CACHE_TTL_SECONDS   Backstop lifetime of an entry (default: 300)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from redis.asyncio import Redis
+
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+NEAR_CACHE_ENABLED = os.getenv("NEAR_CACHE_ENABLED", "false").lower() in ("true", "1", "yes")
+NEAR_CACHE_MAX_ENTRIES = int(os.getenv("NEAR_CACHE_MAX_ENTRIES", "20000"))
+NEAR_CACHE_TTL_SECONDS = float(os.getenv("NEAR_CACHE_TTL_SECONDS", "300"))
+
+# Tracked key prefixes.  No trailing colon, so bulk-load generations
+# (e.g. "book_g20260101:") are tracked as well.
+NEAR_CACHE_PREFIXES = ("media", "person", "podcast", "book", "author")
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+_HEALTH_CHECK_SECONDS = 15.0
+_MAX_RECONNECT_DELAY = 30.0
+
+
+def unwrap_json_mget(raw: list[Any]) -> list[dict[str, Any] | None]:
+    """Turn a ``JSON.MGET keys $`` reply into one document (or None) per key."""
+    docs: list[dict[str, Any] | None] = []
+    for item in raw:
+        if isinstance(item, list):
+            item = item[0] if item else None
+        docs.append(item if isinstance(item, dict) else None)
+    return docs
+
+
+class NearCache:
+    """Bounded LRU of JSON documents kept coherent by client-tracking invalidations."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        max_entries: int = NEAR_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = NEAR_CACHE_TTL_SECONDS,
+        prefixes: Iterable[str] = NEAR_CACHE_PREFIXES,
+    ) -> None:
+        self._redis = redis
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.prefixes = tuple(prefixes)
+        # key -> (JSON text, monotonic expiry)
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        # keys being fetched -> number of fetches; invalidated ones go in _stale
+        self._inflight: dict[str, int] = {}
+        self._stale: set[str] = set()
+        self._ready = False
+        self._reconnected = False
+        self._task: asyncio.Task[None] | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.resets = 0
+
+    @property
+    def ready(self) -> bool:
+        """True while invalidations are being received (the cache is in use)."""
+        return self._ready
+
+    def start(self) -> None:
+        """Start the invalidation listener (idempotent; needs a running event loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the listener and drop every entry."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._reset()
+
+    async def get_json(self, key: str) -> dict[str, Any] | None:
+        """The JSON document at ``key``, or None when it does not exist."""
+        docs = await self.get_json_many([key])
+        return docs[0]
+
+    async def get_json_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        The JSON documents at ``keys`` (None where missing), in order.
+
+        Cached documents are served locally; the rest come from one
+        JSON.MGET and are cached unless invalidated meanwhile.
+        """
+        if not self._ready:
+            return unwrap_json_mget(await self._redis.json().mget(keys, "$"))
+
+        results: list[dict[str, Any] | None] = [None] * len(keys)
+        missing: list[int] = []
+        now = time.monotonic()
+        for i, key in enumerate(keys):
+            item = self._entries.get(key)
+            if item is not None and item[1] > now:
+                self._entries.move_to_end(key)
+                results[i] = json.loads(item[0])
+                self.hits += 1
+                continue
+            if item is not None:
+                del self._entries[key]
+            missing.append(i)
+        self.misses += len(missing)
+        if not missing:
+            return results
+
+        fetch_keys = [keys[i] for i in missing]
+        for key in fetch_keys:
+            self._inflight[key] = self._inflight.get(key, 0) + 1
+        try:
+            fetched = unwrap_json_mget(await self._redis.json().mget(fetch_keys, "$"))
+            expires_at = time.monotonic() + self.ttl_seconds
+            for i, key, doc in zip(missing, fetch_keys, fetched, strict=True):
+                results[i] = doc
+                if doc is not None and self._ready and key not in self._stale:
+                    self._put(key, json.dumps(doc, separators=(",", ":")), expires_at)
+        finally:
+            for key in fetch_keys:
+                remaining = self._inflight[key] - 1
+                if remaining:
+                    self._inflight[key] = remaining
+                else:
+                    del self._inflight[key]
+                    self._stale.discard(key)
+        return results
+
+    def _put(self, key: str, text: str, expires_at: float) -> None:
+        self._entries[key] = (text, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, keys: Iterable[str] | None) -> None:
+        """Evict ``keys``; None (a server-side flush) evicts everything."""
+        if keys is None:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._stale.update(self._inflight)
+            return
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+            if key in self._inflight:
+                self._stale.add(key)
+
+    def _reset(self) -> None:
+        # Invalidations may have been missed: forget everything, cache nothing in flight
+        self._ready = False
+        self._entries.clear()
+        self._stale.update(self._inflight)
+        self.resets += 1
+
+    def _on_reconnect(self, connection: Any) -> None:
+        # redis-py silently reconnects pub/sub connections, which drops tracking
+        self._reconnected = True
+        self._reset()
+
+    async def _subscribe(self, pubsub: Any) -> None:
+        await pubsub.connect()
+        connection = pubsub.connection
+        await connection.send_command("CLIENT", "ID")
+        client_id = await connection.read_response()
+        args: list[Any] = ["CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST"]
+        for prefix in self.prefixes:
+            args += ["PREFIX", prefix]
+        await connection.send_command(*args)
+        await connection.read_response()
+        self._reconnected = False
+        connection.register_connect_callback(self._on_reconnect)
+        await pubsub.subscribe(INVALIDATE_CHANNEL)
+        self._ready = True
+        logger.info(f"Near cache tracking {', '.join(self.prefixes)} (client {client_id})")
+
+    async def _listen(self, pubsub: Any) -> None:
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=_HEALTH_CHECK_SECONDS
+            )
+            if self._reconnected:
+                raise ConnectionError("invalidation connection was re-established")
+            if message is None:
+                await pubsub.ping()
+                continue
+            if message.get("type") == "message":
+                self.invalidate(message.get("data"))
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            pubsub: Any = self._redis.pubsub()
+            try:
+                await self._subscribe(pubsub)
+                delay = 1.0
+                await self._listen(pubsub)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Near cache invalidation listener failed, bypassing cache: {e}")
+            finally:
+                self._reset()
+                if pubsub.connection is not None:
+                    # The connection goes back to the shared pool
+                    pubsub.connection.deregister_connect_callback(self._on_reconnect)
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RECONNECT_DELAY)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ready": self._ready,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "resets": self.resets,
+        }
@@ -2,14 +2,19 @@
 Redis connection manager supporting multiple environments.
 
 Allows switching between local and public Redis instances at runtime.
+Each environment can also carry an opt-in near cache for JSON documents
+(see ``adapters.near_cache``).
 """
 
+import asyncio
 import os
 from dataclasses import dataclass
 from enum import Enum
 
 from redis.asyncio import ConnectionPool, Redis
 
+from adapters.near_cache import NEAR_CACHE_ENABLED, NearCache
+
 
 class RedisEnvironment(str, Enum):
     LOCAL = "local"
@@ -42,6 +47,7 @@ class RedisManager:
     _instance = None
     _current_env: RedisEnvironment = _default_redis_env()
     _connections: dict[RedisEnvironment, Redis] = {}
+    _near_caches: dict[RedisEnvironment, NearCache] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -81,6 +87,13 @@ class RedisManager:
         cls._current_env = env
         # Clear cached connections when switching
         cls._connections.clear()
+        near_caches = list(cls._near_caches.values())
+        cls._near_caches.clear()
+        for near_cache in near_caches:
+            try:
+                asyncio.get_running_loop().create_task(near_cache.close())
+            except RuntimeError:
+                pass
 
     @classmethod
     def get_redis(cls, env: RedisEnvironment | None = None) -> Redis:
@@ -103,6 +116,40 @@ class RedisManager:
 
         return cls._connections[env]
 
+    @classmethod
+    def get_near_cache(cls, env: RedisEnvironment | None = None) -> NearCache | None:
+        """
+        Get the near cache for the specified or current environment.
+
+        Returns None unless NEAR_CACHE_ENABLED is set.  The invalidation
+        listener starts on first use, so call this from a running event loop.
+        """
+        if not NEAR_CACHE_ENABLED:
+            return None
+        if env is None:
+            env = cls._current_env
+
+        near_cache = cls._near_caches.get(env)
+        if near_cache is None:
+            near_cache = NearCache(cls.get_redis(env))
+            cls._near_caches[env] = near_cache
+        near_cache.start()
+        return near_cache
+
+    @classmethod
+    def near_cache_stats(cls) -> dict | None:
+        """Near cache counters for the current environment, or None when disabled."""
+        near_cache = cls._near_caches.get(cls._current_env)
+        return near_cache.stats() if near_cache is not None else None
+
+    @classmethod
+    async def close_near_caches(cls) -> None:
+        """Stop every near cache listener (application shutdown)."""
+        near_caches = list(cls._near_caches.values())
+        cls._near_caches.clear()
+        for near_cache in near_caches:
+            await near_cache.close()
+
     @classmethod
     async def test_connection(cls, env: RedisEnvironment) -> dict:
         """Test connection to a Redis environment."""
@@ -1,8 +1,16 @@
+import time
+from dataclasses import dataclass
 from typing import Any
 
+from redis.client import NEVER_DECODE
+from redis.commands.search.document import Document
 from redis.commands.search.query import Query
 
-from .redis_client import get_redis
+from core.microgenres import drop_microgenre_vector
+
+from .document_patch import queue_document_patch
+from .near_cache import unwrap_json_mget
+from .redis_client import RedisManager, get_redis
 
 _SOURCE_INDEX_ATTR: dict[str, str] = {
     "tv": "idx",
@@ -13,6 +21,122 @@ _SOURCE_INDEX_ATTR: dict[str, str] = {
     "book": "book_idx",
 }
 
+_SEARCH_CMD = "FT.SEARCH"
+_AGGREGATE_CMD = "FT.AGGREGATE"
+_AGGREGATE_DIALECT = 2  # Same dialect redis-py uses for FT.SEARCH
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """One FT.SEARCH request for :meth:`RedisRepository.search_many`.
+
+    Attributes:
+        key: Name the result is returned under (e.g. "tv_media", "person").
+        source: Logical source name used to pick the index (see _SOURCE_INDEX_ATTR).
+        query_str: Redis Search query string.
+        limit: Maximum results to return.
+        sort_by: Field to sort by, or None for query relevance.
+        sort_asc: Sort ascending if True, descending if False.
+        scorer: Optional scoring function (e.g. "BM25" for books).
+        fields: JSON fields to project via RETURN; empty returns full documents.
+        rank_expr: Optional APPLY expression.  When set the spec runs as
+            FT.AGGREGATE, ordered by the expression (ascending), then
+            ``rank_sort_by`` and ``sort_by``, and loads JSON (full, or
+            ``fields`` only) for just the top ``limit`` rows.
+        rank_fields: Non-sortable fields ``rank_expr`` reads, LOADed before APPLY.
+        rank_json_fields: JSON array fields ``rank_expr`` reads, LOADed
+            serialized as ``<name>_json``.
+        rank_sort_by: Sortable fields ordered descending between the
+            expression and ``sort_by``.
+    """
+
+    key: str
+    source: str
+    query_str: str
+    limit: int = 10
+    sort_by: str | None = "popularity"
+    sort_asc: bool = False
+    scorer: str | None = None
+    fields: tuple[str, ...] = ()
+    rank_expr: str | None = None
+    rank_fields: tuple[str, ...] = ()
+    rank_json_fields: tuple[str, ...] = ()
+    rank_sort_by: tuple[str, ...] = ()
+
+    def to_query(self) -> Query:
+        """Build the redis-py Query object for this spec."""
+        query = Query(self.query_str).paging(0, self.limit)
+        if self.scorer:
+            query = query.scorer(self.scorer)
+        for name in self.fields:
+            query.return_field(f"$.{name}", as_field=name)
+        if self.sort_by:
+            query = query.sort_by(self.sort_by, asc=self.sort_asc)
+        return query
+
+    def to_aggregate_args(self, index_name: str) -> list[str | int]:
+        """Build FT.AGGREGATE arguments for a ranked (``rank_expr``) spec.
+
+        The full ``$`` document (or the ``fields`` projection) is LOADed after
+        SORTBY ... MAX so Redis only serializes JSON for the rows that are
+        actually returned.  Projected fields already LOADed as ``rank_fields``
+        are not loaded twice.
+        """
+        args: list[str | int] = [index_name, self.query_str]
+        rank_loads = [f"@{name}" for name in self.rank_fields]
+        for name in self.rank_json_fields:
+            rank_loads += [f"$.{name}", "AS", f"{name}_json"]
+        if rank_loads:
+            args += ["LOAD", len(rank_loads), *rank_loads]
+        args += ["APPLY", self.rank_expr or "0", "AS", "rank"]
+        sort_args = ["@rank", "ASC"]
+        for name in self.rank_sort_by:
+            sort_args += [f"@{name}", "DESC"]
+        if self.sort_by:
+            sort_args += [f"@{self.sort_by}", "ASC" if self.sort_asc else "DESC"]
+        args += ["SORTBY", len(sort_args), *sort_args, "MAX", self.limit]
+        if self.fields:
+            loads = ["@__key"]
+            for name in self.fields:
+                if name not in self.rank_fields:
+                    loads += [f"$.{name}", "AS", name]
+            args += ["LOAD", len(loads), *loads]
+        else:
+            args += ["LOAD", 4, "@__key", "$", "AS", "json"]
+        args += ["DIALECT", _AGGREGATE_DIALECT]
+        return args
+
+
+@dataclass
+class RankedResult:
+    """FT.AGGREGATE rows shaped like an FT.SEARCH ``Result`` (``total`` and ``docs``)."""
+
+    total: int
+    docs: list[Document]
+
+
+def _parse_ranked_rows(raw: Any, fields: tuple[str, ...] = ()) -> RankedResult:
+    """Turn a RESP2 or RESP3 FT.AGGREGATE reply into a :class:`RankedResult`.
+
+    With ``fields`` the documents carry one attribute per projected field,
+    like an FT.SEARCH ``RETURN`` result; otherwise a single ``json`` attribute.
+    """
+    if isinstance(raw, dict):
+        total = int(raw.get("total_results", 0))
+        rows = [row.get("extra_attributes", {}) for row in raw.get("results", [])]
+    else:
+        total = int(raw[0]) if raw else 0
+        rows = [dict(zip(row[::2], row[1::2], strict=True)) for row in raw[1:]]
+
+    if fields:
+        docs = [
+            Document(row.get("__key", ""), **{name: row[name] for name in fields if name in row})
+            for row in rows
+        ]
+    else:
+        docs = [Document(row.get("__key", ""), json=row.get("json")) for row in rows]
+    return RankedResult(total=total, docs=docs)
+
 
 class RedisRepository:
     def __init__(self):
@@ -216,9 +340,124 @@ class RedisRepository:
 
         return await idx.search(query)
 
+    async def search_similar(
+        self,
+        query_str: str,
+        vector: bytes,
+        fields: list[str],
+        limit: int = 10,
+        score_field: str = "vector_distance",
+    ) -> Any:
+        """
+        Run a KNN query against the media index, nearest first.
+
+        Args:
+            query_str: KNN query from ``core.search_queries.build_knn_query``.
+            vector: Packed FLOAT32 query vector, bound to ``$vec``.
+            fields: JSON field names to return alongside ``score_field``.
+            limit: Maximum results to return (should equal the query's K).
+            score_field: Distance alias used in ``query_str``.
+        """
+        query = Query(query_str).paging(0, limit).sort_by(score_field, asc=True).dialect(2)
+        for field in fields:
+            query.return_field(f"$.{field}", as_field=field)
+        query.return_field(score_field)
+        return await self.idx.search(query, query_params={"vec": vector})
+
+    async def search_many(self, specs: list[SearchSpec]) -> dict[str, Any]:
+        """
+        Run several FT.SEARCH commands in one non-transactional pipeline.
+
+        Every spec is sent in a single round trip on a single pooled
+        connection, instead of one connection and RTT per source.  Results
+        are parsed exactly like :meth:`search` so callers can treat them
+        interchangeably.  Specs with a ``rank_expr`` run as FT.AGGREGATE in
+        the same pipeline and come back as :class:`RankedResult`.
+
+        Args:
+            specs: Searches to run; each ``spec.key`` must be unique.
+
+        Returns:
+            Dict keyed by ``spec.key``.  A failed command yields its exception
+            object in place of a result so one bad query never sinks the batch.
+        """
+        if not specs:
+            return {}
+
+        pipe = self.redis.pipeline(transaction=False)
+        queued: list[tuple[SearchSpec, Any, Query | None]] = []
+        for spec in specs:
+            attr = _SOURCE_INDEX_ATTR.get(spec.source)
+            if attr is None:
+                raise ValueError(f"Unknown source for batched search: {spec.source}")
+            idx = getattr(self, attr)
+            if spec.rank_expr:
+                pipe.execute_command(_AGGREGATE_CMD, *spec.to_aggregate_args(idx.index_name))
+                queued.append((spec, idx, None))
+                continue
+            args, query = idx._mk_query_args(spec.to_query(), query_params=None)
+            pipe.execute_command(_SEARCH_CMD, *args, **{NEVER_DECODE: True})
+            queued.append((spec, idx, query))
+
+        start = time.monotonic()
+        raw_results = await pipe.execute(raise_on_error=False)
+        duration_ms = (time.monotonic() - start) * 1000.0
+
+        results: dict[str, Any] = {}
+        for (spec, idx, query), raw in zip(queued, raw_results, strict=True):
+            if isinstance(raw, Exception):
+                results[spec.key] = raw
+                continue
+            try:
+                if query is None:
+                    results[spec.key] = _parse_ranked_rows(raw, spec.fields)
+                else:
+                    results[spec.key] = idx._parse_results(
+                        _SEARCH_CMD, raw, query=query, duration=duration_ms
+                    )
+            except Exception as e:
+                results[spec.key] = e
+        return results
+
+    async def get_document(self, key: str) -> dict[str, Any] | None:
+        """Read one JSON document (None when missing), via the near cache when enabled."""
+        docs = await self.get_documents([key])
+        return docs[0]
+
+    async def get_documents(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Read JSON documents in one round trip, via the near cache when enabled.
+
+        ``microgenre_vector`` is dropped: it is only used server-side.
+
+        Returns:
+            One document per key, in order; None where the key does not exist.
+        """
+        near_cache = RedisManager.get_near_cache()
+        docs: list[dict[str, Any] | None]
+        if near_cache is not None:
+            docs = await near_cache.get_json_many(keys)
+        else:
+            docs = unwrap_json_mget(await self.redis.json().mget(keys, "$"))  # type: ignore[misc]
+        for doc in docs:
+            if doc is not None:
+                drop_microgenre_vector(doc)
+        return docs
+
     async def set_document(self, key: str, value: dict) -> None:
         await self.redis.json().set(key, "$", value)  # type: ignore[misc]
 
+    async def patch_document(self, key: str, old: dict | None, new: dict) -> dict[str, Any]:
+        """Update ``key`` from ``old`` to ``new`` sending only the changed fields.
+
+        Returns the applied patch (empty when nothing changed).
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        patch = queue_document_patch(pipe, key, old, new)
+        if patch:
+            await pipe.execute()
+        return patch
+
     async def stats(self):
         info = await self.redis.info()
         dbsize = await self.redis.dbsize()
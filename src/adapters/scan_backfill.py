@@ -0,0 +1,396 @@
+"""
+Scan Backfill - Shared engine for SCAN → JSON.MGET → transform → patch backfills.
+
+A backfill supplies only a transform ``(key, doc) -> new_doc | None``; the
+engine handles everything else:
+
+- One SCAN walks the keyspace and hands pages to a bounded queue; N worker
+  tasks split the pages into ``JSON.MGET`` batches, run the transform and
+  write the minimal patches (``adapters.document_patch``) in one pipeline
+  per batch.
+- The SCAN cursor is checkpointed to disk once every page before it has
+  been written, so ``--resume`` continues where a crashed run stopped.
+- Workers slow down when Redis round trips exceed the target latency and
+  speed back up when it recovers (multiplicative back-off, halving decay).
+- Dry runs execute the transform and count would-be updates without writing.
+- A changed document that carries a loader content fingerprint
+  (``_content_hash``) gets it recomputed, so it keeps describing the
+  stored document.
+- Progress and keys/sec are logged periodically.
+
+Usage:
+    from adapters.scan_backfill import (
+        add_backfill_arguments,
+        backfill_config_from_args,
+        run_backfill,
+    )
+
+    def transform(key: str, doc: dict) -> dict | None:
+        if doc.get("title_compact"):
+            return None
+        doc["title_compact"] = compact_title(doc["title"])
+        return doc
+
+    stats = await run_backfill(redis, transform, backfill_config_from_args(args, "media:*"))
+
+Tuning flags added by ``add_backfill_arguments``: --workers, --batch-size,
+--scan-count, --target-latency-ms, --limit, --dry-run, --checkpoint, --resume.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import inspect
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from adapters.document_patch import compute_merge_patch, queue_document_patch
+from adapters.index_generation import queue_index_generation_bump
+from core.normalize import CONTENT_HASH_FIELD, compute_content_hash
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+Transform = Callable[
+    [str, dict[str, Any]], dict[str, Any] | None | Awaitable[dict[str, Any] | None]
+]
+
+# Sentinel telling a worker the scan is exhausted
+_DONE = object()
+
+
+@dataclass
+class BackfillConfig:
+    """How a backfill scans, batches, throttles and checkpoints."""
+
+    match: str
+    workers: int = 4
+    batch_size: int = 200
+    scan_count: int = 1000
+    target_latency_ms: float = 50.0
+    max_throttle_seconds: float = 2.0
+    limit: int = 0
+    dry_run: bool = False
+    checkpoint_path: Path | None = None
+    resume: bool = False
+    bump_index_generation: bool = True
+    progress_interval_seconds: float = 10.0
+    dry_run_samples: int = 5
+
+
+@dataclass
+class BackfillStats:
+    """Counters for one backfill run."""
+
+    scanned: int = 0
+    processed: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    missing: int = 0
+    errors: int = 0
+    throttled_seconds: float = 0.0
+    resumed_cursor: int = 0
+    elapsed_seconds: float = 0.0
+    error_messages: list[str] = field(default_factory=list)
+
+    @property
+    def keys_per_second(self) -> float:
+        if self.elapsed_seconds > 0:
+            return self.processed / self.elapsed_seconds
+        return 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["error_messages"] = self.error_messages[:10]
+        data["keys_per_second"] = round(self.keys_per_second, 1)
+        return data
+
+    def log_summary(self, title: str, dry_run: bool) -> None:
+        mode = "[DRY RUN] " if dry_run else ""
+        logger.info("=" * 60)
+        logger.info(f"{mode}{title} Summary")
+        logger.info("=" * 60)
+        logger.info(f"  Scanned:    {self.scanned:,}")
+        logger.info(f"  Processed:  {self.processed:,}")
+        logger.info(f"  {'Would update' if dry_run else 'Updated'}: {self.updated:,}")
+        logger.info(f"  Unchanged:  {self.unchanged:,}")
+        logger.info(f"  Missing:    {self.missing:,}")
+        logger.info(f"  Errors:     {self.errors:,}")
+        logger.info(f"  Throttled:  {self.throttled_seconds:.1f}s")
+        logger.info(
+            f"  Duration:   {self.elapsed_seconds:.1f}s ({self.keys_per_second:,.0f} keys/sec)"
+        )
+        for message in self.error_messages[:5]:
+            logger.info(f"    {message}")
+
+
+class _LatencyThrottle:
+    """Shared delay that grows while Redis is slower than the target."""
+
+    def __init__(self, target_ms: float, max_delay: float) -> None:
+        self.target_ms = target_ms
+        self.max_delay = max_delay
+        self.delay = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        if self.target_ms <= 0:
+            return
+        if latency_ms > self.target_ms:
+            self.delay = min(self.max_delay, max(self.delay * 2, 0.01))
+        else:
+            self.delay = self.delay / 2 if self.delay > 0.002 else 0.0
+
+    async def wait(self, stats: BackfillStats) -> None:
+        if self.delay > 0:
+            stats.throttled_seconds += self.delay
+            await asyncio.sleep(self.delay)
+
+
+def _read_checkpoint(path: Path, match: str) -> int:
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return 0
+    if data.get("match") != match:
+        logger.warning(f"Checkpoint {path} is for match={data.get('match')!r}; starting over")
+        return 0
+    return int(data.get("cursor", 0))
+
+
+def _write_checkpoint(path: Path, match: str, cursor: int, stats: BackfillStats) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps({"match": match, "cursor": cursor, "updated_at": time.time(), **stats.to_dict()})
+    )
+    os.replace(tmp_path, path)
+
+
+async def run_backfill(
+    redis: Any,
+    transform: Transform,
+    config: BackfillConfig,
+) -> BackfillStats:
+    """
+    Apply ``transform`` to every JSON document matching ``config.match``.
+
+    Args:
+        redis: Async Redis client created with ``decode_responses=True``.
+        transform: Receives ``(key, doc)`` with a private copy of the document
+            and returns the desired document, or None to leave it untouched.
+            May be sync or async.
+        config: Scan, batching, throttling and checkpoint settings.
+
+    Returns:
+        Run statistics (``updated`` counts would-be writes in dry-run mode).
+    """
+    stats = BackfillStats()
+    throttle = _LatencyThrottle(config.target_latency_ms, config.max_throttle_seconds)
+    workers = max(1, config.workers)
+    pages: asyncio.Queue[Any] = asyncio.Queue(maxsize=workers * 2)
+    stop = asyncio.Event()
+
+    start_cursor = 0
+    if config.checkpoint_path is not None and config.resume:
+        start_cursor = _read_checkpoint(config.checkpoint_path, config.match)
+        if start_cursor:
+            stats.resumed_cursor = start_cursor
+            logger.info(f"Resuming {config.match} backfill from cursor {start_cursor}")
+
+    # Page bookkeeping: the checkpoint only advances past fully written pages
+    page_cursors: dict[int, int] = {}
+    finished_pages: set[int] = set()
+    next_checkpoint_page = 0
+    start = time.monotonic()
+    last_progress = start
+
+    def _page_done(page_index: int) -> None:
+        nonlocal next_checkpoint_page
+        finished_pages.add(page_index)
+        cursor = None
+        while next_checkpoint_page in finished_pages:
+            finished_pages.discard(next_checkpoint_page)
+            cursor = page_cursors.pop(next_checkpoint_page)
+            next_checkpoint_page += 1
+        if cursor is not None and config.checkpoint_path is not None and not config.dry_run:
+            _write_checkpoint(config.checkpoint_path, config.match, cursor, stats)
+
+    def _maybe_log_progress() -> None:
+        nonlocal last_progress
+        now = time.monotonic()
+        if now - last_progress < config.progress_interval_seconds:
+            return
+        last_progress = now
+        elapsed = now - start
+        logger.info(
+            f"  {config.match}: scanned={stats.scanned:,} processed={stats.processed:,} "
+            f"updated={stats.updated:,} unchanged={stats.unchanged:,} errors={stats.errors:,} "
+            f"({stats.processed / elapsed if elapsed > 0 else 0:,.0f} keys/sec, "
+            f"throttle={throttle.delay * 1000:.0f}ms)"
+        )
+
+    async def _apply(key: str, doc: dict[str, Any]) -> dict[str, Any] | None:
+        result = transform(key, copy.deepcopy(doc))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _process_batch(keys: list[str]) -> None:
+        await throttle.wait(stats)
+        read_start = time.perf_counter()
+        docs = await redis.json().mget(keys, "$")
+        throttle.observe((time.perf_counter() - read_start) * 1000)
+
+        write_pipe = redis.pipeline(transaction=False)
+        writes = 0
+        for key, raw in zip(keys, docs, strict=True):
+            doc = raw[0] if isinstance(raw, list) and raw else raw
+            if not isinstance(doc, dict):
+                stats.missing += 1
+                continue
+            if config.limit and stats.processed >= config.limit:
+                stop.set()
+                break
+            stats.processed += 1
+            try:
+                new_doc = await _apply(key, doc)
+            except Exception as e:
+                stats.errors += 1
+                if len(stats.error_messages) < 50:
+                    stats.error_messages.append(f"{key}: {e}")
+                continue
+            if new_doc is None:
+                stats.unchanged += 1
+                continue
+            if CONTENT_HASH_FIELD in new_doc and new_doc != doc:
+                new_doc[CONTENT_HASH_FIELD] = compute_content_hash(new_doc)
+            if config.dry_run:
+                patch = compute_merge_patch(doc, new_doc)
+                if patch:
+                    if stats.updated < config.dry_run_samples:
+                        logger.info(f"  [DRY RUN] {key}: {json.dumps(patch, default=str)[:300]}")
+                    stats.updated += 1
+                else:
+                    stats.unchanged += 1
+                continue
+            if queue_document_patch(write_pipe, key, doc, new_doc):
+                writes += 1
+                stats.updated += 1
+            else:
+                stats.unchanged += 1
+
+        if writes:
+            if config.bump_index_generation:
+                queue_index_generation_bump(write_pipe)
+            write_start = time.perf_counter()
+            await write_pipe.execute()
+            throttle.observe((time.perf_counter() - write_start) * 1000)
+
+    async def _scan() -> None:
+        cursor = start_cursor
+        page_index = 0
+        try:
+            while not stop.is_set():
+                cursor, keys = await redis.scan(
+                    cursor=cursor, match=config.match, count=config.scan_count
+                )
+                if keys:
+                    stats.scanned += len(keys)
+                    page_cursors[page_index] = cursor
+                    await pages.put((page_index, list(keys)))
+                    page_index += 1
+                if cursor == 0:
+                    break
+        finally:
+            for _ in range(workers):
+                await pages.put(_DONE)
+
+    async def _work() -> None:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            page_index, keys = item
+            for i in range(0, len(keys), config.batch_size):
+                if stop.is_set():
+                    break
+                await _process_batch(keys[i : i + config.batch_size])
+            if not stop.is_set():
+                _page_done(page_index)
+            _maybe_log_progress()
+
+    logger.info(
+        f"Backfill {config.match}: workers={workers} batch={config.batch_size} "
+        f"scan_count={config.scan_count} target_latency={config.target_latency_ms:.0f}ms "
+        f"dry_run={config.dry_run}"
+    )
+    tasks = [asyncio.create_task(_scan())]
+    tasks.extend(asyncio.create_task(_work()) for _ in range(workers))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        stats.elapsed_seconds = time.monotonic() - start
+
+    # A completed walk leaves nothing to resume
+    completed = not stop.is_set() and not page_cursors
+    if completed and config.checkpoint_path is not None and not config.dry_run:
+        config.checkpoint_path.unlink(missing_ok=True)
+    return stats
+
+
+def add_backfill_arguments(parser: argparse.ArgumentParser, dry_run_flag: bool = True) -> None:
+    """
+    Add the shared engine flags to a backfill script's parser.
+
+    Scripts that default to dry-run behind their own ``--apply`` flag pass
+    ``dry_run_flag=False`` and set ``BackfillConfig.dry_run`` themselves.
+    """
+    group = parser.add_argument_group("backfill engine")
+    group.add_argument("--workers", type=int, default=4, help="Concurrent workers (default: 4)")
+    group.add_argument(
+        "--batch-size", type=int, default=200, help="Keys per JSON.MGET/write batch (default: 200)"
+    )
+    group.add_argument(
+        "--scan-count", type=int, default=1000, help="Redis SCAN page size (default: 1000)"
+    )
+    group.add_argument(
+        "--target-latency-ms",
+        type=float,
+        default=50.0,
+        help="Back off while Redis round trips exceed this (0 disables; default: 50)",
+    )
+    group.add_argument("--limit", type=int, default=0, help="Max documents to process (0 = all)")
+    if dry_run_flag:
+        group.add_argument(
+            "--dry-run", action="store_true", help="Run the transform but write nothing"
+        )
+    group.add_argument("--checkpoint", type=Path, default=None, help="Cursor checkpoint file")
+    group.add_argument("--resume", action="store_true", help="Resume from the --checkpoint cursor")
+
+
+def backfill_config_from_args(args: argparse.Namespace, match: str) -> BackfillConfig:
+    """Build a ``BackfillConfig`` from flags added by ``add_backfill_arguments``."""
+    return BackfillConfig(
+        match=match,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        scan_count=args.scan_count,
+        target_latency_ms=args.target_latency_ms,
+        limit=args.limit,
+        dry_run=getattr(args, "dry_run", False),
+        checkpoint_path=args.checkpoint,
+        resume=args.resume,
+    )
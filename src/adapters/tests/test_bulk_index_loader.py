@@ -0,0 +1,203 @@
+"""
+Unit tests for the bulk index loader's generation load and alias swap.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from adapters.bulk_index_loader import BulkLoadConfig, BulkLoadError, bulk_load_index
+from adapters.key_prefix import (
+    KEY_PREFIXES_KEY,
+    clear_key_prefix_cache,
+    is_bulk_loaded,
+    resolve_document_key,
+    resolve_key_prefix,
+)
+
+
+class _FakeSearch:
+    def __init__(self, redis: "_FakeRedis", name: str) -> None:
+        self.redis = redis
+        self.name = name
+
+    async def info(self) -> dict[str, Any]:
+        target = self.redis.aliases.get(self.name, self.name)
+        if target not in self.redis.indexes:
+            raise Exception("Unknown index name")
+        prefix = self.redis.indexes[target]
+        num_docs = 0 if self.redis.broken_indexing else len(self.redis.keys_with(prefix))
+        return {
+            "index_name": target,
+            "index_definition": ["key_type", "JSON", "prefixes", [prefix]],
+            "num_docs": num_docs,
+            "indexing": 0,
+            "percent_indexed": 1,
+        }
+
+    async def dropindex(self, delete_documents: bool = False) -> None:
+        self.redis.indexes.pop(self.name, None)
+
+
+class _FakeJSON:
+    def __init__(self, redis: "_FakeRedis", queued: list[Any] | None) -> None:
+        self.redis = redis
+        self.queued = queued
+
+    async def mget(self, keys: list[str], path: str) -> list[Any]:
+        field = path.removeprefix("$.")
+        store = self.redis.store
+        return [[store[key][field]] if key in store else None for key in keys]
+
+    def set(self, key: str, path: str, value: dict[str, Any]) -> None:
+        assert self.queued is not None
+        self.queued.append(lambda: self.redis.store.__setitem__(key, dict(value)))
+
+
+class _FakePipe:
+    def __init__(self, redis: "_FakeRedis", transaction: bool) -> None:
+        self.redis = redis
+        self.transaction = transaction
+        self.queued: list[Any] = []
+
+    def json(self) -> _FakeJSON:
+        return _FakeJSON(self.redis, self.queued)
+
+    def execute_command(self, *args: str) -> None:
+        self.queued.append(lambda: self.redis.ft_command(*args))
+        self.redis.commands.append(args)
+
+    def hset(self, key: str, field: str, value: str) -> None:
+        self.queued.append(lambda: self.redis.hashes.setdefault(key, {}).__setitem__(field, value))
+
+    def incr(self, key: str) -> None:
+        pass
+
+    async def execute(self) -> None:
+        for op in self.queued:
+            op()
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, dict[str, Any]] = {}
+        self.indexes: dict[str, str] = {}
+        self.aliases: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.commands: list[tuple[str, ...]] = []
+        self.broken_indexing = False
+
+    def keys_with(self, prefix: str) -> list[str]:
+        return sorted(key for key in self.store if key.startswith(prefix))
+
+    def ft(self, name: str) -> _FakeSearch:
+        return _FakeSearch(self, name)
+
+    def json(self) -> _FakeJSON:
+        return _FakeJSON(self, None)
+
+    def pipeline(self, transaction: bool = True) -> _FakePipe:
+        return _FakePipe(self, transaction)
+
+    def ft_command(self, command: str, *args: str) -> None:
+        if command == "FT.DROPINDEX":
+            self.indexes.pop(args[0])
+        else:
+            self.aliases[args[0]] = args[1]
+
+    async def hget(self, key: str, field: str) -> str | None:
+        return self.hashes.get(key, {}).get(field)
+
+    async def scan(self, cursor: int, match: str, count: int) -> tuple[int, list[str]]:
+        return 0, self.keys_with(match.rstrip("*"))
+
+    async def unlink(self, *keys: str) -> int:
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+async def _create_index(redis: _FakeRedis, index_name: str, key_prefix: str) -> bool:
+    redis.indexes[index_name] = key_prefix
+    return True
+
+
+def _docs(ids: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    return [(doc_id, {"id": doc_id, "title": f"Book {doc_id}"}) for doc_id in ids]
+
+
+def test_first_bulk_load_replaces_plain_index_with_alias() -> None:
+    clear_key_prefix_cache()
+    redis = _FakeRedis()
+    redis.indexes["idx:book"] = "book:"
+    redis.store["book:a"] = {"id": "a", "created_at": 111}
+    redis.store["bookmark:x"] = {"id": "x", "created_at": 1}
+
+    config = BulkLoadConfig(pipelines=3, batch_size=2, grace_seconds=0)
+    stats = asyncio.run(
+        bulk_load_index(
+            redis,
+            _docs(["a", "b", "c", "d", "e"]),
+            alias="idx:book",
+            base_prefix="book:",
+            create_index=_create_index,
+            config=config,
+        )
+    )
+
+    new_prefix = stats.key_prefix
+    assert new_prefix.startswith("book_g")
+    assert stats.loaded == stats.indexed == 5
+    assert stats.previous_index == "idx:book"
+    assert redis.commands == [
+        ("FT.DROPINDEX", "idx:book"),
+        ("FT.ALIASADD", "idx:book", stats.index_name),
+    ]
+    assert redis.store[f"{new_prefix}a"]["created_at"] == 111
+    assert (
+        redis.store[f"{new_prefix}b"]["created_at"] == redis.store[f"{new_prefix}b"]["modified_at"]
+    )
+    assert redis.keys_with("book:") == [], "Old generation is deleted after the grace period"
+    assert "bookmark:x" in redis.store
+    assert redis.hashes[KEY_PREFIXES_KEY] == {"book:": new_prefix}
+    assert asyncio.run(resolve_key_prefix(redis, "book:")) == new_prefix
+
+
+def test_failed_build_leaves_live_alias_untouched() -> None:
+    clear_key_prefix_cache()
+    redis = _FakeRedis()
+    redis.indexes["idx:book:old"] = "book_gold:"
+    redis.aliases["idx:book"] = "idx:book:old"
+    redis.store["book_gold:a"] = {"id": "a", "created_at": 1}
+    redis.broken_indexing = True
+
+    with pytest.raises(BulkLoadError):
+        asyncio.run(
+            bulk_load_index(
+                redis,
+                _docs(["a", "b"]),
+                alias="idx:book",
+                base_prefix="book:",
+                create_index=_create_index,
+                config=BulkLoadConfig(grace_seconds=0),
+            )
+        )
+
+    assert redis.aliases == {"idx:book": "idx:book:old"}
+    assert redis.commands == []
+    assert list(redis.store) == ["book_gold:a"]
+
+
+def test_document_keys_follow_the_live_generation() -> None:
+    clear_key_prefix_cache()
+    redis = _FakeRedis()
+    assert asyncio.run(resolve_document_key(redis, "book:", "ol_1")) == "book:ol_1"
+    assert not asyncio.run(is_bulk_loaded(redis, "book:"))
+
+    clear_key_prefix_cache()
+    live = "book_g20261016120000:"
+    redis.hashes[KEY_PREFIXES_KEY] = {"book:": live}
+    for doc_id in ("ol_1", "book:ol_1", f"{live}ol_1"):
+        assert asyncio.run(resolve_document_key(redis, "book:", doc_id)) == f"{live}ol_1"
+    assert asyncio.run(is_bulk_loaded(redis, "book:"))
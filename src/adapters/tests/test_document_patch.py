@@ -0,0 +1,102 @@
+"""
+Unit tests for minimal JSON document patches.
+"""
+
+from typing import Any
+
+import pytest
+
+from adapters import document_patch
+from adapters.document_patch import compute_merge_patch, queue_document_patch
+
+
+def _apply_merge_patch(doc: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """Reference RFC 7386 application, as JSON.MERGE performs it."""
+    result = dict(doc)
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _apply_merge_patch(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+class _RecordingJSON:
+    def __init__(self, calls: list[tuple[Any, ...]]) -> None:
+        self.calls = calls
+
+    def set(self, key: str, path: str, value: Any) -> None:
+        self.calls.append(("set", key, path, value))
+
+    def merge(self, key: str, path: str, value: Any) -> None:
+        self.calls.append(("merge", key, path, value))
+
+    def delete(self, key: str, path: str) -> None:
+        self.calls.append(("delete", key, path))
+
+
+class _RecordingPipe:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Any, ...]] = []
+
+    def json(self) -> _RecordingJSON:
+        return _RecordingJSON(self.calls)
+
+
+OLD = {
+    "title": "Alien",
+    "popularity": 10.0,
+    "genres": ["Horror"],
+    "watch_providers": {"flatrate": [8], "region": "US"},
+    "rt_audience_score": 94,
+    "modified_at": 1,
+}
+
+
+def test_patch_contains_only_changes_and_round_trips() -> None:
+    new = {
+        "title": "Alien",
+        "popularity": 12.5,
+        "genres": ["Horror", "Science Fiction"],
+        "watch_providers": {"flatrate": [8, 337], "region": "US"},
+        "tagline": None,
+        "modified_at": 2,
+    }
+
+    patch = compute_merge_patch(OLD, new)
+
+    assert patch == {
+        "popularity": 12.5,
+        "genres": ["Horror", "Science Fiction"],
+        "watch_providers": {"flatrate": [8, 337]},
+        "rt_audience_score": None,
+        "modified_at": 2,
+    }
+    expected = {k: v for k, v in new.items() if v is not None}
+    assert _apply_merge_patch(OLD, patch) == expected
+
+
+def test_queue_uses_full_set_for_new_docs_and_nothing_for_unchanged() -> None:
+    pipe = _RecordingPipe()
+
+    queue_document_patch(pipe, "media:1", None, OLD)
+    assert queue_document_patch(pipe, "media:1", OLD, dict(OLD)) == {}
+
+    assert pipe.calls == [("set", "media:1", "$", OLD)]
+
+
+def test_paths_mode_sets_and_deletes_top_level_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(document_patch, "JSON_PATCH_MODE", "paths")
+    pipe = _RecordingPipe()
+    new = {**OLD, "watch_providers": {"flatrate": [], "region": "US"}, "rt score": 1}
+    del new["rt_audience_score"]
+
+    queue_document_patch(pipe, "media:1", OLD, new)
+
+    assert pipe.calls == [
+        ("set", "media:1", "$.watch_providers", {"flatrate": [], "region": "US"}),
+        ("set", "media:1", '$["rt score"]', 1),
+        ("delete", "media:1", "$.rt_audience_score"),
+    ]
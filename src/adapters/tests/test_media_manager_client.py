@@ -0,0 +1,31 @@
+"""
+Unit tests for the Media Manager insert-docs payload.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+
+from adapters.media_manager_client import MediaManagerClient
+
+
+def test_insert_docs_does_not_send_microgenre_vector() -> None:
+    sent: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={"queued": 1, "skipped": 0, "queue_depth": 1})
+
+    client = MediaManagerClient(base_url="http://mm.test", token="secret")
+    client._client = httpx.AsyncClient(
+        base_url="http://mm.test", transport=httpx.MockTransport(handler)
+    )
+    doc = {"id": "tmdb_movie_1", "microgenres": {"x": 1}, "microgenre_vector": [1.0, 0.0]}
+
+    response = asyncio.run(client.insert_docs([doc]))
+
+    assert response["queued"] == 1
+    assert sent[0]["documents"] == [{"id": "tmdb_movie_1", "microgenres": {"x": 1}}]
+    assert doc["microgenre_vector"] == [1.0, 0.0]
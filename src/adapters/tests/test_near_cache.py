@@ -0,0 +1,170 @@
+"""
+Unit tests for the invalidation-driven near cache.
+"""
+
+import asyncio
+from typing import Any
+
+from adapters.near_cache import INVALIDATE_CHANNEL, NEAR_CACHE_PREFIXES, NearCache
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.commands: list[tuple[Any, ...]] = []
+        self.callbacks: list[Any] = []
+
+    async def send_command(self, *args: Any) -> None:
+        self.commands.append(args)
+
+    async def read_response(self) -> Any:
+        return 7 if self.commands[-1] == ("CLIENT", "ID") else "OK"
+
+    def register_connect_callback(self, callback: Any) -> None:
+        self.callbacks.append(callback)
+
+    def deregister_connect_callback(self, callback: Any) -> None:
+        self.callbacks.remove(callback)
+
+
+class _FakePubSub:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self.redis = redis
+        self.connection: _FakeConnection | None = None
+
+    async def connect(self) -> None:
+        self.connection = self.redis.connection
+
+    async def subscribe(self, channel: str) -> None:
+        self.redis.subscribed = channel
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float) -> Any:
+        try:
+            return await asyncio.wait_for(self.redis.messages.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def ping(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.connection = None
+
+
+class _FakeJSON:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self.redis = redis
+
+    async def mget(self, keys: list[str], path: str) -> list[Any]:
+        self.redis.mget_calls.append(list(keys))
+        await self.redis.mget_gate.wait()
+        return [[dict(self.redis.store[key])] if key in self.redis.store else None for key in keys]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, dict[str, Any]] = {
+            "media:a": {"title": "A"},
+            "media:b": {"title": "B"},
+        }
+        self.connection = _FakeConnection()
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.mget_calls: list[list[str]] = []
+        self.mget_gate = asyncio.Event()
+        self.mget_gate.set()
+        self.subscribed: str | None = None
+
+    def json(self) -> _FakeJSON:
+        return _FakeJSON(self)
+
+    def pubsub(self) -> _FakePubSub:
+        return _FakePubSub(self)
+
+    def publish_invalidation(self, keys: list[str] | None) -> None:
+        self.messages.put_nowait({"type": "message", "channel": INVALIDATE_CHANNEL, "data": keys})
+
+
+async def _started(redis: _FakeRedis, **kwargs: Any) -> NearCache:
+    cache = NearCache(redis, **kwargs)  # type: ignore[arg-type]
+    cache.start()
+    for _ in range(100):
+        if cache.ready:
+            return cache
+        await asyncio.sleep(0)
+    raise AssertionError("near cache never became ready")
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_hits_are_local_until_a_write_invalidates_the_key() -> None:
+    async def scenario() -> None:
+        redis = _FakeRedis()
+        cache = await _started(redis)
+        assert redis.subscribed == INVALIDATE_CHANNEL
+        tracking = next(c for c in redis.connection.commands if c[:2] == ("CLIENT", "TRACKING"))
+        assert tracking[2:6] == ("ON", "REDIRECT", 7, "BCAST"), "Invalidations redirect to itself"
+        assert tracking[6:] == tuple(x for p in NEAR_CACHE_PREFIXES for x in ("PREFIX", p))
+
+        assert await cache.get_json_many(["media:a", "media:missing"]) == [{"title": "A"}, None]
+        first = await cache.get_json("media:a")
+        assert first == {"title": "A"}
+        first["title"] = "mutated by caller"
+        assert await cache.get_json("media:a") == {"title": "A"}, "Hits are fresh copies"
+        assert redis.mget_calls == [["media:a", "media:missing"]]
+
+        redis.store["media:a"] = {"title": "A2"}
+        redis.publish_invalidation(["media:a"])
+        await _settle()
+        assert await cache.get_json("media:a") == {"title": "A2"}
+        assert cache.stats()["invalidations"] == 1
+
+        await cache.close()
+        assert not cache.ready
+        assert redis.connection.callbacks == [], "Reconnect hook removed from pooled connection"
+
+    asyncio.run(scenario())
+
+
+def test_key_invalidated_during_fetch_is_not_cached() -> None:
+    async def scenario() -> None:
+        redis = _FakeRedis()
+        cache = await _started(redis)
+        redis.mget_gate.clear()
+        fetch = asyncio.create_task(cache.get_json("media:b"))
+        await _settle()
+        redis.publish_invalidation(["media:b"])
+        await _settle()
+        redis.mget_gate.set()
+        assert await fetch == {"title": "B"}
+
+        await cache.get_json("media:b")
+        assert redis.mget_calls == [["media:b"], ["media:b"]]
+        await cache.close()
+
+    asyncio.run(scenario())
+
+
+def test_lru_bound_flush_and_lost_connection_bypass() -> None:
+    async def scenario() -> None:
+        redis = _FakeRedis()
+        redis.store["media:c"] = {"title": "C"}
+        cache = await _started(redis, max_entries=2)
+        await cache.get_json_many(["media:a", "media:b", "media:c"])
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+
+        redis.publish_invalidation(None)
+        await _settle()
+        assert cache.stats()["entries"] == 0
+
+        await cache.get_json("media:a")
+        redis.connection.callbacks[0](redis.connection)
+        assert not cache.ready, "A silent reconnect loses tracking"
+        calls = len(redis.mget_calls)
+        await cache.get_json("media:a")
+        assert len(redis.mget_calls) == calls + 1
+        await cache.close()
+
+    asyncio.run(scenario())
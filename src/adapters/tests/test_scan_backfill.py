@@ -0,0 +1,124 @@
+"""
+Unit tests for the parallel SCAN backfill engine.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from adapters.scan_backfill import BackfillConfig, run_backfill
+from core.normalize import CONTENT_HASH_FIELD, compute_content_hash
+
+
+class _FakeJSON:
+    def __init__(self, store: dict[str, dict[str, Any]], queued: list[Any] | None) -> None:
+        self.store = store
+        self.queued = queued
+
+    async def mget(self, keys: list[str], path: str) -> list[Any]:
+        return [[self.store[key]] if key in self.store else None for key in keys]
+
+    def merge(self, key: str, path: str, patch: dict[str, Any]) -> None:
+        assert self.queued is not None
+        self.queued.append(lambda: self.store[key].update(patch))
+
+    def set(self, key: str, path: str, value: dict[str, Any]) -> None:
+        assert self.queued is not None
+        self.queued.append(lambda: self.store.__setitem__(key, value))
+
+
+class _FakePipe:
+    def __init__(self, store: dict[str, dict[str, Any]]) -> None:
+        self.store = store
+        self.queued: list[Any] = []
+
+    def json(self) -> _FakeJSON:
+        return _FakeJSON(self.store, self.queued)
+
+    def incr(self, key: str) -> None:
+        pass
+
+    async def execute(self) -> None:
+        for op in self.queued:
+            op()
+
+
+class _FakeRedis:
+    """SCAN pages over sorted keys; the cursor is the next key offset."""
+
+    def __init__(self, store: dict[str, dict[str, Any]], page: int = 3) -> None:
+        self.store = store
+        self.page = page
+        self.scan_calls = 0
+
+    async def scan(self, cursor: int, match: str, count: int) -> tuple[int, list[str]]:
+        self.scan_calls += 1
+        keys = sorted(self.store)
+        chunk = keys[cursor : cursor + self.page]
+        next_cursor = cursor + self.page
+        return (0 if next_cursor >= len(keys) else next_cursor), chunk
+
+    def json(self) -> _FakeJSON:
+        return _FakeJSON(self.store, None)
+
+    def pipeline(self, transaction: bool = True) -> _FakePipe:
+        return _FakePipe(self.store)
+
+
+def _store(n: int) -> dict[str, dict[str, Any]]:
+    return {f"media:{i:02d}": {"title": f"Title {i}", "flag": i % 2 == 0} for i in range(n)}
+
+
+def _upper(key: str, doc: dict[str, Any]) -> dict[str, Any] | None:
+    if doc["flag"]:
+        return None
+    doc["title"] = doc["title"].upper()
+    return doc
+
+
+def test_transform_patches_only_changed_documents() -> None:
+    store = _store(10)
+    redis = _FakeRedis(store)
+    stats = asyncio.run(run_backfill(redis, _upper, BackfillConfig("media:*", batch_size=2)))
+
+    assert (stats.scanned, stats.processed, stats.updated, stats.unchanged) == (10, 10, 5, 5)
+    assert store["media:01"]["title"] == "TITLE 1"
+    assert store["media:02"]["title"] == "Title 2"
+
+
+def test_dry_run_counts_without_writing() -> None:
+    store = _store(6)
+    redis = _FakeRedis(store)
+    config = BackfillConfig("media:*", dry_run=True)
+    stats = asyncio.run(run_backfill(redis, _upper, config))
+
+    assert stats.updated == 3
+    assert store["media:01"]["title"] == "Title 1"
+
+
+def test_resume_starts_from_checkpointed_cursor(tmp_path: Path) -> None:
+    checkpoint = tmp_path / "backfill.ckpt"
+    checkpoint.write_text('{"match": "media:*", "cursor": 6}')
+    store = _store(9)
+    redis = _FakeRedis(store)
+    config = BackfillConfig("media:*", checkpoint_path=checkpoint, resume=True)
+    stats = asyncio.run(run_backfill(redis, _upper, config))
+
+    assert (stats.resumed_cursor, stats.scanned) == (6, 3)
+    assert store["media:01"]["title"] == "Title 1"
+    assert store["media:07"]["title"] == "TITLE 7"
+    assert not checkpoint.exists()
+
+
+def test_changed_documents_get_a_fresh_content_hash() -> None:
+    store = _store(2)
+    for doc in store.values():
+        doc[CONTENT_HASH_FIELD] = compute_content_hash(doc)
+    unchanged_hash = store["media:00"][CONTENT_HASH_FIELD]
+    redis = _FakeRedis(store)
+    asyncio.run(run_backfill(redis, _upper, BackfillConfig("media:*")))
+
+    changed = store["media:01"]
+    assert changed["title"] == "TITLE 1"
+    assert changed[CONTENT_HASH_FIELD] == compute_content_hash(changed)
+    assert store["media:00"][CONTENT_HASH_FIELD] == unchanged_hash
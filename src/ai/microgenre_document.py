@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from typing import Any
+
 from ai.microgenre_batch_models import MicroGenreBatchSidecarRecord
 from ai.prompts.microgenre_classifier import MicroGenreScoreResult
-from core.microgenres import MicrogenresDocument, coerce_microgenres_document
+from ai.prompts.microgenre_taxonomy import LEAF_IDS
+from core.microgenres import MicrogenresDocument, coerce_microgenres_document, microgenre_vector
+
+# Dimension of ``microgenre_vector`` (one slot per taxonomy leaf, in LEAF_IDS order)
+MICROGENRE_VECTOR_DIM = len(LEAF_IDS)
 
 
 def microgenre_result_to_redis(result: MicroGenreScoreResult) -> MicrogenresDocument:
@@ -22,3 +28,18 @@ def microgenre_sidecar_to_redis(row: MicroGenreBatchSidecarRecord) -> Microgenre
 
 
 valid_microgenres_value = coerce_microgenres_document
+
+
+def microgenre_vector_for(value: object) -> list[float] | None:
+    """Return the ``microgenre_vector`` for a compact microgenres value, or None."""
+    vector: list[float] | None = microgenre_vector(value, LEAF_IDS)
+    return vector
+
+
+def attach_microgenre_vector(redis_doc: dict[str, Any]) -> None:
+    """Set (or drop) ``microgenre_vector`` to match the document's ``microgenres``."""
+    vector = microgenre_vector_for(redis_doc.get("microgenres"))
+    if vector is None:
+        redis_doc.pop("microgenre_vector", None)
+    else:
+        redis_doc["microgenre_vector"] = vector
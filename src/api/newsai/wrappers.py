@@ -29,6 +29,9 @@ NewsAICache = RedisCache(
     prefix="newsai",
     verbose=False,
     isClassMethod=True,  # Required for class methods
+    local_cache_max_bytes=8 * 1024 * 1024,  # In-process L1 for hot search keys
+    stale_ttl=60 * 60,  # Serve up to an hour stale while refreshing
+    negative_ttl=10 * 60,  # Empty / not-found results
 )
 
 
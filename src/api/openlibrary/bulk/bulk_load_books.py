@@ -7,15 +7,18 @@ ETL pipeline to extract works from OpenLibrary dump for authors in our index:
 3. Output MCBookItem records as JSONL
 
 This is MUCH faster than API calls - processes all works in minutes.
+Pass ``workers > 1`` (``--workers``) to parse the dump on a process pool.
 """
 
 import gzip
 import json
 import sys
 import time
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
+from api.openlibrary.bulk.parallel_dump import default_workers, parse_dump_parallel
 from api.openlibrary.models import MCBookItem
 from utils.get_logger import get_logger
 
@@ -313,11 +316,75 @@ def passes_quality_filter(work: dict[str, Any]) -> bool:
     return has_description or has_subjects
 
 
+def process_work_line(
+    line: str,
+    author_olids: set[str],
+    author_names: dict[str, str],
+    apply_quality_filter: bool,
+    stats: dict[str, int],
+) -> str | None:
+    """
+    Turn one works-dump line into a serialized MCBookItem, or None if skipped.
+
+    Updates the works_* counters in ``stats`` (except works_scanned).
+    """
+    work_key, work_data = parse_works_dump_line(line)
+
+    if not work_key or not work_data:
+        return None
+
+    # Check if any author matches our known authors
+    work_author_olids = extract_author_olids_from_work(work_data)
+
+    if not work_author_olids:
+        stats["works_without_authors"] += 1
+        return None
+
+    # Check if any author is in our set
+    matching_authors = set(work_author_olids) & author_olids
+    if not matching_authors:
+        return None
+
+    stats["works_matched_author"] += 1
+
+    # Apply quality filter if enabled
+    if apply_quality_filter:
+        if not passes_quality_filter(work_data):
+            stats["works_filtered_out"] += 1
+            return None
+        stats["works_passed_filter"] += 1
+
+    # Convert to MCBookItem
+    book = work_to_mc_book(work_data, author_names)
+
+    # Add metadata about which authors matched
+    book_dict = book.model_dump(mode="json", exclude_none=True)
+    book_dict["_matching_author_olids"] = list(matching_authors)
+
+    stats["works_found"] += 1
+    return json.dumps(book_dict, ensure_ascii=False)
+
+
+def works_chunk(
+    lines: list[str], context: tuple[set[str], dict[str, str], bool]
+) -> tuple[list[str], dict[str, int]]:
+    """``parse_dump_parallel`` chunk function for the works dump."""
+    author_olids, author_names, apply_quality_filter = context
+    stats: Counter[str] = Counter()
+    output = []
+    for line in lines:
+        record = process_work_line(line, author_olids, author_names, apply_quality_filter, stats)
+        if record is not None:
+            output.append(record)
+    return output, dict(stats)
+
+
 def run_pipeline(
     authors_jsonl: str,
     works_dump: str,
     output_file: str,
     apply_quality_filter: bool = True,
+    workers: int = 1,
 ) -> dict[str, int]:
     """
     Run the ETL pipeline:
@@ -331,6 +398,8 @@ def run_pipeline(
         works_dump: Path to OpenLibrary works dump
         output_file: Output JSONL file
         apply_quality_filter: If True, only include works with cover AND (description OR subjects)
+        workers: Parser processes; >1 parses the dump on a process pool
+            (see ``parallel_dump``)
 
     Returns:
         Stats dict
@@ -393,6 +462,23 @@ def run_pipeline(
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if workers > 1:
+        start_time = time.time()
+        with open(output_file, "w", encoding="utf8") as f_out:
+            parallel_stats = parse_dump_parallel(
+                works_dump,
+                works_chunk,
+                context=(author_olids, author_names, apply_quality_filter),
+                sink=lambda record: f_out.write(record + "\n"),
+                workers=workers,
+                label="Works",
+            )
+        for key in stats:
+            stats[key] += parallel_stats.get(key, 0)
+        stats["works_scanned"] = parallel_stats["lines_scanned"]
+        _log_phase2_summary(stats, apply_quality_filter, output_file, time.time() - start_time)
+        return stats
+
     opener = gzip.open if works_dump.endswith(".gz") else open
     start_time = time.time()
     last_update = start_time
@@ -404,41 +490,12 @@ def run_pipeline(
         for line in f_in:
             stats["works_scanned"] += 1
 
-            work_key, work_data = parse_works_dump_line(line)
-
-            if not work_key or not work_data:
-                continue
-
-            # Check if any author matches our known authors
-            work_author_olids = extract_author_olids_from_work(work_data)
-
-            if not work_author_olids:
-                stats["works_without_authors"] += 1
-                continue
-
-            # Check if any author is in our set
-            matching_authors = set(work_author_olids) & author_olids
-            if not matching_authors:
+            record = process_work_line(
+                line, author_olids, author_names, apply_quality_filter, stats
+            )
+            if record is None:
                 continue
-
-            stats["works_matched_author"] += 1
-
-            # Apply quality filter if enabled
-            if apply_quality_filter:
-                if not passes_quality_filter(work_data):
-                    stats["works_filtered_out"] += 1
-                    continue
-                stats["works_passed_filter"] += 1
-
-            # Convert to MCBookItem
-            book = work_to_mc_book(work_data, author_names)
-
-            # Add metadata about which authors matched
-            book_dict = book.model_dump(mode="json", exclude_none=True)
-            book_dict["_matching_author_olids"] = list(matching_authors)
-
-            f_out.write(json.dumps(book_dict, ensure_ascii=False) + "\n")
-            stats["works_found"] += 1
+            f_out.write(record + "\n")
 
             # Progress
             current_time = time.time()
@@ -463,7 +520,13 @@ def run_pipeline(
 
     sys.stdout.write("\n")
 
-    elapsed = time.time() - start_time
+    _log_phase2_summary(stats, apply_quality_filter, output_file, time.time() - start_time)
+    return stats
+
+
+def _log_phase2_summary(
+    stats: dict[str, int], apply_quality_filter: bool, output_file: str, elapsed: float
+) -> None:
     logger.info(f"Phase 2 complete in {elapsed:.1f}s")
     logger.info(f"  Works scanned: {stats['works_scanned']:,}")
     logger.info(f"  Works without authors: {stats['works_without_authors']:,}")
@@ -474,14 +537,13 @@ def run_pipeline(
     logger.info(f"  Works written: {stats['works_found']:,}")
     logger.info(f"  Output: {output_file}")
 
-    return stats
-
 
 def main(
     authors_jsonl: str = "data/openlibrary/mc_authors.jsonl",
     works_dump: str = "data/openlibrary/ol_dump_works_latest.txt",
     output_file: str = "data/openlibrary/mc_books.jsonl",
     apply_quality_filter: bool = True,
+    workers: int = 1,
 ) -> dict[str, int]:
     """Main entry point."""
     logger.info("OpenLibrary Bulk Book Load")
@@ -497,6 +559,7 @@ def main(
         works_dump=works_dump,
         output_file=output_file,
         apply_quality_filter=apply_quality_filter,
+        workers=workers,
     )
 
 
@@ -524,6 +587,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Disable quality filter (include all works, not just those with cover AND (description OR subjects))",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Parser processes (default: DUMP_PARSE_WORKERS or CPU count; 1 = single process)",
+    )
     args = parser.parse_args()
 
     stats = main(
@@ -531,6 +600,7 @@ if __name__ == "__main__":
         works_dump=args.works_dump,
         output_file=args.output,
         apply_quality_filter=not args.no_quality_filter,
+        workers=args.workers,
     )
 
     logger.info("")
@@ -303,6 +303,7 @@ async def bulk_load_books_task(
         apply_quality_filter: If True, only include works with cover AND (description OR subjects)
     """
     from api.openlibrary.bulk.bulk_load_books import run_pipeline
+    from api.openlibrary.bulk.parallel_dump import default_workers
 
     status = _ol_etl_status[task_id]
 
@@ -315,6 +316,7 @@ async def bulk_load_books_task(
             works_dump=works_dump,
             output_file=output_file,
             apply_quality_filter=apply_quality_filter,
+            workers=default_workers(),
         )
 
         status.running = False
@@ -25,6 +25,7 @@ import aiohttp
 from aiolimiter import AsyncLimiter
 from redis.asyncio import Redis
 
+from adapters.key_prefix import resolve_key_prefix
 from api.openlibrary.models import MCBookItem
 from utils.get_logger import get_logger
 
@@ -49,10 +50,11 @@ async def check_books_exist_batch(redis: Redis, openlibrary_keys: list[str]) ->
         return {}
 
     # Build Redis keys
+    key_prefix = await resolve_key_prefix(redis, "book:")
     key_mapping = {}
     for ol_key in openlibrary_keys:
         work_id = ol_key.replace("/works/", "")
-        redis_key = f"book:book_{work_id}"
+        redis_key = f"{key_prefix}book_{work_id}"
         key_mapping[ol_key] = redis_key
 
     # Batch check with pipeline
@@ -10,6 +10,7 @@ import json
 import os
 import sys
 import time
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -18,6 +19,9 @@ from redis.asyncio import Redis
 from redis.commands.search.field import NumericField, TagField, TextField
 from redis.commands.search.index_definition import IndexDefinition, IndexType
 
+from adapters.bulk_index_loader import bulk_load_index
+from adapters.index_generation import queue_index_generation_bump
+from adapters.key_prefix import resolve_key_prefix
 from core.normalize import resolve_timestamps
 from utils.get_logger import get_logger
 
@@ -77,10 +81,17 @@ def mc_author_to_redis_doc(author: dict[str, Any]) -> dict[str, Any]:
     return doc
 
 
-async def create_author_index(redis: Redis) -> bool:
+async def create_author_index(
+    redis: Redis, index_name: str = INDEX_NAME, key_prefix: str = KEY_PREFIX
+) -> bool:
     """
     Create the author search index if it doesn't exist.
 
+    Args:
+        redis: Redis connection
+        index_name: Index (or alias) name
+        key_prefix: Key prefix the index covers
+
     Returns:
         True if created or already exists
     """
@@ -103,15 +114,24 @@ async def create_author_index(redis: Redis) -> bool:
         NumericField("$.wikidata_birth_year", as_name="birth_year", sortable=True),
     )
 
-    definition = IndexDefinition(prefix=[KEY_PREFIX], index_type=IndexType.JSON)
+    definition = IndexDefinition(prefix=[key_prefix], index_type=IndexType.JSON)
 
+    # FT.CREATE doesn't see aliases, so check first: after a bulk load the
+    # name is an alias and creating it again would shadow the live index
     try:
-        await redis.ft(INDEX_NAME).create_index(schema, definition=definition)
-        logger.info(f"Created index '{INDEX_NAME}'")
+        await redis.ft(index_name).info()
+        logger.info(f"Index '{index_name}' already exists")
+        return True
+    except Exception:
+        pass
+
+    try:
+        await redis.ft(index_name).create_index(schema, definition=definition)
+        logger.info(f"Created index '{index_name}'")
         return True
     except Exception as e:
         if "Index already exists" in str(e):
-            logger.info(f"Index '{INDEX_NAME}' already exists")
+            logger.info(f"Index '{index_name}' already exists")
             return True
         else:
             logger.error(f"Failed to create index: {e}")
@@ -133,6 +153,27 @@ async def drop_author_index(redis: Redis) -> bool:
             return False
 
 
+def iter_redis_docs(
+    input_file: str, limit: int | None, stats: dict[str, int]
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(doc_id, redis_doc)`` for each line of the JSONL file, counting into ``stats``."""
+    with open(input_file, encoding="utf8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            stats["total_read"] += 1
+            if limit and stats["total_read"] > limit:
+                return
+            try:
+                redis_doc = mc_author_to_redis_doc(json.loads(line))
+            except Exception as e:
+                stats["errors"] += 1
+                if stats["errors"] <= 5:
+                    logger.error(f"Error processing line: {e}")
+                continue
+            yield redis_doc["id"], redis_doc
+
+
 async def load_authors_to_redis(
     input_file: str,
     redis_host: str = "localhost",
@@ -141,6 +182,7 @@ async def load_authors_to_redis(
     recreate_index: bool = False,
     limit: int | None = None,
     dry_run: bool = False,
+    bulk: bool = False,
 ) -> dict[str, int]:
     """
     Load MCAuthorItems from JSONL file to Redis.
@@ -153,6 +195,8 @@ async def load_authors_to_redis(
         recreate_index: Drop and recreate index
         limit: Limit number of authors to load
         dry_run: Don't actually write to Redis
+        bulk: Full rebuild into a fresh key generation, then swap the
+            index alias onto it (see ``adapters.bulk_index_loader``)
 
     Returns:
         Stats dict
@@ -181,6 +225,19 @@ async def load_authors_to_redis(
         await redis.ping()
         logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
 
+        if bulk and not dry_run:
+            bulk_stats = await bulk_load_index(
+                redis,
+                iter_redis_docs(input_file, limit, stats),
+                alias=INDEX_NAME,
+                base_prefix=KEY_PREFIX,
+                create_index=create_author_index,
+            )
+            stats["loaded"] = bulk_stats.loaded
+            stats["errors"] += bulk_stats.errors
+            stats["indexed"] = bulk_stats.indexed
+            return stats
+
         # Handle index
         if recreate_index:
             logger.info("Recreating index...")
@@ -189,6 +246,7 @@ async def load_authors_to_redis(
         if not await create_author_index(redis):
             logger.error("Failed to create index")
             return stats
+        key_prefix = await resolve_key_prefix(redis, KEY_PREFIX)
 
         if dry_run:
             logger.info("[DRY RUN] Would load authors but not writing to Redis")
@@ -211,7 +269,7 @@ async def load_authors_to_redis(
                 try:
                     author = json.loads(line)
                     redis_doc = mc_author_to_redis_doc(author)
-                    key = f"{KEY_PREFIX}{redis_doc['id']}"
+                    key = f"{key_prefix}{redis_doc['id']}"
 
                     if dry_run:
                         stats["loaded"] += 1
@@ -258,6 +316,7 @@ async def load_authors_to_redis(
                     redis_doc["created_at"] = ca
                     redis_doc["modified_at"] = ma
                     write_pipe.json().set(key, "$", redis_doc)
+                queue_index_generation_bump(write_pipe)
                 await write_pipe.execute()
 
         sys.stdout.write("\n")
@@ -291,6 +350,7 @@ async def main(
     recreate_index: bool = False,
     limit: int | None = None,
     dry_run: bool = False,
+    bulk: bool = False,
 ) -> dict[str, int]:
     """Main entry point."""
     # Use environment variables as defaults
@@ -310,6 +370,7 @@ async def main(
         recreate_index=recreate_index,
         limit=limit,
         dry_run=dry_run,
+        bulk=bulk,
     )
 
 
@@ -349,6 +410,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Don't actually write to Redis",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Full rebuild: load a fresh key generation, build the index, swap the alias",
+    )
     args = parser.parse_args()
 
     asyncio.run(
@@ -359,5 +425,6 @@ if __name__ == "__main__":
             recreate_index=args.recreate_index,
             limit=args.limit,
             dry_run=args.dry_run,
+            bulk=args.bulk,
         )
     )
@@ -0,0 +1,239 @@
+"""
+Parallel Dump Parsing - Multi-core line processing for OpenLibrary/Wikidata dumps.
+
+The dump transforms (``json.loads`` + record conversion per line) are CPU
+bound, so one core caps a full rebuild at a few hundred thousand lines/sec.
+``parse_dump_parallel`` spreads them over a process pool:
+
+- Uncompressed dumps are split into byte ranges aligned to line starts.
+  Each worker reads its own range and writes a JSONL shard; shards are
+  merged in range order, so output order matches a sequential scan.
+- Gzip dumps cannot be seeked, so the parent decompresses and hands
+  chunks of lines to the workers (reader + N workers); results come back
+  in chunk order.
+
+A chunk function receives ``(lines, context)`` and returns
+``(output_lines, stats)``: serialized output records without trailing
+newlines and counters that are summed across chunks.  It must be a
+module-level function so it can be pickled.  ``context`` (e.g. the set of
+known author OLIDs) is sent to each worker once, at pool start.
+
+Usage:
+    stats = parse_dump_parallel(
+        "ol_dump_works.txt",
+        works_chunk,
+        context=(author_olids, author_names),
+        sink=out_file.write_record,
+        workers=8,
+    )
+
+Worker count defaults to ``DUMP_PARSE_WORKERS`` or the CPU count.
+"""
+
+from __future__ import annotations
+
+import gzip
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+ChunkFn = Callable[[list[str], Any], tuple[list[str], dict[str, int]]]
+
+DEFAULT_CHUNK_LINES = 20_000
+_RANGES_PER_WORKER = 4  # Smaller ranges balance uneven line sizes across workers
+
+# Set once per worker process by the pool initializer
+_worker_context: Any = None
+
+
+def default_workers() -> int:
+    """Worker processes to use when the caller doesn't say."""
+    configured = os.getenv("DUMP_PARSE_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return os.cpu_count() or 1
+
+
+def _init_worker(context: Any) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def _run_chunk(chunk_fn: ChunkFn, lines: list[str]) -> tuple[list[str], dict[str, int]]:
+    return chunk_fn(lines, _worker_context)
+
+
+def _run_range(
+    chunk_fn: ChunkFn,
+    path: str,
+    start: int,
+    end: int,
+    shard_path: str,
+    chunk_lines: int,
+) -> tuple[int, dict[str, int]]:
+    """Process every line that starts in ``[start, end)``; returns (lines read, stats)."""
+    stats: Counter[str] = Counter()
+    lines_read = 0
+    with open(path, "rb") as f_in, open(shard_path, "w", encoding="utf8") as f_out:
+        if start > 0:
+            # Land on the first line starting at or after ``start``
+            f_in.seek(start - 1)
+            f_in.readline()
+        position = f_in.tell()
+        lines: list[str] = []
+        while position < end:
+            raw = f_in.readline()
+            if not raw:
+                break
+            position += len(raw)
+            lines.append(raw.decode("utf8", errors="ignore"))
+            if len(lines) >= chunk_lines:
+                lines_read += _flush(chunk_fn, lines, stats, f_out)
+                lines = []
+        lines_read += _flush(chunk_fn, lines, stats, f_out)
+    return lines_read, dict(stats)
+
+
+def _flush(chunk_fn: ChunkFn, lines: list[str], stats: Counter[str], f_out: Any) -> int:
+    if not lines:
+        return 0
+    output, chunk_stats = chunk_fn(lines, _worker_context)
+    stats.update(chunk_stats)
+    for record in output:
+        f_out.write(record)
+        f_out.write("\n")
+    return len(lines)
+
+
+def _byte_ranges(path: str, parts: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(path)
+    step = max(1, -(-size // parts))
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _iter_line_chunks(path: str, chunk_lines: int) -> Iterator[list[str]]:
+    with gzip.open(path, "rt", encoding="utf8", errors="ignore") as f_in:
+        lines: list[str] = []
+        for line in f_in:
+            lines.append(line)
+            if len(lines) >= chunk_lines:
+                yield lines
+                lines = []
+        if lines:
+            yield lines
+
+
+def _report(label: str, lines_done: int, records: int, start_time: float) -> None:
+    elapsed = time.time() - start_time
+    rate = lines_done / elapsed if elapsed > 0 else 0
+    sys.stdout.write(f"\r  {label}: {lines_done:,} lines | {records:,} records | {rate:,.0f}/sec")
+    sys.stdout.flush()
+
+
+def parse_dump_parallel(
+    dump_path: str,
+    chunk_fn: ChunkFn,
+    context: Any,
+    sink: Callable[[str], object],
+    workers: int | None = None,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+    label: str = "Parsed",
+) -> dict[str, int]:
+    """
+    Run ``chunk_fn`` over every line of ``dump_path`` on a process pool.
+
+    Args:
+        dump_path: Dump file (``.gz`` is streamed through the parent).
+        chunk_fn: Module-level ``(lines, context) -> (output_lines, stats)``.
+        context: Read-only data the chunk function needs; sent once per worker.
+        sink: Called in the parent with each output line, in input order.
+        workers: Worker processes (default: ``default_workers()``).
+        chunk_lines: Lines per unit of work.
+        label: Progress line prefix.
+
+    Returns:
+        Summed chunk stats plus ``lines_scanned`` and ``records``.
+    """
+    workers = workers or default_workers()
+    totals: Counter[str] = Counter()
+    records = 0
+    lines_done = 0
+    start_time = time.time()
+
+    # spawn, not fork: the ETL API runs these from a threaded web process
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(context,),
+    ) as pool:
+        if dump_path.endswith(".gz"):
+            # Reader + N workers: keep a bounded number of chunks in flight
+            in_flight: list[tuple[Future[tuple[list[str], dict[str, int]]], int]] = []
+
+            def _drain_one() -> None:
+                nonlocal records, lines_done
+                future, line_count = in_flight.pop(0)
+                output, chunk_stats = future.result()
+                totals.update(chunk_stats)
+                for record in output:
+                    sink(record)
+                records += len(output)
+                lines_done += line_count
+                _report(label, lines_done, records, start_time)
+
+            for lines in _iter_line_chunks(dump_path, chunk_lines):
+                in_flight.append((pool.submit(_run_chunk, chunk_fn, lines), len(lines)))
+                if len(in_flight) >= workers * 2:
+                    _drain_one()
+            while in_flight:
+                _drain_one()
+        else:
+            shard_dir = tempfile.mkdtemp(prefix="dump_shards_", dir=Path(dump_path).parent)
+            ranges = _byte_ranges(dump_path, workers * _RANGES_PER_WORKER)
+            shards = [os.path.join(shard_dir, f"part-{i:05d}.jsonl") for i in range(len(ranges))]
+            futures = [
+                pool.submit(_run_range, chunk_fn, dump_path, start, end, shard, chunk_lines)
+                for (start, end), shard in zip(ranges, shards, strict=True)
+            ]
+            try:
+                # Merge shards in range order as each one (and all before it) finishes
+                for future, shard in zip(futures, shards, strict=True):
+                    range_lines, range_stats = future.result()
+                    totals.update(range_stats)
+                    with open(shard, encoding="utf8") as f_shard:
+                        for record in f_shard:
+                            sink(record.rstrip("\n"))
+                            records += 1
+                    os.remove(shard)
+                    lines_done += range_lines
+                    _report(label, lines_done, records, start_time)
+            finally:
+                for future in futures:
+                    future.cancel()
+                for shard in shards:
+                    if os.path.exists(shard):
+                        os.remove(shard)
+                os.rmdir(shard_dir)
+
+    sys.stdout.write("\n")
+    elapsed = time.time() - start_time
+    logger.info(
+        f"{label}: {lines_done:,} lines, {records:,} records in {elapsed:.1f}s "
+        f"({workers} workers, {lines_done / elapsed if elapsed > 0 else 0:,.0f} lines/sec)"
+    )
+    result = dict(totals)
+    result["lines_scanned"] = lines_done
+    result["records"] = records
+    return result
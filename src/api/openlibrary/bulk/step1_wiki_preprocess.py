@@ -4,6 +4,8 @@ import math
 import sys
 import time
 
+from api.openlibrary.bulk.parallel_dump import default_workers, parse_dump_parallel
+
 ###########################
 # Utility helper functions
 ###########################
@@ -95,16 +97,188 @@ def compute_author_quality_score(
 ##################################
 
 
+def parse_wikidata_line(
+    line: str, human_qid: str = "Q5", line_num: int | None = None
+) -> dict | None:
+    """
+    Parse one Wikidata TSV line into a lean author record.
+
+    Returns None for malformed lines, non-human entities and unlabeled
+    entities.  ``line_num`` only enables debug output for the first lines.
+    """
+    try:
+        # Split on TAB: QID, JSON payload, timestamp
+        parts = line.rstrip("\n").split("\t")
+        if len(parts) < 2:
+            return None
+
+        qid, raw_json = parts[0], parts[1]
+
+        # Remove surrounding quotes around the JSON-encoded string
+        if raw_json.startswith('"') and raw_json.endswith('"'):
+            raw_json = raw_json[1:-1]
+
+        # Handle double-escaped quotes ("" -> ")
+        # Use a more efficient approach for large strings
+        if '""' in raw_json:
+            raw_json = raw_json.replace('""', '"')
+
+        # Load payload as JSON
+        try:
+            entity = json.loads(raw_json)
+        except json.JSONDecodeError as e:
+            if line_num is not None and line_num <= 5:  # Debug first few lines
+                print(f"\nLine {line_num} JSON decode error: {e}")
+                print(f"  QID: {qid}, JSON preview: {raw_json[:100]}...")
+            return None
+
+        # Entity type must be item
+        if entity.get("type") != "item":
+            return None
+
+        claims = entity.get("statements") or entity.get("claims") or {}
+
+        # Check "instance of" (P31) includes Q5 (human)
+        is_human = False
+        p31_claims = claims.get("P31", [])
+        for stmt in p31_claims:
+            try:
+                # Handle different possible structures
+                value_content = None
+                if isinstance(stmt, dict):
+                    value_obj = stmt.get("value", {})
+                    if isinstance(value_obj, dict):
+                        value_content = value_obj.get("content")
+                    else:
+                        value_content = value_obj
+
+                if value_content == human_qid:
+                    is_human = True
+                    break
+            except Exception as e:
+                if line_num is not None and line_num <= 5:
+                    print(f"\n  Error checking P31: {e}, stmt: {stmt}")
+                continue
+
+        if not is_human:
+            # Debug: show why first few entities aren't humans
+            if line_num is not None and line_num <= 5:
+                print(f"\n  Line {line_num} (QID: {qid}): Not human")
+                print(f"    P31 claims: {len(p31_claims)}")
+                if p31_claims:
+                    print(f"    First P31: {p31_claims[0]}")
+            return None  # skip non-human entities
+
+        # Extract metadata
+        labels = entity.get("labels", {})
+        aliases = entity.get("aliases", {})
+        sitelinks = entity.get("sitelinks", {})
+        sitelink_count = len(sitelinks)
+        has_wikipedia = "enwiki" in sitelinks
+
+        # Best label
+        name = get_label(labels)
+        if not name:
+            return None  # require at least some label
+
+        # Aliases
+        flat_aliases = extract_aliases(aliases)
+
+        # Birth/death years
+        birth_year = extract_year_from_claim(claims.get("P569", []))
+        death_year = extract_year_from_claim(claims.get("P570", []))
+
+        # External IDs
+        viaf = extract_external_id(claims, "P214")
+        isni = extract_external_id(claims, "P213")
+        lccn = extract_external_id(claims, "P244")
+        ol_id = extract_external_id(claims, "P648")  # OpenLibrary author ID
+
+        # Compute author quality score
+        score = compute_author_quality_score(
+            has_wikipedia=has_wikipedia,
+            sitelink_count=sitelink_count,
+            alias_count=len(flat_aliases),
+            birth_year=birth_year,
+        )
+
+        # Build lean author object
+        author_obj = {
+            "wd_id": qid,
+            "name": name,
+            "aliases": flat_aliases,
+            "birth_year": birth_year,
+            "death_year": death_year,
+            "viaf": viaf,
+            "isni": isni,
+            "lccn": lccn,
+            "ol_id": ol_id,  # OpenLibrary author ID (P648)
+            "sitelinks": sitelink_count,
+            "has_wikipedia": has_wikipedia,
+            "author_quality_score": score,
+        }
+
+        return author_obj
+
+    except Exception as e:
+        # Log errors for debugging, especially on first few lines
+        if line_num is not None and line_num <= 10:
+            print(f"\nError processing line {line_num}: {type(e).__name__}: {e}")
+            import traceback
+
+            traceback.print_exc()
+        return None
+
+
+def wikidata_chunk(lines: list[str], human_qid: str) -> tuple[list[str], dict[str, int]]:
+    """``parse_dump_parallel`` chunk function for the Wikidata dump."""
+    output = []
+    for line in lines:
+        author_obj = parse_wikidata_line(line, human_qid)
+        if author_obj is not None:
+            output.append(json.dumps(author_obj, ensure_ascii=False))
+    return output, {}
+
+
 def process_wikidata_tsv(
     infile: str,
     outfile: str,
     human_qid: str = "Q5",
+    workers: int = 1,
 ):
     """
     Streams a Wikidata dump (tsv with QID, JSON-string, timestamp),
     extracts human authors, and outputs a JSON array of lean records.
     Streams both input and output for memory efficiency.
+
+    With ``workers`` > 1 the lines are parsed on a process pool (see
+    ``parallel_dump``); output order is unchanged.
     """
+    if workers > 1:
+        with open(outfile, "w", encoding="utf8") as f_out:
+            f_out.write("[\n")
+            is_first = True
+
+            def write_author(record: str) -> None:
+                nonlocal is_first
+                if not is_first:
+                    f_out.write(",\n")
+                f_out.write("  ")
+                f_out.write(record)
+                is_first = False
+
+            stats = parse_dump_parallel(
+                infile,
+                wikidata_chunk,
+                context=human_qid,
+                sink=write_author,
+                workers=workers,
+                label="Wikidata",
+            )
+            f_out.write("\n]")
+        print(f"Done. Wrote {stats['records']:,} records to: {outfile}")
+        return
+
     spinner_chars = ["|", "/", "-", "\\"]
     spinner_idx = 0
     last_update_time = time.time()
@@ -146,118 +320,8 @@ def process_wikidata_tsv(
             )
             sys.stdout.flush()
 
-            try:
-                # Split on TAB: QID, JSON payload, timestamp
-                parts = line.rstrip("\n").split("\t")
-                if len(parts) < 2:
-                    continue
-
-                qid, raw_json = parts[0], parts[1]
-
-                # Remove surrounding quotes around the JSON-encoded string
-                if raw_json.startswith('"') and raw_json.endswith('"'):
-                    raw_json = raw_json[1:-1]
-
-                # Handle double-escaped quotes ("" -> ")
-                # Use a more efficient approach for large strings
-                if '""' in raw_json:
-                    raw_json = raw_json.replace('""', '"')
-
-                # Load payload as JSON
-                try:
-                    entity = json.loads(raw_json)
-                except json.JSONDecodeError as e:
-                    if line_num <= 5:  # Debug first few lines
-                        print(f"\nLine {line_num} JSON decode error: {e}")
-                        print(f"  QID: {qid}, JSON preview: {raw_json[:100]}...")
-                    continue
-
-                # Entity type must be item
-                if entity.get("type") != "item":
-                    continue
-
-                claims = entity.get("statements") or entity.get("claims") or {}
-
-                # Check "instance of" (P31) includes Q5 (human)
-                is_human = False
-                p31_claims = claims.get("P31", [])
-                for stmt in p31_claims:
-                    try:
-                        # Handle different possible structures
-                        value_content = None
-                        if isinstance(stmt, dict):
-                            value_obj = stmt.get("value", {})
-                            if isinstance(value_obj, dict):
-                                value_content = value_obj.get("content")
-                            else:
-                                value_content = value_obj
-
-                        if value_content == human_qid:
-                            is_human = True
-                            break
-                    except Exception as e:
-                        if line_num <= 5:
-                            print(f"\n  Error checking P31: {e}, stmt: {stmt}")
-                        continue
-
-                if not is_human:
-                    # Debug: show why first few entities aren't humans
-                    if line_num <= 5:
-                        print(f"\n  Line {line_num} (QID: {qid}): Not human")
-                        print(f"    P31 claims: {len(p31_claims)}")
-                        if p31_claims:
-                            print(f"    First P31: {p31_claims[0]}")
-                    continue  # skip non-human entities
-
-                # Extract metadata
-                labels = entity.get("labels", {})
-                aliases = entity.get("aliases", {})
-                sitelinks = entity.get("sitelinks", {})
-                sitelink_count = len(sitelinks)
-                has_wikipedia = "enwiki" in sitelinks
-
-                # Best label
-                name = get_label(labels)
-                if not name:
-                    continue  # require at least some label
-
-                # Aliases
-                flat_aliases = extract_aliases(aliases)
-
-                # Birth/death years
-                birth_year = extract_year_from_claim(claims.get("P569", []))
-                death_year = extract_year_from_claim(claims.get("P570", []))
-
-                # External IDs
-                viaf = extract_external_id(claims, "P214")
-                isni = extract_external_id(claims, "P213")
-                lccn = extract_external_id(claims, "P244")
-                ol_id = extract_external_id(claims, "P648")  # OpenLibrary author ID
-
-                # Compute author quality score
-                score = compute_author_quality_score(
-                    has_wikipedia=has_wikipedia,
-                    sitelink_count=sitelink_count,
-                    alias_count=len(flat_aliases),
-                    birth_year=birth_year,
-                )
-
-                # Build lean author object
-                author_obj = {
-                    "wd_id": qid,
-                    "name": name,
-                    "aliases": flat_aliases,
-                    "birth_year": birth_year,
-                    "death_year": death_year,
-                    "viaf": viaf,
-                    "isni": isni,
-                    "lccn": lccn,
-                    "ol_id": ol_id,  # OpenLibrary author ID (P648)
-                    "sitelinks": sitelink_count,
-                    "has_wikipedia": has_wikipedia,
-                    "author_quality_score": score,
-                }
-
+            author_obj = parse_wikidata_line(line, human_qid, line_num)
+            if author_obj is not None:
                 # Stream write to output file
                 if not is_first_author:
                     f_out.write(",\n")
@@ -267,15 +331,6 @@ def process_wikidata_tsv(
                 author_count += 1
                 is_first_author = False
 
-            except Exception as e:
-                # Log errors for debugging, especially on first few lines
-                if line_num <= 10:
-                    print(f"\nError processing line {line_num}: {type(e).__name__}: {e}")
-                    import traceback
-
-                    traceback.print_exc()
-                continue
-
             # Update spinner progress bar (every N lines or every time interval)
             # Update more frequently for first 1000 lines to show immediate progress
             update_frequency = 10 if line_num < 1000 else update_every_n_lines
@@ -331,4 +386,5 @@ if __name__ == "__main__":
     process_wikidata_tsv(
         infile=str(infile),
         outfile=str(outfile),
+        workers=default_workers(),
     )
@@ -14,6 +14,7 @@ import time
 from pathlib import Path
 from typing import Any
 
+from api.openlibrary.bulk.parallel_dump import default_workers, parse_dump_parallel
 from api.openlibrary.models import MCAuthorItem
 from utils.get_logger import get_logger
 
@@ -113,10 +114,48 @@ def ol_dump_to_mc_author(data: dict[str, Any], wd_author: dict[str, Any]) -> MCA
     return mc_author
 
 
+def ol_dump_line_to_author_json(line: str, wd_by_olid: dict[str, dict[str, Any]]) -> str | None:
+    """Serialize the MCAuthorItem for a dump line whose author is in ``wd_by_olid``."""
+    ol_id, author_data = parse_ol_dump_line(line)
+    if not ol_id or ol_id not in wd_by_olid or author_data is None:
+        return None
+
+    # Found a match!
+    wd_author = wd_by_olid[ol_id]
+
+    # Convert to MCAuthorItem
+    mc_author = ol_dump_to_mc_author(author_data, wd_author)
+
+    # Add metadata
+    author_dict = mc_author.model_dump(mode="json", exclude_none=True)
+    author_dict["_wikidata_metadata"] = {
+        "wikidata_id": wd_author.get("wd_id"),
+        "wikidata_name": wd_author.get("name"),
+        "wikidata_birth_year": wd_author.get("birth_year"),
+        "ol_id": ol_id,
+        "method": "dump",
+        "matched": True,
+    }
+    return json.dumps(author_dict, ensure_ascii=False)
+
+
+def authors_chunk(
+    lines: list[str], wd_by_olid: dict[str, dict[str, Any]]
+) -> tuple[list[str], dict[str, int]]:
+    """``parse_dump_parallel`` chunk function for the authors dump."""
+    output = [
+        record
+        for record in (ol_dump_line_to_author_json(line, wd_by_olid) for line in lines)
+        if record is not None
+    ]
+    return output, {}
+
+
 def extract_authors_from_dump(
     wikidata_file: str,
     dump_file: str,
     outfile: str,
+    workers: int = 1,
 ):
     """
     Extract matching authors from OpenLibrary dump in a single pass.
@@ -125,6 +164,8 @@ def extract_authors_from_dump(
         wikidata_file: Path to cleansed_wiki.json
         dump_file: Path to ol_dump_authors file
         outfile: Path to output JSONL file
+        workers: Parser processes; >1 parses the dump on a process pool
+            (see ``parallel_dump``) and scans the whole dump
     """
     # Load and index wikidata authors by ol_id
     wd_by_olid = load_wikidata_authors(wikidata_file)
@@ -148,6 +189,22 @@ def extract_authors_from_dump(
     out_path = Path(outfile)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if workers > 1:
+        with open(outfile, "w", encoding="utf8") as f_out:
+            parallel_stats = parse_dump_parallel(
+                dump_file,
+                authors_chunk,
+                context=wd_by_olid,
+                sink=lambda record: f_out.write(record + "\n"),
+                workers=workers,
+                label="Authors",
+            )
+        found = parallel_stats["records"]
+        logger.info(f"Found: {found:,} ({found * 100 / len(wd_by_olid):.1f}%)")
+        logger.info(f"Not found (stale IDs): {len(wd_by_olid) - found:,}")
+        logger.info(f"Output: {outfile}")
+        return
+
     with (
         open(dump_file, encoding="utf8", errors="ignore") as f_in,
         open(outfile, "w", encoding="utf8") as f_out,
@@ -155,28 +212,9 @@ def extract_authors_from_dump(
         for line in f_in:
             lines_processed += 1
 
-            # Parse the dump line
-            ol_id, author_data = parse_ol_dump_line(line)
-
-            if ol_id and ol_id in wd_by_olid:
-                # Found a match!
-                wd_author = wd_by_olid[ol_id]
-
-                # Convert to MCAuthorItem
-                mc_author = ol_dump_to_mc_author(author_data, wd_author)
-
-                # Add metadata
-                author_dict = mc_author.model_dump(mode="json", exclude_none=True)
-                author_dict["_wikidata_metadata"] = {
-                    "wikidata_id": wd_author.get("wd_id"),
-                    "wikidata_name": wd_author.get("name"),
-                    "wikidata_birth_year": wd_author.get("birth_year"),
-                    "ol_id": ol_id,
-                    "method": "dump",
-                    "matched": True,
-                }
-
-                f_out.write(json.dumps(author_dict, ensure_ascii=False) + "\n")
+            record = ol_dump_line_to_author_json(line, wd_by_olid)
+            if record is not None:
+                f_out.write(record + "\n")
                 found += 1
 
                 # Early exit if we found all
@@ -236,10 +274,17 @@ if __name__ == "__main__":
         default="data/openlibrary/wiki_authors_from_dump.jsonl",
         help="Output JSONL file",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Parser processes (default: DUMP_PARSE_WORKERS or CPU count; 1 = single process)",
+    )
     args = parser.parse_args()
 
     extract_authors_from_dump(
         wikidata_file=args.wikidata,
         dump_file=args.dump,
         outfile=args.outfile,
+        workers=args.workers,
     )
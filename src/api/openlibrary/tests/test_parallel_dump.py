@@ -0,0 +1,45 @@
+"""
+Tests for multi-process dump parsing.
+"""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from api.openlibrary.bulk.parallel_dump import parse_dump_parallel
+
+
+def keep_even_chunk(lines: list[str], modulus: int) -> tuple[list[str], dict[str, int]]:
+    output = []
+    for line in lines:
+        value = int(line.split("\t")[1])
+        if value % modulus == 0:
+            output.append(f'{{"value": {value}}}')
+    return output, {"kept": len(output), "dropped": len(lines) - len(output)}
+
+
+def _dump_lines(count: int) -> list[str]:
+    # Uneven line lengths so byte ranges split mid-line
+    return [f"/type/work\t{i}\t{'x' * (i % 37)}\n" for i in range(count)]
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_parallel_output_matches_sequential_order(tmp_path: Path, compressed: bool) -> None:
+    lines = _dump_lines(5_000)
+    dump = tmp_path / ("dump.txt.gz" if compressed else "dump.txt")
+    if compressed:
+        with gzip.open(dump, "wt", encoding="utf8") as f:
+            f.writelines(lines)
+    else:
+        dump.write_text("".join(lines), encoding="utf8")
+
+    expected, _ = keep_even_chunk(lines, 2)
+    records: list[str] = []
+    stats = parse_dump_parallel(
+        str(dump), keep_even_chunk, context=2, sink=records.append, workers=3, chunk_lines=128
+    )
+
+    assert records == expected
+    assert stats == {"kept": 2_500, "dropped": 2_500, "lines_scanned": 5_000, "records": 2_500}
+    assert list(tmp_path.iterdir()) == [dump], "Shard files are cleaned up"
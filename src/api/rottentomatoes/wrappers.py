@@ -31,6 +31,8 @@ RottenTomatoesWrapperCache = RedisCache(
     prefix="rottentomatoes_wrapper",
     verbose=False,
     isClassMethod=True,
+    local_cache_max_bytes=8 * 1024 * 1024,  # In-process L1 for hot search keys
+    stale_ttl=60 * 60 * 24,  # Serve up to a day stale while refreshing
 )
 
 
@@ -93,6 +93,9 @@ SpotifyWrapperCache = RedisCache(
     prefix="spotify_wrapper",
     verbose=False,
     isClassMethod=True,  # Required for class methods
+    local_cache_max_bytes=8 * 1024 * 1024,  # In-process L1 for hot search keys
+    stale_ttl=24 * 60 * 60,  # Serve up to a day stale while refreshing
+    negative_ttl=15 * 60,  # Empty / not-found results
 )
 
 
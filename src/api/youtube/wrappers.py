@@ -32,6 +32,9 @@ YouTubeWrapperCache = RedisCache(
     prefix="youtube_wrapper",
     verbose=False,
     isClassMethod=True,  # Required for class methods
+    local_cache_max_bytes=8 * 1024 * 1024,  # In-process L1 for hot search keys
+    stale_ttl=24 * 60 * 60,  # Serve up to a day stale while refreshing
+    negative_ttl=15 * 60,  # Empty / not-found results
 )
 
 
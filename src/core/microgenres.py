@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import TypedDict
+import math
+from collections.abc import Sequence
+from typing import Any, TypedDict
+
+# Decimal places kept per vector component (keeps the stored JSON compact)
+MICROGENRE_VECTOR_PRECISION = 5
+
+# Document field holding the vector.  It only backs KNN queries, so API
+# responses never carry it.
+MICROGENRE_VECTOR_FIELD = "microgenre_vector"
 
 
 class MicrogenresDocument(TypedDict):
@@ -37,3 +46,29 @@ def coerce_microgenres_document(value: object) -> MicrogenresDocument | None:
         "microgenre_scores": resolved_scores,
         "rationale": rationale,
     }
+
+
+def microgenre_vector(value: object, leaf_ids: Sequence[str]) -> list[float] | None:
+    """
+    Project microgenre scores onto a fixed leaf order as a unit-length vector.
+
+    Scores are sparse (omitted leaves are zero), so the vector has one slot
+    per entry of ``leaf_ids`` and unknown leaf ids are ignored.  The vector
+    is L2-normalized for cosine KNN; documents whose scores are all zero have
+    no direction and get None.
+    """
+    microgenres = coerce_microgenres_document(value)
+    if microgenres is None:
+        return None
+    scores = microgenres["microgenre_scores"]
+    vector = [max(scores.get(leaf_id, 0.0), 0.0) for leaf_id in leaf_ids]
+    norm = math.sqrt(sum(score * score for score in vector))
+    if norm == 0.0:
+        return None
+    return [round(score / norm, MICROGENRE_VECTOR_PRECISION) for score in vector]
+
+
+def drop_microgenre_vector(doc: dict[str, Any]) -> dict[str, Any]:
+    """Remove ``microgenre_vector`` from a document about to be returned (in place)."""
+    doc.pop(MICROGENRE_VECTOR_FIELD, None)
+    return doc
@@ -11,6 +11,8 @@ TAG values are normalized (lowercase, special chars replaced with underscore)
 to ensure consistent filtering in Redis Search.
 """
 
+import hashlib
+import json
 import math
 import re
 from abc import ABC, abstractmethod
@@ -930,6 +932,60 @@ def resolve_timestamps(
     return int(created_at), now_ts, source_tag
 
 
+CONTENT_HASH_FIELD = "_content_hash"
+
+# Bookkeeping fields that change on every write and must not affect the fingerprint
+_CONTENT_HASH_EXCLUDED_FIELDS = frozenset(
+    {"created_at", "modified_at", "_source", CONTENT_HASH_FIELD}
+)
+
+
+def compute_content_hash(redis_doc: dict[str, Any]) -> str:
+    """
+    Stable fingerprint of a Redis document's content.
+
+    Computed over canonical JSON (sorted keys) of every field except
+    timestamps, provenance and the fingerprint itself, so two normalizations
+    of the same upstream data hash identically.
+    """
+    content = {k: v for k, v in redis_doc.items() if k not in _CONTENT_HASH_EXCLUDED_FIELDS}
+    payload = json.dumps(
+        content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def stamp_document_for_write(
+    redis_doc: dict[str, Any],
+    existing_doc: dict[str, Any] | None,
+    now_ts: int,
+    source_tag: str | None = None,
+) -> bool:
+    """
+    Stamp the content fingerprint and timestamps on a document about to be written.
+
+    Args:
+        redis_doc: Write-ready document (mutated in place).
+        existing_doc: The existing Redis document (None if new).
+        now_ts: Current Unix timestamp.
+        source_tag: Optional provenance tag; when given it is stored as ``_source``.
+
+    Returns:
+        False when ``existing_doc`` already carries the same fingerprint, i.e.
+        the JSON.SET would only bump ``modified_at`` and can be skipped.
+    """
+    content_hash = compute_content_hash(redis_doc)
+    redis_doc[CONTENT_HASH_FIELD] = content_hash
+    if existing_doc is not None and existing_doc.get(CONTENT_HASH_FIELD) == content_hash:
+        return False
+    ca, ma, src = resolve_timestamps(existing_doc, now_ts, source_tag=source_tag)
+    redis_doc["created_at"] = ca
+    redis_doc["modified_at"] = ma
+    if source_tag is not None:
+        redis_doc["_source"] = src
+    return True
+
+
 def _serialize_tmdb_payload(payload: Any) -> dict[str, Any] | None:
     """Convert a TMDB details model (or dict) to a JSON-serializable dict."""
     if payload is None:
@@ -1,7 +1,9 @@
+import json
 import re
 from datetime import datetime
 
 from core.iptc import get_search_aliases
+from core.ranking import normalize_for_match
 from utils.get_logger import get_logger
 
 logger = get_logger(__name__)
@@ -332,6 +334,148 @@ def escape_redis_search_term(term: str) -> str:
     return result
 
 
+# Fields the media tier APPLY expression reads (not sortable, so they must be LOADed)
+MEDIA_TIER_FIELDS: tuple[str, ...] = ("search_title", "title_compact", "director_name")
+# JSON arrays it looks for exact values in, LOADed serialized as ``<name>_json``
+MEDIA_TIER_JSON_FIELDS: tuple[str, ...] = ("cast_names", "keywords", "genres")
+
+
+def _expression_literal(value: str) -> str:
+    """Quote *value* as a double-quoted FT.AGGREGATE expression string."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _field_equals(field: str, value: str, lower: bool = False) -> str:
+    ref = f"lower(@{field})" if lower else f"@{field}"
+    return f"(exists(@{field}) && {ref} == {_expression_literal(value)})"
+
+
+def _field_contains(field: str, fragment: str) -> str:
+    return f"(exists(@{field}) && contains(@{field}, {_expression_literal(fragment)}))"
+
+
+# Characters that end a word in a lowered display title; the title is padded
+# with spaces, so the first and last words are bounded too.
+_TITLE_WORD_SEPARATORS = ' :-.,;!?&/()[]*+~"\u00b7'
+
+
+def _title_contains_word(word: str) -> str:
+    """Match *word* as a separator-bounded word of ``search_title``.
+
+    The start and end boundaries are checked independently, which can only
+    over-match, so a title word ``score_media_result`` finds is never missed
+    unless it is bounded by a character outside ``_TITLE_WORD_SEPARATORS``.
+    """
+    padded = 'format(" %s ", lower(@search_title))'
+    starts = " || ".join(
+        f"contains({padded}, {_expression_literal(sep + word)})" for sep in _TITLE_WORD_SEPARATORS
+    )
+    ends = " || ".join(
+        f"contains({padded}, {_expression_literal(word + sep)})" for sep in _TITLE_WORD_SEPARATORS
+    )
+    return f"(exists(@search_title) && ({starts}) && ({ends}))"
+
+
+def _tag_contains_word(field: str, word: str) -> str:
+    """Match *word* as an ``_``-separated token of a normalized TAG value."""
+    if not field.endswith("_json"):
+        return f'(exists(@{field}) && contains(format("_%s_", @{field}), "_{word}_"))'
+    fragments = [f"{start}{word}{end}" for start in '"_' for end in '"_']
+    matched = " || ".join(
+        f"contains(@{field}, {_expression_literal(fragment)})" for fragment in fragments
+    )
+    return f"(exists(@{field}) && ({matched}))"
+
+
+def build_media_tier_expression(q: str) -> str:
+    """
+    Build an FT.AGGREGATE APPLY expression mirroring the tiers of ``score_media_result``.
+
+    Evaluates per document to:
+        0: EXACT title (case-insensitive, apostrophes stripped like ``search_title``)
+        1: EXACT compact title (``title_compact``, which also covers normalized matches)
+        2: EXACT director_name
+        3: EXACT cast_names entry
+        4: EXACT keywords entry, or an IPTC alias inside the compact title
+        5: keywords entry starting with an IPTC alias, or EXACT genres entry
+        6-10: CONTAINS_WORD title, director_name, cast_names, keywords, genres
+        11: CONTAINS_SUBSTRING compact title (query or IPTC alias)
+        12: CONTAINS_SUBSTRING director/cast/keywords/genres (query or IPTC alias in keywords)
+        13: anything else
+
+    Each check compares the same stored value with the same normalized query
+    as the Python ranker, and the alias, word and substring checks are
+    looser, so a document's expression tier is at most its Python tier.  The
+    Python PREFIX tiers (13-14) are implied by the substring tiers and never
+    reached.  Array entries are matched as quoted JSON strings in the
+    serialized ``<name>_json`` loads.  Every field is guarded with ``exists``
+    because documents may lack any of them.  The result is a candidate
+    pre-sort; callers still re-rank the returned rows with ``score_media_result``.
+
+    Args:
+        q: User search query
+
+    Returns:
+        Expression string reading ``MEDIA_TIER_FIELDS`` and ``MEDIA_TIER_JSON_FIELDS``
+    """
+    exact = strip_query_apostrophes(q.lower().strip())
+    compact = _compact_query(exact)
+    norm = normalize_for_match(q)
+    quoted = json.dumps(norm, ensure_ascii=False)
+    all_aliases = [a for a in get_search_aliases(norm) if a != norm]
+    aliases = [a for a in all_aliases if len(a) > 3]
+    tag_json_fields = [f"{name}_json" for name in MEDIA_TIER_JSON_FIELDS]
+
+    tiers: list[list[str]] = [[] for _ in range(13)]
+    tiers[0].append(_field_equals("search_title", exact, lower=True))
+    if compact:
+        tiers[1].append(_field_equals("title_compact", compact))
+    if norm:
+        tiers[2].append(_field_equals("director_name", norm))
+        tiers[3].append(_field_contains("cast_names_json", quoted))
+        tiers[4].append(_field_contains("keywords_json", quoted))
+        tiers[5].append(_field_contains("genres_json", quoted))
+    for alias in aliases:
+        tiers[4].append(_field_contains("title_compact", alias.replace("_", "")))
+        # Opening quote only: a keyword entry that starts with the alias
+        entry_start = json.dumps(alias, ensure_ascii=False)[:-1]
+        tiers[5].append(_field_contains("keywords_json", entry_start))
+
+    # A multi-token query is never a single word of anything
+    if norm and "_" not in norm:
+        tiers[6].append(_title_contains_word(norm))
+        for tier, field in enumerate(["director_name", *tag_json_fields], start=7):
+            tiers[tier].append(_tag_contains_word(field, norm))
+
+    if compact:
+        tiers[11].append(_field_contains("title_compact", compact))
+    elif exact:
+        # Nothing survives the ASCII compaction (e.g. CJK titles)
+        tiers[11].append(
+            f"(exists(@search_title) && contains(lower(@search_title), "
+            f"{_expression_literal(exact)}))"
+        )
+    for alias in all_aliases:
+        if alias_compact := alias.replace("_", ""):
+            tiers[11].append(_field_contains("title_compact", alias_compact))
+    if norm:
+        for field in ["director_name", *tag_json_fields]:
+            tiers[12].append(_field_contains(field, norm))
+    for alias in all_aliases:
+        tiers[12].append(_field_contains("keywords_json", alias))
+
+    # tier = miss_0 * (1 + miss_1 * (1 + ... miss_12)), miss_k = 0 once tier k matches
+    expr = ""
+    for conditions in reversed(tiers):
+        if not conditions:
+            expr = f"1 + {expr}" if expr else "1"
+            continue
+        matched = conditions[0] if len(conditions) == 1 else f"({' || '.join(conditions)})"
+        expr = f"(!{matched}) * (1 + {expr})" if expr else f"(!{matched})"
+    return expr
+
+
 def build_minimal_autocomplete_query(q: str) -> str:
     """
     Build a title-only prefix query for lightweight autocomplete.
@@ -472,7 +616,7 @@ def build_autocomplete_query(q: str, include_tag_fields: bool = True) -> str:
         match_type = "prefix" if use_prefix else "exact"
 
         # Log the TAG search
-        logger.info(
+        logger.debug(
             f"[Media Index] Query: '{q}' -> TAG: '{tag_pattern}' ({match_type}) "
             f"(searching: cast_names, director_name, genres)"
         )
@@ -501,7 +645,7 @@ def build_autocomplete_query(q: str, include_tag_fields: bool = True) -> str:
         keyword_union = "|".join(keyword_patterns)
         query_parts.append(f"@keywords:{{{keyword_union}}}")
 
-        logger.info(
+        logger.debug(
             f"[Media Index] Query: '{q}' -> Keywords: {len(keyword_aliases)} aliases "
             f"(raw=exact, expanded=prefix: {keyword_aliases[:5]}{'...' if len(keyword_aliases) > 5 else ''})"
         )
@@ -587,7 +731,7 @@ def build_podcast_autocomplete_query(q: str, include_tag_fields: bool = True) ->
         match_type = "prefix" if use_prefix else "exact"
 
         # Log the TAG aliases being searched
-        logger.info(
+        logger.debug(
             f"[Podcast Index] Query: '{q}' -> TAG alias: '{tag_pattern}' ({match_type}) "
             f"(searching: author_normalized, categories)"
         )
@@ -707,7 +851,7 @@ def build_books_autocomplete_query(q: str, include_tag_fields: bool = True) -> s
         tag_pattern = f"{normalized_full}*" if use_prefix else normalized_full
         match_type = "prefix" if use_prefix else "exact"
 
-        logger.info(
+        logger.debug(
             f"[Book Index] Query: '{q}' -> TAG: '{tag_pattern}' ({match_type}) "
             f"(searching: author_normalized, subjects)"
         )
@@ -721,7 +865,7 @@ def build_books_autocomplete_query(q: str, include_tag_fields: bool = True) -> s
         subject_union = "|".join(subject_aliases)
         query_parts.append(f"@subjects:{{{subject_union}}}")
 
-        logger.info(
+        logger.debug(
             f"[Book Index] Query: '{q}' -> Subjects: {len(subject_aliases)} aliases "
             f"({subject_aliases[:5]}{'...' if len(subject_aliases) > 5 else ''})"
         )
@@ -901,3 +1045,27 @@ def build_filter_query(
         return "*"
 
     return " ".join(parts)
+
+
+def build_knn_query(
+    filter_query: str,
+    k: int,
+    vector_field: str = "microgenre_vector",
+    score_alias: str = "vector_distance",
+) -> str:
+    """
+    Build a hybrid KNN query: ``filter_query`` pre-filters, then the ``k``
+    nearest neighbours of the ``$vec`` query parameter are returned.
+
+    Requires DIALECT 2 and a ``vec`` query parameter holding the packed
+    FLOAT32 query vector.
+
+    Examples:
+        build_knn_query("@mc_type:{movie} @year:[2000 +inf]", 10)
+        # Returns: "(@mc_type:{movie} @year:[2000 +inf])=>[KNN 10 @microgenre_vector $vec AS vector_distance]"
+
+        build_knn_query("*", 5)
+        # Returns: "*=>[KNN 5 @microgenre_vector $vec AS vector_distance]"
+    """
+    prefilter = "*" if not filter_query or filter_query == "*" else f"({filter_query})"
+    return f"{prefilter}=>[KNN {k} @{vector_field} $vec AS {score_alias}]"
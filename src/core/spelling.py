@@ -0,0 +1,169 @@
+"""
+Spelling correction over indexed title/name vocabulary.
+
+A SymSpell-style symmetric-delete index: every dictionary term is stored
+under each string reachable by deleting up to ``max_edit_distance``
+characters from its first ``prefix_length`` characters.  A lookup generates
+the same deletes for the query word and only computes real edit distances
+for the handful of terms that share one, so correcting a word costs a few
+dict probes instead of a scan of the vocabulary.
+
+Term counts are document frequencies from the search indexes (see
+``etl.spelling_dictionary_etl``); among equally close candidates the more
+frequent term wins.
+
+Usage:
+    from core.spelling import SpellingDictionary
+
+    dictionary = SpellingDictionary({"breaking": 40, "bad": 900})
+    dictionary.correct("braeking bda")  # "breaking bad"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+from core.search_queries import STOPWORDS
+from utils.normalize import normalize
+
+DEFAULT_MAX_EDIT_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+_MIN_SPLIT_PART = 2
+
+
+def title_terms(text: str) -> set[str]:
+    """Distinct dictionary terms in a title or name (normalized, 2+ chars, not numeric)."""
+    return {term for term in normalize(text).split() if len(term) >= 2 and not term.isdigit()}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or ``max_distance + 1`` once it is exceeded."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def _max_distance_for(word: str, ceiling: int) -> int:
+    # Two edits on a four-letter word can reach almost anything
+    if len(word) <= 2:
+        return 0
+    if len(word) <= 4:
+        return min(1, ceiling)
+    return ceiling
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for candidate in frontier:
+            if len(candidate) <= 1:
+                continue
+            for i in range(len(candidate)):
+                deleted = candidate[:i] + candidate[i + 1 :]
+                if deleted not in results:
+                    next_frontier.add(deleted)
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class SpellingDictionary:
+    """In-memory symmetric-delete spelling corrector."""
+
+    def __init__(
+        self,
+        counts: Mapping[str, int],
+        max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    ) -> None:
+        self.counts = dict(counts)
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        # delete -> terms; a single term is stored bare (the common case)
+        self._index: dict[str, str | list[str]] = {}
+        for term in self.counts:
+            for deleted in _deletes(term[:prefix_length], max_edit_distance):
+                existing = self._index.get(deleted)
+                if existing is None:
+                    self._index[deleted] = term
+                elif isinstance(existing, str):
+                    self._index[deleted] = [existing, term]
+                else:
+                    existing.append(term)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def _candidates(self, deletes: Iterable[str]) -> set[str]:
+        terms: set[str] = set()
+        for deleted in deletes:
+            entry = self._index.get(deleted)
+            if entry is None:
+                continue
+            if isinstance(entry, str):
+                terms.add(entry)
+            else:
+                terms.update(entry)
+        return terms
+
+    def lookup(self, word: str) -> str | None:
+        """Closest known term to ``word`` (ties go to the more frequent), or None."""
+        if word in self.counts:
+            return word
+        max_distance = _max_distance_for(word, self.max_edit_distance)
+        if max_distance == 0:
+            return None
+        best: tuple[int, int, str] | None = None
+        for term in self._candidates(_deletes(word[: self.prefix_length], max_distance)):
+            distance = edit_distance(word, term, max_distance)
+            if distance > max_distance:
+                continue
+            rank = (distance, -self.counts[term], term)
+            if best is None or rank < best:
+                best = rank
+        return best[2] if best else None
+
+    def _split(self, word: str) -> str | None:
+        # "spiderman" -> "spider man": both halves must be known terms
+        best: tuple[int, str] | None = None
+        for i in range(_MIN_SPLIT_PART, len(word) - _MIN_SPLIT_PART + 1):
+            left, right = word[:i], word[i:]
+            if left in self.counts and right in self.counts:
+                score = min(self.counts[left], self.counts[right])
+                if best is None or score > best[0]:
+                    best = (score, f"{left} {right}")
+        return best[1] if best else None
+
+    def correct(self, text: str) -> str | None:
+        """
+        Correct each unknown word of ``text``.
+
+        Returns:
+            The corrected, normalized text, or None when nothing changed.
+        """
+        words = normalize(text).split()
+        corrected: list[str] = []
+        changed = False
+        for word in words:
+            replacement = word
+            if word not in self.counts and word not in STOPWORDS and not word.isdigit():
+                replacement = self.lookup(word) or self._split(word) or word
+            changed = changed or replacement != word
+            corrected.append(replacement)
+        return " ".join(corrected) if changed else None
@@ -0,0 +1,49 @@
+"""
+Unit tests for document content fingerprints used to skip no-op ETL writes.
+"""
+
+from core.normalize import (
+    CONTENT_HASH_FIELD,
+    compute_content_hash,
+    stamp_document_for_write,
+)
+
+
+def _doc(**overrides: object) -> dict[str, object]:
+    doc: dict[str, object] = {
+        "id": "tmdb_movie_1",
+        "title": "Alien",
+        "genres": ["Horror", "Science Fiction"],
+        "popularity": 12.5,
+    }
+    doc.update(overrides)
+    return doc
+
+
+def test_hash_ignores_key_order_timestamps_and_provenance() -> None:
+    reordered = dict(reversed(list(_doc().items())))
+    stamped = _doc(created_at=1, modified_at=2, _source="nightly_etl")
+
+    assert compute_content_hash(_doc()) == compute_content_hash(reordered)
+    assert compute_content_hash(_doc()) == compute_content_hash(stamped)
+    assert compute_content_hash(_doc()) != compute_content_hash(_doc(popularity=13.0))
+
+
+def test_unchanged_document_is_not_rewritten() -> None:
+    existing = _doc()
+    assert stamp_document_for_write(existing, None, now_ts=100, source_tag="nightly_etl")
+    assert (existing["created_at"], existing["modified_at"]) == (100, 100)
+
+    fresh = _doc()
+    assert not stamp_document_for_write(fresh, existing, now_ts=200, source_tag="nightly_etl")
+    assert fresh[CONTENT_HASH_FIELD] == existing[CONTENT_HASH_FIELD]
+
+
+def test_changed_document_keeps_created_at_and_bumps_modified_at() -> None:
+    existing = _doc(created_at=100, modified_at=100)
+    existing[CONTENT_HASH_FIELD] = compute_content_hash(existing)
+
+    changed = _doc(title="Aliens")
+    assert stamp_document_for_write(changed, existing, now_ts=200)
+    assert (changed["created_at"], changed["modified_at"]) == (100, 200)
+    assert "_source" not in changed
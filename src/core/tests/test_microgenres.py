@@ -0,0 +1,40 @@
+"""
+Tests for microgenre vector projection and the KNN query builder.
+"""
+
+import math
+
+from core.microgenres import microgenre_vector
+from core.search_queries import build_filter_query, build_knn_query
+
+LEAF_IDS = ("heist", "noir", "space_opera", "cozy_mystery")
+
+
+def _microgenres(scores: dict[str, float]) -> dict[str, object]:
+    return {"confidence": 0.9, "microgenre_scores": scores, "rationale": ""}
+
+
+def test_vector_follows_leaf_order_and_has_unit_length() -> None:
+    vector = microgenre_vector(_microgenres({"noir": 0.3, "heist": 0.4, "unknown": 0.9}), LEAF_IDS)
+
+    assert vector == [0.8, 0.6, 0.0, 0.0], "Unknown leaves are ignored, omitted ones are zero"
+    assert math.isclose(sum(v * v for v in vector), 1.0)
+
+
+def test_vector_is_none_without_usable_scores() -> None:
+    assert microgenre_vector(_microgenres({"heist": 0.0}), LEAF_IDS) is None
+    assert microgenre_vector(_microgenres({}), LEAF_IDS) is None
+    assert microgenre_vector(None, LEAF_IDS) is None
+    assert microgenre_vector({"microgenre_scores": {"heist": 1.0}}, LEAF_IDS) is None
+
+
+def test_knn_query_wraps_prefilter() -> None:
+    prefilter = build_filter_query(genre_ids=["80"], year_min=1990, mc_type="movie")
+
+    assert build_knn_query(prefilter, 11) == (
+        "(@genre_ids:{80} @year:[1990 +inf] @mc_type:{movie})"
+        "=>[KNN 11 @microgenre_vector $vec AS vector_distance]"
+    )
+    assert build_knn_query(build_filter_query(), 5) == (
+        "*=>[KNN 5 @microgenre_vector $vec AS vector_distance]"
+    )
@@ -0,0 +1,294 @@
+"""
+Parity tests: FT.AGGREGATE tier expression vs the Python media ranker.
+
+The expression built by ``build_media_tier_expression`` is evaluated here by
+spelling its logical operators (``&&``, ``||``, ``!``) the Python way and
+reading ``@field`` references from a row shaped like the FT.AGGREGATE LOADs;
+the rest of its grammar (``==``, ``*``, ``+``, parentheses, double-quoted
+literals, ``exists``/``contains``/``lower``/``format``) has identical
+semantics in Python.  No Redis server is required.
+"""
+
+import json
+import re
+from typing import Any
+
+import pytest
+
+from core import ranking, search_queries
+from core.normalize import compact_title, normalize_search_title
+from core.ranking import score_media_result
+from core.search_queries import MEDIA_TIER_JSON_FIELDS, build_media_tier_expression
+
+TITLES = [
+    "It's Complicated",
+    "Its Complicated",
+    "Good Will Hunting",
+    "Spider-Man: No Way Home",
+    "Spider Man",
+    "Up",
+    "Up!",
+    "M*A*S*H",
+    "Amélie",
+    "WALL·E",
+    "Se7en",
+    "The Office",
+    "Office Space",
+    "The Office (UK)",
+    "Alien",
+    "Aliens",
+    "Alien³",
+    '"Weird Al" Yankovic',
+    "Schindler's List",
+    "東京物語",
+]
+
+QUERIES = [
+    "it's complicated",
+    "its complicated",
+    "ITS COMPLICATED",
+    "goodwillhunting",
+    "good will hunting",
+    "spider-man no way home",
+    "spiderman",
+    "up",
+    "mash",
+    "m*a*s*h",
+    "amelie",
+    "amélie",
+    "wall-e",
+    "se7en",
+    "the office",
+    "office",
+    "alien",
+    "aliens",
+    '"weird al" yankovic',
+    "schindlers list",
+    "東京物語",
+]
+
+
+def _indexed_doc(
+    title: str, popularity: float = 1.0, year: int = 2000, **tags: Any
+) -> dict[str, Any]:
+    """Document as stored in Redis (see core.normalize.document_to_redis)."""
+    return {
+        "title": title,
+        "search_title": normalize_search_title(title),
+        "title_compact": compact_title(title),
+        "popularity": popularity,
+        "year": year,
+        **tags,
+    }
+
+
+def _parsed_doc(indexed: dict[str, Any]) -> dict[str, Any]:
+    """Document as the Python ranker sees it (parse_doc restores the display title)."""
+    return {**indexed, "search_title": indexed["title"]}
+
+
+_FUNCTIONS = {
+    "exists": lambda value: value is not None,
+    "contains": lambda value, fragment: value.count(fragment),
+    "lower": lambda value: value.lower(),
+    "format": lambda fmt, *args: fmt % args,
+}
+
+
+def _loaded_row(indexed: dict[str, Any]) -> dict[str, Any]:
+    """The values FT.AGGREGATE LOADs for the expression (RedisJSON serializes arrays compactly)."""
+    row = {name: indexed.get(name) for name in ("search_title", "title_compact", "director_name")}
+    for name in MEDIA_TIER_JSON_FIELDS:
+        if name in indexed:
+            row[f"{name}_json"] = json.dumps(
+                indexed[name], ensure_ascii=False, separators=(",", ":")
+            )
+    return row
+
+
+def _expression_tier(query: str, indexed: dict[str, Any]) -> int:
+    expr = build_media_tier_expression(query)
+    expr = expr.replace("&&", " and ").replace("||", " or ").replace("(!", "(not ")
+    expr = re.sub(r"@(\w+)", r"_row.get('\1')", expr)
+    namespace = {"__builtins__": {}, "_row": _loaded_row(indexed), **_FUNCTIONS}
+    return int(eval(expr, namespace))
+
+
+def _presorted(query: str, corpus: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order like the FT.AGGREGATE spec: SORTBY @rank ASC @year DESC @popularity DESC."""
+    return sorted(corpus, key=lambda d: (_expression_tier(query, d), -d["year"], -d["popularity"]))
+
+
+def _ranked(query: str, docs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return sorted((_parsed_doc(d) for d in docs), key=lambda item: score_media_result(query, item))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_expression_tier_never_worse_than_python_title_tier(query: str) -> None:
+    for title in TITLES:
+        indexed = _indexed_doc(title)
+        python_tier = score_media_result(query, _parsed_doc(indexed))[0]
+        expr_tier = _expression_tier(query, indexed)
+
+        if python_tier == 0:
+            assert expr_tier == 0, (query, title)
+        else:
+            assert expr_tier <= python_tier, (query, title)
+
+
+def test_missing_title_compact_falls_back_to_exact_tier_only() -> None:
+    indexed = {"search_title": "Alien", "title_compact": None}
+
+    assert _expression_tier("alien", indexed) == 0
+    assert _expression_tier("aliens", indexed) == 13
+
+
+def test_expression_literals_are_escaped() -> None:
+    expr = build_media_tier_expression('say "hi" \\ bye')
+
+    assert '"say \\"hi\\" \\\\ bye"' in expr
+    assert _expression_tier('say "hi" \\ bye', {"search_title": 'Say "Hi" \\ Bye'}) == 0
+
+
+def test_redis_ranked_head_matches_python_ranker_over_all_matches() -> None:
+    """Server-side pre-sort + Python re-rank of ``limit * 2`` rows keeps the exact-match head.
+
+    The exact titles are given the lowest popularity, so a popularity-sorted
+    candidate window would push them out; the tier pre-sort must not.
+    """
+    limit = 5
+    query = "the office"
+    corpus = [
+        _indexed_doc(f"The Office Party {i}", popularity=1000.0 - i, year=2010) for i in range(60)
+    ]
+    corpus += [
+        _indexed_doc("The Office", popularity=1.0, year=2005),
+        _indexed_doc("The Office", popularity=0.5, year=2001),
+        _indexed_doc("The Office!", popularity=0.1, year=2019),
+    ]
+
+    expected = _ranked(query, corpus)[:limit]
+    actual = _ranked(query, _presorted(query, corpus)[: limit * 2])[:limit]
+
+    assert [(d["title"], d["year"]) for d in actual] == [(d["title"], d["year"]) for d in expected]
+    assert [d["title"] for d in actual[:3]] == ["The Office", "The Office", "The Office!"]
+
+
+TAG_QUERY = "tom hanks"
+TAG_DOCS = [
+    _indexed_doc("Directed", director_name="tom_hanks"),
+    _indexed_doc("Starring", cast_names=["meg_ryan", "tom_hanks"]),
+    _indexed_doc("Tagged", keywords=["tom_hanks", "new_york"]),
+    _indexed_doc("Genre", genres=["tom_hanks"]),
+    _indexed_doc("Near Miss", cast_names=["tom_hanks_jr"], keywords=["not_tom_hanks"]),
+    _indexed_doc("Bare"),
+]
+
+
+@pytest.mark.parametrize("indexed", TAG_DOCS, ids=lambda d: d["title"])
+def test_expression_matches_python_tag_tiers(indexed: dict[str, Any]) -> None:
+    python_tier = score_media_result(TAG_QUERY, _parsed_doc(indexed))[0]
+
+    assert _expression_tier(TAG_QUERY, indexed) == min(python_tier, 13)
+
+
+def test_alias_tiers_are_never_worse_than_python(monkeypatch: pytest.MonkeyPatch) -> None:
+    def aliases(term: str) -> list[str]:
+        return [term, "artificial_intelligence"] if term == "ai" else [term]
+
+    monkeypatch.setattr(ranking, "get_search_aliases", aliases)
+    monkeypatch.setattr(search_queries, "get_search_aliases", aliases)
+    title_alias = _indexed_doc("A.I. Artificial Intelligence")
+    keyword_alias = _indexed_doc("Ex Machina", keywords=["artificial_intelligence_a_i"])
+
+    assert score_media_result("ai", _parsed_doc(title_alias))[0] == 4
+    assert _expression_tier("ai", title_alias) <= 4
+    assert score_media_result("ai", _parsed_doc(keyword_alias))[0] == 5
+    assert _expression_tier("ai", keyword_alias) <= 5
+
+
+def test_redis_ranked_head_keeps_low_popularity_tag_matches() -> None:
+    """Director/cast/keyword/genre matches outrank popular title-substring matches.
+
+    The TAG matches have the lowest popularity and the cast tier is larger
+    than the head, so both the tier and the year ordering inside it must
+    happen in Redis for the ``limit * 2`` window to hold Python's top results.
+    """
+    limit = 5
+    corpus = [
+        _indexed_doc(f"Tom Hanks: A Life {i}", popularity=1000.0 - i, year=2024) for i in range(60)
+    ]
+    corpus += [
+        _indexed_doc("Directed", popularity=0.1, year=1996, director_name="tom_hanks"),
+        _indexed_doc("Tagged", popularity=0.1, year=2020, keywords=["tom_hanks"]),
+        _indexed_doc("Genre", popularity=0.1, year=2021, genres=["tom_hanks"]),
+    ]
+    corpus += [
+        _indexed_doc(f"Cast {year}", popularity=0.2, year=year, cast_names=["tom_hanks"])
+        for year in range(1990, 2000)
+    ]
+
+    expected = _ranked(TAG_QUERY, corpus)[:limit]
+    actual = _ranked(TAG_QUERY, _presorted(TAG_QUERY, corpus)[: limit * 2])[:limit]
+
+    assert [d["title"] for d in actual] == [d["title"] for d in expected]
+    assert [d["title"] for d in actual] == [
+        "Directed",
+        "Cast 1999",
+        "Cast 1998",
+        "Cast 1997",
+        "Cast 1996",
+    ]
+
+
+WORD_QUERY = "star"
+WORD_DOCS = [
+    _indexed_doc("Star Wars"),
+    _indexed_doc("A Star Is Born"),
+    _indexed_doc("Lone Star"),
+    _indexed_doc("Star-Crossed"),
+    _indexed_doc("Wars: Star"),
+    _indexed_doc("Starship Troopers"),
+    _indexed_doc("Lodestar"),
+    _indexed_doc("Directed", director_name="ringo_star"),
+    _indexed_doc("Starring", cast_names=["star_jones"]),
+    _indexed_doc("Tagged", keywords=["rising_star", "space"]),
+    _indexed_doc("Genre", genres=["star"]),
+    _indexed_doc("Starred", cast_names=["starla"], keywords=["superstar"]),
+    _indexed_doc("Bare"),
+]
+
+
+@pytest.mark.parametrize("indexed", WORD_DOCS, ids=lambda d: d["title"])
+def test_expression_matches_python_word_and_substring_tiers(indexed: dict[str, Any]) -> None:
+    python_tier = score_media_result(WORD_QUERY, _parsed_doc(indexed))[0]
+
+    assert _expression_tier(WORD_QUERY, indexed) == min(python_tier, 13)
+
+
+@pytest.mark.parametrize(
+    ("query", "title"),
+    [("goodwillhunt", "Good Will Hunting"), ("spider", "Spider-Man: No Way Home")],
+)
+def test_prefix_title_matches_rank_in_substring_or_word_tier(query: str, title: str) -> None:
+    indexed = _indexed_doc(title)
+
+    assert _expression_tier(query, indexed) == score_media_result(query, _parsed_doc(indexed))[0]
+    assert _expression_tier(query, indexed) < 13
+
+
+def test_redis_ranked_head_keeps_old_title_word_matches() -> None:
+    """A title word match outranks newer substring matches, as in the Python ranker.
+
+    The substring matches are newer and more popular, so a pre-sort that
+    lumped them into one catch-all tier would cut "Star Wars" from the head.
+    """
+    limit = 5
+    corpus = [_indexed_doc(f"Starship {i}", popularity=100.0 - i, year=2024) for i in range(20)]
+    corpus.append(_indexed_doc("Star Wars", popularity=50.0, year=1977))
+
+    expected = _ranked(WORD_QUERY, corpus)[:limit]
+    actual = _ranked(WORD_QUERY, _presorted(WORD_QUERY, corpus)[: limit * 2])[:limit]
+
+    assert [d["title"] for d in actual] == [d["title"] for d in expected]
+    assert actual[0]["title"] == "Star Wars"
@@ -0,0 +1,41 @@
+"""
+Tests for the symmetric-delete spelling corrector.
+"""
+
+from core.spelling import SpellingDictionary, edit_distance, title_terms
+
+COUNTS = {
+    "breaking": 40,
+    "bad": 900,
+    "bed": 30,
+    "godfather": 25,
+    "spider": 50,
+    "man": 300,
+    "stranger": 20,
+    "things": 80,
+}
+
+
+def test_corrects_each_unknown_word_and_splits_run_together_words() -> None:
+    dictionary = SpellingDictionary(COUNTS)
+
+    assert dictionary.correct("Braeking Bda") == "breaking bad"
+    assert dictionary.correct("the godfahter") == "the godfather"
+    assert dictionary.correct("strnager thigns") == "stranger things"
+    assert dictionary.correct("spiderman") == "spider man"
+
+
+def test_known_queries_and_hopeless_words_are_left_alone() -> None:
+    dictionary = SpellingDictionary(COUNTS)
+
+    assert dictionary.correct("breaking bad") is None
+    assert dictionary.correct("xyzzyqq") is None
+    assert dictionary.lookup("bxd") == "bad", "Ties go to the more frequent term"
+    assert dictionary.lookup("zz") is None, "Two-letter words are never corrected"
+
+
+def test_edit_distance_counts_transpositions_and_stops_early() -> None:
+    assert edit_distance("teh", "the", 2) == 1
+    assert edit_distance("kitten", "sitting", 2) == 3
+    assert edit_distance("a", "abcdef", 2) == 3
+    assert title_terms("The Lord of the Rings: 2") == {"the", "lord", "of", "rings"}
@@ -27,6 +27,8 @@ from typing import Any, cast
 from redis.asyncio import Redis
 
 from adapters.config import load_env
+from adapters.index_generation import queue_index_generation_bump
+from adapters.key_prefix import resolve_key_prefix
 from api.openlibrary.bulk.load_author_index import mc_author_to_redis_doc
 from api.openlibrary.models import MCAuthorItem
 from api.openlibrary.wrappers import openlibrary_wrapper
@@ -34,6 +36,7 @@ from core.normalize import resolve_timestamps
 from core.search_queries import escape_redis_search_term, normalize_query_separators
 from utils.base_api_client import BaseAPIClient
 from utils.get_logger import get_logger
+from utils.http_session import run_with_http_sessions
 
 logger = get_logger(__name__)
 
@@ -494,6 +497,7 @@ class BestsellerAuthorETL(BaseAPIClient):
 
                 load_start = time.time()
                 prepared: list[tuple[str, dict[str, Any]]] = []
+                key_prefix = await resolve_key_prefix(redis, KEY_PREFIX)
 
                 for author in found_authors:
                     stats.load_phase.items_processed += 1
@@ -501,7 +505,7 @@ class BestsellerAuthorETL(BaseAPIClient):
                     try:
                         author_dict = author.model_dump(mode="json")
                         redis_doc = mc_author_to_redis_doc(author_dict)
-                        key = f"{KEY_PREFIX}{redis_doc['id']}"
+                        key = f"{key_prefix}{redis_doc['id']}"
 
                         prepared.append((key, redis_doc))
                         stats.load_phase.items_success += 1
@@ -522,6 +526,7 @@ class BestsellerAuthorETL(BaseAPIClient):
                                 doc["created_at"] = ca
                                 doc["modified_at"] = ma
                                 write_pipe.json().set(k, "$", doc)
+                            queue_index_generation_bump(write_pipe)
                             await write_pipe.execute()
                             prepared = []
 
@@ -547,6 +552,7 @@ class BestsellerAuthorETL(BaseAPIClient):
                         doc["created_at"] = ca
                         doc["modified_at"] = ma
                         write_pipe.json().set(k, "$", doc)
+                    queue_index_generation_bump(write_pipe)
                     await write_pipe.execute()
 
                 stats.load_phase.completed_at = datetime.now()
@@ -692,7 +698,7 @@ if __name__ == "__main__":
     if args.local:
         api_url = MEDIACIRCLE_API_URL_LOCAL
 
-    asyncio.run(
+    run_with_http_sessions(
         run_bestseller_author_etl(
             redis_host=args.redis_host,
             redis_port=args.redis_port,
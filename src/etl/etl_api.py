@@ -21,6 +21,7 @@ from adapters.config import load_env
 from etl.etl_metadata import ETLMetadataStore
 from etl.etl_runner import ETLConfig, ETLRunner, run_single_etl
 from utils.get_logger import get_logger
+from utils.http_session import close_http_sessions
 
 logger = get_logger(__name__)
 
@@ -43,6 +44,12 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared upstream HTTP sessions opened by background ETL tasks."""
+    await close_http_sessions()
+
+
 # Track running ETL task
 _etl_task_status: dict[str, Any] = {
     "running": False,
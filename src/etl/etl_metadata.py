@@ -36,6 +36,8 @@ class JobRunResult:
     duration_seconds: float | None = None
     effective_start_date: str | None = None  # YYYY-MM-DD resolved at runtime
     effective_end_date: str | None = None  # YYYY-MM-DD resolved at runtime
+    resource_group: str | None = None
+    queued_seconds: float | None = None  # Run start -> job start (dependency/slot waits)
 
     # Job-specific stats
     changes_found: int = 0
@@ -64,6 +66,8 @@ class JobRunResult:
             "duration_seconds": self.duration_seconds,
             "effective_start_date": self.effective_start_date,
             "effective_end_date": self.effective_end_date,
+            "resource_group": self.resource_group,
+            "queued_seconds": self.queued_seconds,
             "changes_found": self.changes_found,
             "documents_upserted": self.documents_upserted,
             "documents_skipped": self.documents_skipped,
@@ -96,6 +100,10 @@ class ETLRunMetadata:
     jobs_failed: int = 0
     jobs_skipped: int = 0
 
+    # Scheduling: total_job_seconds vs duration_seconds shows the overlap won
+    max_concurrent_jobs: int = 1
+    total_job_seconds: float = 0.0
+
     # Aggregate stats
     total_changes_found: int = 0
     total_documents_upserted: int = 0
@@ -143,6 +151,8 @@ class ETLRunMetadata:
             "jobs_completed": self.jobs_completed,
             "jobs_failed": self.jobs_failed,
             "jobs_skipped": self.jobs_skipped,
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "total_job_seconds": self.total_job_seconds,
             "total_changes_found": self.total_changes_found,
             "total_documents_upserted": self.total_documents_upserted,
             "total_errors": self.total_errors,
@@ -525,6 +535,8 @@ class ETLMetadataStore:
             jobs_completed=data.get("jobs_completed", 0),
             jobs_failed=data.get("jobs_failed", 0),
             jobs_skipped=data.get("jobs_skipped", 0),
+            max_concurrent_jobs=data.get("max_concurrent_jobs", 1),
+            total_job_seconds=data.get("total_job_seconds", 0.0),
             total_changes_found=data.get("total_changes_found", 0),
             total_documents_upserted=data.get("total_documents_upserted", 0),
             total_errors=data.get("total_errors", 0),
@@ -555,6 +567,8 @@ class ETLMetadataStore:
                 status=jr_data.get("status", "unknown"),
                 effective_start_date=jr_data.get("effective_start_date"),
                 effective_end_date=jr_data.get("effective_end_date"),
+                resource_group=jr_data.get("resource_group"),
+                queued_seconds=jr_data.get("queued_seconds"),
                 changes_found=jr_data.get("changes_found", 0),
                 documents_upserted=jr_data.get("documents_upserted", 0),
                 documents_skipped=jr_data.get("documents_skipped", 0),
@@ -3,7 +3,7 @@ ETL Runner - Execute ETL jobs from YAML configuration.
 
 This module provides:
 - YAML configuration loading for ETL jobs
-- Sequential job execution
+- Dependency-aware concurrent job execution (see ``etl.job_graph``)
 - Progress tracking and metadata persistence
 - HTTP trigger support for Cloud Run scheduling
 """
@@ -27,7 +27,9 @@ from etl.etl_metadata import (
     JobRunResult,
     create_run_metadata,
 )
+from etl.job_graph import JobNode, run_job_graph
 from etl.pi_nightly_etl import PIETLStats, run_pi_nightly_etl
+from etl.spelling_dictionary_etl import SpellingETLStats, run_spelling_dictionary_etl
 from etl.tmdb_nightly_etl import ChangesETLStats, run_nightly_etl
 from utils.alerts import send_alert
 from utils.get_logger import get_logger
@@ -35,6 +37,7 @@ from utils.get_logger import get_logger
 logger = get_logger(__name__)
 
 DEFAULT_JOB_TIMEOUT_SECONDS = 10800  # 3 hours
+DEFAULT_MAX_CONCURRENT_JOBS = 3
 
 
 @dataclass
@@ -75,6 +78,8 @@ class JobConfig:
     target: str  # Function name to call
     enabled: bool = True
     runs: list[JobRunParams] = field(default_factory=list)
+    depends_on: list[str] = field(default_factory=list)  # Job names that must succeed first
+    resource_group: str | None = None  # Jobs sharing a group share its concurrency limit
 
     @classmethod
     def from_dict(cls, name: str, data: dict[str, Any]) -> "JobConfig":
@@ -88,6 +93,8 @@ class JobConfig:
             target=data.get("target", ""),
             enabled=data.get("enabled", True),
             runs=runs,
+            depends_on=list(data.get("depends_on", [])),
+            resource_group=data.get("resource_group"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -96,6 +103,8 @@ class JobConfig:
             "target": self.target,
             "enabled": self.enabled,
             "runs": [r.to_dict() for r in self.runs],
+            "depends_on": self.depends_on,
+            "resource_group": self.resource_group,
         }
 
 
@@ -105,6 +114,10 @@ class ETLConfig:
 
     jobs: list[JobConfig] = field(default_factory=list)
 
+    # Scheduling
+    max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS
+    resource_group_limits: dict[str, int] = field(default_factory=dict)
+
     # Redis config
     redis_host: str = "localhost"
     redis_port: int = 6380
@@ -124,6 +137,19 @@ class ETLConfig:
             job = JobConfig.from_dict(job_name, job_data)
             config.jobs.append(job)
 
+        # Load scheduler config
+        scheduler_config = data.get("scheduler", {})
+        config.max_concurrent_jobs = int(
+            os.getenv(
+                "ETL_MAX_CONCURRENT_JOBS",
+                scheduler_config.get("max_concurrent_jobs", DEFAULT_MAX_CONCURRENT_JOBS),
+            )
+        )
+        config.resource_group_limits = {
+            str(name): int(limit)
+            for name, limit in (scheduler_config.get("resource_groups") or {}).items()
+        }
+
         # Load Redis config
         redis_config = data.get("redis", {})
         config.redis_host = redis_config.get("host", os.getenv("REDIS_HOST", "localhost"))
@@ -145,6 +171,8 @@ class ETLConfig:
     def to_dict(self) -> dict[str, Any]:
         return {
             "jobs": [j.to_dict() for j in self.jobs],
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "resource_group_limits": self.resource_group_limits,
             "redis_host": self.redis_host,
             "redis_port": self.redis_port,
         }
@@ -159,6 +187,7 @@ def _get_etl_functions() -> dict[str, Any]:
         "tmdb_nightly_etl": run_nightly_etl,
         "pi_nightly_etl": run_pi_nightly_etl,
         "bestseller_author_etl": run_bestseller_author_etl,
+        "spelling_dictionary_etl": run_spelling_dictionary_etl,
     }
 
 
@@ -173,7 +202,7 @@ class ETLRunner:
     The runner:
     1. Loads job configurations from YAML
     2. Determines start_date from last successful run (or uses provided override)
-    3. Executes jobs sequentially
+    3. Executes jobs concurrently, honouring depends_on and resource groups
     4. Tracks progress and saves metadata to GCS
     """
 
@@ -271,9 +300,10 @@ class ETLRunner:
             logger.info(f"Running {job_name}: {start_date} to {end_date}")
 
             # Handle different ETL types
+            stats: ChangesETLStats | PIETLStats | BestsellerETLStats | SpellingETLStats
             if job.target == "pi_nightly_etl":
                 # PodcastIndex ETL - doesn't use media_type/dates, uses since_hours
-                stats: ChangesETLStats | PIETLStats | BestsellerETLStats = await etl_func(
+                stats = await etl_func(
                     media_type="podcast",
                     redis_host=self.config.redis_host,
                     redis_port=self.config.redis_port,
@@ -291,6 +321,14 @@ class ETLRunner:
                     verbose=params.verbose,
                     max_batches=params.max_batches,
                 )
+            elif job.target == "spelling_dictionary_etl":
+                # Spelling dictionary - rebuilt from the live indexes, no dates
+                stats = await etl_func(
+                    redis_host=self.config.redis_host,
+                    redis_port=self.config.redis_port,
+                    redis_password=self.config.redis_password,
+                    verbose=params.verbose,
+                )
             else:
                 # TMDB ETL - validate media_type
                 if params.media_type not in ("tv", "movie", "person"):
@@ -371,7 +409,12 @@ class ETLRunner:
         progress_callback: Callable[[dict[str, Any]], None] | None = None,
     ) -> ETLRunMetadata:
         """
-        Run all enabled ETL jobs sequentially.
+        Run all enabled ETL jobs.
+
+        Jobs run concurrently up to ``config.max_concurrent_jobs``; a job waits
+        for everything in its ``depends_on`` to succeed and for a free slot in
+        its ``resource_group``.  A job whose dependency failed is recorded as
+        skipped.
 
         Args:
             start_date_override: Override start date for all jobs
@@ -418,19 +461,73 @@ class ETLRunner:
         print(f"  Total jobs: {total_runs}")
         print(f"  Redis: {self.config.redis_host}:{self.config.redis_port}")
         print(f"  Media Manager: {'enabled' if mm_client else 'disabled'}")
+        print(f"  Max concurrent jobs: {self.config.max_concurrent_jobs}")
         print()
 
         job_timeout = int(
             os.getenv("ETL_JOB_TIMEOUT_SECONDS", str(DEFAULT_JOB_TIMEOUT_SECONDS))
         )
 
-        # Run each job sequentially
-        for job in enabled_jobs:
+        run_metadata = self._run_metadata
+        run_metadata.max_concurrent_jobs = self.config.max_concurrent_jobs
+        run_started = datetime.now()
+
+        def record_result(result: JobRunResult) -> None:
+            run_metadata.job_results.append(result)
+
+            if result.status == "success":
+                run_metadata.jobs_completed += 1
+            elif result.status == "failed":
+                run_metadata.jobs_failed += 1
+            elif result.status == "skipped":
+                run_metadata.jobs_skipped += 1
+
+            # Aggregate stats
+            run_metadata.total_changes_found += result.changes_found
+            run_metadata.total_documents_upserted += result.documents_upserted
+            run_metadata.total_errors += result.errors_count
+            run_metadata.total_mm_docs_sent += result.mm_docs_sent
+            run_metadata.total_new_entries += result.new_entries
+            run_metadata.total_microgenres_generated += result.microgenres_generated
+            run_metadata.total_microgenres_preserved += result.microgenres_preserved
+            run_metadata.total_microgenres_skipped_existing += (
+                result.microgenres_skipped_existing
+            )
+            run_metadata.total_microgenres_failed += result.microgenres_failed
+            run_metadata.total_job_seconds += result.duration_seconds or 0.0
+
+            # Update job state (don't let GCS failures kill the whole run)
+            if result.status != "skipped":
+                try:
+                    self.metadata_store.update_job_state(result.job_name, result)
+                except Exception as e:
+                    logger.warning(f"Failed to update job state for {result.job_name}: {e}")
+
+            # Call progress callback if provided
+            if progress_callback:
+                progress_callback(
+                    {
+                        "total_jobs": total_runs,
+                        "jobs_completed": run_metadata.jobs_completed,
+                        "jobs_failed": run_metadata.jobs_failed,
+                        "current_job": result.job_name,
+                        "last_result": {
+                            "job_name": result.job_name,
+                            "status": result.status,
+                            "changes_found": result.changes_found,
+                            "documents_upserted": result.documents_upserted,
+                        },
+                    }
+                )
+
+        async def run_scheduled_job(job: JobConfig) -> bool:
+            """Run every parameter set of one job in order; True if none failed."""
             print(f"\n📋 Job: {job.name}")
             print(f"   Target: {job.target}")
 
+            succeeded = True
             for params in job.runs:
-                print(f"\n   Running: {params.media_type}")
+                print(f"\n   Running: {job.name} ({params.media_type})")
 
                 job_name = f"{job.name}_{params.media_type}"
                 resolved_start_date = (
@@ -468,56 +565,43 @@ class ETLRunner:
                         error_message=f"Timed out after {job_timeout}s",
                         errors=[f"Timed out after {job_timeout}s"],
                     )
-                    if self._run_metadata:
-                        self._run_metadata.add_log(
-                            f"TIMEOUT {job_name} after {job_timeout}s"
-                        )
-
-                # Track result
-                self._run_metadata.job_results.append(result)
-
-                if result.status == "success":
-                    self._run_metadata.jobs_completed += 1
-                elif result.status == "failed":
-                    self._run_metadata.jobs_failed += 1
-                elif result.status == "skipped":
-                    self._run_metadata.jobs_skipped += 1
-
-                # Aggregate stats
-                self._run_metadata.total_changes_found += result.changes_found
-                self._run_metadata.total_documents_upserted += result.documents_upserted
-                self._run_metadata.total_errors += result.errors_count
-                self._run_metadata.total_mm_docs_sent += result.mm_docs_sent
-                self._run_metadata.total_new_entries += result.new_entries
-                self._run_metadata.total_microgenres_generated += result.microgenres_generated
-                self._run_metadata.total_microgenres_preserved += result.microgenres_preserved
-                self._run_metadata.total_microgenres_skipped_existing += (
-                    result.microgenres_skipped_existing
-                )
-                self._run_metadata.total_microgenres_failed += result.microgenres_failed
+                    run_metadata.add_log(f"TIMEOUT {job_name} after {job_timeout}s")
 
-                # Update job state (don't let GCS failures kill the whole run)
-                try:
-                    self.metadata_store.update_job_state(result.job_name, result)
-                except Exception as e:
-                    logger.warning(f"Failed to update job state for {result.job_name}: {e}")
+                result.resource_group = job.resource_group or job.name
+                result.queued_seconds = (started_at - run_started).total_seconds()
+                record_result(result)
+                if result.status == "failed":
+                    succeeded = False
+            return succeeded
 
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(
-                        {
-                            "total_jobs": total_runs,
-                            "jobs_completed": self._run_metadata.jobs_completed,
-                            "jobs_failed": self._run_metadata.jobs_failed,
-                            "current_job": f"{job.name}_{params.media_type}",
-                            "last_result": {
-                                "job_name": result.job_name,
-                                "status": result.status,
-                                "changes_found": result.changes_found,
-                                "documents_upserted": result.documents_upserted,
-                            },
-                        }
+        def skip_blocked_job(node: JobNode, failed_dependency: str) -> None:
+            job = jobs_by_name[node.name]
+            for params in job.runs:
+                message = f"Skipped: dependency {failed_dependency} did not succeed"
+                run_metadata.add_log(f"SKIPPED {job.name}_{params.media_type}: {message}")
+                record_result(
+                    JobRunResult(
+                        job_name=f"{job.name}_{params.media_type}",
+                        media_type=params.media_type,
+                        status="skipped",
+                        resource_group=node.group,
+                        error_message=message,
                     )
+                )
+
+        # Independent jobs overlap; depends_on and resource groups serialize the rest
+        jobs_by_name = {job.name: job for job in enabled_jobs}
+        nodes = [
+            JobNode(job.name, depends_on=list(job.depends_on), resource_group=job.resource_group)
+            for job in enabled_jobs
+        ]
+        await run_job_graph(
+            nodes,
+            lambda node: run_scheduled_job(jobs_by_name[node.name]),
+            max_concurrent=self.config.max_concurrent_jobs,
+            group_limits=self.config.resource_group_limits,
+            on_blocked=skip_blocked_job,
+        )
 
         # Drain queue and rebuild FAISS indexes
         if mm_client and self._run_metadata.total_mm_docs_sent > 0:
@@ -667,7 +751,10 @@ class ETLRunner:
             print(f"  Media Manager docs sent: {self._run_metadata.total_mm_docs_sent}")
         print(f"  Total errors: {self._run_metadata.total_errors}")
         if self._run_metadata.duration_seconds:
-            print(f"  Duration: {self._run_metadata.duration_seconds:.1f}s")
+            print(
+                f"  Duration: {self._run_metadata.duration_seconds:.1f}s "
+                f"(job time {self._run_metadata.total_job_seconds:.1f}s)"
+            )
         print()
         print("🎉 ETL Run Complete!")
 
@@ -0,0 +1,151 @@
+"""
+Job Graph - Dependency-aware concurrent scheduling for ETL jobs.
+
+Each job declares the jobs it ``depends_on`` and the ``resource_group`` it
+draws from (e.g. the TMDB rate budget).  A job starts once all of its
+dependencies finished successfully, a slot in its resource group is free,
+and the global concurrency cap allows it.  Jobs in different groups with no
+dependency between them overlap, so the run takes roughly as long as its
+longest chain instead of the sum of all jobs.
+
+A job whose dependency failed is not run; the scheduler reports it through
+``on_blocked`` so the caller can record it as skipped.
+
+Jobs run as coroutines on one event loop, so a job must push blocking work
+(downloads, archive extraction, SQLite scans) to ``asyncio.to_thread``;
+otherwise it stalls every job it is meant to overlap with.
+
+Usage:
+    from etl.job_graph import JobNode, run_job_graph
+
+    nodes = [
+        JobNode("tmdb_tv", resource_group="tmdb"),
+        JobNode("tmdb_movie", resource_group="tmdb"),
+        JobNode("reindex", depends_on=["tmdb_tv", "tmdb_movie"]),
+    ]
+    outcomes = await run_job_graph(nodes, run_one, max_concurrent=3)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class JobNode:
+    """One schedulable job."""
+
+    name: str
+    depends_on: list[str] = field(default_factory=list)
+    resource_group: str | None = None  # None = a group of its own
+
+    @property
+    def group(self) -> str:
+        return self.resource_group or self.name
+
+
+def order_job_graph(nodes: list[JobNode]) -> list[JobNode]:
+    """
+    Validate the graph and return the nodes in a dependency-respecting order.
+
+    Dependencies on jobs outside ``nodes`` (disabled or filtered out) are
+    dropped with a warning rather than blocking the run.
+
+    Raises:
+        ValueError: On duplicate job names or a dependency cycle.
+    """
+    by_name: dict[str, JobNode] = {}
+    for node in nodes:
+        if node.name in by_name:
+            raise ValueError(f"Duplicate ETL job name: {node.name}")
+        by_name[node.name] = node
+
+    for node in nodes:
+        missing = [dep for dep in node.depends_on if dep not in by_name]
+        if missing:
+            logger.warning(f"Job {node.name}: ignoring dependencies not in this run: {missing}")
+            node.depends_on = [dep for dep in node.depends_on if dep in by_name]
+
+    ordered: list[JobNode] = []
+    state: dict[str, str] = {}  # name -> "visiting" | "done"
+
+    def visit(node: JobNode, path: list[str]) -> None:
+        status = state.get(node.name)
+        if status == "done":
+            return
+        if status == "visiting":
+            cycle = " -> ".join([*path[path.index(node.name) :], node.name])
+            raise ValueError(f"ETL job dependency cycle: {cycle}")
+        state[node.name] = "visiting"
+        for dep in node.depends_on:
+            visit(by_name[dep], [*path, node.name])
+        state[node.name] = "done"
+        ordered.append(node)
+
+    for node in nodes:
+        visit(node, [])
+    return ordered
+
+
+async def run_job_graph(
+    nodes: list[JobNode],
+    run: Callable[[JobNode], Awaitable[bool]],
+    max_concurrent: int = 1,
+    group_limits: dict[str, int] | None = None,
+    on_blocked: Callable[[JobNode, str], None] | None = None,
+) -> dict[str, bool]:
+    """
+    Run every node once its dependencies succeeded.
+
+    Args:
+        nodes: Jobs to run; validated with ``order_job_graph``.
+        run: Runs one job and returns True on success.  Exceptions count
+            as failure.
+        max_concurrent: Global cap on jobs running at once.
+        group_limits: Concurrent jobs allowed per resource group (default 1).
+        on_blocked: Called with ``(node, failed_dependency)`` for jobs that
+            are skipped because a dependency failed.
+
+    Returns:
+        Job name -> success.  Blocked jobs map to False.
+    """
+    ordered = order_job_graph(nodes)
+    limits = group_limits or {}
+    global_slots = asyncio.Semaphore(max(1, max_concurrent))
+    group_slots = {
+        node.group: asyncio.Semaphore(max(1, limits.get(node.group, 1))) for node in ordered
+    }
+    finished = {node.name: asyncio.Event() for node in ordered}
+    outcomes: dict[str, bool] = {}
+
+    async def _run_node(node: JobNode) -> None:
+        try:
+            for dep in node.depends_on:
+                await finished[dep].wait()
+            failed_dep = next((dep for dep in node.depends_on if not outcomes[dep]), None)
+            if failed_dep is not None:
+                logger.warning(f"Skipping {node.name}: dependency {failed_dep} did not succeed")
+                outcomes[node.name] = False
+                if on_blocked:
+                    on_blocked(node, failed_dep)
+                return
+            # Group first so a job waiting on its rate budget doesn't hold a global slot
+            async with group_slots[node.group], global_slots:
+                try:
+                    outcomes[node.name] = await run(node)
+                except Exception as e:
+                    logger.error(f"Job {node.name} raised: {e}")
+                    outcomes[node.name] = False
+        finally:
+            outcomes.setdefault(node.name, False)
+            finished[node.name].set()
+
+    # Tasks start in dependency order so same-group jobs keep their config order
+    await asyncio.gather(*(_run_node(node) for node in ordered))
+    return outcomes
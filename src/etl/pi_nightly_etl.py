@@ -50,9 +50,11 @@ from google.cloud import storage as gcs_storage  # type: ignore[attr-defined]
 from redis.asyncio import Redis
 
 from adapters.config import load_env
+from adapters.document_patch import queue_document_patch
+from adapters.index_generation import queue_index_generation_bump
 from contracts.models import MCSources, MCType
 from core.iptc import expand_keywords, normalize_tag
-from core.normalize import SearchDocument, document_to_redis, resolve_timestamps
+from core.normalize import SearchDocument, document_to_redis, stamp_document_for_write
 from utils.get_logger import get_logger
 
 logger = get_logger(__name__)
@@ -123,6 +125,7 @@ class PIETLStats:
     # Load
     documents_loaded: int = 0
     documents_skipped: int = 0
+    documents_unchanged: int = 0  # Loaded but identical to Redis; JSON.SET skipped
     errors: int = 0
     error_messages: list[str] = field(default_factory=list)
 
@@ -160,6 +163,7 @@ class PIETLStats:
             "after_filters": self.after_filters,
             "documents_loaded": self.documents_loaded,
             "documents_skipped": self.documents_skipped,
+            "documents_unchanged": self.documents_unchanged,
             "errors": self.errors,
         }
 
@@ -414,6 +418,74 @@ class PodcastIndexNightlyETL:
 
         return redis_doc
 
+    def _query_recent_podcasts(
+        self, db_path: Path, since_timestamp: int, limit: int | None
+    ) -> list[sqlite3.Row]:
+        """Rows of podcasts updated since ``since_timestamp`` that pass the load filters."""
+        # Build query with filters (same as bulk loader + lastUpdate filter)
+        query = """
+            SELECT
+                id, title, url, link, description,
+                itunesAuthor, itunesOwnerName, imageUrl, language,
+                category1, category2, category3, category4, category5,
+                category6, category7, category8, category9, category10,
+                episodeCount, popularityScore, itunesId, podcastGuid, lastUpdate
+            FROM podcasts
+            WHERE
+                lastUpdate >= ?
+                AND popularityScore >= ?
+                AND language LIKE 'en%'
+                AND episodeCount > 0
+                AND imageUrl != ''
+                AND imageUrl IS NOT NULL
+                AND dead = 0
+            ORDER BY popularityScore DESC, episodeCount DESC
+        """
+        params: list[Any] = [since_timestamp, MIN_POPULARITY_SCORE]
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.row_factory = sqlite3.Row
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+    def _prepare_documents(
+        self, rows: list[sqlite3.Row], dry_run: bool, stats: PIETLStats
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Convert rows to ``(key, redis_doc)`` pairs (none on a dry run)."""
+        prepared: list[tuple[str, dict[str, Any]]] = []
+
+        for row in rows:
+            try:
+                search_doc = self._row_to_search_document(row)
+                redis_doc = document_to_redis(search_doc)
+                redis_doc = self._add_display_fields(redis_doc, row)
+                key = f"podcast:{search_doc.id}"
+
+                if dry_run:
+                    stats.documents_loaded += 1
+                    if stats.documents_loaded <= 5:
+                        logger.info(
+                            f"  [DRY RUN] Would load: {search_doc.search_title[:50]} -> {key}"
+                        )
+                else:
+                    prepared.append((key, redis_doc))
+                    stats.documents_loaded += 1
+
+            except Exception as e:
+                stats.errors += 1
+                if stats.errors <= 5:
+                    row_keys = row.keys()
+                    podcast_id = row["id"] if "id" in row_keys else "unknown"
+                    stats.error_messages.append(f"Feed {podcast_id}: {e}")
+                    logger.error(f"Error processing podcast {podcast_id}: {e}")
+        return prepared
+
     async def run(
         self,
         since_hours: int = 48,
@@ -441,7 +513,10 @@ class PodcastIndexNightlyETL:
             logger.info("🎙️  PodcastIndex Nightly ETL")
             logger.info("=" * 60)
 
-            db_path = self._download_database(stats)
+            # Download, extraction, the SQLite scan and row conversion block;
+            # they run in worker threads so other ETL jobs scheduled on this
+            # event loop (run_job_graph) keep making progress.
+            db_path = await asyncio.to_thread(self._download_database, stats)
 
             # Step 2: Connect to Redis
             if not dry_run:
@@ -456,75 +531,21 @@ class PodcastIndexNightlyETL:
 
             logger.info(f"  Since: {since_time} (ts: {since_timestamp})")
 
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Build query with filters (same as bulk loader + lastUpdate filter)
-            query = """
-                SELECT
-                    id, title, url, link, description,
-                    itunesAuthor, itunesOwnerName, imageUrl, language,
-                    category1, category2, category3, category4, category5,
-                    category6, category7, category8, category9, category10,
-                    episodeCount, popularityScore, itunesId, podcastGuid, lastUpdate
-                FROM podcasts
-                WHERE
-                    lastUpdate >= ?
-                    AND popularityScore >= ?
-                    AND language LIKE 'en%'
-                    AND episodeCount > 0
-                    AND imageUrl != ''
-                    AND imageUrl IS NOT NULL
-                    AND dead = 0
-                ORDER BY popularityScore DESC, episodeCount DESC
-            """
-            params: list[Any] = [since_timestamp, MIN_POPULARITY_SCORE]
-
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            rows = await asyncio.to_thread(
+                self._query_recent_podcasts, db_path, since_timestamp, limit
+            )
 
             stats.after_filters = len(rows)
             logger.info(f"  Found {len(rows):,} podcasts matching criteria")
 
             if not rows:
                 logger.info("No podcasts to update")
-                conn.close()
                 return stats
 
             # Step 4: Load into Redis
             logger.info("Loading into Redis...")
 
-            prepared: list[tuple[str, dict[str, Any]]] = []
-
-            for row in rows:
-                try:
-                    search_doc = self._row_to_search_document(row)
-                    redis_doc = document_to_redis(search_doc)
-                    redis_doc = self._add_display_fields(redis_doc, row)
-                    key = f"podcast:{search_doc.id}"
-
-                    if dry_run:
-                        stats.documents_loaded += 1
-                        if stats.documents_loaded <= 5:
-                            logger.info(
-                                f"  [DRY RUN] Would load: {search_doc.search_title[:50]} -> {key}"
-                            )
-                    else:
-                        prepared.append((key, redis_doc))
-                        stats.documents_loaded += 1
-
-                except Exception as e:
-                    stats.errors += 1
-                    if stats.errors <= 5:
-                        row_keys = row.keys()
-                        podcast_id = row["id"] if "id" in row_keys else "unknown"
-                        stats.error_messages.append(f"Feed {podcast_id}: {e}")
-                        logger.error(f"Error processing podcast {podcast_id}: {e}")
+            prepared = await asyncio.to_thread(self._prepare_documents, rows, dry_run, stats)
 
             if not dry_run:
                 for i in range(0, len(prepared), REDIS_BATCH_SIZE):
@@ -537,23 +558,25 @@ class PodcastIndexNightlyETL:
                     existing_docs: list[object] = await read_pipe.execute()
 
                     write_pipe = self.redis.pipeline()  # type: ignore[union-attr]
+                    written = 0
                     for (key, redis_doc), existing in zip(
                         batch, existing_docs, strict=True
                     ):
                         existing_dict = existing if isinstance(existing, dict) else None
-                        ca, ma, _ = resolve_timestamps(existing_dict, now_ts)
-                        redis_doc["created_at"] = ca
-                        redis_doc["modified_at"] = ma
-                        write_pipe.json().set(key, "$", redis_doc)
-                    await write_pipe.execute()
+                        if not stamp_document_for_write(redis_doc, existing_dict, now_ts):
+                            stats.documents_unchanged += 1
+                            continue
+                        queue_document_patch(write_pipe, key, existing_dict, redis_doc)
+                        written += 1
+                    if written:
+                        queue_index_generation_bump(write_pipe)
+                        await write_pipe.execute()
 
                     logger.info(
                         f"  Loaded {min(i + REDIS_BATCH_SIZE, len(prepared)):,}"
                         f"/{len(prepared):,} podcasts..."
                     )
 
-            conn.close()
-
         finally:
             # Step 5: Cleanup
             if not dry_run:
@@ -561,7 +584,7 @@ class PodcastIndexNightlyETL:
 
             if not keep_db and self.temp_dir.exists():
                 logger.info("Cleaning up downloaded files...")
-                shutil.rmtree(self.temp_dir)
+                await asyncio.to_thread(shutil.rmtree, self.temp_dir)
                 logger.info("  Cleanup complete")
 
         stats.completed_at = datetime.now()
@@ -36,6 +36,7 @@ from datetime import datetime
 
 from etl.etl_runner import ETLConfig, ETLRunner
 from utils.get_logger import get_logger
+from utils.http_session import close_http_sessions
 
 logger = get_logger(__name__)
 
@@ -170,6 +171,8 @@ async def main() -> int:
     except Exception as e:
         logger.error(f"ETL failed with error: {e}", exc_info=True)
         return 1
+    finally:
+        await close_http_sessions()
 
 
 if __name__ == "__main__":
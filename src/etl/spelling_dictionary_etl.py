@@ -0,0 +1,179 @@
+"""
+Spelling Dictionary ETL - Rebuild the local spelling-correction vocabulary.
+
+Scans every indexed document type, counts in how many documents each
+title/name term appears, and stores the most frequent terms for
+``services.spelling_service`` (which replaces the external suggest call in
+``resolve``).  Runs after the nightly TMDB loads so new titles are
+correctable the next morning; podcast, book and author titles loaded later
+(or by a failed run) are picked up by the next rebuild.
+
+Every web process builds the full symmetric-delete index from the kept
+terms, so the vocabulary size bounds its memory and rebuild time: about
+90 MB and 2 s of CPU per 50,000 terms.
+
+Usage:
+    python -m etl.spelling_dictionary_etl
+
+Tuning (environment variables):
+    SPELLING_MAX_TERMS   Vocabulary size kept, most frequent first (default: 50000)
+    SPELLING_MIN_COUNT   Minimum document frequency for a term (default: 1)
+"""
+
+import asyncio
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from redis.asyncio import Redis
+
+from adapters.config import load_env
+from adapters.key_prefix import resolve_key_prefix
+from core.spelling import title_terms
+from etl.tmdb_nightly_etl import ETLPhaseStats
+from services.spelling_service import save_spelling_terms
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Base key prefixes of every index whose titles/names are searchable
+SPELLING_SOURCE_PREFIXES = ("media:", "person:", "podcast:", "book:", "author:")
+SPELLING_MAX_TERMS = int(os.getenv("SPELLING_MAX_TERMS", "50000"))
+SPELLING_MIN_COUNT = int(os.getenv("SPELLING_MIN_COUNT", "1"))
+
+_SCAN_COUNT = 1000
+
+
+@dataclass
+class SpellingETLStats:
+    """Statistics from a spelling dictionary rebuild."""
+
+    fetch_phase: ETLPhaseStats = field(default_factory=lambda: ETLPhaseStats("scan_titles"))
+    load_phase: ETLPhaseStats = field(default_factory=lambda: ETLPhaseStats("save_dictionary"))
+    documents_by_prefix: dict[str, int] = field(default_factory=dict)
+    distinct_terms: int = 0
+    terms_kept: int = 0
+    version: str = ""
+
+    # Compatibility with ETL runner (matches ChangesETLStats interface)
+    total_changes_found: int = 0
+    failed_filter: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "documents_by_prefix": self.documents_by_prefix,
+            "distinct_terms": self.distinct_terms,
+            "terms_kept": self.terms_kept,
+            "version": self.version,
+            "scan_seconds": self.fetch_phase.duration_seconds,
+            "errors": (self.fetch_phase.errors + self.load_phase.errors)[:10],
+        }
+
+
+async def count_title_terms(redis: Redis, prefix: str, counts: Counter[str]) -> int:
+    """Add the terms of every ``search_title`` under ``prefix`` to ``counts``."""
+    documents = 0
+    cursor = 0
+    while True:
+        cursor, keys = await redis.scan(cursor=cursor, match=f"{prefix}*", count=_SCAN_COUNT)
+        if keys:
+            titles = await redis.json().mget(cast(list[str], keys), "$.search_title")
+            for title in titles:
+                # JSONPath reads come back as a one-element list
+                if isinstance(title, list):
+                    title = title[0] if title else None
+                if isinstance(title, str):
+                    counts.update(title_terms(title))
+                    documents += 1
+        if int(cursor) == 0:
+            return documents
+
+
+async def run_spelling_dictionary_etl(
+    media_type: str = "all",  # Ignored, for compatibility with ETL runner
+    start_date: str | None = None,  # Ignored
+    end_date: str | None = None,  # Ignored
+    redis_host: str = "localhost",
+    redis_port: int = 6379,
+    redis_password: str | None = None,
+    verbose: bool = False,
+    max_batches: int = 0,  # Ignored
+) -> SpellingETLStats:
+    """
+    Rebuild the spelling vocabulary from the live indexes.
+
+    This function signature is compatible with the ETL runner.
+
+    Returns:
+        SpellingETLStats with run results
+    """
+    stats = SpellingETLStats()
+    redis = Redis(host=redis_host, port=redis_port, password=redis_password, decode_responses=True)
+    counts: Counter[str] = Counter()
+    try:
+        stats.fetch_phase.started_at = datetime.now()
+        for base_prefix in SPELLING_SOURCE_PREFIXES:
+            prefix = await resolve_key_prefix(redis, base_prefix)
+            try:
+                documents = await count_title_terms(redis, prefix, counts)
+            except Exception as e:
+                stats.fetch_phase.errors.append(f"{base_prefix}: {e}")
+                stats.fetch_phase.items_failed += 1
+                continue
+            stats.documents_by_prefix[base_prefix] = documents
+            stats.fetch_phase.items_processed += documents
+            stats.fetch_phase.items_success += documents
+            if verbose:
+                logger.info(f"  {prefix}*: {documents:,} documents, {len(counts):,} terms so far")
+        stats.fetch_phase.completed_at = datetime.now()
+        stats.distinct_terms = len(counts)
+        stats.total_changes_found = stats.fetch_phase.items_processed
+
+        stats.load_phase.started_at = datetime.now()
+        kept = {
+            term: count
+            for term, count in counts.most_common(SPELLING_MAX_TERMS)
+            if count >= SPELLING_MIN_COUNT
+        }
+        stats.terms_kept = len(kept)
+        if not kept:
+            # Keep yesterday's dictionary rather than publishing an empty one
+            stats.load_phase.errors.append("No terms found; dictionary not replaced")
+            stats.load_phase.items_failed = 1
+        else:
+            stats.version = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+            await save_spelling_terms(redis, kept, stats.version)
+            stats.load_phase.items_processed = stats.load_phase.items_success = len(kept)
+        stats.load_phase.completed_at = datetime.now()
+    finally:
+        await redis.aclose()
+
+    logger.info(
+        f"Spelling dictionary: {stats.terms_kept:,} of {stats.distinct_terms:,} terms "
+        f"from {stats.fetch_phase.items_processed:,} documents"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    load_env()
+
+    parser = argparse.ArgumentParser(description="Rebuild the spelling-correction dictionary")
+    parser.add_argument("--redis-host", default=os.getenv("REDIS_HOST", "localhost"))
+    parser.add_argument("--redis-port", type=int, default=int(os.getenv("REDIS_PORT", "6380")))
+    parser.add_argument("--redis-password", default=os.getenv("REDIS_PASSWORD"))
+    parser.add_argument("--verbose", action="store_true", help="Log per-prefix progress")
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_spelling_dictionary_etl(
+            redis_host=args.redis_host,
+            redis_port=args.redis_port,
+            redis_password=args.redis_password,
+            verbose=args.verbose,
+        )
+    )
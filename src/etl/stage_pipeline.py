@@ -0,0 +1,179 @@
+"""
+Stage Pipeline - Bounded producer/consumer pipeline for ETL batches.
+
+Each stage runs its own pool of worker tasks and reads from a bounded input
+queue, so stages overlap: while one batch is being classified, the next is
+being read from Redis and the previous one written.  When a downstream
+stage falls behind, its full queue blocks upstream workers (backpressure)
+instead of buffering the whole file in memory.  Steady-state wall time is
+roughly that of the slowest stage.
+
+Per-stage counters are collected on ``PipelineStageStats``:
+    busy_seconds     Time workers spent inside the stage function
+    starved_seconds  Time workers waited for input (upstream is the bottleneck)
+    blocked_seconds  Time workers waited to hand off output (downstream is the bottleneck)
+    max_queue_size   Peak depth of the stage's input queue
+
+Usage:
+    from etl.stage_pipeline import PipelineStage, run_pipeline
+
+    stats = await run_pipeline(
+        batches,
+        [
+            PipelineStage("read", read_batch, workers=2),
+            PipelineStage("write", write_batch, workers=1, queue_depth=4),
+        ],
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# Sentinel telling a worker its input is exhausted
+_DONE = object()
+
+
+@dataclass
+class PipelineStage(Generic[T]):
+    """One pipeline stage.
+
+    ``fn`` receives a batch and returns the batch to hand downstream, or
+    ``None`` to drop it (e.g. every item failed).  ``size`` reports the item
+    count of a batch for throughput stats.
+    """
+
+    name: str
+    fn: Callable[[T], Awaitable[T | None]]
+    workers: int = 1
+    queue_depth: int = 2
+    size: Callable[[T], int] = len  # type: ignore[assignment]
+
+
+@dataclass
+class PipelineStageStats:
+    """Throughput and backpressure counters for one stage."""
+
+    name: str
+    workers: int
+    queue_depth: int
+    batches: int = 0
+    items: int = 0
+    busy_seconds: float = 0.0
+    starved_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    max_queue_size: int = 0
+
+    @property
+    def items_per_second(self) -> float:
+        """Stage throughput per busy worker-second."""
+        if self.busy_seconds > 0:
+            return self.items / self.busy_seconds
+        return 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "batches": self.batches,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "starved_seconds": round(self.starved_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "max_queue_size": self.max_queue_size,
+            "items_per_second": round(self.items_per_second, 1),
+        }
+
+
+async def run_pipeline(
+    batches: Iterable[T],
+    stages: list[PipelineStage[T]],
+) -> dict[str, PipelineStageStats]:
+    """
+    Push ``batches`` through ``stages`` with overlapping, bounded workers.
+
+    Batches may complete out of order when a stage has more than one worker.
+    If any stage raises, the remaining workers are cancelled and the
+    exception propagates to the caller.
+
+    Args:
+        batches: Input batches, consumed lazily as the first queue drains.
+        stages: Stages in execution order.
+
+    Returns:
+        Stats per stage name, in stage order.
+    """
+    if not stages:
+        raise ValueError("run_pipeline requires at least one stage")
+
+    queues: list[asyncio.Queue[Any]] = [
+        asyncio.Queue(maxsize=max(1, stage.queue_depth)) for stage in stages
+    ]
+    stats = {
+        stage.name: PipelineStageStats(
+            name=stage.name, workers=max(1, stage.workers), queue_depth=max(1, stage.queue_depth)
+        )
+        for stage in stages
+    }
+    remaining = [max(1, stage.workers) for stage in stages]
+
+    async def _put(index: int, item: Any, stage_stats: PipelineStageStats | None) -> None:
+        queue = queues[index]
+        start = time.perf_counter()
+        await queue.put(item)
+        if stage_stats is not None:
+            stage_stats.blocked_seconds += time.perf_counter() - start
+        next_stats = stats[stages[index].name]
+        next_stats.max_queue_size = max(next_stats.max_queue_size, queue.qsize())
+
+    async def _feed() -> None:
+        for batch in batches:
+            await _put(0, batch, None)
+        for _ in range(remaining[0]):
+            await queues[0].put(_DONE)
+
+    async def _work(index: int) -> None:
+        stage = stages[index]
+        stage_stats = stats[stage.name]
+        queue = queues[index]
+        is_last = index == len(stages) - 1
+        while True:
+            wait_start = time.perf_counter()
+            batch = await queue.get()
+            stage_stats.starved_seconds += time.perf_counter() - wait_start
+            if batch is _DONE:
+                break
+
+            busy_start = time.perf_counter()
+            stage_stats.items += stage.size(batch)
+            result = await stage.fn(batch)
+            stage_stats.busy_seconds += time.perf_counter() - busy_start
+            stage_stats.batches += 1
+
+            if result is not None and not is_last:
+                await _put(index + 1, result, stage_stats)
+
+        remaining[index] -= 1
+        if remaining[index] == 0 and not is_last:
+            for _ in range(remaining[index + 1]):
+                await queues[index + 1].put(_DONE)
+
+    tasks = [asyncio.create_task(_feed())]
+    for index, stage in enumerate(stages):
+        tasks.extend(asyncio.create_task(_work(index)) for _ in range(max(1, stage.workers)))
+
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return stats
@@ -0,0 +1,185 @@
+"""
+Staging File - Streaming gzip JSONL staging for the changes ETL.
+
+Layout of ``tmdb_changes_<media>_<date>.jsonl.gz``:
+    line 1    {"_staging": {"format": 1, "media_type": ..., "start_date": ..., ...}}
+    line 2..  one fetched TMDB item per line
+
+Each fetched batch is appended as its own gzip member, so the fetch phase
+never holds more than one batch in memory and the load phase reads items
+with a generator.  A sidecar ``<file>.progress.json`` records the byte
+offset after the last completed batch (and, during load, how many items
+were written to Redis).  After a crash the fetch phase truncates the file
+back to that offset and resumes at the next batch; the load phase skips
+the items already written.  A rerun for the same change set whose fetch
+completed but whose load crashed keeps the file and goes straight to the
+load (``interrupted_load``).
+
+Staging files in the older single-document format (``{"items": [...]}``)
+are still readable.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+STAGING_FORMAT_VERSION = 1
+STAGING_SUFFIX = ".jsonl.gz"
+_HEADER_KEY = "_staging"
+
+
+@dataclass
+class StagingProgress:
+    """Checkpoint stored next to a staging file."""
+
+    change_ids_digest: str = ""
+    fetched_batches: int = 0
+    fetched_bytes: int = 0
+    items: int = 0
+    complete: bool = False
+    loaded_items: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StagingProgress:
+        known = {name: data[name] for name in cls.__dataclass_fields__ if name in data}
+        return cls(**known)
+
+
+def change_ids_digest(change_ids: list[int], batch_size: int) -> str:
+    """Fingerprint of the fetch plan; a resume is only valid for the same plan."""
+    payload = f"{batch_size}:" + ",".join(str(i) for i in change_ids)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def progress_path(staging_path: Path) -> Path:
+    return staging_path.with_name(staging_path.name + ".progress.json")
+
+
+def read_progress(staging_path: Path) -> StagingProgress | None:
+    """Return the checkpoint for ``staging_path``, or None if absent/unreadable."""
+    path = progress_path(staging_path)
+    try:
+        return StagingProgress.from_dict(json.loads(path.read_text()))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable staging progress {path}: {e}")
+        return None
+
+
+def write_progress(staging_path: Path, progress: StagingProgress) -> None:
+    """Atomically replace the checkpoint for ``staging_path``."""
+    path = progress_path(staging_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(asdict(progress)))
+    os.replace(tmp_path, path)
+
+
+def interrupted_load(staging_path: Path, digest: str) -> StagingProgress | None:
+    """Checkpoint of a fully fetched ``digest`` plan whose load stopped part way, if any."""
+    progress = read_progress(staging_path)
+    if (
+        progress is None
+        or not progress.complete
+        or progress.change_ids_digest != digest
+        or progress.loaded_items <= 0
+        or not staging_path.exists()
+        or staging_path.stat().st_size < progress.fetched_bytes
+    ):
+        return None
+    return progress
+
+
+class StagingWriter:
+    """Append-only writer for a JSONL staging file with batch checkpoints."""
+
+    def __init__(
+        self,
+        path: Path,
+        header: dict[str, Any],
+        digest: str,
+        resume: StagingProgress | None = None,
+    ) -> None:
+        self.path = path
+        if resume is not None:
+            # Drop any partially written member from the crashed run
+            os.truncate(path, resume.fetched_bytes)
+            self.progress = resume
+        else:
+            self.progress = StagingProgress(change_ids_digest=digest)
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                f.write(json.dumps({_HEADER_KEY: {"format": STAGING_FORMAT_VERSION, **header}}))
+                f.write("\n")
+            self._checkpoint()
+
+    @property
+    def items_written(self) -> int:
+        return self.progress.items
+
+    def append_batch(self, items: list[dict[str, Any]], batch_index: int) -> None:
+        """Append one fetched batch as a gzip member and checkpoint after it."""
+        if items:
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                for item in items:
+                    f.write(json.dumps(item))
+                    f.write("\n")
+        self.progress.items += len(items)
+        self.progress.fetched_batches = batch_index
+        self._checkpoint()
+
+    def finish(self) -> None:
+        self.progress.complete = True
+        self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        self.progress.fetched_bytes = self.path.stat().st_size
+        write_progress(self.path, self.progress)
+
+
+def _iter_lines(path: Path) -> Iterator[dict[str, Any]]:
+    """Decode JSON lines, stopping cleanly at a truncated tail."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    except (EOFError, zlib.error, gzip.BadGzipFile, json.JSONDecodeError) as e:
+        logger.warning(f"Staging file {path} ends with a truncated record, stopping there: {e}")
+
+
+def read_staging_header(path: Path) -> dict[str, Any]:
+    """Return the header of a staging file (media_type, dates, fetched_at)."""
+    first = next(_iter_lines(path), None)
+    if first is None:
+        return {}
+    if _HEADER_KEY in first:
+        return dict(first[_HEADER_KEY])
+    # Legacy single-document format
+    return {key: value for key, value in first.items() if key != "items"}
+
+
+def iter_staging_items(path: Path, skip: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield staged items in order, skipping the first ``skip``."""
+    lines = _iter_lines(path)
+    first = next(lines, None)
+    if first is None:
+        return
+    if _HEADER_KEY in first:
+        items: Iterator[dict[str, Any]] = lines
+    else:
+        items = iter(first.get("items", []))
+    for index, item in enumerate(items):
+        if index >= skip:
+            yield item
@@ -0,0 +1,104 @@
+"""
+Unit tests for dependency-aware ETL job scheduling.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from etl.job_graph import JobNode, order_job_graph, run_job_graph
+
+
+def _run_graph(
+    nodes: list[JobNode], fail: set[str] | None = None, **kwargs: object
+) -> tuple[dict[str, bool], list[str], int, list[str]]:
+    events: list[str] = []
+    blocked: list[str] = []
+    running = 0
+    peak = 0
+
+    async def run(node: JobNode) -> bool:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        events.append(f"start:{node.name}")
+        await asyncio.sleep(0.01)
+        events.append(f"end:{node.name}")
+        running -= 1
+        return node.name not in (fail or set())
+
+    outcomes = asyncio.run(
+        run_job_graph(
+            nodes,
+            run,
+            on_blocked=lambda node, dep: blocked.append(f"{node.name}<-{dep}"),
+            **kwargs,  # type: ignore[arg-type]
+        )
+    )
+    return outcomes, events, peak, blocked
+
+
+def test_independent_groups_overlap_and_shared_group_serializes() -> None:
+    nodes = [
+        JobNode("tv", resource_group="tmdb"),
+        JobNode("movie", resource_group="tmdb"),
+        JobNode("podcasts", resource_group="podcastindex"),
+    ]
+    outcomes, events, peak, _ = _run_graph(nodes, max_concurrent=3)
+
+    assert all(outcomes.values())
+    assert peak == 2
+    assert events.index("end:tv") < events.index("start:movie")
+    assert events.index("start:podcasts") < events.index("end:tv")
+
+
+def test_dependents_wait_and_are_skipped_after_a_failure() -> None:
+    nodes = [
+        JobNode("fetch"),
+        JobNode("index", depends_on=["fetch"]),
+        JobNode("publish", depends_on=["index"]),
+        JobNode("other"),
+    ]
+    outcomes, events, _, blocked = _run_graph(nodes, fail={"fetch"}, max_concurrent=4)
+
+    assert outcomes == {"fetch": False, "index": False, "publish": False, "other": True}
+    assert blocked == ["index<-fetch", "publish<-index"]
+    assert "start:index" not in events
+
+
+def test_cycles_are_rejected_and_unknown_dependencies_dropped() -> None:
+    with pytest.raises(ValueError, match="a -> b -> a"):
+        order_job_graph([JobNode("a", depends_on=["b"]), JobNode("b", depends_on=["a"])])
+
+    ordered = order_job_graph([JobNode("a", depends_on=["disabled"]), JobNode("b")])
+    assert [node.name for node in ordered] == ["a", "b"]
+    assert ordered[0].depends_on == []
+
+
+def test_jobs_keep_overlapping_while_one_does_blocking_work() -> None:
+    ticks: list[float] = []
+    blocking: list[float] = []
+
+    async def run(node: JobNode) -> bool:
+        if node.name == "podcasts":
+            started = time.monotonic()
+            # Real blocking work (as a dump download or SQLite scan would be)
+            await asyncio.to_thread(time.sleep, 0.3)
+            blocking.extend([started, time.monotonic()])
+        else:
+            for _ in range(10):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+        return True
+
+    nodes = [
+        JobNode("podcasts", resource_group="podcastindex"),
+        JobNode("tv", resource_group="tmdb"),
+    ]
+    outcomes = asyncio.run(run_job_graph(nodes, run, max_concurrent=3))
+
+    assert all(outcomes.values())
+    started, finished = blocking
+    during = [t for t in ticks if started < t < finished]
+    assert len(during) >= 5, "The TMDB job must keep running during the blocking step"
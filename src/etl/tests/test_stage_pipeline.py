@@ -0,0 +1,81 @@
+"""
+Unit tests for the bounded ETL stage pipeline.
+"""
+
+import asyncio
+
+import pytest
+
+from etl.stage_pipeline import PipelineStage, run_pipeline
+
+
+@pytest.mark.asyncio
+async def test_batches_flow_through_every_stage_and_drops_are_skipped() -> None:
+    written: list[list[int]] = []
+
+    async def _double(batch: list[int]) -> list[int]:
+        return [value * 2 for value in batch]
+
+    async def _drop_empty(batch: list[int]) -> list[int] | None:
+        kept = [value for value in batch if value % 4 == 0]
+        return kept or None
+
+    async def _write(batch: list[int]) -> list[int]:
+        written.append(batch)
+        return batch
+
+    stats = await run_pipeline(
+        ([i, i + 1] for i in range(0, 10, 2)),
+        [
+            PipelineStage("double", _double, workers=2),
+            PipelineStage("filter", _drop_empty),
+            PipelineStage("write", _write),
+        ],
+    )
+
+    assert sorted(v for batch in written for v in batch) == [0, 4, 8, 12, 16]
+    assert list(stats) == ["double", "filter", "write"]
+    assert (stats["double"].batches, stats["double"].items) == (5, 10)
+    assert stats["write"].items == 5
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_so_wall_time_tracks_the_slowest_stage() -> None:
+    async def _slow(batch: list[int]) -> list[int]:
+        await asyncio.sleep(0.02)
+        return batch
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    stats = await run_pipeline(
+        ([i] for i in range(8)),
+        [PipelineStage("a", _slow), PipelineStage("b", _slow), PipelineStage("c", _slow)],
+    )
+    elapsed = loop.time() - start
+
+    # Sequential would be 8 * 3 * 20ms = 480ms; pipelined is ~(8 + 2) * 20ms.
+    assert elapsed < 0.35
+    assert stats["a"].max_queue_size >= 1
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_applies_backpressure_and_errors_propagate() -> None:
+    async def _fast(batch: list[int]) -> list[int]:
+        return batch
+
+    async def _slow(batch: list[int]) -> list[int]:
+        await asyncio.sleep(0.01)
+        return batch
+
+    stats = await run_pipeline(
+        ([i] for i in range(6)),
+        [PipelineStage("fast", _fast), PipelineStage("slow", _slow, queue_depth=1)],
+    )
+    assert stats["fast"].blocked_seconds > 0
+    assert stats["slow"].max_queue_size == 1
+
+    async def _boom(batch: list[int]) -> list[int]:
+        raise RuntimeError("write failed")
+
+    with pytest.raises(RuntimeError, match="write failed"):
+        await run_pipeline(([i] for i in range(3)), [PipelineStage("boom", _boom)])
@@ -0,0 +1,92 @@
+"""
+Unit tests for the streaming JSONL staging file and its resume checkpoints.
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+from etl.staging_file import (
+    StagingWriter,
+    change_ids_digest,
+    interrupted_load,
+    iter_staging_items,
+    read_progress,
+    read_staging_header,
+    write_progress,
+)
+
+_HEADER = {"media_type": "movie", "start_date": "2026-01-01", "end_date": "2026-01-02"}
+
+
+def test_batches_round_trip_through_header_and_items(tmp_path: Path) -> None:
+    path = tmp_path / "tmdb_changes_movie_2026-01-01.jsonl.gz"
+    writer = StagingWriter(path, _HEADER, "digest")
+    writer.append_batch([{"id": 1}, {"id": 2}], 1)
+    writer.append_batch([], 2)
+    writer.append_batch([{"id": 3}], 3)
+    writer.finish()
+
+    assert read_staging_header(path)["media_type"] == "movie"
+    assert [item["id"] for item in iter_staging_items(path)] == [1, 2, 3]
+    assert [item["id"] for item in iter_staging_items(path, skip=2)] == [3]
+
+    progress = read_progress(path)
+    assert progress is not None
+    assert (progress.items, progress.fetched_batches, progress.complete) == (3, 3, True)
+
+
+def test_resume_truncates_a_partially_written_batch(tmp_path: Path) -> None:
+    path = tmp_path / "staging.jsonl.gz"
+    writer = StagingWriter(path, _HEADER, "digest")
+    writer.append_batch([{"id": 1}], 1)
+
+    # Crash mid-append: a truncated gzip member after the last checkpoint
+    with path.open("ab") as f:
+        f.write(gzip.compress(b'{"id": 99}\n')[:12])
+    assert [item["id"] for item in iter_staging_items(path)] == [1]
+
+    progress = read_progress(path)
+    assert progress is not None and not progress.complete
+    resumed = StagingWriter(path, _HEADER, "digest", resume=progress)
+    resumed.append_batch([{"id": 2}], 2)
+    resumed.finish()
+
+    assert [item["id"] for item in iter_staging_items(path)] == [1, 2]
+
+
+def test_legacy_single_document_files_are_still_readable(tmp_path: Path) -> None:
+    path = tmp_path / "tmdb_changes_tv_2026-01-01.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"media_type": "tv", "items": [{"id": 7}, {"id": 8}]}, f)
+
+    assert read_staging_header(path) == {"media_type": "tv"}
+    assert [item["id"] for item in iter_staging_items(path)] == [7, 8]
+    assert read_progress(path) is None
+
+
+def test_digest_depends_on_ids_and_batch_size() -> None:
+    assert change_ids_digest([1, 2], 20) == change_ids_digest([1, 2], 20)
+    assert change_ids_digest([1, 2], 20) != change_ids_digest([2, 1], 20)
+    assert change_ids_digest([1, 2], 20) != change_ids_digest([1, 2], 10)
+
+
+def test_interrupted_load_is_only_reported_for_a_complete_fetch_of_the_same_plan(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "staging.jsonl.gz"
+    writer = StagingWriter(path, _HEADER, "digest")
+    writer.append_batch([{"id": 1}, {"id": 2}], 1)
+    assert interrupted_load(path, "digest") is None, "Fetch not finished"
+
+    writer.finish()
+    assert interrupted_load(path, "digest") is None, "Nothing loaded yet"
+
+    progress = read_progress(path)
+    assert progress is not None
+    progress.loaded_items = 1
+    write_progress(path, progress)
+
+    pending = interrupted_load(path, "digest")
+    assert pending is not None and pending.loaded_items == 1
+    assert interrupted_load(path, "other-digest") is None
@@ -1,13 +1,13 @@
 """
 TMDB Changes ETL - Two-phase ETL with file staging.
 
-Phase 1: Fetch all changes from TMDB API → save to local JSON file
-Phase 2: Load from local file → upsert to Redis
+Phase 1: Fetch all changes from TMDB API → stream to a local gzip JSONL file
+Phase 2: Stream from local file → upsert to Redis
 
 This separation allows:
 - Clear performance diagnostics (API vs Redis)
 - Re-running Redis load without re-fetching
-- File-based recovery if Redis load fails
+- File-based recovery if Redis load fails (both phases resume from a checkpoint)
 - Ephemeral files cleaned up after 1 day
 
 Usage:
@@ -18,15 +18,16 @@ Usage:
     python -m etl.tmdb_nightly_etl_v2 --media-type tv --fetch-only
 
     # Phase 2 only (load from existing file)
-    python -m etl.tmdb_nightly_etl_v2 --media-type tv --load-only --file /path/to/file.json
+    python -m etl.tmdb_nightly_etl_v2 --media-type tv --load-only --file /path/to/file.jsonl.gz
 """
 
 import asyncio
 import gzip
+import itertools
 import json
 import os
 import time
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -35,14 +36,20 @@ from typing import Any, Literal, cast
 from redis.asyncio import Redis
 
 from adapters.config import load_env
+from adapters.document_patch import queue_document_patch
+from adapters.index_generation import queue_index_generation_bump
 from adapters.media_manager_client import MEDIA_INDEX_NAMES, MediaManagerClient
 from ai.microgenre_batch import build_microgenre_input_from_document
-from ai.microgenre_document import microgenre_result_to_redis, valid_microgenres_value
+from ai.microgenre_document import (
+    attach_microgenre_vector,
+    microgenre_result_to_redis,
+    valid_microgenres_value,
+)
 from ai.prompts.microgenre_classifier import score_microgenres
 from api.tmdb.core import TMDBService
 from api.tmdb.person import TMDBPersonService
 from contracts.models import MCType
-from core.normalize import document_to_redis, normalize_document, resolve_timestamps
+from core.normalize import document_to_redis, normalize_document, stamp_document_for_write
 from core.streaming_providers import (
     MAJOR_PROVIDER_IDS,
     MAJOR_STREAMING_PROVIDERS,
@@ -51,15 +58,36 @@ from core.streaming_providers import (
 from etl.documentary_filter import is_documentary, is_eligible_documentary
 from etl.media_manager_filter import passes_media_manager_filter
 from etl.rt_enrichment import enrich_from_algolia, enrich_from_local
+from etl.stage_pipeline import PipelineStage, PipelineStageStats, run_pipeline
+from etl.staging_file import (
+    STAGING_SUFFIX,
+    StagingWriter,
+    change_ids_digest,
+    interrupted_load,
+    iter_staging_items,
+    read_progress,
+    read_staging_header,
+    write_progress,
+)
+from utils.adaptive_pool import AIMDController, adaptive_map
 from utils.get_logger import get_logger
+from utils.http_session import run_with_http_sessions
 from utils.redis_cache import disable_cache
 
 logger = get_logger(__name__)
 
-# Batch size for concurrent API calls
-# Keep small to avoid overwhelming TMDB's rate limit (40 req/sec)
+# Staging batch size (checkpoint granularity of the fetch phase)
 BATCH_SIZE = 20
 
+# Fetch concurrency is adaptive (utils.adaptive_pool): it starts at
+# NIGHTLY_FETCH_CONCURRENCY and moves between the min/max bounds as TMDB
+# latency and 429s allow.  The window may run at most MAX_AHEAD batches past
+# the oldest unfinished item.
+FETCH_INITIAL_CONCURRENCY = int(os.getenv("NIGHTLY_FETCH_CONCURRENCY", str(BATCH_SIZE)))
+FETCH_MIN_CONCURRENCY = int(os.getenv("NIGHTLY_FETCH_MIN_CONCURRENCY", "4"))
+FETCH_MAX_CONCURRENCY = int(os.getenv("NIGHTLY_FETCH_MAX_CONCURRENCY", "64"))
+FETCH_MAX_AHEAD_BATCHES = int(os.getenv("NIGHTLY_FETCH_MAX_AHEAD_BATCHES", "10"))
+
 # Retry configuration
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1.0
@@ -72,6 +100,25 @@ RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 MIN_PERSON_POPULARITY = 0.5
 IMAGE_BASE_URL = "https://image.tmdb.org/t/p/"
 
+# Load-phase pipeline: workers per stage (override with NIGHTLY_LOAD_<STAGE>_WORKERS)
+# and the number of batches each stage may queue before upstream blocks.
+_LOAD_STAGE_WORKERS = {
+    "normalize": 1,
+    "enrich": 2,
+    "read": 2,
+    "microgenre": 2,
+    "write": 1,
+    "mm_push": 1,
+}
+LOAD_QUEUE_DEPTH = max(1, int(os.getenv("NIGHTLY_LOAD_QUEUE_DEPTH", "2")))
+
+
+def _load_stage_workers(stage: str) -> int:
+    env_value = os.getenv(f"NIGHTLY_LOAD_{stage.upper()}_WORKERS")
+    if env_value:
+        return max(1, int(env_value))
+    return _LOAD_STAGE_WORKERS[stage]
+
 
 @dataclass
 class ETLPhaseStats:
@@ -143,6 +190,17 @@ class ChangesETLStats:
     microgenres_skipped_existing: int = 0
     microgenres_failed: int = 0
 
+    # Resume offsets picked up from an interrupted run's staging checkpoint
+    fetch_resumed_batches: int = 0
+    load_resumed_items: int = 0
+
+    # Adaptive fetch concurrency
+    fetch_peak_concurrency: int = 0
+    fetch_concurrency_decreases: int = 0
+
+    # Per-stage throughput/backpressure of the pipelined load phase
+    load_stages: dict[str, PipelineStageStats] = field(default_factory=dict)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "media_type": self.media_type,
@@ -164,12 +222,15 @@ class ChangesETLStats:
                 "items_skipped": self.fetch_phase.items_skipped,
                 "items_failed": self.fetch_phase.items_failed,
                 "items_per_second": self.fetch_phase.items_per_second,
+                "peak_concurrency": self.fetch_peak_concurrency,
+                "concurrency_decreases": self.fetch_concurrency_decreases,
                 "errors": self.fetch_phase.errors[:10],
             },
             "load_phase": {
                 "duration_seconds": self.load_phase.duration_seconds,
                 "items_processed": self.load_phase.items_processed,
                 "items_success": self.load_phase.items_success,
+                "items_unchanged": self.load_phase.items_skipped,
                 "items_failed": self.load_phase.items_failed,
                 "items_per_second": self.load_phase.items_per_second,
                 "errors": self.load_phase.errors[:10],
@@ -186,9 +247,27 @@ class ChangesETLStats:
                 "skipped_existing": self.microgenres_skipped_existing,
                 "failed": self.microgenres_failed,
             },
+            "resume": {
+                "fetch_batches": self.fetch_resumed_batches,
+                "load_items": self.load_resumed_items,
+            },
+            "load_stages": {name: stage.to_dict() for name, stage in self.load_stages.items()},
         }
 
 
+@dataclass
+class _LoadBatch:
+    """One staging-file slice moving through the load pipeline."""
+
+    items: list[dict[str, Any]]
+    index: int = 0
+    prepared: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    existing: list[dict[str, Any] | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.prepared) or len(self.items)
+
+
 class TMDBChangesETL(TMDBService):
     """Two-phase ETL: Fetch to file, then load to Redis."""
 
@@ -201,7 +280,7 @@ class TMDBChangesETL(TMDBService):
 
     def _get_staging_path(self, media_type: str, run_date: str) -> Path:
         """Get path for staging file."""
-        return self.staging_dir / f"tmdb_changes_{media_type}_{run_date}.json.gz"
+        return self.staging_dir / f"tmdb_changes_{media_type}_{run_date}{STAGING_SUFFIX}"
 
     def _get_errors_path(self, media_type: str, run_date: str) -> Path:
         """Get path for errors file."""
@@ -438,6 +517,101 @@ class TMDBChangesETL(TMDBService):
         popularity: float = float(person.get("popularity", 0) or 0)
         return popularity >= MIN_PERSON_POPULARITY
 
+    async def _filter_fetched_batch(
+        self,
+        media_type: Literal["tv", "movie", "person"],
+        batch: list[int],
+        results: list[Any],
+        stats: ChangesETLStats,
+        redis_conn: Redis | None,
+    ) -> list[dict[str, Any]]:
+        """Turn one batch of fetch results into staged items, updating stats."""
+        batch_items: list[dict[str, Any]] = []
+
+        # Pipelined EXISTS check: O(batch_size) point lookups instead of O(keyspace) SCAN.
+        existing_in_batch: set[int] = set()
+        if redis_conn is not None and media_type in ("movie", "tv"):
+            pipe = redis_conn.pipeline(transaction=False)
+            for tid in batch:
+                pipe.exists(f"media:tmdb_{media_type}_{tid}")
+            exists_results = await pipe.execute()
+            for tid, exists in zip(batch, exists_results, strict=True):
+                if exists:
+                    existing_in_batch.add(tid)
+
+        for tmdb_id, result in zip(batch, results, strict=True):
+            stats.fetch_phase.items_processed += 1
+
+            if isinstance(result, BaseException):
+                stats.fetch_phase.items_failed += 1
+                stats.fetch_phase.errors.append(f"{tmdb_id}: {result}")
+                stats.enrichment_errors += 1
+                logger.error(f"Exception for {tmdb_id}: {result}")
+                continue
+
+            if result is None:
+                stats.fetch_phase.items_skipped += 1
+                logger.debug(f"Null result for {tmdb_id}")
+                continue
+
+            # Raw API returns dict directly, person service returns model
+            if hasattr(result, "model_dump"):
+                item_dict = result.model_dump(mode="json")
+            elif isinstance(result, dict):
+                item_dict = result
+            else:
+                stats.fetch_phase.items_failed += 1
+                logger.warning(f"Unexpected type for {tmdb_id}: {type(result)}")
+                continue
+
+            if not item_dict or item_dict.get("status_code") == 404:
+                stats.fetch_phase.items_skipped += 1
+                logger.debug(f"Empty or 404 for {tmdb_id}")
+                continue
+
+            # Check for enrichment errors (e.g. partial failures in get_media_details)
+            item_error = item_dict.get("error")
+            if item_error:
+                stats.fetch_phase.items_failed += 1
+                stats.fetch_phase.errors.append(f"{tmdb_id}: {item_error}")
+                logger.warning(f"Enrichment error for {tmdb_id}: {item_error}")
+                continue
+
+            item_dict["_media_type"] = media_type
+            item_dict["_tmdb_id"] = tmdb_id
+
+            # Existing items always pass — we must update them
+            stats.enriched_count += 1
+            is_existing = tmdb_id in existing_in_batch
+
+            if is_existing:
+                batch_items.append(item_dict)
+                stats.passed_filter += 1
+                stats.existing_items += 1
+            elif media_type == "person":
+                if self._passes_person_filter(item_dict):
+                    batch_items.append(item_dict)
+                    stats.passed_filter += 1
+                    stats.new_items += 1
+                else:
+                    stats.failed_filter += 1
+            else:
+                item_is_documentary = is_documentary(item_dict)
+                if self._passes_media_filter(item_dict):
+                    batch_items.append(item_dict)
+                    stats.passed_filter += 1
+                    stats.new_items += 1
+                    if item_is_documentary:
+                        stats.documentary_passed_filter += 1
+                else:
+                    stats.failed_filter += 1
+                    if item_is_documentary:
+                        stats.documentary_failed_filter += 1
+
+            stats.fetch_phase.items_success += 1
+
+        return batch_items
+
     async def fetch_and_stage(
         self,
         media_type: Literal["tv", "movie", "person"],
@@ -447,7 +621,12 @@ class TMDBChangesETL(TMDBService):
         max_batches: int = 0,
         redis_conn: Redis | None = None,
     ) -> Path:
-        """Phase 1: Fetch all data from TMDB and save to staging file."""
+        """Phase 1: Fetch all data from TMDB and stream it to a JSONL staging file.
+
+        Each batch is appended and checkpointed as it completes.  If an earlier
+        run for the same change set crashed, fetching resumes after its last
+        completed batch.
+        """
         stats.fetch_phase.started_at = datetime.now()
         stats.fetch_phase.phase = f"fetch_{media_type}"
 
@@ -464,9 +643,6 @@ class TMDBChangesETL(TMDBService):
             stats.fetch_phase.completed_at = datetime.now()
             return self._get_staging_path(media_type, start_date)
 
-        # Fetch details in batches
-        enriched_items = []
-
         batches = [change_ids[i : i + BATCH_SIZE] for i in range(0, len(change_ids), BATCH_SIZE)]
         total_batches = len(batches)
         stats.total_batches = total_batches
@@ -477,128 +653,108 @@ class TMDBChangesETL(TMDBService):
             batches = batches[:max_batches]
             logger.info(f"⚠️  TESTING MODE: Limited to {max_batches} batches")
 
-        for batch_idx, batch in enumerate(batches, 1):
-            stats.current_batch = batch_idx
-            batch_start = time.time()
-            logger.info(f"Fetching batch {batch_idx}/{total_batches} ({len(batch)} items)")
-
-            if media_type == "person":
-                tasks = [self.person_service.get_person_details(pid) for pid in batch]
-            else:
-                # Use get_media_details with no_cache to get fresh data
-                mc_type = MCType.MOVIE if media_type == "movie" else MCType.TV_SERIES
-                tasks = [
-                    self.get_media_details(
-                        mid,
-                        mc_type,
-                    )
-                    for mid in batch
-                ]
+        # Stream batches to the staging file, resuming an interrupted run of the same plan
+        staging_path = self._get_staging_path(media_type, start_date)
+        digest = change_ids_digest(change_ids, BATCH_SIZE)
+        pending = interrupted_load(staging_path, digest)
+        if pending is not None:
+            # Refetching would recreate the file and lose the load checkpoint
+            stats.fetch_resumed_batches = pending.fetched_batches
+            stats.fetch_phase.completed_at = datetime.now()
+            logger.info(
+                f"Staging file already fetched for this change set; resuming its load "
+                f"after {pending.loaded_items}/{pending.items} items"
+            )
+            return staging_path
+        progress = read_progress(staging_path)
+        resume = (
+            progress
+            if progress is not None
+            and not progress.complete
+            and progress.change_ids_digest == digest
+            and staging_path.exists()
+            and staging_path.stat().st_size >= progress.fetched_bytes
+            else None
+        )
+        writer = StagingWriter(
+            staging_path,
+            {
+                "media_type": media_type,
+                "start_date": start_date,
+                "end_date": end_date,
+                "fetched_at": datetime.now().isoformat(),
+            },
+            digest,
+            resume=resume,
+        )
+        if resume is not None:
+            stats.fetch_resumed_batches = resume.fetched_batches
+            logger.info(
+                f"Resuming fetch after batch {resume.fetched_batches}/{total_batches} "
+                f"({resume.items} items already staged)"
+            )
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            batch_time = time.time() - batch_start
-
-            # Pipelined EXISTS check: O(batch_size) point lookups instead of O(keyspace) SCAN.
-            existing_in_batch: set[int] = set()
-            if redis_conn is not None and media_type in ("movie", "tv"):
-                pipe = redis_conn.pipeline(transaction=False)
-                for tid in batch:
-                    pipe.exists(f"media:tmdb_{media_type}_{tid}")
-                exists_results = await pipe.execute()
-                for tid, exists in zip(batch, exists_results, strict=True):
-                    if exists:
-                        existing_in_batch.add(tid)
-
-            for tmdb_id, result in zip(batch, results, strict=True):
-                stats.fetch_phase.items_processed += 1
-
-                if isinstance(result, BaseException):
-                    stats.fetch_phase.items_failed += 1
-                    stats.fetch_phase.errors.append(f"{tmdb_id}: {result}")
-                    stats.enrichment_errors += 1
-                    logger.error(f"Exception for {tmdb_id}: {result}")
-                    continue
-
-                if result is None:
-                    stats.fetch_phase.items_skipped += 1
-                    logger.debug(f"Null result for {tmdb_id}")
-                    continue
-
-                # Raw API returns dict directly, person service returns model
-                if hasattr(result, "model_dump"):
-                    item_dict = result.model_dump(mode="json")
-                elif isinstance(result, dict):
-                    item_dict = result
-                else:
-                    stats.fetch_phase.items_failed += 1
-                    logger.warning(f"Unexpected type for {tmdb_id}: {type(result)}")
-                    continue
-
-                if not item_dict or item_dict.get("status_code") == 404:
-                    stats.fetch_phase.items_skipped += 1
-                    logger.debug(f"Empty or 404 for {tmdb_id}")
-                    continue
-
-                # Check for enrichment errors (e.g. partial failures in get_media_details)
-                item_error = item_dict.get("error")
-                if item_error:
-                    stats.fetch_phase.items_failed += 1
-                    stats.fetch_phase.errors.append(f"{tmdb_id}: {item_error}")
-                    logger.warning(f"Enrichment error for {tmdb_id}: {item_error}")
-                    continue
-
-                item_dict["_media_type"] = media_type
-                item_dict["_tmdb_id"] = tmdb_id
-
-                # Existing items always pass — we must update them
-                stats.enriched_count += 1
-                is_existing = tmdb_id in existing_in_batch
-
-                if is_existing:
-                    enriched_items.append(item_dict)
-                    stats.passed_filter += 1
-                    stats.existing_items += 1
-                elif media_type == "person":
-                    if self._passes_person_filter(item_dict):
-                        enriched_items.append(item_dict)
-                        stats.passed_filter += 1
-                        stats.new_items += 1
-                    else:
-                        stats.failed_filter += 1
-                else:
-                    item_is_documentary = is_documentary(item_dict)
-                    if self._passes_media_filter(item_dict):
-                        enriched_items.append(item_dict)
-                        stats.passed_filter += 1
-                        stats.new_items += 1
-                        if item_is_documentary:
-                            stats.documentary_passed_filter += 1
-                    else:
-                        stats.failed_filter += 1
-                        if item_is_documentary:
-                            stats.documentary_failed_filter += 1
+        # Fetch through a sliding window so one slow item never stalls a batch;
+        # completed items are regrouped into staging batches for checkpointing.
+        if media_type == "person":
+            fetch_one: Callable[[int], Awaitable[Any]] = self.person_service.get_person_details
+        else:
+            # Use get_media_details with no_cache to get fresh data
+            mc_type = MCType.MOVIE if media_type == "movie" else MCType.TV_SERIES
+
+            async def fetch_one(tmdb_id: int) -> Any:
+                return await self.get_media_details(tmdb_id, mc_type)
+
+        resumed = stats.fetch_resumed_batches
+        remaining_batches = batches[resumed:]
+        controller = AIMDController(
+            initial=FETCH_INITIAL_CONCURRENCY,
+            min_limit=FETCH_MIN_CONCURRENCY,
+            max_limit=FETCH_MAX_CONCURRENCY,
+        )
+        batch_results: dict[int, list[Any]] = {}
+        batch_done: dict[int, int] = {}
+        next_flush = 0
+        batch_start = time.time()
+
+        async for index, _tmdb_id, result in adaptive_map(
+            itertools.chain.from_iterable(remaining_batches),
+            fetch_one,
+            controller,
+            max_ahead=FETCH_MAX_AHEAD_BATCHES * BATCH_SIZE,
+        ):
+            slot, offset = divmod(index, BATCH_SIZE)
+            results = batch_results.setdefault(slot, [None] * len(remaining_batches[slot]))
+            results[offset] = result
+            batch_done[slot] = batch_done.get(slot, 0) + 1
+
+            # Flush every leading batch whose items have all completed
+            while batch_done.get(next_flush) == len(remaining_batches[next_flush]):
+                batch = remaining_batches[next_flush]
+                batch_idx = resumed + next_flush + 1
+                stats.current_batch = batch_idx
+                batch_items = await self._filter_fetched_batch(
+                    media_type, batch, batch_results.pop(next_flush), stats, redis_conn
+                )
+                del batch_done[next_flush]
+                writer.append_batch(batch_items, batch_idx)
 
-                stats.fetch_phase.items_success += 1
+                # Log batch performance
+                batch_time = time.time() - batch_start
+                batch_start = time.time()
+                items_per_sec = len(batch) / batch_time if batch_time > 0 else 0
+                logger.info(
+                    f"  Batch {batch_idx}/{total_batches}: {batch_time:.1f}s "
+                    f"({items_per_sec:.1f} items/sec, concurrency {controller.limit})"
+                )
+                next_flush += 1
+                if next_flush == len(remaining_batches):
+                    break
 
-            # Log batch performance
-            items_per_sec = len(batch) / batch_time if batch_time > 0 else 0
-            logger.info(f"  Batch {batch_idx}: {batch_time:.1f}s ({items_per_sec:.1f} items/sec)")
+        stats.fetch_peak_concurrency = controller.peak_limit
+        stats.fetch_concurrency_decreases = controller.decreases
 
-        # Save to staging file
-        staging_path = self._get_staging_path(media_type, start_date)
-        with gzip.open(staging_path, "wt", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "media_type": media_type,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "fetched_at": datetime.now().isoformat(),
-                    "total_items": len(enriched_items),
-                    "items": enriched_items,
-                },
-                f,
-            )
+        writer.finish()
 
         stats.staging_file = str(staging_path)
         stats.fetch_phase.completed_at = datetime.now()
@@ -621,7 +777,7 @@ class TMDBChangesETL(TMDBService):
                 )
             logger.info(f"Errors saved to {errors_path}")
 
-        logger.info(f"Phase 1 complete: {len(enriched_items)} items saved to {staging_path}")
+        logger.info(f"Phase 1 complete: {writer.items_written} items saved to {staging_path}")
         logger.info(f"  Duration: {stats.fetch_phase.duration_seconds:.1f}s")
         logger.info(f"  Rate: {stats.fetch_phase.items_per_second:.1f} items/sec")
 
@@ -636,24 +792,36 @@ class TMDBChangesETL(TMDBService):
         stats: ChangesETLStats,
         media_manager_client: MediaManagerClient | None = None,
     ) -> None:
-        """Phase 2: Load from staging file to Redis, optionally push to Media Manager."""
+        """Phase 2: Load from staging file to Redis, optionally push to Media Manager.
+
+        Batches of 100 items move through overlapping stages (normalize → enrich →
+        read existing → microgenre → write → Media Manager push) via
+        ``run_pipeline``; per-stage stats are stored on ``stats.load_stages``.
+        Items are streamed from the staging file, and the contiguous prefix of
+        completed batches is checkpointed so an interrupted load resumes there.
+        """
         stats.load_phase.started_at = datetime.now()
         stats.load_phase.phase = "load_to_redis"
         stats.current_phase = "load"
 
         logger.info(f"Phase 2: Loading from {staging_path} to Redis")
 
-        # Read staging file
-        with gzip.open(staging_path, "rt", encoding="utf-8") as f:
-            data = json.load(f)
-
-        items = data.get("items", [])
-        media_type = data.get("media_type", "")
-
-        if not items:
+        # Stream the staging file, skipping items a crashed load already wrote
+        media_type = read_staging_header(staging_path).get("media_type", "")
+        progress = read_progress(staging_path)
+        skip = progress.loaded_items if progress is not None else 0
+        total_items = progress.items if progress is not None and progress.complete else None
+        if skip:
+            stats.load_resumed_items = skip
+            logger.info(f"Resuming load after {skip} items already written")
+
+        item_iter = iter_staging_items(staging_path, skip=skip)
+        first_item = next(item_iter, None)
+        if first_item is None:
             logger.info("No items to load")
             stats.load_phase.completed_at = datetime.now()
             return
+        items = itertools.chain([first_item], item_iter)
 
         # Load genre mapping for media types
         genre_mapping: dict[int, str] = {}
@@ -668,7 +836,8 @@ class TMDBChangesETL(TMDBService):
                 logger.warning(f"Failed to load genre mapping: {e}. Continuing without it.")
 
         push_to_mm = media_manager_client is not None and media_type in ("movie", "tv")
-        mm_buffer: list[dict[str, Any]] = []
+        # (batch index, doc) awaiting the next full Media Manager batch
+        mm_buffer: list[tuple[int, dict[str, Any]]] = []
         mm_batch_size = 100
 
         # Connect to Redis
@@ -778,18 +947,14 @@ class TMDBChangesETL(TMDBService):
                 redis_doc["microgenres"] = microgenre_result_to_redis(response.result)
                 stats.microgenres_generated += 1
 
-            for i in range(0, len(items), batch_size):
-                batch = items[i : i + batch_size]
-                batch_start = time.time()
-
-                prepared: list[tuple[str, dict[str, Any]]] = []
-                for item in batch:
+            async def _normalize_stage(batch: _LoadBatch) -> _LoadBatch | None:
+                for item in batch.items:
                     stats.load_phase.items_processed += 1
                     try:
                         if media_type == "person":
                             doc_dict = self._normalize_person(item)
                             key = f"{prefix}{doc_dict['id']}"
-                            prepared.append((key, doc_dict))
+                            batch.prepared.append((key, doc_dict))
                         else:
                             doc = normalize_document(item, genre_mapping=genre_mapping)
                             if doc is None:
@@ -800,78 +965,191 @@ class TMDBChangesETL(TMDBService):
                                 continue
                             key = f"{prefix}{doc.id}"
                             redis_doc = document_to_redis(doc)
-                            prepared.append((key, redis_doc))
+                            batch.prepared.append((key, redis_doc))
                     except Exception as e:
                         stats.load_phase.items_failed += 1
                         stats.load_phase.errors.append(f"{item.get('id')}: {e}")
-
-                if prepared and media_type != "person":
-                    await asyncio.gather(
-                        *[_enrich_with_backoff(doc) for _, doc in prepared]
-                    )
-
-                if prepared:
-                    now_ts = int(datetime.now(UTC).timestamp())
-                    read_pipe = redis.pipeline()
-                    for key, _ in prepared:
-                        read_pipe.json().get(key)
-                    existing_docs: list[object] = await read_pipe.execute()
-
-                    if media_type != "person":
-                        await asyncio.gather(
-                            *[
-                                _attach_microgenres(
-                                    redis_doc,
-                                    existing if isinstance(existing, dict) else None,
-                                )
-                                for (_key, redis_doc), existing in zip(
-                                    prepared, existing_docs, strict=True
-                                )
-                            ]
-                        )
-
-                    write_pipe = redis.pipeline()
-                    for (key, redis_doc), existing in zip(prepared, existing_docs, strict=True):
-                        existing_dict = existing if isinstance(existing, dict) else None
-                        ca, ma, src = resolve_timestamps(
-                            existing_dict, now_ts, source_tag="nightly_etl"
+                if not batch.prepared:
+                    _mark_loaded(batch.index)
+                    return None
+                return batch
+
+            async def _enrich_stage(batch: _LoadBatch) -> _LoadBatch:
+                await asyncio.gather(*[_enrich_with_backoff(doc) for _, doc in batch.prepared])
+                return batch
+
+            async def _read_stage(batch: _LoadBatch) -> _LoadBatch:
+                read_pipe = redis.pipeline()
+                for key, _ in batch.prepared:
+                    read_pipe.json().get(key)
+                existing_docs: list[object] = await read_pipe.execute()
+                batch.existing = [
+                    existing if isinstance(existing, dict) else None for existing in existing_docs
+                ]
+                return batch
+
+            async def _microgenre_stage(batch: _LoadBatch) -> _LoadBatch:
+                await asyncio.gather(
+                    *[
+                        _attach_microgenres(redis_doc, existing)
+                        for (_key, redis_doc), existing in zip(
+                            batch.prepared, batch.existing, strict=True
                         )
-                        redis_doc["created_at"] = ca
-                        redis_doc["modified_at"] = ma
-                        redis_doc["_source"] = src
-                        write_pipe.json().set(key, "$", redis_doc)
-                        stats.load_phase.items_success += 1
+                    ]
+                )
+                # Keep the KNN vector in step with whichever microgenres were kept
+                for _key, redis_doc in batch.prepared:
+                    if redis_doc.get("mc_type") in ("movie", "tv"):
+                        attach_microgenre_vector(redis_doc)
+                return batch
+
+            async def _write_stage(batch: _LoadBatch) -> _LoadBatch:
+                now_ts = int(datetime.now(UTC).timestamp())
+                write_pipe = redis.pipeline()
+                written = 0
+                for (key, redis_doc), existing in zip(batch.prepared, batch.existing, strict=True):
+                    if not stamp_document_for_write(
+                        redis_doc, existing, now_ts, source_tag="nightly_etl"
+                    ):
+                        stats.load_phase.items_skipped += 1
+                        continue
+                    queue_document_patch(write_pipe, key, existing, redis_doc)
+                    written += 1
+                if written:
+                    queue_index_generation_bump(write_pipe)
                     await write_pipe.execute()
+                stats.load_phase.items_success += written
+
+                stats.current_batch += 1
+                elapsed = time.time() - load_start
+                done = (
+                    stats.load_phase.items_success
+                    + stats.load_phase.items_skipped
+                    + stats.load_phase.items_failed
+                )
+                logger.info(
+                    f"  Loaded {done}/{total_items - skip if total_items else '?'} "
+                    f"(batch {stats.current_batch}/{stats.total_batches}, "
+                    f"{done / elapsed if elapsed > 0 else 0:.0f} items/sec)"
+                )
+                return batch
 
-                    if push_to_mm and media_manager_client is not None:
-                        for _key, redis_doc in prepared:
-                            passed, _reason = passes_media_manager_filter(redis_doc)
-                            if passed:
-                                mm_buffer.append(redis_doc)
-                            else:
-                                stats.mm_docs_filtered += 1
-
-                        while len(mm_buffer) >= mm_batch_size:
-                            mm_batch = mm_buffer[:mm_batch_size]
-                            mm_buffer = mm_buffer[mm_batch_size:]
-                            await self._send_mm_batch(
-                                media_manager_client, mm_batch, stats
-                            )
-
-                batch_time = time.time() - batch_start
-                items_per_sec = len(batch) / batch_time if batch_time > 0 else 0
+            # A batch is only checkpointed once its buffered MM docs have been
+            # sent, otherwise a resumed load would never push them.
+            mm_unsent: dict[int, int] = {}
+            mm_held: set[int] = set()
 
+            async def _send_mm(entries: list[tuple[int, dict[str, Any]]]) -> None:
+                if media_manager_client is None:
+                    return
+                await self._send_mm_batch(media_manager_client, [doc for _, doc in entries], stats)
+                for index, _doc in entries:
+                    mm_unsent[index] -= 1
+                    if not mm_unsent[index]:
+                        del mm_unsent[index]
+                        if index in mm_held:
+                            mm_held.discard(index)
+                            _mark_loaded(index)
+
+            async def _mm_push_stage(batch: _LoadBatch) -> _LoadBatch:
+                nonlocal mm_buffer
+                for _key, redis_doc in batch.prepared:
+                    passed, _reason = passes_media_manager_filter(redis_doc)
+                    if passed:
+                        mm_buffer.append((batch.index, redis_doc))
+                        mm_unsent[batch.index] = mm_unsent.get(batch.index, 0) + 1
+                    else:
+                        stats.mm_docs_filtered += 1
+
+                while len(mm_buffer) >= mm_batch_size:
+                    mm_batch = mm_buffer[:mm_batch_size]
+                    mm_buffer = mm_buffer[mm_batch_size:]
+                    await _send_mm(mm_batch)
+                return batch
+
+            loaded_batches: set[int] = set()
+            loaded_watermark = 0
+
+            def _mark_loaded(index: int) -> None:
+                """Advance the resume offset past the contiguous prefix of finished batches."""
+                nonlocal loaded_watermark
+                loaded_batches.add(index)
+                advanced = False
+                while loaded_watermark in loaded_batches:
+                    loaded_batches.discard(loaded_watermark)
+                    loaded_watermark += 1
+                    advanced = True
+                if advanced and progress is not None:
+                    progress.loaded_items = skip + loaded_watermark * batch_size
+                    write_progress(staging_path, progress)
+
+            async def _checkpoint_stage(batch: _LoadBatch) -> _LoadBatch:
+                if batch.index in mm_unsent:
+                    mm_held.add(batch.index)
+                else:
+                    _mark_loaded(batch.index)
+                return batch
+
+            # Stages overlap across batches: Redis reads/writes proceed while the
+            # classifier and RT enrichment work on neighbouring batches.
+            stage_fns: list[tuple[str, Callable[[_LoadBatch], Awaitable[_LoadBatch | None]]]] = [
+                ("normalize", _normalize_stage)
+            ]
+            if media_type != "person":
+                stage_fns.append(("enrich", _enrich_stage))
+            stage_fns.append(("read", _read_stage))
+            if media_type != "person":
+                stage_fns.append(("microgenre", _microgenre_stage))
+            stage_fns.append(("write", _write_stage))
+            if push_to_mm:
+                stage_fns.append(("mm_push", _mm_push_stage))
+            stage_fns.append(("checkpoint", _checkpoint_stage))
+
+            def _batches() -> Iterator[_LoadBatch]:
+                index = 0
+                while chunk := list(itertools.islice(items, batch_size)):
+                    yield _LoadBatch(items=chunk, index=index)
+                    index += 1
+
+            stats.current_batch = 0
+            stats.total_batches = (
+                (total_items - skip + batch_size - 1) // batch_size if total_items else 0
+            )
+            stats.load_stages = await run_pipeline(
+                _batches(),
+                [
+                    PipelineStage(
+                        name,
+                        fn,
+                        workers=_load_stage_workers(name),
+                        queue_depth=LOAD_QUEUE_DEPTH,
+                    )
+                    for name, fn in stage_fns
+                ],
+            )
+            for stage_stats in stats.load_stages.values():
                 logger.info(
-                    f"  Loaded {i + len(batch)}/{len(items)} "
-                    f"({batch_time:.2f}s, {items_per_sec:.0f} items/sec)"
+                    f"  Stage {stage_stats.name}: workers={stage_stats.workers} "
+                    f"busy={stage_stats.busy_seconds:.1f}s "
+                    f"starved={stage_stats.starved_seconds:.1f}s "
+                    f"blocked={stage_stats.blocked_seconds:.1f}s "
+                    f"({stage_stats.items_per_second:.0f} items/sec)"
                 )
 
             # Flush remaining MM buffer
-            if push_to_mm and media_manager_client is not None and mm_buffer:
-                await self._send_mm_batch(media_manager_client, mm_buffer, stats)
+            if push_to_mm and mm_buffer:
+                await _send_mm(mm_buffer)
+
+            # Load finished: a later run should reload the whole file
+            if progress is not None:
+                progress.loaded_items = 0
+                write_progress(staging_path, progress)
 
             total_time = time.time() - load_start
-            logger.info(f"Phase 2 complete: {stats.load_phase.items_success} items loaded")
+            logger.info(
+                f"Phase 2 complete: {stats.load_phase.items_success} items loaded, "
+                f"{stats.load_phase.items_skipped} unchanged"
+            )
             logger.info(f"  Duration: {total_time:.1f}s")
             logger.info(f"  Rate: {stats.load_phase.items_success / total_time:.1f} items/sec")
             if stats.mm_docs_sent > 0:
@@ -887,9 +1165,8 @@ class TMDBChangesETL(TMDBService):
 
         # Save load errors to separate file if any
         if stats.load_phase.errors:
-            errors_path = staging_path.parent / staging_path.name.replace(
-                ".json.gz", "_load_errors.json.gz"
-            )
+            stem = staging_path.name.removesuffix(STAGING_SUFFIX).removesuffix(".json.gz")
+            errors_path = staging_path.parent / f"{stem}_load_errors.json.gz"
             with gzip.open(errors_path, "wt", encoding="utf-8") as f:
                 json.dump(
                     {
@@ -1071,6 +1348,7 @@ async def run_nightly_etl(
             print()
             print("📊 Phase 2 (Load) Results:")
             print(f"  Items loaded: {stats.load_phase.items_success}")
+            print(f"  Unchanged (write skipped): {stats.load_phase.items_skipped}")
             print(f"  Errors: {stats.load_phase.items_failed}")
             if media_type in ("movie", "tv"):
                 if stats.mm_docs_sent > 0:
@@ -1115,7 +1393,11 @@ def cleanup_old_staging_files(staging_dir: str = "/tmp/etl-staging", max_age_day
 
     cutoff = datetime.now() - timedelta(days=max_age_days)
 
-    for file in staging_path.glob("*.json.gz"):
+    for file in [
+        *staging_path.glob("*.json.gz"),
+        *staging_path.glob(f"*{STAGING_SUFFIX}"),
+        *staging_path.glob("*.progress.json"),
+    ]:
         mtime = datetime.fromtimestamp(file.stat().st_mtime)
         if mtime < cutoff:
             logger.info(f"Removing old staging file: {file}")
@@ -1213,4 +1495,4 @@ if __name__ == "__main__":
             if mm_client:
                 await mm_client.close()
 
-    asyncio.run(run_with_media_manager())
+    run_with_http_sessions(run_with_media_manager())
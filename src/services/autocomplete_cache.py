@@ -0,0 +1,206 @@
+"""
+Autocomplete Response Cache - In-process cache for hot autocomplete prefixes.
+
+Autocomplete traffic is dominated by short, repeated prefixes ("the", "star",
+"harry p"), and every call otherwise re-runs the full ``search()`` fan-out,
+parse and rerank.  This cache stores finished ``autocomplete()`` responses
+keyed by the normalized query, the sorted source set and the request flags.
+
+Invalidation is driven by the index generation counter
+(``adapters.index_generation``) that ETL loaders bump after each write batch:
+the generation is part of every key, and a bump clears the cache.  The
+generation is re-read from Redis at most every ``generation_check_seconds``,
+and entries also expire after ``ttl_seconds`` as a backstop for writes that
+bypass the loaders.
+
+Tuning (environment variables):
+    AUTOCOMPLETE_CACHE_MAX_ENTRIES        LRU capacity, 0 disables (default: 4096)
+    AUTOCOMPLETE_CACHE_TTL                Entry lifetime in seconds (default: 300)
+    AUTOCOMPLETE_CACHE_GENERATION_CHECK   Seconds between generation reads (default: 5)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from utils.get_logger import get_logger
+from utils.metrics import record_cache
+
+logger = get_logger(__name__)
+
+_MAX_ENTRIES = int(os.getenv("AUTOCOMPLETE_CACHE_MAX_ENTRIES", "4096"))
+_TTL_SECONDS = float(os.getenv("AUTOCOMPLETE_CACHE_TTL", "300"))
+_GENERATION_CHECK_SECONDS = float(os.getenv("AUTOCOMPLETE_CACHE_GENERATION_CHECK", "5"))
+_LATENCY_WINDOW = 1024  # Recent samples kept per outcome for percentiles
+
+CacheKey = tuple[int, str, tuple[str, ...], bool, bool, bool]
+
+
+def normalize_autocomplete_query(q: str, raw: bool = False) -> str:
+    """
+    Normalize a query for use in an autocomplete cache key.
+
+    Lowercases and collapses whitespace, so "Harry P" and "harry  p" share one
+    entry.  This is the same key ``compile_query_plan`` uses: punctuation,
+    accents and non-ASCII text are kept, since the query builders and the
+    ranker treat "spider-man", "Amélie" or "東京物語" differently from their
+    stripped forms.  Raw RediSearch queries are only trimmed, since their
+    syntax is significant.
+    """
+    if raw:
+        return q.strip()
+    return " ".join(q.lower().split())
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+class AutocompleteCache:
+    """LRU + TTL cache of autocomplete responses scoped to an index generation.
+
+    Not thread-safe; intended for use from the web app's event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _MAX_ENTRIES,
+        ttl_seconds: float = _TTL_SECONDS,
+        generation_check_seconds: float = _GENERATION_CHECK_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation_check_seconds = generation_check_seconds
+        self._entries: OrderedDict[CacheKey, tuple[dict[str, Any], float]] = OrderedDict()
+        self._generation = 0
+        self._generation_checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._hit_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._miss_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    async def _current_generation(self, fetch_generation: Callable[[], Awaitable[int]]) -> int:
+        """Return the index generation, re-reading it when the check interval has passed."""
+        now = time.monotonic()
+        if now - self._generation_checked_at < self.generation_check_seconds:
+            return self._generation
+        self._generation_checked_at = now
+        try:
+            generation = await fetch_generation()
+        except Exception as e:
+            logger.warning(f"Autocomplete cache: index generation read failed: {e}")
+            return self._generation
+        if generation != self._generation:
+            if self._entries:
+                logger.info(
+                    f"Autocomplete cache: index generation {self._generation} -> {generation}, "
+                    f"dropping {len(self._entries)} entries"
+                )
+                self.invalidations += 1
+            self._entries.clear()
+            self._generation = generation
+        return generation
+
+    async def get_or_compute(
+        self,
+        q: str,
+        sources: set[str],
+        flags: tuple[bool, bool, bool],
+        compute: Callable[[], Awaitable[dict[str, Any]]],
+        fetch_generation: Callable[[], Awaitable[int]],
+    ) -> dict[str, Any]:
+        """
+        Return the cached response for this request, computing and storing it on a miss.
+
+        Args:
+            q: User query (normalized here for the key).
+            sources: Indexed sources the response covers.
+            flags: ``(raw, no_duplicate, full)`` request flags.
+            compute: Coroutine factory producing the response on a miss.
+            fetch_generation: Coroutine factory returning the current index generation.
+
+        Returns:
+            A shallow copy of the response dict; nested lists are shared with the
+            cache and must not be mutated.
+        """
+        normalized = normalize_autocomplete_query(q, flags[0])
+        if not self.enabled or not normalized:
+            return await compute()
+
+        start = time.perf_counter()
+        generation = await self._current_generation(fetch_generation)
+        raw, no_duplicate, full = flags
+        key: CacheKey = (
+            generation,
+            normalized,
+            tuple(sorted(sources)),
+            raw,
+            no_duplicate,
+            full,
+        )
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._hit_ms.append((time.perf_counter() - start) * 1000)
+            record_cache("autocomplete", True)
+            return dict(entry[0])
+        if entry is not None:
+            del self._entries[key]
+
+        record_cache("autocomplete", False)
+        response = await compute()
+        self.misses += 1
+        self._miss_ms.append((time.perf_counter() - start) * 1000)
+
+        if generation == self._generation:
+            self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return dict(response)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        hit_ms = list(self._hit_ms)
+        miss_ms = list(self._miss_ms)
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "index_generation": self._generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_latency_ms": {
+                "p50": _percentile(hit_ms, 50),
+                "p95": _percentile(hit_ms, 95),
+                "p99": _percentile(hit_ms, 99),
+            },
+            "miss_latency_ms": {
+                "p50": _percentile(miss_ms, 50),
+                "p95": _percentile(miss_ms, 95),
+                "p99": _percentile(miss_ms, 99),
+            },
+        }
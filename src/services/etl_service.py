@@ -21,6 +21,7 @@ from google.cloud import storage  # type: ignore[attr-defined]
 from redis.asyncio import Redis
 
 from adapters.config import load_env
+from adapters.index_generation import queue_index_generation_bump
 from contracts.models import MCSources, MCType
 from core.normalize import SearchDocument, document_to_redis, normalize_document, resolve_timestamps
 from core.streaming_providers import (
@@ -622,5 +623,6 @@ class TMDBETLService:
             redis_doc = document_to_redis(search_doc)
             write_pipe.json().set(key, "$", redis_doc)
 
+        queue_index_generation_bump(write_pipe)
         await write_pipe.execute()
         return len(batch)
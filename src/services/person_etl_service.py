@@ -25,9 +25,12 @@ from typing import Any
 from redis.asyncio import Redis
 
 from adapters.config import load_env
+from adapters.document_patch import queue_document_patch
+from adapters.index_generation import queue_index_generation_bump
 from api.tmdb.person import TMDBPersonService
 from contracts.models import MCSources, MCType
-from core.normalize import SearchDocument, document_to_redis, resolve_timestamps
+from core.normalize import SearchDocument, document_to_redis, stamp_document_for_write
+from utils.adaptive_pool import AIMDController, adaptive_map
 from utils.get_logger import get_logger
 
 logger = get_logger(__name__)
@@ -59,6 +62,7 @@ class PersonETLStats:
     files_processed: int = 0
     documents_loaded: int = 0
     documents_skipped: int = 0
+    documents_unchanged: int = 0  # Loaded but identical to Redis; JSON.SET skipped
     load_errors: list[str] = field(default_factory=list)
 
     started_at: datetime | None = None
@@ -79,8 +83,9 @@ class PersonETLConfig:
     redis_host: str
     redis_port: int
     redis_password: str | None
-    batch_size: int = 50  # Smaller batches for API calls
-    api_concurrency: int = 5  # Concurrent API calls
+    batch_size: int = 50  # Progress-reporting granularity for enrichment
+    api_concurrency: int = 5  # Initial concurrent API calls (adapts up to api_max_concurrency)
+    api_max_concurrency: int = 32
 
     @classmethod
     def from_env(cls) -> "PersonETLConfig":
@@ -93,6 +98,7 @@ class PersonETLConfig:
             redis_password=os.getenv("REDIS_PASSWORD") or None,
             batch_size=int(os.getenv("PERSON_ETL_BATCH_SIZE", "50")),
             api_concurrency=int(os.getenv("PERSON_API_CONCURRENCY", "5")),
+            api_max_concurrency=int(os.getenv("PERSON_API_MAX_CONCURRENCY", "32")),
         )
 
 
@@ -215,54 +221,57 @@ class PersonETLService:
 
         # Enrich each person with TMDB details
         print("🔍 Enriching with TMDB details...")
-        enriched_persons: list[dict[str, Any]] = []
-        semaphore = asyncio.Semaphore(self.config.api_concurrency)
 
         async def enrich_person(person: dict[str, Any]) -> dict[str, Any] | None:
             """Enrich a single person with TMDB details."""
-            async with semaphore:
-                try:
-                    person_id = person.get("id")
-                    if not person_id:
-                        return None
-
-                    details = await self.tmdb_service.get_person_details(person_id)
-                    if details:
-                        # Convert MCPersonItem to dict for storage
-                        result: dict[str, Any] = details.to_dict()
-                        return result
-                    return None
-                except Exception as e:
-                    stats.extract_errors.append(f"Error enriching person {person.get('id')}: {e}")
+            try:
+                person_id = person.get("id")
+                if not person_id:
                     return None
 
-        # Process in batches
+                details = await self.tmdb_service.get_person_details(person_id)
+                if details:
+                    # Convert MCPersonItem to dict for storage
+                    result: dict[str, Any] = details.to_dict()
+                    return result
+                return None
+            except Exception as e:
+                stats.extract_errors.append(f"Error enriching person {person.get('id')}: {e}")
+                return None
+
+        # Sliding window with adaptive concurrency; progress is still reported per batch
         batch_size = self.config.batch_size
         total_batches = (len(persons_to_enrich) + batch_size - 1) // batch_size
-
-        for batch_idx in range(0, len(persons_to_enrich), batch_size):
-            batch = persons_to_enrich[batch_idx : batch_idx + batch_size]
-            batch_num = batch_idx // batch_size + 1
-
-            if progress_callback is not None:
-                progress_callback(
-                    batch_current=batch_num,
-                    batch_total=total_batches,
-                    status_message=f"Processing batch {batch_num}/{total_batches}",
+        controller = AIMDController(
+            initial=self.config.api_concurrency,
+            max_limit=self.config.api_max_concurrency,
+        )
+        enriched_by_index: dict[int, dict[str, Any]] = {}
+        completed = 0
+
+        async for index, _person, result in adaptive_map(
+            persons_to_enrich, enrich_person, controller
+        ):
+            completed += 1
+            if isinstance(result, BaseException):
+                stats.extract_errors.append(str(result))
+            elif result is not None:
+                enriched_by_index[index] = result
+
+            if completed % batch_size == 0 or completed == len(persons_to_enrich):
+                batch_num = (completed + batch_size - 1) // batch_size
+                if progress_callback is not None:
+                    progress_callback(
+                        batch_current=batch_num,
+                        batch_total=total_batches,
+                        status_message=f"Processing batch {batch_num}/{total_batches}",
+                    )
+                print(
+                    f"  Enriched {completed:,}/{len(persons_to_enrich):,} "
+                    f"(concurrency {controller.limit})..."
                 )
 
-            print(f"  Processing batch {batch_num}/{total_batches} ({len(batch)} items)...")
-
-            # Enrich batch concurrently
-            tasks = [enrich_person(p) for p in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, BaseException):
-                    stats.extract_errors.append(str(result))
-                elif result is not None:
-                    enriched_persons.append(result)
-
+        enriched_persons = [enriched_by_index[i] for i in sorted(enriched_by_index)]
         stats.enriched_count = len(enriched_persons)
         print()
         print(f"  Enriched: {stats.enriched_count:,}")
@@ -435,11 +444,11 @@ class PersonETLService:
             stats.documents_loaded += 1
 
             if len(prepared) >= self.config.batch_size:
-                await self._write_batch_with_timestamps(prepared)
+                await self._write_batch_with_timestamps(prepared, stats)
                 prepared = []
 
         if prepared:
-            await self._write_batch_with_timestamps(prepared)
+            await self._write_batch_with_timestamps(prepared, stats)
 
         await self.disconnect()
 
@@ -451,6 +460,7 @@ class PersonETLService:
         print("=" * 60)
         print(f"  Documents loaded: {stats.documents_loaded:,}")
         print(f"  Documents skipped: {stats.documents_skipped:,}")
+        print(f"  Documents unchanged: {stats.documents_unchanged:,}")
         if stats.duration_seconds:
             print(f"  Duration: {stats.duration_seconds:.1f}s")
         print()
@@ -461,8 +471,9 @@ class PersonETLService:
     async def _write_batch_with_timestamps(
         self,
         prepared: list[tuple[str, dict[str, Any]]],
+        stats: PersonETLStats,
     ) -> None:
-        """Flush a batch with read-before-write timestamp resolution."""
+        """Flush a batch with read-before-write timestamps, skipping unchanged documents."""
         if not prepared or not self.redis:
             return
         now_ts = int(datetime.now(UTC).timestamp())
@@ -472,13 +483,17 @@ class PersonETLService:
         existing_docs: list[object] = await read_pipe.execute()
 
         write_pipe = self.redis.pipeline()
+        written = 0
         for (key, redis_doc), existing in zip(prepared, existing_docs, strict=True):
             existing_dict = existing if isinstance(existing, dict) else None
-            ca, ma, _ = resolve_timestamps(existing_dict, now_ts)
-            redis_doc["created_at"] = ca
-            redis_doc["modified_at"] = ma
-            write_pipe.json().set(key, "$", redis_doc)
-        await write_pipe.execute()
+            if not stamp_document_for_write(redis_doc, existing_dict, now_ts):
+                stats.documents_unchanged += 1
+                continue
+            queue_document_patch(write_pipe, key, existing_dict, redis_doc)
+            written += 1
+        if written:
+            queue_index_generation_bump(write_pipe)
+            await write_pipe.execute()
 
     def _normalize_person_for_search(self, person: dict) -> SearchDocument | None:
         """
@@ -1,17 +1,20 @@
 import asyncio
 import json
+import os
 import re
+import struct
 import time
-import urllib.parse
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime, timedelta
-from typing import Any, Literal, Union
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple, Union
 
-import aiohttp
 from pydantic import BaseModel
 
+from adapters.index_generation import get_index_generation
+from adapters.key_prefix import resolve_key_prefix
 from adapters.redis_client import get_redis
-from adapters.redis_repository import RedisRepository
+from adapters.redis_repository import RedisRepository, SearchSpec
 from api.newsai.wrappers import newsai_wrapper
 from api.rottentomatoes.wrappers import rottentomatoes_wrapper
 from api.subapi.spotify.wrappers import spotify_wrapper
@@ -21,6 +24,7 @@ from api.tmdb.wrappers import get_person_credits_async
 from api.youtube.wrappers import youtube_wrapper
 from contracts.models import MCType
 from core.iptc import expand_query_string, get_search_aliases
+from core.microgenres import drop_microgenre_vector
 from core.ranking import (
     EXACT_MATCH_SOURCE_PRIORITY,
     is_exact_match,
@@ -30,19 +34,26 @@ from core.ranking import (
     score_podcast_result,
 )
 from core.search_queries import (
+    MEDIA_TIER_FIELDS,
+    MEDIA_TIER_JSON_FIELDS,
     STOPWORDS,
     build_autocomplete_query,
     build_books_autocomplete_query,
     build_filter_query,
     build_fuzzy_fulltext_query,
+    build_knn_query,
     build_media_query_from_user_input,
+    build_media_tier_expression,
     build_minimal_autocomplete_query,
     escape_redis_search_term,
     normalize_for_tag,
     normalize_query_separators,
     strip_query_apostrophes,
 )
+from services.autocomplete_cache import AutocompleteCache
+from services.spelling_service import get_spelling_correction
 from utils.get_logger import get_logger
+from utils.metrics import record_span, span
 from utils.normalize import normalize
 from utils.soft_comparison import (
     _levenshtein_distance,
@@ -413,8 +424,15 @@ def parse_doc(doc):
     if "title" in result and result["title"]:
         result["search_title"] = result["title"]
 
-    # Fix legacy person data that may be missing tmdb_ prefix and source_id
-    # BUT skip this for OpenLibrary authors (mc_subtype === "author")
+    _fix_legacy_person_ids(result)
+    return drop_microgenre_vector(result)
+
+
+def _fix_legacy_person_ids(result: dict[str, Any]) -> None:
+    """Fix legacy person data that may be missing tmdb_ prefix and source_id (in-place).
+
+    Skipped for OpenLibrary authors (mc_subtype === "author").
+    """
     doc_id = result.get("id", "")
     mc_type = result.get("mc_type", "")
     mc_subtype = result.get("mc_subtype", "")
@@ -432,8 +450,6 @@ def parse_doc(doc):
             if match:
                 result["source_id"] = match.group(1)
 
-    return result
-
 
 def _extract_docs(result: object) -> list[object]:
     """Safely extract RediSearch docs from an arbitrary result object."""
@@ -451,16 +467,126 @@ def _build_media_source_query(query_str: str, media_source: str) -> str:
     return f"({query_str}) {type_filter}"
 
 
+def _indexed_search_specs(
+    sources: set[str],
+    *,
+    media_query: str,
+    people_query: str,
+    podcasts_query: str,
+    authors_query: str,
+    books_query: str,
+    limit: int,
+    media_limit: int,
+    media_sort: str = "popularity",
+    media_rank_expr: str | None = None,
+    fields: list[str] | None = None,
+) -> list[SearchSpec]:
+    """
+    Build the per-source FT.SEARCH specs for one pipelined ``search_many`` call.
+
+    Keys match the names ``search()`` and ``autocomplete_stream()`` have always
+    used for their indexed tasks (``tv_media``, ``movie_media``, ``person``, ...).
+    Person fetches ``limit * 2`` for post-query prefix filtering; books use BM25.
+    With ``media_rank_expr`` the media specs run as FT.AGGREGATE, pre-sorted by
+    that expression and then ``media_sort``.  With ``fields`` every spec
+    projects those fields plus its source's ranking inputs.
+    """
+
+    def projection(source: str) -> tuple[str, ...]:
+        return _search_projection(source, fields) if fields else ()
+
+    specs: list[SearchSpec] = []
+    for media_source in ("tv", "movie"):
+        if media_source in sources:
+            specs.append(
+                SearchSpec(
+                    key=f"{media_source}_media",
+                    source=media_source,
+                    query_str=_build_media_source_query(media_query, media_source),
+                    limit=media_limit,
+                    sort_by=media_sort,
+                    fields=projection(media_source),
+                    rank_expr=media_rank_expr,
+                    rank_fields=MEDIA_TIER_FIELDS if media_rank_expr else (),
+                    rank_json_fields=MEDIA_TIER_JSON_FIELDS if media_rank_expr else (),
+                    # score_media_result orders each tier by year, then popularity
+                    rank_sort_by=("year",) if media_rank_expr else (),
+                )
+            )
+    if "person" in sources:
+        specs.append(
+            SearchSpec(
+                key="person",
+                source="person",
+                query_str=people_query,
+                limit=limit * 2,
+                fields=projection("person"),
+            )
+        )
+    if "podcast" in sources:
+        specs.append(
+            SearchSpec(
+                key="podcast",
+                source="podcast",
+                query_str=podcasts_query,
+                limit=limit,
+                fields=projection("podcast"),
+            )
+        )
+    if "author" in sources:
+        specs.append(
+            SearchSpec(
+                key="author",
+                source="author",
+                query_str=authors_query,
+                limit=limit,
+                sort_by=None,
+                fields=projection("author"),
+            )
+        )
+    if "book" in sources:
+        specs.append(
+            SearchSpec(
+                key="book",
+                source="book",
+                query_str=books_query,
+                limit=limit,
+                sort_by=None,
+                scorer="BM25",
+                fields=projection("book"),
+            )
+        )
+    return specs
+
+
+def _unpack_indexed_batch(batch: tuple[str, Any, float]) -> list[tuple[str, Any, float]]:
+    """Split a timed ``search_many`` result into per-source ``(name, result, elapsed)`` tuples.
+
+    Every source shares the pipeline's elapsed time.  A failed batch yields no
+    tuples, which callers already treat as empty results.
+    """
+    _, results, elapsed = batch
+    if not isinstance(results, dict):
+        if isinstance(results, BaseException):
+            logger.error(f"Indexed search batch failed: {results}")
+        return []
+    return [(name, result, elapsed) for name, result in results.items()]
+
+
 def _parse_media_results(
     result: object,
     query: str | None,
     *,
     preserve_redis_order: bool = False,
+    parse: Callable[[Any], dict[str, Any]] = parse_doc,
+    source: str = "media",
 ) -> list[dict[str, Any]]:
     """Parse media results for a single source bucket."""
-    parsed_results = [parse_doc(doc) for doc in _extract_docs(result)]
+    with span("parse", source):
+        parsed_results = [parse(doc) for doc in _extract_docs(result)]
     if query and not preserve_redis_order:
-        return sorted(parsed_results, key=lambda item: _rank_media_result(item, query))
+        with span("rank", source):
+            return sorted(parsed_results, key=lambda item: _rank_media_result(item, query))
     return parsed_results
 
 
@@ -685,6 +811,64 @@ def build_authors_autocomplete_query(q: str) -> str:
         return f"({title_query}) | ({name_query})"
 
 
+# ---------------------------------------------------------------------------
+# Compiled per-source query plans
+# ---------------------------------------------------------------------------
+
+# Distinct normalized queries kept; override with QUERY_PLAN_CACHE_SIZE.
+_QUERY_PLAN_CACHE_SIZE = int(os.getenv("QUERY_PLAN_CACHE_SIZE", "2048"))
+
+
+class QueryPlan(NamedTuple):
+    """RediSearch query strings for every indexed source, compiled from one input."""
+
+    media: str
+    people: str
+    podcasts: str
+    authors: str
+    books: str
+
+
+def normalize_query_plan_key(q: str) -> str:
+    """Lowercase and collapse whitespace; every query builder is insensitive to both."""
+    return " ".join(q.lower().split())
+
+
+@lru_cache(maxsize=_QUERY_PLAN_CACHE_SIZE)
+def _compile_query_plan(normalized_q: str) -> QueryPlan:
+    return QueryPlan(
+        media=build_autocomplete_query(normalized_q),
+        people=build_people_autocomplete_query(normalized_q),
+        podcasts=build_podcasts_autocomplete_query(normalized_q),
+        authors=build_authors_autocomplete_query(normalized_q),
+        books=build_books_autocomplete_query(normalized_q),
+    )
+
+
+def compile_query_plan(q: str) -> QueryPlan:
+    """
+    Return the per-source query strings for a user query (non-raw mode).
+
+    Tokenizing, escaping and IPTC alias expansion run once per distinct
+    normalized query; repeats (every keystroke re-sends the prefix) are served
+    from a bounded LRU.  Raw queries bypass the plan and are passed through.
+    """
+    return _compile_query_plan(normalize_query_plan_key(q))
+
+
+def get_query_plan_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters and size of the compiled query plan LRU."""
+    info = _compile_query_plan.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
+
+
 # Indexed sources only; brokered APIs are never called from JSON autocomplete.
 _AUTOCOMPLETE_INDEXED_SOURCES: frozenset[str] = frozenset(
     {"tv", "movie", "person", "podcast", "author", "book"}
@@ -703,6 +887,7 @@ _AUTOCOMPLETE_RESPONSE_KEYS: tuple[str, ...] = (
     "artist",
     "album",
 )
+_autocomplete_cache = AutocompleteCache()
 
 
 async def autocomplete(
@@ -753,22 +938,39 @@ async def autocomplete(
             **{k: [] for k in _AUTOCOMPLETE_RESPONSE_KEYS},
         }
 
-    merged = await search(
+    async def _compute() -> dict[str, Any]:
+        merged = await search(
+            q,
+            sources=indexed,
+            limit=_AUTOCOMPLETE_LIMIT,
+            raw=raw,
+            no_duplicate=no_duplicate,
+            full=full,
+        )
+
+        out: dict[str, Any] = {
+            "exact_match": merged.get("exact_match"),
+            "exact_matches": merged.get("exact_matches", []),
+        }
+        for key in _AUTOCOMPLETE_RESPONSE_KEYS:
+            out[key] = merged.get(key, []) if key in indexed else []
+        return out
+
+    response: dict[str, Any] = await _autocomplete_cache.get_or_compute(
         q,
-        sources=indexed,
-        limit=_AUTOCOMPLETE_LIMIT,
-        raw=raw,
-        no_duplicate=no_duplicate,
-        full=full,
+        indexed,
+        (raw, no_duplicate, full),
+        _compute,
+        lambda: get_index_generation(get_repo().redis),
     )
+    return response
+
+
+def get_autocomplete_cache_stats() -> dict[str, Any]:
+    """Hit rate, latency percentiles and size of the autocomplete response cache."""
+    stats: dict[str, Any] = _autocomplete_cache.stats()
+    return stats
 
-    out: dict[str, Any] = {
-        "exact_match": merged.get("exact_match"),
-        "exact_matches": merged.get("exact_matches", []),
-    }
-    for key in _AUTOCOMPLETE_RESPONSE_KEYS:
-        out[key] = merged.get(key, []) if key in indexed else []
-    return out
 
 # ---------------------------------------------------------------------------
 # Lightweight / projected autocomplete
@@ -872,6 +1074,140 @@ def _parse_projected_doc(doc: object) -> dict[str, Any]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Projected full search (search() / search_stream() with ``fields``)
+# ---------------------------------------------------------------------------
+
+SEARCH_FIELD_ALLOWLIST: frozenset[str] = MINIMAL_FIELD_ALLOWLIST | frozenset(
+    {
+        "cast",
+        "cast_ids",
+        "cast_names",
+        "director",
+        "keywords",
+        "networks",
+        "tagline",
+        "watch_providers",
+        "categories",
+        "author_normalized",
+        "description",
+        "popularity_score",
+        "openlibrary_key",
+    }
+)
+
+_SEARCH_ALWAYS_FIELDS: frozenset[str] = frozenset({"mc_id", "mc_type"})
+
+# Fields each source's ranker (core.ranking), exact-match picker and parse-time
+# fixups read.  They are always projected so ranking is identical to the
+# full-document path, then trimmed from the response unless requested.
+_SEARCH_RANKING_FIELDS: dict[str, frozenset[str]] = {
+    "tv": frozenset(
+        {
+            "search_title",
+            "title",
+            "title_compact",
+            "director_name",
+            "cast_names",
+            "keywords",
+            "genres",
+            "year",
+            "popularity",
+            "release_date",
+            "last_air_date",
+            "watch_providers",
+        }
+    ),
+    "person": frozenset({"mc_subtype", "search_title", "name", "popularity", "source_id"}),
+    "podcast": frozenset(
+        {
+            "search_title",
+            "title",
+            "author",
+            "author_normalized",
+            "categories",
+            "popularity",
+            "episode_count",
+        }
+    ),
+    "author": frozenset({"search_title", "name"}),
+    "book": frozenset(
+        {
+            "search_title",
+            "title",
+            "author",
+            "author_normalized",
+            "subjects_normalized",
+            "description",
+            "popularity_score",
+            "openlibrary_key",
+            "key",
+        }
+    ),
+}
+_SEARCH_RANKING_FIELDS["movie"] = _SEARCH_RANKING_FIELDS["tv"]
+
+# RETURN yields bare strings for text values, so "1917" would otherwise be
+# JSON-decoded into an int; keep these as the raw string.
+_PROJECTED_TEXT_FIELDS: tuple[str, ...] = (
+    "search_title",
+    "title",
+    "title_compact",
+    "name",
+    "author",
+    "source_id",
+)
+
+
+def _search_projection(source: str, fields: list[str]) -> tuple[str, ...]:
+    """Return the JSON fields to project for *source*: requested + identity + ranking inputs."""
+    return tuple(
+        sorted(set(fields) | _SEARCH_ALWAYS_FIELDS | _SEARCH_RANKING_FIELDS.get(source, set()))
+    )
+
+
+def _parse_search_projected_doc(doc: object) -> dict[str, Any]:
+    """Parse a projected document for ``search()``, matching ``parse_doc`` semantics.
+
+    Restores the display title into ``search_title`` and applies the legacy
+    person id fixups, so rankers and exact-match pickers see the same values
+    they would for a full document.
+    """
+    result = _parse_projected_doc(doc)
+    for key in _PROJECTED_TEXT_FIELDS:
+        raw_value = doc.__dict__.get(key)
+        if isinstance(raw_value, str) and not raw_value.startswith('"'):
+            result[key] = raw_value
+    if result.get("title"):
+        result["search_title"] = result["title"]
+    _fix_legacy_person_ids(result)
+    return result
+
+
+def _trim_search_item(item: dict[str, Any], keep: set[str]) -> dict[str, Any]:
+    """Return a copy of *item* limited to the *keep* fields."""
+    return {key: value for key, value in item.items() if key in keep}
+
+
+def _trim_search_results(results: dict[str, Any], fields: list[str]) -> None:
+    """Trim indexed-source items and exact matches to *fields* (in-place).
+
+    Brokered sources (news, video, ratings, ...) are not projected and are
+    returned unchanged.
+    """
+    keep = set(fields) | _SEARCH_ALWAYS_FIELDS
+    for source in MINIMAL_AUTOCOMPLETE_SOURCES:
+        items = results.get(source)
+        if items:
+            results[source] = [_trim_search_item(item, keep) for item in items]
+    if results.get("exact_match"):
+        results["exact_match"] = _trim_search_item(results["exact_match"], keep)
+    if results.get("exact_matches"):
+        results["exact_matches"] = [
+            _trim_search_item(item, keep) for item in results["exact_matches"]
+        ]
+
+
 def _item_date_key(item: dict[str, Any]) -> str:
     """Return the best available date string for recency sorting (descending)."""
     return str(item.get("release_date") or item.get("last_aired_date") or "")
@@ -930,29 +1266,6 @@ _RESOLVE_RANKERS: dict[
 }
 
 
-_GOOGLE_SUGGEST_URL = "https://suggestqueries.google.com/complete/search"
-_GOOGLE_SUGGEST_TIMEOUT = aiohttp.ClientTimeout(total=2)
-
-
-async def _google_suggest_top(query: str) -> str | None:
-    """Return the top Google autocomplete suggestion for *query*, or None."""
-    params = {"client": "firefox", "ds": "yt", "q": query}
-    url = f"{_GOOGLE_SUGGEST_URL}?{urllib.parse.urlencode(params)}"
-    try:
-        async with (
-            aiohttp.ClientSession(timeout=_GOOGLE_SUGGEST_TIMEOUT) as session,
-            session.get(url) as resp,
-        ):
-            if resp.status != 200:
-                return None
-            data = await resp.json(content_type=None)
-            if isinstance(data, list) and len(data) >= 2 and isinstance(data[1], list) and data[1]:
-                return str(data[1][0])
-    except (TimeoutError, aiohttp.ClientError, ValueError, IndexError):
-        return None
-    return None
-
-
 async def resolve(
     q: str,
     sources: set[str],
@@ -1158,12 +1471,12 @@ async def resolve(
                     doc["_rank"] = (dist, -popularity)
                     candidates.append(doc)
 
-    # Google Suggest fallback: when both prefix and fuzzy returned nothing,
-    # ask Google autocomplete for a spelling correction, then re-query Redis.
+    # Spelling fallback: when both prefix and fuzzy returned nothing, correct
+    # the query against the local title/name dictionary, then re-query Redis.
     if near_misses > 0 and not matches and not candidates:
-        suggestion = await _google_suggest_top(q)
+        suggestion = await get_spelling_correction(q)
         if suggestion and suggestion.lower().strip() != q.lower().strip():
-            timing_parts.append(f"google_suggest='{suggestion}'")
+            timing_parts.append(f"spelling='{suggestion}'")
             suggest_query = build_minimal_autocomplete_query(suggestion)
             suggest_tasks: list[Any] = []
             for source in sources:
@@ -1244,7 +1557,7 @@ async def resolve(
             doc.pop("_rank", None)
 
     total_elapsed = (time.perf_counter() - total_start) * 1000
-    logger.info(
+    logger.debug(
         f"Resolve '{q}' sources={sorted(sources)} matches={len(matches)} "
         f"near_misses={len(near_miss_results)} "
         f"total={total_elapsed:.0f}ms | {' | '.join(timing_parts)}"
@@ -1342,7 +1655,7 @@ async def autocomplete_minimal(
                 response[name] = []
 
     total_elapsed = (time.perf_counter() - total_start) * 1000
-    logger.info(
+    logger.debug(
         f"Autocomplete/minimal '{q}' fields={len(request_fields)} "
         f"total={total_elapsed:.0f}ms | {' | '.join(timing_parts)}"
     )
@@ -1354,6 +1667,84 @@ async def autocomplete_minimal(
     return response
 
 
+_SIMILAR_SCORE_FIELD = "vector_distance"
+
+
+async def similar_media(
+    mc_id: str,
+    fields: list[str],
+    limit: int = 10,
+    mc_type: str | None = None,
+    genre_ids: list[str] | None = None,
+    genre_match: str = "any",
+    year_min: int | None = None,
+    year_max: int | None = None,
+) -> dict[str, Any] | None:
+    """
+    "More like this" for a movie or TV show from its microgenre vector.
+
+    One KNN query over ``idx:media`` replaces the TMDB recommendations
+    calls: the title's stored ``microgenre_vector`` is the query vector and
+    the filters are applied as a hybrid pre-filter, so the K neighbours
+    returned all satisfy them.
+
+    Args:
+        mc_id: Media id of the title to match (e.g. "tmdb_movie_603").
+        fields: Validated field names to project from each result.
+        limit: Max similar titles to return.
+        mc_type: Restrict results to "movie" or "tv".
+        genre_ids: TMDB genre IDs to restrict results to.
+        genre_match: "any" (OR) or "all" (AND) for ``genre_ids``.
+        year_min: Minimum release year (inclusive).
+        year_max: Maximum release year (inclusive).
+
+    Returns:
+        Dict with ``mc_id`` and ``results`` (nearest first, each with a
+        cosine ``similarity``), or None when the title is not indexed.
+        A title without microgenre scores has no results.
+    """
+    redis = get_redis()
+    key = f"{await resolve_key_prefix(redis, 'media:')}{mc_id}"
+    stored = await redis.json().get(key, "$.microgenre_vector")  # type: ignore[misc]
+    if stored is None:
+        return None
+    vector = stored[0] if isinstance(stored, list) and stored else None
+    if not isinstance(vector, list) or not vector:
+        return {"mc_id": mc_id, "results": []}
+
+    filter_query = build_filter_query(
+        genre_ids=genre_ids,
+        genre_match=genre_match,
+        year_min=year_min,
+        year_max=year_max,
+        mc_type=mc_type,
+    )
+    # The title is normally its own nearest neighbour; ask for one extra
+    k = limit + 1
+    query_str = build_knn_query(filter_query, k, score_alias=_SIMILAR_SCORE_FIELD)
+    request_fields = sorted(set(fields) | _SEARCH_ALWAYS_FIELDS)
+
+    with span("knn", "media"):
+        result = await get_repo().search_similar(
+            query_str,
+            struct.pack(f"<{len(vector)}f", *vector),
+            fields=request_fields,
+            limit=k,
+            score_field=_SIMILAR_SCORE_FIELD,
+        )
+
+    items: list[dict[str, Any]] = []
+    for doc in _extract_docs(result):
+        if getattr(doc, "id", None) == key:
+            continue
+        item = _parse_projected_doc(doc)
+        distance = item.pop(_SIMILAR_SCORE_FIELD, None)
+        if distance is not None:
+            item["similarity"] = round(1.0 - float(distance), 4)
+        items.append(item)
+    return {"mc_id": mc_id, "results": items[:limit]}
+
+
 async def autocomplete_stream(
     q: str,
     sources: set[str] | None = None,
@@ -1364,7 +1755,8 @@ async def autocomplete_stream(
     """
     Streaming autocomplete that yields results as they become available.
 
-    Uses asyncio.as_completed() to return fast sources first.
+    All indexed sources are fetched in one pipelined ``search_many`` round
+    trip, then parsed and yielded per source.
     Each yield contains: (source_name, results_list, latency_ms)
 
     Args:
@@ -1398,76 +1790,42 @@ async def autocomplete_stream(
     repo = get_repo()
 
     # Build queries - raw mode passes query through to all indexed sources
-    media_query = build_media_query_from_user_input(q, raw=raw)
     if raw:
+        media_query = build_media_query_from_user_input(q, raw=True)
         raw_query = q.strip()
         people_query = raw_query
         podcasts_query = raw_query
         authors_query = raw_query
         books_query = raw_query
     else:
-        people_query = build_people_autocomplete_query(q)
-        podcasts_query = build_podcasts_autocomplete_query(q)
-        authors_query = build_authors_autocomplete_query(q)
-        books_query = build_books_autocomplete_query(q)
-
-    # Create named tasks based on requested sources
-    tasks_dict: dict[asyncio.Task, str] = {}  # type: ignore[type-arg]
+        plan = compile_query_plan(q)
+        media_query = plan.media
+        people_query = plan.people
+        podcasts_query = plan.podcasts
+        authors_query = plan.authors
+        books_query = plan.books
 
     # Match /api/search indexed fetch sizes (limit=10) so streamed slices and
     # exact-match resolution align with batch search.
     ac_limit = _AUTOCOMPLETE_LIMIT
     ac_media_limit = 250 if full else max(ac_limit * 5, 50)
-    if "tv" in sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task(
-                    "tv_media",
-                    repo.search(_build_media_source_query(media_query, "tv"), limit=ac_media_limit),
-                )
-            )
-        ] = "tv_media"
-    if "movie" in sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task(
-                    "movie_media",
-                    repo.search(_build_media_source_query(media_query, "movie"), limit=ac_media_limit),
-                )
-            )
-        ] = "movie_media"
-    if "person" in sources:
-        # Fetch more results for post-query filtering (handles 1-char prefix case)
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("person", repo.search_people(people_query, limit=ac_limit * 2))
-            )
-        ] = "person"
-    if "podcast" in sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("podcast", repo.search_podcasts(podcasts_query, limit=ac_limit))
-            )
-        ] = "podcast"
-    if "author" in sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("author", repo.search_authors(authors_query, limit=ac_limit))
-            )
-        ] = "author"
-    if "book" in sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("book", repo.search_books(books_query, limit=ac_limit))
-            )
-        ] = "book"
+    specs = _indexed_search_specs(
+        sources,
+        media_query=media_query,
+        people_query=people_query,
+        podcasts_query=podcasts_query,
+        authors_query=authors_query,
+        books_query=books_query,
+        limit=ac_limit,
+        media_limit=ac_media_limit,
+    )
 
     # External/brokered APIs (news, video, ratings, artist, album) are excluded
     # from autocomplete stream to avoid excessive API calls during typing.
     # They are only fetched on the /api/search endpoint (Enter key).
 
     # If no tasks, return early
-    if not tasks_dict:
+    if not specs:
         return
 
     total_start = time.perf_counter()
@@ -1475,14 +1833,11 @@ async def autocomplete_stream(
     streamed_results: dict[str, list[dict[str, Any]]] = {}
     streamed_full: dict[str, list[dict[str, Any]]] = {}
 
-    # Yield results as they complete (fastest first)
-    for completed_task in asyncio.as_completed(tasks_dict.keys()):
-        try:
-            result = await completed_task
-            if not isinstance(result, tuple) or len(result) != 3:
-                continue
+    # Every indexed source goes out in one pipelined round trip
+    indexed_results = _unpack_indexed_batch(await timed_task("indexed", repo.search_many(specs)))
 
-            name, data, elapsed = result
+    for name, data, elapsed in indexed_results:
+        try:
             timing_parts.append(f"{name}={elapsed:.0f}ms")
 
             # Parse results based on source type
@@ -1491,7 +1846,7 @@ async def autocomplete_stream(
             if name in {"tv_media", "movie_media"}:
                 if data and not isinstance(data, BaseException) and hasattr(data, "docs"):
                     source_name = "tv" if name == "tv_media" else "movie"
-                    media_parsed_full = _parse_media_results(data, q)
+                    media_parsed_full = _parse_media_results(data, q, source=source_name)
                     streamed_full[source_name] = media_parsed_full
                     media_results = media_parsed_full[:ac_limit]
                     streamed_results[source_name] = media_results
@@ -1580,7 +1935,7 @@ async def autocomplete_stream(
     all_exact = _collect_exact_matches(streamed_full, q, hero=final_exact)
     if all_exact:
         yield ("exact_matches_final", all_exact)
-    logger.info(
+    logger.debug(
         f"Autocomplete stream '{q}' latency: total={total_elapsed:.0f}ms | {' | '.join(timing_parts)}"
     )
 
@@ -1603,6 +1958,19 @@ VALID_SOURCES = {
 }
 
 
+_UPSTREAM_TASKS: frozenset[str] = frozenset({"news", "video", "ratings", "artist", "album"})
+
+
+def _record_task_span(name: str, elapsed: float) -> None:
+    """Record a ``timed_task`` as a redis or upstream span (RT enrichment tasks share one label)."""
+    if name.startswith("rt_"):
+        record_span("upstream", "ratings_enrich", elapsed)
+    elif name in _UPSTREAM_TASKS:
+        record_span("upstream", name, elapsed)
+    else:
+        record_span("redis", name.removesuffix("_media"), elapsed)
+
+
 async def timed_task(
     name: str, coro: Any, timeout_seconds: float | None = None
 ) -> tuple[str, Any, float]:
@@ -1614,13 +1982,16 @@ async def timed_task(
         else:
             result = await coro
         elapsed = (time.perf_counter() - start) * 1000  # ms
+        _record_task_span(name, elapsed)
         return (name, result, elapsed)
     except TimeoutError:
         elapsed = (time.perf_counter() - start) * 1000
+        _record_task_span(name, elapsed)
         logger.warning(f"Task '{name}' timed out after {elapsed:.0f}ms (limit: {timeout_seconds}s)")
         return (name, None, elapsed)
     except Exception as e:
         elapsed = (time.perf_counter() - start) * 1000
+        _record_task_span(name, elapsed)
         return (name, e, elapsed)
 
 
@@ -1648,6 +2019,8 @@ async def search(
     raw: bool = False,
     no_duplicate: bool = False,
     full: bool = False,
+    media_ranking: str = "python",
+    fields: list[str] | None = None,
 ) -> dict[str, Any]:
     """
     Unified search API that returns categorized results.
@@ -1678,6 +2051,14 @@ async def search(
                      Options: "popularity" (default), "audience_score", "critics_score".
                      Sorts in descending order (highest first).
         media_sort: Sort order for indexed media results.
+        media_ranking: "python" (default) fetches a wide popularity-sorted candidate
+                       set and ranks it with score_media_result.  "redis" ranks the
+                       exact-match tiers server-side with FT.AGGREGATE and fetches only
+                       ``limit * 2`` documents, which are then re-ranked in Python.
+        fields: Optional field projection for indexed sources.  Each per-source
+                query returns only these fields plus mc_id, mc_type and the
+                ranking inputs; results are trimmed to these fields plus mc_id
+                and mc_type.  Brokered sources are unaffected.
 
     Returns:
         dict with keys for each requested source, each containing list of MCBaseItem-compliant results
@@ -1751,7 +2132,11 @@ async def search(
             raw=raw,
         )
     elif query_text is not None:
-        media_query = build_media_query_from_user_input(query_text, raw=raw)
+        media_query = (
+            build_media_query_from_user_input(query_text, raw=True)
+            if raw
+            else compile_query_plan(query_text).media
+        )
     else:
         media_query = "*"
 
@@ -1764,10 +2149,11 @@ async def search(
             authors_query = raw_query
             books_query = raw_query
         else:
-            people_query = build_people_autocomplete_query(query_text)
-            podcasts_query = build_podcasts_autocomplete_query(query_text)
-            authors_query = build_authors_autocomplete_query(query_text)
-            books_query = build_books_autocomplete_query(query_text)
+            plan = compile_query_plan(query_text)
+            people_query = plan.people
+            podcasts_query = plan.podcasts
+            authors_query = plan.authors
+            books_query = plan.books
     else:
         # Filter-only mode: use match-all for indices without specific filters
         people_query = "*"
@@ -1777,6 +2163,7 @@ async def search(
 
     # Create empty result placeholder for indexed searches
     empty_result = type("obj", (object,), {"docs": []})()
+    parse_indexed = _parse_search_projected_doc if fields else parse_doc
 
     # Build task list based on requested sources (wrapped with timing)
     # External API timeout - YouTube/Spotify/RT are single-call APIs (~1-2s)
@@ -1792,37 +2179,29 @@ async def search(
     # full=True bumps to 250 so low-popularity exact matches aren't missed.
     _base = 250 if full else max(limit * 5, 50)
     media_fetch_limit = _base if has_query else limit * 2
-    if "tv" in requested_sources:
-        timed_tasks.append(
-            timed_task(
-                "tv_media",
-                repo.search(
-                    _build_media_source_query(media_query, "tv"),
-                    limit=media_fetch_limit,
-                    sort_by=media_sort,
-                ),
-            )
-        )
-    if "movie" in requested_sources:
-        timed_tasks.append(
-            timed_task(
-                "movie_media",
-                repo.search(
-                    _build_media_source_query(media_query, "movie"),
-                    limit=media_fetch_limit,
-                    sort_by=media_sort,
-                ),
-            )
-        )
-    if "person" in requested_sources:
-        # Fetch more results for post-query filtering (handles 1-char prefix case)
-        timed_tasks.append(timed_task("person", repo.search_people(people_query, limit=limit * 2)))
-    if "podcast" in requested_sources:
-        timed_tasks.append(timed_task("podcast", repo.search_podcasts(podcasts_query, limit=limit)))
-    if "author" in requested_sources:
-        timed_tasks.append(timed_task("author", repo.search_authors(authors_query, limit=limit)))
-    if "book" in requested_sources:
-        timed_tasks.append(timed_task("book", repo.search_books(books_query, limit=limit)))
+    # media_ranking="redis": the exact, word and substring tiers of
+    # score_media_result are sorted inside Redis over every match, so better
+    # matches can't be pushed out and a short head suffices.
+    media_rank_expr: str | None = None
+    if media_ranking == "redis" and query_text is not None and media_sort == "popularity":
+        media_rank_expr = build_media_tier_expression(query_text)
+        media_fetch_limit = limit * 2
+    # All indexed sources share one pipelined FT.SEARCH round trip
+    specs = _indexed_search_specs(
+        requested_sources,
+        media_query=media_query,
+        people_query=people_query,
+        podcasts_query=podcasts_query,
+        authors_query=authors_query,
+        books_query=books_query,
+        limit=limit,
+        media_limit=media_fetch_limit,
+        media_sort=media_sort,
+        media_rank_expr=media_rank_expr,
+        fields=fields,
+    )
+    if specs:
+        timed_tasks.append(timed_task("indexed", repo.search_many(specs)))
 
     # Brokered sources (Redis-cached API calls) - apply timeout
     # Ratings can be enriched from indexed results when no query is provided
@@ -1885,7 +2264,11 @@ async def search(
     results_map: dict[str, Any] = {}
     timing_map: dict[str, float] = {}
     for item in timed_results:
-        if isinstance(item, tuple) and len(item) == 3:
+        if isinstance(item, tuple) and len(item) == 3 and item[0] == "indexed":
+            for name, result, elapsed in _unpack_indexed_batch(item):
+                results_map[name] = result
+                timing_map[name] = elapsed
+        elif isinstance(item, tuple) and len(item) == 3:
             name, result, elapsed = item
             results_map[name] = result
             timing_map[name] = elapsed
@@ -1895,7 +2278,7 @@ async def search(
     # Sort by slowest first to highlight bottlenecks
     timing_parts = [f"{k}={v:.0f}ms" for k, v in sorted(timing_map.items(), key=lambda x: -x[1])]
     query_desc = f"'{q}'" if q else "[filters only]"
-    logger.info(
+    logger.debug(
         f"Search {query_desc} latency: total={total_elapsed:.0f}ms | {' | '.join(timing_parts)}"
     )
 
@@ -1912,6 +2295,8 @@ async def search(
             tv_media_res,
             q,
             preserve_redis_order=media_sort != "popularity",
+            parse=parse_indexed,
+            source="tv",
         )
         full_results["tv"] = tv_full
         final_results["tv"] = tv_full[:limit]
@@ -1923,6 +2308,8 @@ async def search(
             movie_media_res,
             q,
             preserve_redis_order=media_sort != "popularity",
+            parse=parse_indexed,
+            source="movie",
         )
         full_results["movie"] = movie_full
         final_results["movie"] = movie_full[:limit]
@@ -1932,17 +2319,19 @@ async def search(
         person_res = results_map["person"]
         if isinstance(person_res, BaseException):
             person_res = empty_result
-        parsed_people = [parse_doc(doc) for doc in _extract_docs(person_res)]
+        with span("parse", "person"):
+            parsed_people = [parse_indexed(doc) for doc in _extract_docs(person_res)]
 
         if has_query and q:
-            filtered_people = [
-                p
-                for p in parsed_people
-                if is_person_autocomplete_match(q, p.get("search_title", "") or p.get("name", ""))
-            ]
-            person_full = sorted(
-                filtered_people, key=lambda p: _rank_person_result(p, q)
-            )
+            with span("rank", "person"):
+                filtered_people = [
+                    p
+                    for p in parsed_people
+                    if is_person_autocomplete_match(
+                        q, p.get("search_title", "") or p.get("name", "")
+                    )
+                ]
+                person_full = sorted(filtered_people, key=lambda p: _rank_person_result(p, q))
         else:
             person_full = parsed_people
         full_results["person"] = person_full
@@ -1953,9 +2342,11 @@ async def search(
         podcast_res = results_map["podcast"]
         if isinstance(podcast_res, BaseException):
             podcast_res = empty_result
-        parsed_podcasts = [parse_doc(doc) for doc in _extract_docs(podcast_res)]
+        with span("parse", "podcast"):
+            parsed_podcasts = [parse_indexed(doc) for doc in _extract_docs(podcast_res)]
         if q:
-            parsed_podcasts = sorted(parsed_podcasts, key=lambda p: _rank_podcast_result(p, q))
+            with span("rank", "podcast"):
+                parsed_podcasts = sorted(parsed_podcasts, key=lambda p: _rank_podcast_result(p, q))
         full_results["podcast"] = parsed_podcasts
         final_results["podcast"] = parsed_podcasts[:limit]
 
@@ -1964,13 +2355,15 @@ async def search(
         author_res = results_map["author"]
         if isinstance(author_res, BaseException):
             author_res = empty_result
-        parsed_authors = [parse_doc(doc) for doc in _extract_docs(author_res)]
+        with span("parse", "author"):
+            parsed_authors = [parse_indexed(doc) for doc in _extract_docs(author_res)]
         if has_query and q:
-            parsed_authors = [
-                a
-                for a in parsed_authors
-                if is_author_name_match(q, a.get("search_title", "") or a.get("name", ""))
-            ]
+            with span("rank", "author"):
+                parsed_authors = [
+                    a
+                    for a in parsed_authors
+                    if is_author_name_match(q, a.get("search_title", "") or a.get("name", ""))
+                ]
         full_results["author"] = parsed_authors
         final_results["author"] = parsed_authors[:limit]
 
@@ -1979,9 +2372,11 @@ async def search(
         book_res = results_map["book"]
         if isinstance(book_res, BaseException):
             book_res = empty_result
-        parsed_books = [parse_doc(doc) for doc in _extract_docs(book_res)]
+        with span("parse", "book"):
+            parsed_books = [parse_indexed(doc) for doc in _extract_docs(book_res)]
         if q:
-            parsed_books = sorted(parsed_books, key=lambda b: _rank_book_result(b, q))
+            with span("rank", "book"):
+                parsed_books = sorted(parsed_books, key=lambda b: _rank_book_result(b, q))
         full_results["book"] = parsed_books
         final_results["book"] = parsed_books[:limit]
 
@@ -2192,10 +2587,20 @@ async def search(
     final_results["exact_matches"] = _collect_exact_matches(full_results, q_for_exact, hero=exact)
     if no_duplicate and exact is not None:
         _remove_exact_from_results(final_results, exact)
+    if fields:
+        _trim_search_results(final_results, fields)
 
     return final_results
 
 
+async def _search_one(repo: RedisRepository, spec: SearchSpec) -> Any:
+    """Run a single spec through ``search_many``, raising its error like ``repo.search``."""
+    result = (await repo.search_many([spec]))[spec.key]
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 async def search_stream(
     q: str | None,
     sources: set[str] | None = None,
@@ -2220,6 +2625,7 @@ async def search_stream(
     raw: bool = False,
     no_duplicate: bool = False,
     full: bool = False,
+    fields: list[str] | None = None,
 ) -> AsyncIterator[StreamEvent]:
     """
     Streaming search that yields categorized results as each source completes.
@@ -2293,7 +2699,11 @@ async def search_stream(
             raw=raw,
         )
     elif query_text is not None:
-        media_query = build_media_query_from_user_input(query_text, raw=raw)
+        media_query = (
+            build_media_query_from_user_input(query_text, raw=True)
+            if raw
+            else compile_query_plan(query_text).media
+        )
     else:
         media_query = "*"
 
@@ -2305,10 +2715,11 @@ async def search_stream(
             authors_query = raw_query
             books_query = raw_query
         else:
-            people_query = build_people_autocomplete_query(query_text)
-            podcasts_query = build_podcasts_autocomplete_query(query_text)
-            authors_query = build_authors_autocomplete_query(query_text)
-            books_query = build_books_autocomplete_query(query_text)
+            plan = compile_query_plan(query_text)
+            people_query = plan.people
+            podcasts_query = plan.podcasts
+            authors_query = plan.authors
+            books_query = plan.books
     else:
         people_query = "*"
         podcasts_query = "*"
@@ -2326,54 +2737,72 @@ async def search_stream(
     # aren't pushed out by popularity-sorted keyword/cast/genre matches.
     _stream_base = 250 if full else max(limit * 5, 50)
     media_fetch_limit = _stream_base if has_query else limit * 2
-    if "tv" in requested_sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task(
-                    "tv_media",
-                    repo.search(
-                        _build_media_source_query(media_query, "tv"),
-                        limit=media_fetch_limit,
-                        sort_by=media_sort,
-                    ),
+    if fields:
+        # Projected: same specs as search(), each run as its own task so
+        # sources still stream independently.
+        for spec in _indexed_search_specs(
+            requested_sources,
+            media_query=media_query,
+            people_query=people_query,
+            podcasts_query=podcasts_query,
+            authors_query=authors_query,
+            books_query=books_query,
+            limit=limit,
+            media_limit=media_fetch_limit,
+            media_sort=media_sort,
+            fields=fields,
+        ):
+            task = asyncio.create_task(timed_task(spec.key, _search_one(repo, spec)))
+            tasks_dict[task] = spec.key
+    else:
+        if "tv" in requested_sources:
+            tasks_dict[
+                asyncio.create_task(
+                    timed_task(
+                        "tv_media",
+                        repo.search(
+                            _build_media_source_query(media_query, "tv"),
+                            limit=media_fetch_limit,
+                            sort_by=media_sort,
+                        ),
+                    )
                 )
-            )
-        ] = "tv_media"
-    if "movie" in requested_sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task(
-                    "movie_media",
-                    repo.search(
-                        _build_media_source_query(media_query, "movie"),
-                        limit=media_fetch_limit,
-                        sort_by=media_sort,
-                    ),
+            ] = "tv_media"
+        if "movie" in requested_sources:
+            tasks_dict[
+                asyncio.create_task(
+                    timed_task(
+                        "movie_media",
+                        repo.search(
+                            _build_media_source_query(media_query, "movie"),
+                            limit=media_fetch_limit,
+                            sort_by=media_sort,
+                        ),
+                    )
                 )
-            )
-        ] = "movie_media"
-    if "person" in requested_sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("person", repo.search_people(people_query, limit=limit * 2))
-            )
-        ] = "person"
-    if "podcast" in requested_sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("podcast", repo.search_podcasts(podcasts_query, limit=limit))
-            )
-        ] = "podcast"
-    if "author" in requested_sources:
-        tasks_dict[
-            asyncio.create_task(
-                timed_task("author", repo.search_authors(authors_query, limit=limit))
-            )
-        ] = "author"
-    if "book" in requested_sources:
-        tasks_dict[
-            asyncio.create_task(timed_task("book", repo.search_books(books_query, limit=limit)))
-        ] = "book"
+            ] = "movie_media"
+        if "person" in requested_sources:
+            tasks_dict[
+                asyncio.create_task(
+                    timed_task("person", repo.search_people(people_query, limit=limit * 2))
+                )
+            ] = "person"
+        if "podcast" in requested_sources:
+            tasks_dict[
+                asyncio.create_task(
+                    timed_task("podcast", repo.search_podcasts(podcasts_query, limit=limit))
+                )
+            ] = "podcast"
+        if "author" in requested_sources:
+            tasks_dict[
+                asyncio.create_task(
+                    timed_task("author", repo.search_authors(authors_query, limit=limit))
+                )
+            ] = "author"
+        if "book" in requested_sources:
+            tasks_dict[
+                asyncio.create_task(timed_task("book", repo.search_books(books_query, limit=limit)))
+            ] = "book"
 
     # Brokered sources - apply timeout
     if query_text is not None and not raw:
@@ -2431,6 +2860,12 @@ async def search_stream(
     if not tasks_dict:
         return
 
+    parse_indexed = _parse_search_projected_doc if fields else parse_doc
+    keep = set(fields) | _SEARCH_ALWAYS_FIELDS if fields else None
+
+    def project(item: dict[str, Any]) -> dict[str, Any]:
+        return _trim_search_item(item, keep) if keep is not None else item
+
     total_start = time.perf_counter()
     timing_parts: list[str] = []
     streamed_results: dict[str, list[dict[str, Any]]] = {}
@@ -2452,6 +2887,8 @@ async def search_stream(
                         data,
                         q,
                         preserve_redis_order=media_sort != "popularity",
+                        parse=parse_indexed,
+                        source=source_name,
                     )
                     streamed_full[source_name] = media_parsed_full
                     media_results = media_parsed_full[:limit]
@@ -2460,14 +2897,14 @@ async def search_stream(
                     if no_duplicate and media_exact:
                         media_results = _filter_exact_items(media_results, media_exact)
                     if media_results:
-                        yield (source_name, media_results, elapsed)
+                        yield (source_name, [project(item) for item in media_results], elapsed)
                     for item in media_exact:
-                        yield ("exact_match", item)
+                        yield ("exact_match", project(item))
                 continue
 
             elif name == "person":
                 if data and not isinstance(data, BaseException) and hasattr(data, "docs"):
-                    parsed_all = [parse_doc(doc) for doc in data.docs]
+                    parsed_all = [parse_indexed(doc) for doc in data.docs]
                     if has_query and q:
                         filtered = [
                             p
@@ -2486,7 +2923,7 @@ async def search_stream(
 
             elif name == "podcast":
                 if data and not isinstance(data, BaseException) and hasattr(data, "docs"):
-                    parsed_all = [parse_doc(doc) for doc in data.docs]
+                    parsed_all = [parse_indexed(doc) for doc in data.docs]
                     if q:
                         podcast_full = sorted(
                             parsed_all, key=lambda p: _rank_podcast_result(p, q)
@@ -2500,7 +2937,7 @@ async def search_stream(
 
             elif name == "author":
                 if data and not isinstance(data, BaseException) and hasattr(data, "docs"):
-                    parsed_all = [parse_doc(doc) for doc in data.docs]
+                    parsed_all = [parse_indexed(doc) for doc in data.docs]
                     if has_query and q:
                         author_full = [
                             a
@@ -2518,7 +2955,7 @@ async def search_stream(
 
             elif name == "book":
                 if data and not isinstance(data, BaseException) and hasattr(data, "docs"):
-                    parsed_all = [parse_doc(doc) for doc in data.docs]
+                    parsed_all = [parse_indexed(doc) for doc in data.docs]
                     if q:
                         book_full = sorted(
                             parsed_all, key=lambda b: _rank_book_result(b, q)
@@ -2576,9 +3013,11 @@ async def search_stream(
                 if no_duplicate and exact_items:
                     parsed_results = _filter_exact_items(parsed_results, exact_items)
                 if parsed_results:
+                    if name in MINIMAL_AUTOCOMPLETE_SOURCES:
+                        parsed_results = [project(item) for item in parsed_results]
                     yield (name, parsed_results, elapsed)
                 for item in exact_items:
-                    yield ("exact_match", item)
+                    yield ("exact_match", project(item))
 
         except Exception as e:
             logger.warning(f"Error processing streaming search result: {e}")
@@ -2588,12 +3027,12 @@ async def search_stream(
     q_for_exact = q if has_query else None
     final_exact = _pick_exact_match(streamed_full, q_for_exact)
     if final_exact is not None:
-        yield ("exact_match_final", final_exact)
+        yield ("exact_match_final", project(final_exact))
     all_exact = _collect_exact_matches(streamed_full, q_for_exact, hero=final_exact)
     if all_exact:
-        yield ("exact_matches_final", all_exact)
+        yield ("exact_matches_final", [project(item) for item in all_exact])
     query_desc = f"'{q}'" if q else "[filters only]"
-    logger.info(
+    logger.debug(
         f"Search stream {query_desc} latency: total={total_elapsed:.0f}ms | "
         f"{' | '.join(timing_parts)}"
     )
@@ -2745,14 +3184,13 @@ async def get_details(request: DetailsRequest) -> dict[str, Any]:
     else:
         key_prefix = "media:"
 
-    # Try to get from Redis index first
+    # Try to get from Redis index first (bulk rebuilds move docs to a new prefix)
+    key_prefix = await resolve_key_prefix(redis, key_prefix)
     key = f"{key_prefix}{request.mc_id}"
     index_data: dict | None = None
 
     try:
-        raw_data = await redis.json().get(key)  # type: ignore[misc]
-        if isinstance(raw_data, dict):
-            index_data = raw_data
+        index_data = await get_repo().get_document(key)
     except Exception as e:
         logger.warning(f"Error fetching from Redis: {e}")
 
@@ -2905,12 +3343,13 @@ async def get_details_batch(
 ) -> list[dict[str, Any] | None]:
     """Fetch multiple detail documents in a single Redis round-trip.
 
-    Uses JSON.MGET for the index lookup.  Items that require upstream
+    Uses JSON.MGET for the index lookup (documents held by the near cache
+    need no round trip at all).  Items that require upstream
     enrichment (force=True, or media types that always enrich) fall back
     to individual ``get_details`` calls via asyncio.gather.
     """
     redis = get_redis()
-    prefix = _key_prefix_for(mc_type, mc_subtype)
+    prefix = await resolve_key_prefix(redis, _key_prefix_for(mc_type, mc_subtype))
     keys = [f"{prefix}{mid}" for mid in mc_ids]
 
     mt_lower = mc_type.lower()
@@ -2932,7 +3371,7 @@ async def get_details_batch(
 
     # Index-only fast path: single MGET
     try:
-        raw_docs: list[object] = await redis.json().mget(keys, "$")  # type: ignore[misc]
+        raw_docs = await get_repo().get_documents(keys)
     except Exception as e:
         logger.warning("JSON.MGET failed, falling back to individual lookups: %s", e)
         requests = [
@@ -2944,20 +3383,14 @@ async def get_details_batch(
 
     out: list[dict[str, Any] | None] = []
     for mid, raw in zip(mc_ids, raw_docs, strict=True):
-        doc: dict[str, Any] | None = None
-        if isinstance(raw, list) and raw and isinstance(raw[0], dict):
-            doc = raw[0]
-        elif isinstance(raw, dict):
-            doc = raw
-
-        if doc is None:
+        if raw is None:
             out.append(None)
             continue
 
         sid_parts = mid.rsplit("_", maxsplit=1)
         sid = sid_parts[1] if len(sid_parts) == 2 else None
 
-        result: dict[str, Any] = {**doc, "id": mid, "mc_type": mt_lower}
+        result: dict[str, Any] = {**raw, "id": mid, "mc_type": mt_lower}
         if sid is not None:
             try:
                 result["tmdb_id"] = int(sid)
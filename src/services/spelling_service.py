@@ -0,0 +1,125 @@
+"""
+Spelling Service - Local query correction for resolve's last-chance fallback.
+
+The vocabulary (term -> document frequency over indexed titles and names)
+is built by ``etl.spelling_dictionary_etl`` and stored in Redis as one
+compressed JSON blob plus a version key.  Each process loads it into a
+``core.spelling.SpellingDictionary`` and checks the version at most every
+``SPELLING_REFRESH_SECONDS``; a new version is rebuilt in a worker thread
+while the previous dictionary keeps answering.  Until the first build
+finishes ``get_spelling_correction`` returns None.
+
+Usage:
+    from services.spelling_service import get_spelling_correction
+
+    suggestion = await get_spelling_correction("braeking bda")  # "breaking bad"
+
+Tuning (environment variables):
+    SPELLING_REFRESH_SECONDS   Seconds between version checks (default: 60)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import os
+import time
+import zlib
+from typing import Any
+
+from adapters.redis_client import get_redis
+from core.spelling import SpellingDictionary
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+SPELLING_TERMS_KEY = "search:spelling:terms"
+SPELLING_VERSION_KEY = "search:spelling:version"
+SPELLING_REFRESH_SECONDS = float(os.getenv("SPELLING_REFRESH_SECONDS", "60"))
+
+
+def encode_spelling_terms(counts: dict[str, int]) -> str:
+    # base64 so the blob survives clients created with decode_responses=True
+    raw = json.dumps(counts, separators=(",", ":")).encode("utf-8")
+    return base64.b64encode(zlib.compress(raw)).decode("ascii")
+
+
+def decode_spelling_terms(blob: bytes | str) -> dict[str, int]:
+    counts: dict[str, int] = json.loads(zlib.decompress(base64.b64decode(blob)))
+    return counts
+
+
+async def save_spelling_terms(redis: Any, counts: dict[str, int], version: str) -> None:
+    """Store a new vocabulary; processes pick it up on their next version check."""
+    pipe = redis.pipeline()
+    pipe.set(SPELLING_TERMS_KEY, encode_spelling_terms(counts))
+    pipe.set(SPELLING_VERSION_KEY, version)
+    await pipe.execute()
+
+
+class _SpellingState:
+    def __init__(self) -> None:
+        self.dictionary: SpellingDictionary | None = None
+        self.version: str | None = None
+        self.checked_at = float("-inf")
+        self.loading: asyncio.Task[None] | None = None
+
+
+_state = _SpellingState()
+
+
+async def _load(redis: Any, version: str) -> None:
+    blob = await redis.get(SPELLING_TERMS_KEY)
+    if not blob:
+        return
+    start = time.perf_counter()
+    dictionary = await asyncio.to_thread(lambda: SpellingDictionary(decode_spelling_terms(blob)))
+    _state.dictionary = dictionary
+    _state.version = version
+    logger.info(
+        f"Loaded spelling dictionary v{version}: {len(dictionary):,} terms "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+async def _current_dictionary() -> SpellingDictionary | None:
+    now = time.monotonic()
+    if now - _state.checked_at < SPELLING_REFRESH_SECONDS:
+        return _state.dictionary
+    _state.checked_at = now
+    if _state.loading is not None and not _state.loading.done():
+        return _state.dictionary
+
+    redis = get_redis()
+    try:
+        version = await redis.get(SPELLING_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Spelling dictionary version check failed: {e}")
+        return _state.dictionary
+    if isinstance(version, bytes):
+        version = version.decode()
+    if version and version != _state.version:
+        _state.loading = asyncio.create_task(_load(redis, version))
+        _state.loading.add_done_callback(_log_load_failure)
+    return _state.dictionary
+
+
+def _log_load_failure(task: asyncio.Task[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Spelling dictionary load failed: {task.exception()}")
+
+
+async def get_spelling_correction(query: str) -> str | None:
+    """Return a corrected form of ``query`` from the local dictionary, or None."""
+    dictionary = await _current_dictionary()
+    if dictionary is None:
+        return None
+    correction: str | None = dictionary.correct(query)
+    return correction
+
+
+def reset_spelling_state() -> None:
+    """Forget the loaded dictionary (tests)."""
+    global _state
+    _state = _SpellingState()
@@ -0,0 +1,132 @@
+"""
+Unit tests for the autocomplete response cache.
+
+The index generation is supplied by a plain coroutine, so no Redis is required.
+"""
+
+from typing import Any
+
+import pytest
+
+from services.autocomplete_cache import AutocompleteCache, normalize_autocomplete_query
+
+
+class _Backend:
+    """Counts computations and serves a mutable index generation."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.generation = 1
+
+    async def compute(self) -> dict[str, Any]:
+        self.calls += 1
+        return {"movie": [{"title": f"result {self.calls}"}], "exact_match": None}
+
+    async def fetch_generation(self) -> int:
+        return self.generation
+
+
+async def _lookup(
+    cache: AutocompleteCache,
+    backend: _Backend,
+    q: str,
+    sources: set[str] | None = None,
+    flags: tuple[bool, bool, bool] = (False, False, False),
+) -> dict[str, Any]:
+    return await cache.get_or_compute(
+        q, sources or {"movie", "tv"}, flags, backend.compute, backend.fetch_generation
+    )
+
+
+def test_normalize_query_collapses_case_and_whitespace() -> None:
+    assert normalize_autocomplete_query("Harry  P") == "harry p"
+    assert normalize_autocomplete_query(" Star\tWars ") == "star wars"
+    assert normalize_autocomplete_query(" @title:(foo) ", raw=True) == "@title:(foo)"
+
+
+def test_normalize_query_keeps_punctuation_and_non_ascii() -> None:
+    assert normalize_autocomplete_query("spider-man") != normalize_autocomplete_query("spider man")
+    assert normalize_autocomplete_query("Schindler's") != normalize_autocomplete_query("schindlers")
+    assert normalize_autocomplete_query("Amélie") != normalize_autocomplete_query("am lie")
+    assert normalize_autocomplete_query("東京物語") == "東京物語"
+    assert normalize_autocomplete_query("Борат") == "борат"
+
+
+@pytest.mark.asyncio
+async def test_equivalent_queries_share_an_entry() -> None:
+    cache, backend = AutocompleteCache(generation_check_seconds=0), _Backend()
+
+    first = await _lookup(cache, backend, "Star  Wars", {"tv", "movie"})
+    second = await _lookup(cache, backend, "star wars", {"movie", "tv"})
+
+    assert backend.calls == 1
+    assert first == second
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_distinct_queries_do_not_collide() -> None:
+    cache, backend = AutocompleteCache(generation_check_seconds=0), _Backend()
+    queries = ["東京物語", "鬼滅の刃", "Борат", "Amélie", "am lie", "spider-man", "spider man"]
+
+    results = [await _lookup(cache, backend, q) for q in queries]
+
+    assert backend.calls == len(queries)
+    assert len({r["movie"][0]["title"] for r in results}) == len(queries)
+    assert cache.stats()["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_key_is_not_cached() -> None:
+    cache, backend = AutocompleteCache(generation_check_seconds=0), _Backend()
+
+    await _lookup(cache, backend, "   ")
+    await _lookup(cache, backend, "   ")
+
+    assert backend.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sources_and_flags_are_part_of_the_key() -> None:
+    cache, backend = AutocompleteCache(generation_check_seconds=0), _Backend()
+
+    await _lookup(cache, backend, "star", {"movie"})
+    await _lookup(cache, backend, "star", {"tv"})
+    await _lookup(cache, backend, "star", {"movie"}, (False, True, False))
+
+    assert backend.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_generation_bump_invalidates() -> None:
+    cache, backend = AutocompleteCache(generation_check_seconds=0), _Backend()
+    await _lookup(cache, backend, "the")
+
+    backend.generation = 2
+    result = await _lookup(cache, backend, "the")
+
+    assert backend.calls == 2
+    assert result["movie"][0]["title"] == "result 2"
+    stats = cache.stats()
+    assert stats["index_generation"] == 2
+    assert stats["invalidations"] == 1
+    assert stats["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_disabled_cache() -> None:
+    cache, backend = AutocompleteCache(max_entries=2, generation_check_seconds=0), _Backend()
+    for q in ("aa", "bb", "cc"):
+        await _lookup(cache, backend, q)
+    await _lookup(cache, backend, "aa")
+
+    assert cache.stats()["evictions"] >= 1
+    assert backend.calls == 4
+
+    disabled, backend = AutocompleteCache(max_entries=0), _Backend()
+    await _lookup(disabled, backend, "aa")
+    await _lookup(disabled, backend, "aa")
+    assert backend.calls == 2
+    assert disabled.stats()["enabled"] is False
@@ -0,0 +1,38 @@
+"""
+Unit tests for the compiled per-source query plan cache.
+"""
+
+import pytest
+
+from core.search_queries import build_autocomplete_query, build_books_autocomplete_query
+from services.search_service import (
+    _compile_query_plan,
+    build_authors_autocomplete_query,
+    build_people_autocomplete_query,
+    build_podcasts_autocomplete_query,
+    compile_query_plan,
+    get_query_plan_cache_stats,
+)
+
+
+@pytest.mark.parametrize("q", ["The Office", "it's", "Predator:Badlands", "NY Jets", "ai", "a"])
+def test_plan_matches_individual_builders(q: str) -> None:
+    plan = compile_query_plan(q)
+
+    assert plan.media == build_autocomplete_query(q)
+    assert plan.people == build_people_autocomplete_query(q)
+    assert plan.podcasts == build_podcasts_autocomplete_query(q)
+    assert plan.authors == build_authors_autocomplete_query(q)
+    assert plan.books == build_books_autocomplete_query(q)
+
+
+def test_case_and_whitespace_variants_share_one_entry() -> None:
+    _compile_query_plan.cache_clear()
+
+    first = compile_query_plan("Star  Wars")
+    second = compile_query_plan(" star wars ")
+
+    assert first is second
+    stats = get_query_plan_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,196 @@
+"""
+Unit tests for projected-field search (``search(fields=...)``).
+
+A fake repository returns FT.SEARCH-style projected documents, so no Redis
+server is required.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from redis.commands.search.document import Document
+
+from adapters.redis_repository import SearchSpec, _parse_ranked_rows
+from services import search_service
+from services.search_service import (
+    _parse_search_projected_doc,
+    _search_projection,
+    parse_doc,
+    search,
+)
+
+
+def _projected(key: str, **fields: Any) -> Document:
+    """Document as FT.SEARCH RETURN yields it: bare strings, JSON for everything else."""
+    encoded = {
+        name: value if isinstance(value, str) else json.dumps(value)
+        for name, value in fields.items()
+    }
+    return Document(key, **encoded)
+
+
+class _FakeRepo:
+    def __init__(self, docs: dict[str, list[Document]]) -> None:
+        self.docs = docs
+        self.specs: list[SearchSpec] = []
+
+    async def search_many(self, specs: list[SearchSpec]) -> dict[str, Any]:
+        self.specs.extend(specs)
+        return {spec.key: SimpleNamespace(docs=self.docs.get(spec.key, [])) for spec in specs}
+
+
+def test_projection_always_includes_identity_and_ranking_inputs() -> None:
+    movie = _search_projection("movie", ["poster_path"])
+    author = _search_projection("author", ["image"])
+
+    assert {"mc_id", "mc_type", "poster_path", "search_title", "cast_names"} <= set(movie)
+    assert "watch_providers" in movie
+    assert set(author) == {"image", "mc_id", "mc_type", "name", "search_title"}
+
+
+def test_projected_doc_matches_parse_doc_semantics() -> None:
+    doc = _projected(
+        "media:tmdb_movie_1",
+        mc_id="tmdb_movie_530915",
+        title="1917",
+        search_title="1917",
+        year=2019,
+        genres=["War"],
+    )
+    person = _projected("idx:person_1", mc_id="person_17419", mc_type="person")
+
+    parsed = _parse_search_projected_doc(doc)
+    parsed_person = _parse_search_projected_doc(person)
+
+    assert parsed["search_title"] == "1917"
+    assert parsed["year"] == 2019
+    assert parsed["genres"] == ["War"]
+    assert parsed["id"] == "tmdb_movie_530915"
+    assert parsed_person["id"] == "tmdb_person_17419"
+    assert parsed_person["source_id"] == "17419"
+
+
+def test_full_documents_never_carry_the_microgenre_vector() -> None:
+    stored = {"mc_id": "tmdb_movie_603", "title": "The Matrix", "microgenre_vector": [0.6, 0.8]}
+
+    parsed = parse_doc(Document("media:tmdb_movie_603", json=json.dumps(stored)))
+
+    assert parsed["title"] == "The Matrix"
+    assert "microgenre_vector" not in parsed
+
+
+def test_ranked_spec_loads_tier_inputs_and_sorts_by_year_within_a_tier() -> None:
+    spec = SearchSpec(
+        key="movie_media",
+        source="movie",
+        query_str="@mc_type:{movie}",
+        rank_expr="0",
+        rank_fields=("search_title",),
+        rank_json_fields=("cast_names",),
+        rank_sort_by=("year",),
+    )
+
+    args = spec.to_aggregate_args("idx:media")
+
+    assert args[2:9] == [
+        "LOAD",
+        4,
+        "@search_title",
+        "$.cast_names",
+        "AS",
+        "cast_names_json",
+        "APPLY",
+    ]
+    sort_at = args.index("SORTBY")
+    assert args[sort_at : sort_at + 10] == [
+        "SORTBY",
+        6,
+        "@rank",
+        "ASC",
+        "@year",
+        "DESC",
+        "@popularity",
+        "DESC",
+        "MAX",
+        10,
+    ]
+
+
+def test_ranked_spec_loads_only_projected_fields() -> None:
+    spec = SearchSpec(
+        key="movie_media",
+        source="movie",
+        query_str="@mc_type:{movie}",
+        fields=("mc_id", "search_title", "year"),
+        rank_expr="0",
+        rank_fields=("search_title",),
+    )
+
+    args = spec.to_aggregate_args("idx:media")
+    load_at = len(args) - 1 - args[::-1].index("LOAD")
+
+    assert args[load_at : load_at + 8] == [
+        "LOAD",
+        7,
+        "@__key",
+        "$.mc_id",
+        "AS",
+        "mc_id",
+        "$.year",
+        "AS",
+    ]
+    assert "$" not in args
+
+    rows = _parse_ranked_rows(
+        [1, ["__key", "k1", "search_title", "Up", "rank", "0", "mc_id", "m1", "year", "2009"]],
+        spec.fields,
+    )
+    assert rows.docs[0].__dict__ == {
+        "id": "k1",
+        "payload": None,
+        "mc_id": "m1",
+        "search_title": "Up",
+        "year": "2009",
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_on_projected_inputs_and_trims_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    media = [
+        _projected(
+            "media:1",
+            mc_id="tmdb_movie_1",
+            mc_type="movie",
+            title="Alien Nation",
+            search_title="alien nation",
+            popularity=500.0,
+            poster_path="/a.jpg",
+        ),
+        _projected(
+            "media:2",
+            mc_id="tmdb_movie_2",
+            mc_type="movie",
+            title="Alien",
+            search_title="alien",
+            popularity=50.0,
+            poster_path="/b.jpg",
+            watch_providers={"streaming_platform_ids": [8]},
+        ),
+    ]
+    repo = _FakeRepo({"movie_media": media})
+    monkeypatch.setattr(search_service, "_repo", repo)
+
+    results = await search("alien", sources={"movie"}, fields=["poster_path"])
+
+    assert all(spec.fields for spec in repo.specs)
+    assert [item["mc_id"] for item in results["movie"]] == ["tmdb_movie_2", "tmdb_movie_1"]
+    assert results["movie"][0] == {
+        "mc_id": "tmdb_movie_2",
+        "mc_type": "movie",
+        "poster_path": "/b.jpg",
+    }
+    assert results["exact_match"] == results["movie"][0]
@@ -0,0 +1,180 @@
+"""
+Adaptive Pool - Sliding-window worker pool with AIMD concurrency control.
+
+Instead of ``asyncio.gather`` over fixed batches (where one slow item stalls
+the batch), ``adaptive_map`` keeps up to ``controller.limit`` calls in flight
+and starts the next item the moment any call finishes.  The limit follows
+TCP-style AIMD:
+
+- additive increase: +1 per ``limit`` healthy completions
+- multiplicative decrease: ``limit *= backoff`` when upstream returned 429s
+  (``utils.metrics.rate_limited_total`` moved) or smoothed latency rose past
+  ``latency_tolerance`` x its observed floor; at most once per window
+
+Usage:
+    from utils.adaptive_pool import AIMDController, adaptive_map
+
+    controller = AIMDController(initial=20, max_limit=64)
+    async for index, item, result in adaptive_map(ids, fetch_one, controller):
+        if isinstance(result, BaseException):
+            ...
+
+Tuning (environment):
+    ADAPTIVE_POOL_LATENCY_TOLERANCE   default 2.0
+    ADAPTIVE_POOL_BACKOFF             default 0.7
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Generic, TypeVar
+
+from utils.get_logger import get_logger
+from utils.metrics import rate_limited_total
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+LATENCY_TOLERANCE = float(os.getenv("ADAPTIVE_POOL_LATENCY_TOLERANCE", "2.0"))
+BACKOFF = float(os.getenv("ADAPTIVE_POOL_BACKOFF", "0.7"))
+
+_EWMA_ALPHA = 0.2
+_FLOOR_DRIFT = 1.01  # Let the latency floor creep up so a one-off fast call doesn't pin it
+
+
+class AIMDController:
+    """Concurrency limit driven by completion latency and upstream 429s."""
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = LATENCY_TOLERANCE,
+        backoff: float = BACKOFF,
+        throttle_signal: Callable[[], float] = rate_limited_total,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._throttle_signal = throttle_signal
+        self._throttle_seen = throttle_signal()
+        self._latency_ewma: float | None = None
+        self._latency_floor: float | None = None
+        self._cooldown = 0
+        self.decreases = 0
+        self.peak_limit = int(self._limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def latency_ewma(self) -> float:
+        return self._latency_ewma or 0.0
+
+    def on_complete(self, latency: float) -> None:
+        """Feed one completed call's latency (seconds) into the controller."""
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += _EWMA_ALPHA * (latency - self._latency_ewma)
+        if self._latency_floor is None or self._latency_ewma < self._latency_floor:
+            self._latency_floor = self._latency_ewma
+        else:
+            self._latency_floor *= _FLOOR_DRIFT
+
+        throttle_now = self._throttle_signal()
+        throttled = throttle_now > self._throttle_seen
+        self._throttle_seen = throttle_now
+        congested = self._latency_ewma > self._latency_floor * self.latency_tolerance
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+        if (throttled or congested) and self._cooldown == 0:
+            self._limit = max(float(self.min_limit), self._limit * self.backoff)
+            self._cooldown = self.limit
+            self.decreases += 1
+            logger.debug(
+                f"Adaptive pool: limit -> {self.limit} "
+                f"({'429s' if throttled else f'latency {self._latency_ewma:.2f}s'})"
+            )
+        elif not throttled and not congested:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+
+
+class _Timed(Generic[R]):
+    __slots__ = ("latency", "result")
+
+    def __init__(self, latency: float, result: R | BaseException) -> None:
+        self.latency = latency
+        self.result = result
+
+
+async def adaptive_map(
+    items: Iterable[T],
+    fn: Callable[[T], Awaitable[R]],
+    controller: AIMDController,
+    max_ahead: int | None = None,
+) -> AsyncIterator[tuple[int, T, R | BaseException]]:
+    """
+    Run ``fn`` over ``items`` with adaptive concurrency, yielding as calls finish.
+
+    Args:
+        items: Inputs, consumed lazily.
+        fn: Async call per item.  Exceptions are yielded, not raised.
+        controller: Decides how many calls may be in flight.
+        max_ahead: If set, never start item ``i`` while item ``i - max_ahead``
+            is unfinished, bounding how many out-of-order results a caller
+            that reassembles ordered batches has to hold.
+
+    Yields:
+        ``(index, item, result_or_exception)`` in completion order.
+    """
+    source = iter(enumerate(items))
+    pending: dict[asyncio.Task[_Timed[R]], tuple[int, T]] = {}
+    exhausted = False
+    submitted = 0
+
+    async def _call(item: T) -> _Timed[R]:
+        start = time.monotonic()
+        try:
+            result: R | BaseException = await fn(item)
+        except Exception as e:
+            result = e
+        return _Timed(time.monotonic() - start, result)
+
+    try:
+        while True:
+            while not exhausted and len(pending) < controller.limit:
+                if max_ahead is not None and pending:
+                    oldest = min(index for index, _ in pending.values())
+                    if submitted - oldest >= max_ahead:
+                        break
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                submitted += 1
+                pending[asyncio.ensure_future(_call(item))] = (index, item)
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: pending[t][0]):
+                index, item = pending.pop(task)
+                timed = task.result()
+                controller.on_complete(timed.latency)
+                yield index, item, timed.result
+    finally:
+        for task in pending:
+            task.cancel()
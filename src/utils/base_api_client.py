@@ -9,10 +9,13 @@ import os
 import random
 import sys
 from typing import Any, Protocol
+from urllib.parse import urlparse
 
 import aiohttp
 
 from utils.get_logger import get_logger
+from utils.http_session import get_http_session
+from utils.metrics import record_rate_limited
 from utils.rate_limiter import get_rate_limiter
 
 logger = get_logger(__name__)
@@ -212,7 +215,9 @@ class BaseAPIClient:
                     # Use real rate limiting AND concurrency control for production and integration tests
                     # Rate limiter: controls requests per time period (e.g., 5 per second)
                     # Semaphore: limits simultaneous in-flight requests (prevents bursts)
-                    rate_limiter = get_rate_limiter(rate_limit_max, rate_limit_period)
+                    rate_limiter = get_rate_limiter(
+                        rate_limit_max, rate_limit_period, api=urlparse(url).hostname
+                    )
                     concurrency_semaphore = self._get_concurrency_semaphore(
                         rate_limit_max, rate_limit_period
                     )
@@ -244,9 +249,10 @@ class BaseAPIClient:
                             # AsyncLimiter will queue requests - only rate_limit_max requests
                             # will proceed per rate_limit_period seconds
                             # This must happen INSIDE the retry loop so each retry attempt consumes a token
+                            # Shared keep-alive session per host (no per-request handshake)
+                            session = get_http_session(url)
                             async with (  # noqa: SIM117
                                 rate_limiter,
-                                aiohttp.ClientSession() as session,
                                 session.get(
                                     url,
                                     headers=headers,
@@ -260,6 +266,7 @@ class BaseAPIClient:
                                     # Rate limit hit - wait and retry without incrementing attempt
                                     # Note: We've already exited the rate_limiter context, so the next
                                     # retry will acquire a new token (which is correct for rate limiting)
+                                    record_rate_limited(urlparse(url).hostname or "")
                                     rate_limit_retries += 1
                                     if rate_limit_retries > max_rate_limit_retries:
                                         logger.error(
@@ -484,7 +491,9 @@ class BaseAPIClient:
                 rate_limiter: Any = NoOpRateLimiter()
                 concurrency_semaphore: Any = NoOpRateLimiter()
             else:
-                rate_limiter = get_rate_limiter(rate_limit_max, rate_limit_period)
+                rate_limiter = get_rate_limiter(
+                    rate_limit_max, rate_limit_period, api=urlparse(url).hostname
+                )
                 concurrency_semaphore = self._get_concurrency_semaphore(
                     rate_limit_max, rate_limit_period
                 )
@@ -496,10 +505,10 @@ class BaseAPIClient:
 
             while attempt < max_retries:
                 try:
+                    session = get_http_session(url)
                     async with (  # noqa: SIM117
                         concurrency_semaphore,
                         rate_limiter,
-                        aiohttp.ClientSession() as session,
                     ):
                         # Select the appropriate session method based on HTTP method
                         if method == "POST":
@@ -520,6 +529,7 @@ class BaseAPIClient:
 
                             if status == 429:
                                 # Rate limit hit - wait and retry
+                                record_rate_limited(urlparse(url).hostname or "")
                                 rate_limit_retries += 1
                                 if rate_limit_retries > max_rate_limit_retries:
                                     logger.error(
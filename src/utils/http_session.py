@@ -0,0 +1,149 @@
+"""
+HTTP Session Registry - Shared, long-lived aiohttp sessions per event loop per host.
+
+Opening a new ``aiohttp.ClientSession`` per request pays a fresh TCP + TLS
+handshake every time.  This registry keeps one keep-alive session per
+(event loop, scheme/host/port) so repeated calls to TMDB, YouTube, Spotify,
+etc. reuse pooled connections and cached DNS lookups.
+
+Sessions are scoped to event loops (like ``utils.rate_limiter``) so a session
+created on one loop is never used from another.  Call ``close_http_sessions()``
+before the loop shuts down (web app shutdown hooks, end of an ETL run); CLI
+entry points can use ``run_with_http_sessions(main())`` in place of
+``asyncio.run(main())`` to get this automatically.
+
+Usage:
+    from utils.http_session import get_http_session
+
+    session = get_http_session(url)
+    async with session.get(url, timeout=timeout) as response:
+        ...
+
+Tuning (environment variables):
+    HTTP_CONNECTOR_LIMIT           Total pooled connections per session (default: 100)
+    HTTP_CONNECTOR_LIMIT_PER_HOST  Connections per host, 0 = unlimited (default: 0)
+    HTTP_KEEPALIVE_TIMEOUT         Idle keep-alive seconds (default: 30)
+    HTTP_DNS_CACHE_TTL             DNS cache seconds (default: 300)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import aiohttp
+from yarl import URL
+
+from utils.get_logger import get_logger
+
+logger = get_logger(__name__)
+
+_CONNECTOR_LIMIT = int(os.getenv("HTTP_CONNECTOR_LIMIT", "100"))
+_CONNECTOR_LIMIT_PER_HOST = int(os.getenv("HTTP_CONNECTOR_LIMIT_PER_HOST", "0"))
+_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+
+T = TypeVar("T")
+
+# Module-level lock for thread safety
+_lock = threading.Lock()
+
+# Key: (loop_id, origin), Value: (weakref to owning loop, session)
+_sessions: dict[
+    tuple[int, str], tuple[weakref.ref[asyncio.AbstractEventLoop], aiohttp.ClientSession]
+] = {}
+
+
+def _origin(url: str) -> str:
+    """Return ``scheme://host:port`` for *url* (the registry's per-host key)."""
+    parsed = URL(url)
+    return f"{parsed.scheme}://{parsed.host}:{parsed.port}"
+
+
+def _new_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=_CONNECTOR_LIMIT,
+        limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=_DNS_CACHE_TTL,
+        use_dns_cache=True,
+    )
+    # DummyCookieJar keeps requests stateless, matching the old
+    # session-per-request behavior (no cookies leak between callers).
+    return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+
+def get_http_session(url: str) -> aiohttp.ClientSession:
+    """
+    Get or create the shared session for *url*'s host on the running event loop.
+
+    Must be called from inside a running event loop.  Closed sessions and
+    sessions whose loop has gone away are replaced transparently.
+
+    Args:
+        url: Request URL; only scheme, host and port are used for the key.
+
+    Returns:
+        A keep-alive ``aiohttp.ClientSession``.  Do not close it per request.
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop), _origin(url))
+
+    with _lock:
+        entry = _sessions.get(key)
+        if entry is not None:
+            owner_ref, session = entry
+            if owner_ref() is loop and not session.closed:
+                return session
+        session = _new_session()
+        _sessions[key] = (weakref.ref(loop), session)
+        logger.debug(f"Created shared HTTP session for {key[1]} on loop {key[0]}")
+        _prune_dead_loops()
+        return session
+
+
+def _prune_dead_loops() -> None:
+    """Drop registry entries whose event loop is gone or closed (caller holds _lock)."""
+    for key, (owner_ref, _session) in list(_sessions.items()):
+        owner = owner_ref()
+        if owner is None or owner.is_closed():
+            _sessions.pop(key, None)
+
+
+async def close_http_sessions() -> None:
+    """Close every shared session owned by the running event loop.
+
+    Safe to call multiple times; the next ``get_http_session`` call simply
+    opens a new session.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        owned = [key for key, (owner_ref, _) in _sessions.items() if owner_ref() is loop]
+        sessions = [_sessions.pop(key)[1] for key in owned]
+
+    for session in sessions:
+        try:
+            await session.close()
+        except Exception as e:
+            logger.warning(f"Error closing shared HTTP session: {e}")
+
+
+def run_with_http_sessions(main: Coroutine[Any, Any, T]) -> T:
+    """
+    ``asyncio.run(main)``, closing the loop's shared sessions before it shuts down.
+
+    Use this in CLI entry points that call upstream APIs so pooled connections
+    are closed cleanly instead of being reported as unclosed at exit.
+    """
+
+    async def _run() -> T:
+        try:
+            return await main
+        finally:
+            await close_http_sessions()
+
+    return asyncio.run(_run())
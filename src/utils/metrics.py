@@ -0,0 +1,293 @@
+"""
+Request Metrics - In-process latency histograms and per-request tracing.
+
+Service code records *spans* (one timed stage of one source) and cache
+lookups; each is observed into a process-wide histogram/counter registry
+that ``/metrics`` renders in the Prometheus text exposition format.  When a
+request runs inside ``trace_request()``, the same spans are also collected on
+a ``RequestTrace`` so the endpoint can return them as ``debug_timing``.
+
+Stages used by the search service:
+    redis     Redis round trip (FT.SEARCH / FT.AGGREGATE / pipelined batch)
+    parse     Decoding RediSearch documents into dicts
+    rank      Python re-ranking and filtering
+    upstream  Brokered API call (news, video, ratings, artist, album)
+
+Usage:
+    from utils.metrics import record_span, span, trace_request
+
+    with trace_request("search") as trace:
+        with span("parse", "movie"):
+            ...
+        record_span("redis", "indexed", elapsed_ms)
+    payload["debug_timing"] = trace.to_dict()
+
+The trace is held in a ``ContextVar``, so spans recorded in tasks spawned by
+``asyncio.gather`` are attributed to the request that spawned them.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds in seconds; spans range from sub-millisecond parses to
+# multi-second upstream timeouts.
+_DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with a fixed label set."""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def total(self) -> float:
+        """Sum across every label combination."""
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a fixed label set (values in seconds)."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = _DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # Per label set: [count per bucket..., +Inf count], sum
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labels] = series
+            counts, total = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, (list(c), s[0])) for labels, (c, s) in self._series.items())
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                label_str = _format_labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{label_str} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(round(total, 6))}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named counters and histograms rendered together for ``/metrics``."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> Counter:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Counter(name, help_text, labelnames)
+                self._metrics[name] = metric
+        if not isinstance(metric, Counter):
+            raise TypeError(f"Metric {name} is already registered as {type(metric).__name__}")
+        return metric
+
+    def histogram(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> Histogram:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Histogram(name, help_text, labelnames)
+                self._metrics[name] = metric
+        if not isinstance(metric, Histogram):
+            raise TypeError(f"Metric {name} is already registered as {type(metric).__name__}")
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+_REQUEST_DURATION = REGISTRY.histogram(
+    "search_request_duration_seconds", "End-to-end service latency per endpoint.", ("endpoint",)
+)
+_STAGE_DURATION = REGISTRY.histogram(
+    "search_stage_duration_seconds",
+    "Latency of one stage (redis, parse, rank, upstream) for one source.",
+    ("endpoint", "stage", "source"),
+)
+_CACHE_REQUESTS = REGISTRY.counter(
+    "search_cache_requests_total", "Cache lookups by cache and result.", ("cache", "result")
+)
+_UPSTREAM_RATE_LIMITED = REGISTRY.counter(
+    "upstream_rate_limited_total", "HTTP 429 responses from upstream APIs.", ("host",)
+)
+
+
+@dataclass
+class RequestTrace:
+    """Spans and cache lookups collected for one request."""
+
+    endpoint: str
+    spans: list[tuple[str, str, float]] = field(default_factory=list)
+    cache: list[tuple[str, bool]] = field(default_factory=list)
+    total_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "total_ms": round(self.total_ms, 2),
+            "spans": [
+                {"stage": stage, "source": source, "ms": round(ms, 2)}
+                for stage, source, ms in self.spans
+            ],
+            "cache": [{"cache": name, "hit": hit} for name, hit in self.cache],
+        }
+
+
+_current_trace: ContextVar[RequestTrace | None] = ContextVar("request_trace", default=None)
+
+
+@contextmanager
+def trace_request(endpoint: str) -> Iterator[RequestTrace]:
+    """Collect spans for one request and observe its total latency on exit."""
+    trace = RequestTrace(endpoint=endpoint)
+    token = _current_trace.set(trace)
+    start = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        elapsed = time.perf_counter() - start
+        trace.total_ms = elapsed * 1000
+        _current_trace.reset(token)
+        _REQUEST_DURATION.observe(elapsed, endpoint)
+
+
+def record_span(stage: str, source: str, elapsed_ms: float) -> None:
+    """Record an already-measured span against the current request (if any)."""
+    trace = _current_trace.get()
+    endpoint = trace.endpoint if trace is not None else "none"
+    _STAGE_DURATION.observe(elapsed_ms / 1000, endpoint, stage, source)
+    if trace is not None:
+        trace.spans.append((stage, source, elapsed_ms))
+
+
+@contextmanager
+def span(stage: str, source: str) -> Iterator[None]:
+    """Time the enclosed block as one span."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(stage, source, (time.perf_counter() - start) * 1000)
+
+
+def record_cache(cache: str, hit: bool, stale: bool = False, negative: bool = False) -> None:
+    """Count a cache lookup and note it on the current request (if any).
+
+    ``stale`` marks a hit served past its soft TTL while a refresh runs;
+    ``negative`` a hit on a cached empty / not-found result.
+    """
+    result = "negative" if negative else "stale" if stale else "hit" if hit else "miss"
+    _CACHE_REQUESTS.inc(cache, result)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.cache.append((cache, hit))
+
+
+def record_rate_limited(host: str) -> None:
+    """Count one 429 from an upstream API."""
+    _UPSTREAM_RATE_LIMITED.inc(host)
+
+
+def rate_limited_total() -> float:
+    """429s seen from all upstream APIs since process start."""
+    return _UPSTREAM_RATE_LIMITED.total()
+
+
+def render_prometheus() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    return REGISTRY.render()
@@ -16,12 +16,28 @@ Usage:
     async with limiter:
         # Make your API request
         pass
+
+Distributed limiting:
+    Limiters requested with an ``api`` name listed in ``DISTRIBUTED_RATE_LIMIT_APIS``
+    (comma separated, or ``*`` for all) share one Redis token bucket across every
+    process - web app, ETL VM and backfill scripts together stay under the
+    provider cap.  Each process leases a small batch of tokens per round trip
+    (``RATE_LIMIT_PREFETCH_SECONDS`` worth of rate) instead of one per request.
+    The bucket lives on the Redis that ``RedisManager`` currently points at and
+    is keyed by host and rate, so clients of one host configured with different
+    rates get separate buckets instead of overwriting each other's parameters.
+    If Redis is unavailable the limiter falls back to the per-loop limiter.
+
+        limiter = get_rate_limiter(38, 1, api="api.themoviedb.org")
 """
 
 from __future__ import annotations
 
 import asyncio
+import math
+import os
 import threading
+import time
 import weakref
 from typing import Any
 
@@ -42,6 +58,52 @@ _limiters: dict[tuple[int, float, int], ResilientRateLimiter] = {}
 # Track limiter creation for monitoring
 _limiter_creation_count = 0
 
+# Distributed token buckets (see module docstring)
+DISTRIBUTED_RATE_LIMIT_APIS = {
+    api.strip() for api in os.getenv("DISTRIBUTED_RATE_LIMIT_APIS", "").split(",") if api.strip()
+}
+_PREFETCH_SECONDS = float(os.getenv("RATE_LIMIT_PREFETCH_SECONDS", "0.1"))
+_BUCKET_KEY_PREFIX = "ratelimit:"
+_REDIS_RETRY_SECONDS = 30.0  # How long to stay on the local fallback after a Redis error
+_REDIS_MAX_CONNECTIONS = 4  # Shared by every distributed limiter in the process
+
+_distributed_limiters: dict[tuple[str, int, float, int], DistributedRateLimiter] = {}
+
+# Process-wide sync clients for the token bucket, keyed by (host, port)
+_bucket_clients: dict[tuple[str, int], Any] = {}
+
+# Lua token bucket: refill at rate/period from the server clock, grant up to
+# ARGV[3] tokens (at least 1 if available), else return the wait in ms.
+#   KEYS[1] bucket hash {tokens, ts}
+#   ARGV    max_rate, time_period, requested
+#   returns {granted, wait_ms}
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local rate = capacity / period
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+local wait_ms = 0
+if granted < 1 then
+    granted = 0
+    wait_ms = math.ceil((1 - tokens) / rate * 1000)
+end
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(period * 2000))
+return {granted, wait_ms}
+"""
+
 
 class ResilientRateLimiter:
     """
@@ -141,7 +203,9 @@ class ResilientRateLimiter:
                 logger.warning(f"Error releasing rate limiter: {e}")
 
 
-def get_rate_limiter(max_rate: int, time_period: float = 1.0) -> ResilientRateLimiter:
+def get_rate_limiter(
+    max_rate: int, time_period: float = 1.0, api: str | None = None
+) -> ResilientRateLimiter | DistributedRateLimiter:
     """
     Get or create a resilient rate limiter per API configuration per event loop.
 
@@ -160,9 +224,13 @@ def get_rate_limiter(max_rate: int, time_period: float = 1.0) -> ResilientRateLi
     Args:
         max_rate: Maximum number of requests allowed
         time_period: Time period in seconds (default: 1.0)
+        api: Upstream API name (e.g. the request host).  APIs listed in
+            ``DISTRIBUTED_RATE_LIMIT_APIS`` get a Redis-backed limiter shared
+            by every process.
 
     Returns:
-        ResilientRateLimiter instance that handles cross-loop errors gracefully
+        ResilientRateLimiter instance that handles cross-loop errors gracefully,
+        or a DistributedRateLimiter for distributed APIs
 
     Example:
         >>> limiter = get_rate_limiter(max_rate=35, time_period=1)
@@ -182,6 +250,9 @@ def get_rate_limiter(max_rate: int, time_period: float = 1.0) -> ResilientRateLi
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
+    if api and (api in DISTRIBUTED_RATE_LIMIT_APIS or "*" in DISTRIBUTED_RATE_LIMIT_APIS):
+        return _get_distributed_rate_limiter(api, max_rate, time_period, loop)
+
     # Cache key includes loop ID to ensure limiters are per-event-loop
     cache_key = (max_rate, time_period, id(loop))
 
@@ -201,3 +272,158 @@ def get_rate_limiter(max_rate: int, time_period: float = 1.0) -> ResilientRateLi
                 )
 
     return _limiters[cache_key]
+
+
+class DistributedRateLimiter:
+    """
+    Token bucket shared across processes through a Redis Lua script.
+
+    Tokens are leased from Redis in small batches and spent locally; a
+    lease expires after ``RATE_LIMIT_PREFETCH_SECONDS`` so unused tokens
+    cannot be hoarded into a later burst.  Any Redis failure switches this
+    limiter to a per-loop ``ResilientRateLimiter`` for a while.
+
+    The bucket key includes the rate (``ratelimit:<api>:<max_rate>/<time_period>``)
+    because the script stores the rate with the bucket; keying on the host alone
+    let limiters with different rates overwrite each other's parameters.
+
+    Limiters are per event loop, but the bucket script runs on one
+    process-wide sync Redis client in a worker thread: async connections
+    belong to the loop that opened them, and a client per loop would outlive
+    every short-lived ``asyncio.run`` loop.
+    """
+
+    def __init__(
+        self,
+        api: str,
+        max_rate: int,
+        time_period: float,
+        redis: Any = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        self.api = api
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.key = f"{_BUCKET_KEY_PREFIX}{api}:{max_rate}/{time_period:g}"
+        self.lease_size = max(1, math.floor(max_rate / time_period * _PREFETCH_SECONDS))
+        self._redis = redis
+        self._loop_ref = weakref.ref(loop) if loop is not None else None
+        self._script: Any = None
+        self._lock = asyncio.Lock()
+        self._tokens = 0
+        self._lease_expires = 0.0
+        self._fallback = ResilientRateLimiter(max_rate, time_period)
+        self._fallback_until = 0.0
+        self._fallback_tasks: weakref.WeakSet[asyncio.Task[Any]] = weakref.WeakSet()
+
+    @property
+    def loop_closed(self) -> bool:
+        """True once the event loop this limiter was created for is closed or gone."""
+        if self._loop_ref is None:
+            return False
+        loop = self._loop_ref()
+        return loop is None or loop.is_closed()
+
+    def _get_script(self) -> Any:
+        if self._script is None:
+            if self._redis is None:
+                self._redis = _get_bucket_client()
+            self._script = self._redis.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    def _take_local(self) -> bool:
+        if self._tokens > 0 and time.monotonic() < self._lease_expires:
+            self._tokens -= 1
+            return True
+        return False
+
+    async def _lease(self) -> float:
+        """Lease tokens from Redis; returns seconds to wait if none were granted."""
+        granted, wait_ms = await asyncio.to_thread(
+            self._get_script(),
+            keys=[self.key],
+            args=[self.max_rate, self.time_period, self.lease_size],
+        )
+        if int(granted) > 0:
+            self._tokens = int(granted)
+            self._lease_expires = time.monotonic() + _PREFETCH_SECONDS
+            return 0.0
+        return max(int(wait_ms), 1) / 1000
+
+    async def __aenter__(self) -> DistributedRateLimiter:
+        while time.monotonic() >= self._fallback_until:
+            if self._take_local():
+                return self
+            async with self._lock:
+                if self._take_local():
+                    return self
+                try:
+                    wait = await self._lease()
+                except Exception as e:
+                    # RedisError/OSError, but also a misconfigured client
+                    logger.warning(
+                        f"Distributed rate limiter for {self.api} unavailable, "
+                        f"using local limiter for {_REDIS_RETRY_SECONDS:.0f}s: {e}"
+                    )
+                    self._fallback_until = time.monotonic() + _REDIS_RETRY_SECONDS
+                    break
+                if wait == 0.0 and self._take_local():
+                    return self
+            if wait:
+                await asyncio.sleep(wait)
+
+        await self._fallback.__aenter__()
+        task = asyncio.current_task()
+        if task is not None:
+            self._fallback_tasks.add(task)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        task = asyncio.current_task()
+        if task is not None and task in self._fallback_tasks:
+            self._fallback_tasks.discard(task)
+            await self._fallback.__aexit__(exc_type, exc_val, exc_tb)
+
+
+def _get_bucket_client() -> Any:
+    """Sync Redis client for the token bucket on ``RedisManager``'s current environment."""
+    from redis import Redis
+
+    from adapters.redis_manager import RedisManager
+
+    config = RedisManager.get_config(RedisManager.get_current_env())
+    client_key = (config.host, config.port)
+    with _lock:
+        client = _bucket_clients.get(client_key)
+        if client is None:
+            client = Redis(
+                host=config.host,
+                port=config.port,
+                password=config.password,
+                max_connections=_REDIS_MAX_CONNECTIONS,
+                socket_timeout=5.0,
+                socket_connect_timeout=5.0,
+            )
+            _bucket_clients[client_key] = client
+    return client
+
+
+def _get_distributed_rate_limiter(
+    api: str, max_rate: int, time_period: float, loop: asyncio.AbstractEventLoop
+) -> DistributedRateLimiter:
+    cache_key = (api, max_rate, time_period, id(loop))
+    limiter = _distributed_limiters.get(cache_key)
+    if limiter is None or limiter.loop_closed:
+        with _lock:
+            # Drop limiters of finished loops (a closed loop's id can be reused)
+            for key in [k for k, v in _distributed_limiters.items() if v.loop_closed]:
+                del _distributed_limiters[key]
+            if cache_key not in _distributed_limiters:
+                _distributed_limiters[cache_key] = DistributedRateLimiter(
+                    api, max_rate, time_period, loop=loop
+                )
+                logger.debug(
+                    f"Created distributed rate limiter for {api} on loop {id(loop)}: "
+                    f"{max_rate} requests per {time_period}s"
+                )
+    return _distributed_limiters[cache_key]
@@ -9,10 +9,13 @@ import pickle
 import random
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from hashlib import md5
 from typing import Any, cast
 
+import msgpack
+import zstandard
 from redis import Redis
 from redis.asyncio import ConnectionPool as AsyncConnectionPool
 from redis.asyncio import Redis as AsyncRedis
@@ -20,6 +23,7 @@ from redis.exceptions import RedisError
 
 from utils.alerts import send_alert
 from utils.get_logger import get_logger
+from utils.metrics import record_cache
 
 # Define version constant
 RELEASE_VERSION = "1.3.4"
@@ -44,6 +48,29 @@ _LOCK_POLL_INITIAL = 0.05
 _LOCK_POLL_MAX = 0.3
 _LOCK_POLL_JITTER = 0.03
 
+# Stale-while-revalidate background refreshes.  Strong references keep the
+# tasks alive until they finish; the key set stops one process from
+# scheduling the same refresh again while it is running.
+_REFRESH_TASKS: set[asyncio.Task[None]] = set()
+_REFRESHING_KEYS: set[str] = set()
+
+
+# In-process L1 tier (opt-in per RedisCache via local_cache_max_bytes)
+_LOCAL_CACHE_DEFAULT_MAX_TTL = 300  # Cap on L1 lifetime; bounds cross-process staleness
+_LOCAL_VERSION_CHECK_SECONDS = 30  # How often L1-enabled caches re-read the version registry
+
+# Payload codec.  New entries start with one header byte: low nibble is the
+# serializer, high nibble the compression.  Legacy entries are raw pickles,
+# whose first byte is the PROTO opcode (0x80) and never collides with a header.
+_CODEC_MSGPACK = 0x01
+_CODEC_PICKLE = 0x02
+_CODEC_ZSTD = 0x10
+_SERIALIZER_MASK = 0x0F
+_COMPRESSION_MASK = 0x70
+_PICKLE_PROTO_OPCODE = 0x80
+_COMPRESS_MIN_BYTES = int(os.getenv("REDIS_CACHE_COMPRESS_MIN_BYTES", "1024"))
+_ZSTD_LEVEL = 3
+
 
 def _poll_sleep(attempt: int) -> float:
     """Jittered exponential backoff, capped. Spreads load, avoids stampede."""
@@ -296,6 +323,9 @@ class CacheEntry:
     args: list[Any] = dataclasses.field(default_factory=list)
     source: str = "redis"
     version: str = "0.0"
+    # Marks a cached empty / not-found result (data may be None), which is
+    # a hit rather than a miss and lives for the short negative TTL
+    negative: bool = False
 
     def to_dict(self):
         return {
@@ -303,6 +333,79 @@ class CacheEntry:
         }
 
 
+class _LocalCache:
+    """Byte-bounded in-process LRU holding raw cache payloads.
+
+    Stores the exact bytes read from / written to Redis together with the
+    entry's absolute expiry and cache version, so a hit skips the network
+    round trip but still yields a fresh object per caller (safe for the
+    ``mutable=True`` default of ``use_cache``).  Not thread-safe; intended
+    for use from a single event loop.
+    """
+
+    def __init__(self, max_bytes: int, max_ttl: int = _LOCAL_CACHE_DEFAULT_MAX_TTL) -> None:
+        self.max_bytes = max_bytes
+        self.max_ttl = max_ttl
+        self._entries: OrderedDict[str, tuple[bytes, float, str]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, version: str) -> bytes | None:
+        """Return the payload for *key* if present, unexpired and on *version*."""
+        item = self._entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        payload, expires_at, entry_version = item
+        if expires_at <= time.time() or entry_version != version:
+            self.pop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, key: str, payload: bytes, expiry: float, version: str) -> None:
+        """Store *payload* until ``min(expiry, now + max_ttl)``; ``expiry=-1`` means no expiry."""
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + self.max_ttl
+        if expiry != -1:
+            expires_at = min(expires_at, expiry)
+        if expires_at <= now:
+            return
+        self.pop(key)
+        self._entries[key] = (payload, expires_at, version)
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            _, (evicted, _, _) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def pop(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._bytes -= len(item[0])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
 class _CacheEntryUnpickler(pickle.Unpickler):
     """Unpickler that resolves CacheEntry to the local class regardless of source module path.
 
@@ -320,6 +423,57 @@ class _CacheEntryUnpickler(pickle.Unpickler):
         return cls
 
 
+def _encode_entry(entry: CacheEntry) -> bytes:
+    """Serialize *entry* to a codec-tagged payload.
+
+    Entries whose fields are all msgpack-native (dict/list/str/bytes/int/
+    float/bool/None, no subclasses or tuples) are packed with msgpack;
+    anything else (Pydantic models, dataclasses, tuples) falls back to pickle
+    so round-trips stay type-exact.  Bodies of at least
+    ``_COMPRESS_MIN_BYTES`` are zstd-compressed when that makes them smaller.
+    """
+    try:
+        body = cast(bytes, msgpack.packb(entry.to_dict(), use_bin_type=True, strict_types=True))
+        header = _CODEC_MSGPACK
+    except (TypeError, ValueError, OverflowError):
+        body = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        header = _CODEC_PICKLE
+
+    if len(body) >= _COMPRESS_MIN_BYTES:
+        compressed = zstandard.compress(body, _ZSTD_LEVEL)
+        if len(compressed) < len(body):
+            body = compressed
+            header |= _CODEC_ZSTD
+
+    return bytes((header,)) + body
+
+
+def _decode_entry(raw: bytes) -> Any:
+    """Inverse of ``_encode_entry``; also reads legacy untagged pickle payloads.
+
+    Returns whatever the payload holds; callers check it is a ``CacheEntry``.
+    """
+    if not raw or raw[0] & _PICKLE_PROTO_OPCODE:
+        return _CacheEntryUnpickler(io.BytesIO(raw)).load()
+
+    header = raw[0]
+    body = memoryview(raw)[1:]
+    compression = header & _COMPRESSION_MASK
+    if compression == _CODEC_ZSTD:
+        body = memoryview(zstandard.decompress(body))
+    elif compression:
+        raise ValueError(f"Unknown cache payload compression: {compression:#x}")
+
+    serializer = header & _SERIALIZER_MASK
+    if serializer == _CODEC_MSGPACK:
+        fields = msgpack.unpackb(body, raw=False, strict_map_key=False)
+        known = CacheEntry.__dataclass_fields__
+        return CacheEntry(**{k: v for k, v in fields.items() if k in known})
+    if serializer == _CODEC_PICKLE:
+        return _CacheEntryUnpickler(io.BytesIO(body)).load()
+    raise ValueError(f"Unknown cache payload serializer: {serializer:#x}")
+
+
 # Singleton Redis client (synchronous)
 _redis_client: Redis | None = None
 
@@ -338,7 +492,7 @@ def get_redis_client() -> Redis:
             raise RuntimeError(f"Invalid REDIS_PORT value: {port_str!r}")
 
         # Synchronous Redis client - no event loop issues!
-        # decode_responses=False because we are storing pickled binary values
+        # decode_responses=False because we are storing codec-encoded binary values
         _redis_client = Redis(
             host=host,
             port=port,
@@ -436,6 +590,10 @@ class RedisCache:
         allow_empty: bool = False,
         use_cloud_storage: bool = False,
         use_firestore: bool = False,
+        local_cache_max_bytes: int = 0,
+        local_cache_max_ttl: int = _LOCAL_CACHE_DEFAULT_MAX_TTL,
+        stale_ttl: int = 0,
+        negative_ttl: int = 0,
         **kwargs,
     ) -> None:
         # Redis client and version are lazy-loaded on first cache operation.
@@ -444,11 +602,26 @@ class RedisCache:
         self._redis_instance: AsyncRedis | None = None
         self._version: str | None = None
 
+        # Optional in-process L1 in front of Redis (0 = disabled).  L1-enabled
+        # caches re-check the version registry periodically so a
+        # set_cache_version() bust drops local entries within seconds.
+        self._local: _LocalCache | None = (
+            _LocalCache(local_cache_max_bytes, local_cache_max_ttl)
+            if local_cache_max_bytes > 0
+            else None
+        )
+        self._version_checked_at = 0.0
+
         self.defaultTTL = defaultTTL
         self.prefix = prefix
         self.verbose = verbose
         self.isClassMethod = isClassMethod
         self.allow_empty = allow_empty
+        # Seconds an entry may be served past its (soft) TTL while
+        # use_cache refreshes it in the background (0 = disabled)
+        self.stale_ttl = stale_ttl
+        # Lifetime of cached empty / not-found results (0 = not cached)
+        self.negative_ttl = negative_ttl
 
         # Logging setup
         level = logging.WARNING if not verbose else logging.DEBUG
@@ -472,12 +645,42 @@ class RedisCache:
         """Lazy accessor for the cache version — fetched from Redis on first use."""
         if self._version is None:
             self._version = get_cache_version(self.prefix)
+            self._version_checked_at = time.monotonic()
         return self._version
 
     @version.setter
     def version(self, value: str) -> None:
         """Allow external code to set the version directly."""
         self._version = value
+        self._version_checked_at = time.monotonic()
+
+    async def _refresh_version_if_due(self) -> None:
+        """Re-read the registry version for L1-enabled caches, at most every few seconds.
+
+        A changed version clears the L1 tier so no process keeps serving
+        entries that another process has invalidated via ``set_cache_version``.
+        The registry read is synchronous, so it runs in a worker thread.
+        """
+        if self._local is None:
+            return
+        now = time.monotonic()
+        if (
+            self._version is not None
+            and now - self._version_checked_at < _LOCAL_VERSION_CHECK_SECONDS
+        ):
+            return
+        self._version_checked_at = now
+        latest = await asyncio.to_thread(get_cache_version, self.prefix)
+        if self._version is not None and latest != self._version:
+            self.logging.info(
+                f"Cache version changed for {self.prefix}: {self._version} -> {latest}"
+            )
+            self._local.clear()
+        self._version = latest
+
+    def local_cache_stats(self) -> dict[str, int] | None:
+        """Return L1 hit/miss/size counters, or None when the L1 tier is disabled."""
+        return self._local.stats() if self._local is not None else None
 
     @classmethod
     def for_firebase_functions(
@@ -542,9 +745,23 @@ class RedisCache:
         return key
 
     async def add(
-        self, data: Any, cache_key: str, funcName: str, args: list, expiry: int, kwargs: dict
+        self,
+        data: Any,
+        cache_key: str,
+        funcName: str,
+        args: list,
+        expiry: int,
+        kwargs: dict,
+        stale_ttl: int = 0,
+        negative_ttl: int = 0,
     ) -> CacheEntry:
-        """Add data to Redis cache (async)."""
+        """Add data to Redis cache (async).
+
+        ``expiry`` is the entry's soft expiry; the Redis key is kept for a
+        further ``stale_ttl`` seconds so it can be served stale.  With
+        ``negative_ttl`` an empty / not-found result is stored as a negative
+        entry for that many seconds instead of being skipped.
+        """
         try:
             storage_key = self._full_key(cache_key)
 
@@ -554,6 +771,11 @@ class RedisCache:
             now = time.time()
             ttl_seconds = 0
 
+            entry.negative = negative_ttl > 0 and self.is_negative_result(data)
+            if entry.negative:
+                expiry = int(now) + negative_ttl
+                stale_ttl = 0
+
             if expiry == -1:
                 ttl_seconds = self.defaultTTL if self.defaultTTL != -1 else 0
             else:
@@ -561,6 +783,8 @@ class RedisCache:
 
             if ttl_seconds < 0:
                 ttl_seconds = 1
+            if ttl_seconds > 0 and expiry != -1:
+                ttl_seconds += stale_ttl
 
             entry.expiry = int(expiry)
             entry.data_type = str(type(data))
@@ -584,19 +808,25 @@ class RedisCache:
             entry.data = data
             entry.source = "redis"
 
-            if not self.allow_empty and self.filter_empty(entry) is None:
-                return entry
+            if not entry.negative:
+                if not self.allow_empty and self.filter_empty(entry) is None:
+                    return entry
 
-            if hasattr(data, "error") and data.error:
-                return entry
+                if hasattr(data, "error") and data.error:
+                    return entry
 
-            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            payload = _encode_entry(entry)
 
             if ttl_seconds > 0:
                 await self._redis.set(storage_key, payload, ex=ttl_seconds)
             else:
                 await self._redis.set(storage_key, payload)
 
+            if self._local is not None:
+                self._local.put(
+                    storage_key, payload, self._hard_expiry(entry, stale_ttl), entry.version
+                )
+
             self.logging.debug(f"Added to Redis: {storage_key} (ttl={ttl_seconds})")
 
             return entry
@@ -615,18 +845,32 @@ class RedisCache:
             self.logging.warning(f"Redis add error for {cache_key}: {e}")
             return CacheEntry()
 
+    @staticmethod
+    def _hard_expiry(entry: CacheEntry, stale_ttl: int) -> int:
+        return entry.expiry if entry.expiry == -1 else entry.expiry + stale_ttl
+
     async def read(
-        self, key: str, noExpiration: bool = False, mutable: bool = True
+        self, key: str, noExpiration: bool = False, mutable: bool = True, stale_ttl: int = 0
     ) -> CacheEntry | None:
-        """Read from Redis cache (async)."""
+        """Read from Redis cache (async).
+
+        With ``stale_ttl`` an entry past its expiry is still returned for
+        that many seconds; callers compare ``entry.expiry`` to spot it.
+        """
         try:
             storage_key = self._full_key(key)
-            raw = await self._redis.get(storage_key)
+            raw: bytes | None = None
+            if self._local is not None:
+                await self._refresh_version_if_due()
+                raw = self._local.get(storage_key, self.version)
+            from_local = raw is not None
+            if raw is None:
+                raw = cast(bytes | None, await self._redis.get(storage_key))
             if raw is None:
                 self.logging.debug(f"Redis miss: {storage_key}")
                 return None
 
-            entry = _CacheEntryUnpickler(io.BytesIO(cast(bytes, raw))).load()
+            entry = _decode_entry(raw)
             if not isinstance(entry, CacheEntry):
                 self.logging.warning(f"Invalid cache entry format for {key}")
                 return None
@@ -636,14 +880,19 @@ class RedisCache:
                 await self.remove(key)
                 return None
 
-            if not noExpiration and entry.expiry != -1 and entry.expiry < time.time():
+            # Negative entries are never served stale
+            hard_expiry = self._hard_expiry(entry, 0 if entry.negative else stale_ttl)
+            if not noExpiration and hard_expiry != -1 and hard_expiry < time.time():
                 self.logging.info(f"Cache logically expired: {key}")
                 await self.remove(key)
                 return None
 
-            if not self.allow_empty and self.filter_empty(entry) is None:
+            if not entry.negative and not self.allow_empty and self.filter_empty(entry) is None:
                 return None
 
+            if self._local is not None and not from_local:
+                self._local.put(storage_key, raw, hard_expiry, entry.version)
+
             if mutable:
                 return entry
             else:
@@ -669,8 +918,10 @@ class RedisCache:
 
     async def remove(self, key: str) -> None:
         """Remove a key from Redis cache (async)."""
+        storage_key = self._full_key(key)
+        if self._local is not None:
+            self._local.pop(storage_key)
         try:
-            storage_key = self._full_key(key)
             await self._redis.delete(storage_key)
         except RedisError as e:
             self.logging.warning(f"Redis delete failed for {key}: {e}")
@@ -690,6 +941,20 @@ class RedisCache:
             return None
         return entry
 
+    def is_negative_result(self, data: Any) -> bool:
+        """True for an empty result or an upstream not-found response.
+
+        Covers the values ``filter_empty`` rejects and response models with
+        an empty ``results`` list or a 404 ``status_code``.  Other errors are
+        not negative results: they are transient and never cached.
+        """
+        if self.filter_empty(CacheEntry(data=data)) is None:
+            return True
+        if getattr(data, "error", None):
+            return getattr(data, "status_code", None) == 404
+        results = getattr(data, "results", None)
+        return isinstance(results, list) and not results
+
     async def clear(self, include_locks: bool = False) -> None:
         """Clear the cache for this prefix (async).
 
@@ -701,6 +966,9 @@ class RedisCache:
             self.logging.warning("Clear called without prefix - skipping for safety")
             return
 
+        if self._local is not None:
+            self._local.clear()
+
         patterns = [f"{self.prefix}:*"]
         if include_locks:
             patterns.append(f"__lock__:{self.prefix}:*")
@@ -807,7 +1075,9 @@ class RedisCache:
             await self._redis_instance.aclose()
 
     @classmethod
-    def use_cache(cls, instance, prefix="", expiry_override=None):
+    def use_cache(
+        cls, instance, prefix="", expiry_override=None, stale_ttl=None, negative_ttl=None
+    ):
         """Decorator to cache async function results.
 
         All Redis I/O is async so the event loop stays unblocked.
@@ -815,9 +1085,24 @@ class RedisCache:
         Advisory-lock coalescing: on cache miss only one caller fetches;
         concurrent callers wait and reuse the result.  Function errors
         propagate to the caller (never silently swallowed).
+
+        Stale-while-revalidate: with a ``stale_ttl`` (here or on the
+        instance) the TTL is soft.  For ``stale_ttl`` seconds after it an
+        entry is still returned immediately, and one background refresh is
+        started — deduplicated across processes by the same advisory lock.
+        Refresh errors are logged and the stale entry keeps being served.
+
+        Negative caching: with a ``negative_ttl`` (here or on the instance)
+        empty and not-found results (see ``is_negative_result``) are cached
+        for that many seconds, never served stale, and counted as
+        ``result="negative"`` hits per prefix.
         """
 
         def decorator(func):
+            metrics_name = prefix or func.__name__
+            grace = instance.stale_ttl if stale_ttl is None else stale_ttl
+            negative_window = instance.negative_ttl if negative_ttl is None else negative_ttl
+
             async def inner1(*args, **kwargs):
                 skipCacheRead = kwargs.pop("no_cache", False)
 
@@ -865,6 +1150,8 @@ class RedisCache:
                                 args=args[1:],
                                 expiry=expiry,
                                 kwargs=kwargs,
+                                stale_ttl=grace,
+                                negative_ttl=negative_window,
                             )
                         return data
                     except Exception:
@@ -877,16 +1164,57 @@ class RedisCache:
                                 pass
                         raise
 
+                storage_key = instance._full_key(cache_key)
+                lock_key = f"__lock__:{storage_key}"
+
+                async def _refresh_stale() -> None:
+                    """Re-fetch a stale entry unless another caller already is."""
+                    token = os.urandom(16).hex()
+                    try:
+                        if instance._local is not None:
+                            # The L1 copy may be older than what Redis holds
+                            instance._local.pop(storage_key)
+                            current = await instance.read(cache_key, noExpiration, True, grace)
+                            if current is not None and current.expiry >= time.time():
+                                return
+                        if not await instance._redis.set(
+                            lock_key, token, nx=True, ex=_LOCK_TTL_SECONDS
+                        ):
+                            return
+                        await _fetch_and_cache(lock_key=lock_key, lock_token=token)
+                        instance.logging.debug(f"Refreshed stale entry: {cache_key}")
+                    except Exception as e:
+                        instance.logging.warning(f"Background refresh failed for {cache_key}: {e}")
+                    finally:
+                        _REFRESHING_KEYS.discard(storage_key)
+
                 # ---- Phase 1: Cache read ----
                 if not skipCacheRead:
-                    cachedEntry = await instance.read(cache_key, noExpiration, mutable)
+                    cachedEntry = await instance.read(cache_key, noExpiration, mutable, grace)
+                    negative = cachedEntry is not None and cachedEntry.negative
+                    stale = (
+                        cachedEntry is not None
+                        and not negative
+                        and cachedEntry.expiry != -1
+                        and cachedEntry.expiry < time.time()
+                    )
+                    record_cache(metrics_name, cachedEntry is not None, stale, negative)
                     if cachedEntry is not None:
-                        instance.logging.debug(f"Cache hit: {cache_key}")
+                        if (
+                            stale
+                            and not cacheUpdateDisabled
+                            and storage_key not in _REFRESHING_KEYS
+                        ):
+                            _REFRESHING_KEYS.add(storage_key)
+                            task = asyncio.create_task(_refresh_stale())
+                            _REFRESH_TASKS.add(task)
+                            task.add_done_callback(_REFRESH_TASKS.discard)
+                        instance.logging.debug(
+                            f"Cache {'stale hit' if stale else 'hit'}: {cache_key}"
+                        )
                         return cachedEntry.data
 
                 # ---- Phase 2: Cache miss — coalescing via advisory lock ----
-                storage_key = instance._full_key(cache_key)
-                lock_key = f"__lock__:{storage_key}"
                 lock_token = os.urandom(16).hex()
 
                 try:
@@ -913,7 +1241,7 @@ class RedisCache:
                 waited = 0.0
                 poll_attempt = 0
                 while waited < _LOCK_MAX_WAIT:
-                    cachedEntry = await instance.read(cache_key, noExpiration, mutable)
+                    cachedEntry = await instance.read(cache_key, noExpiration, mutable, grace)
                     if cachedEntry is not None:
                         return cachedEntry.data
                     interval = _poll_sleep(poll_attempt)
@@ -936,7 +1264,7 @@ class RedisCache:
                     )
                     return await _fetch_and_cache(lock_key=lock_key, lock_token=lock_token)
 
-                cachedEntry = await instance.read(cache_key, noExpiration, mutable)
+                cachedEntry = await instance.read(cache_key, noExpiration, mutable, grace)
                 if cachedEntry is not None:
                     return cachedEntry.data
 
@@ -944,14 +1272,14 @@ class RedisCache:
                 brief_wait = min(2.0, _LOCK_MAX_WAIT)
                 waited = 0.0
                 while waited < brief_wait:
-                    cachedEntry = await instance.read(cache_key, noExpiration, mutable)
+                    cachedEntry = await instance.read(cache_key, noExpiration, mutable, grace)
                     if cachedEntry is not None:
                         return cachedEntry.data
                     interval = _poll_sleep(0)
                     await asyncio.sleep(interval)
                     waited += interval
 
-                cachedEntry = await instance.read(cache_key, noExpiration, mutable)
+                cachedEntry = await instance.read(cache_key, noExpiration, mutable, grace)
                 if cachedEntry is not None:
                     return cachedEntry.data
 
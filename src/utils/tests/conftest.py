@@ -0,0 +1,67 @@
+"""
+Shared RedisCache test doubles for the utils tests.
+
+``FakeAsyncRedis`` is an in-memory async Redis stand-in so no server is
+required; ``make_cache`` wires one into a fresh ``RedisCache``.
+"""
+
+from typing import Any
+
+import pytest
+
+from utils import redis_cache as _redis_module
+from utils.redis_cache import RedisCache
+
+
+class FakeAsyncRedis:
+    """Async GET/SET NX/DELETE/EVAL double that counts GETs and records SET TTLs.
+
+    TTLs are recorded but not enforced; ``expire_locks`` simulates refresh
+    locks timing out.
+    """
+
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.gets = 0
+
+    def expire_locks(self) -> None:
+        for key in [k for k in self.store if k.startswith("__lock__:")]:
+            del self.store[key]
+
+    async def get(self, key: str) -> Any:
+        self.gets += 1
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for k in keys if self.store.pop(k, None) is not None)
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force caching on with a fixed cache version."""
+    monkeypatch.setattr(_redis_module, "DISABLE_CACHE", False)
+    monkeypatch.setattr(_redis_module, "get_cache_version", lambda prefix: "1.0.0")
+
+
+def make_cache(
+    prefix: str, defaultTTL: int = 3600, **kwargs: Any
+) -> tuple[RedisCache, FakeAsyncRedis]:
+    """A ``RedisCache`` backed by a fresh ``FakeAsyncRedis``."""
+    cache = RedisCache(prefix=prefix, defaultTTL=defaultTTL, **kwargs)
+    fake = FakeAsyncRedis()
+    cache._redis_instance = fake  # type: ignore[assignment]
+    return cache, fake
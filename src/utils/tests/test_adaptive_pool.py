@@ -0,0 +1,83 @@
+"""
+Tests for the AIMD sliding-window worker pool.
+"""
+
+import asyncio
+
+import pytest
+
+from utils.adaptive_pool import AIMDController, adaptive_map
+
+
+def test_controller_grows_additively_and_backs_off_on_429s() -> None:
+    throttled = [0.0]
+    controller = AIMDController(initial=4, max_limit=8, throttle_signal=lambda: throttled[0])
+
+    for _ in range(4):
+        controller.on_complete(0.1)
+    assert controller.limit == 4  # +1/limit per completion: just under 5
+    for _ in range(2):
+        controller.on_complete(0.1)
+    assert controller.limit == 5
+
+    throttled[0] = 3.0
+    controller.on_complete(0.1)
+    assert controller.limit == 3
+    assert controller.decreases == 1
+
+    # Further trouble inside the cooldown window doesn't compound the cut
+    throttled[0] = 6.0
+    controller.on_complete(0.1)
+    assert controller.limit == 3
+
+
+def test_controller_backs_off_when_latency_climbs() -> None:
+    controller = AIMDController(initial=10, throttle_signal=lambda: 0.0)
+    for _ in range(5):
+        controller.on_complete(0.1)
+    for _ in range(10):
+        controller.on_complete(1.0)
+    assert controller.decreases >= 1
+    assert controller.limit < 10
+
+
+@pytest.mark.asyncio
+async def test_slow_item_does_not_stall_the_window() -> None:
+    async def fetch(item: int) -> int:
+        if item == 0:
+            await asyncio.sleep(0.05)
+        elif item == 5:
+            raise ValueError("boom")
+        return item * 10
+
+    controller = AIMDController(initial=2, max_limit=2, throttle_signal=lambda: 0.0)
+    order: list[int] = []
+    results: dict[int, object] = {}
+    async for index, _item, result in adaptive_map(range(8), fetch, controller):
+        order.append(index)
+        results[index] = result
+
+    assert order[-1] == 0, "Fast items keep flowing past the slow one"
+    assert isinstance(results[5], ValueError)
+    assert results[7] == 70
+
+
+@pytest.mark.asyncio
+async def test_max_ahead_bounds_distance_from_oldest_unfinished() -> None:
+    started: list[int] = []
+    release = asyncio.Event()
+
+    async def fetch(item: int) -> int:
+        started.append(item)
+        if item == 0:
+            await release.wait()
+        return item
+
+    controller = AIMDController(initial=8, max_limit=8, throttle_signal=lambda: 0.0)
+    seen = 0
+    async for _index, _item, _result in adaptive_map(range(10), fetch, controller, max_ahead=4):
+        seen += 1
+        if seen == 3:
+            assert max(started) == 3
+            release.set()
+    assert seen == 10
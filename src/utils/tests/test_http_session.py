@@ -0,0 +1,71 @@
+"""
+Unit tests for the shared HTTP session registry.
+
+No network access is required; sessions are created but never used.
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from utils import http_session
+from utils.http_session import close_http_sessions, get_http_session, run_with_http_sessions
+
+
+@pytest.mark.asyncio
+async def test_session_reused_per_host() -> None:
+    a = get_http_session("https://api.themoviedb.org/3/movie/1")
+    b = get_http_session("https://api.themoviedb.org/3/tv/2?page=1")
+    c = get_http_session("https://www.googleapis.com/youtube/v3/search")
+
+    assert a is b
+    assert a is not c
+    await close_http_sessions()
+    assert a.closed and c.closed
+
+
+@pytest.mark.asyncio
+async def test_closed_session_is_replaced() -> None:
+    first = get_http_session("https://example.com/")
+    await close_http_sessions()
+
+    second = get_http_session("https://example.com/other")
+
+    assert second is not first
+    assert not second.closed
+    await close_http_sessions()
+
+
+def test_sessions_are_scoped_to_event_loop() -> None:
+    async def _open() -> object:
+        return get_http_session("https://example.com/")
+
+    loop_a = asyncio.new_event_loop()
+    loop_b = asyncio.new_event_loop()
+    try:
+        session_a = loop_a.run_until_complete(_open())
+        session_b = loop_b.run_until_complete(_open())
+        assert session_a is not session_b
+    finally:
+        loop_a.run_until_complete(close_http_sessions())
+        loop_b.run_until_complete(close_http_sessions())
+        loop_a.close()
+        loop_b.close()
+
+    assert not any(
+        owner_ref() in (loop_a, loop_b) for owner_ref, _ in http_session._sessions.values()
+    )
+
+
+def test_run_with_http_sessions_closes_sessions_on_error() -> None:
+    opened: list[aiohttp.ClientSession] = []
+
+    async def _main() -> None:
+        opened.append(get_http_session("https://example.com/"))
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run_with_http_sessions(_main())
+
+    assert opened[0].closed
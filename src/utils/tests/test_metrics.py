@@ -0,0 +1,90 @@
+"""
+Tests for the in-process latency histograms and per-request tracing.
+"""
+
+import asyncio
+
+import pytest
+
+from services.search_service import timed_task
+from utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+    record_cache,
+    render_prometheus,
+    span,
+    trace_request,
+)
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    hist = registry.histogram("demo_seconds", "Demo latency.", ("stage",))
+    hist.observe(0.002, "parse")
+    hist.observe(0.02, "parse")
+    hist.observe(20.0, "parse")
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == ["# HELP demo_seconds Demo latency.", "# TYPE demo_seconds histogram"]
+    assert 'demo_seconds_bucket{stage="parse",le="0.001"} 0' in lines
+    assert 'demo_seconds_bucket{stage="parse",le="0.0025"} 1' in lines
+    assert 'demo_seconds_bucket{stage="parse",le="0.025"} 2' in lines
+    assert 'demo_seconds_bucket{stage="parse",le="+Inf"} 3' in lines
+    assert 'demo_seconds_sum{stage="parse"} 20.022' in lines
+    assert 'demo_seconds_count{stage="parse"} 3' in lines
+
+
+def test_registry_rejects_conflicting_metric_types() -> None:
+    registry = MetricsRegistry()
+    registry.counter("dup_total", "Dup.", ("a",))
+
+    with pytest.raises(TypeError):
+        registry.histogram("dup_total", "Dup.", ("a",))
+    assert isinstance(registry.histogram("h", "H.", ()), Histogram)
+
+
+@pytest.mark.asyncio
+async def test_trace_collects_spans_from_gathered_tasks() -> None:
+    async def _fetch() -> str:
+        await asyncio.sleep(0)
+        return "ok"
+
+    with trace_request("search") as trace:
+        await asyncio.gather(
+            timed_task("indexed", _fetch()),
+            timed_task("news", _fetch()),
+            timed_task("rt_The Matrix", _fetch()),
+        )
+        with span("rank", "movie"):
+            pass
+        record_cache("autocomplete", False)
+
+    stages = sorted((stage, source) for stage, source, _ in trace.spans)
+    assert stages == [
+        ("rank", "movie"),
+        ("redis", "indexed"),
+        ("upstream", "news"),
+        ("upstream", "ratings_enrich"),
+    ]
+    payload = trace.to_dict()
+    assert payload["endpoint"] == "search"
+    assert payload["cache"] == [{"cache": "autocomplete", "hit": False}]
+    assert payload["total_ms"] >= 0
+
+    text = render_prometheus()
+    assert (
+        'search_stage_duration_seconds_count{endpoint="search",stage="redis",source="indexed"}'
+        in text
+    )
+    assert 'search_cache_requests_total{cache="autocomplete",result="miss"}' in text
+
+
+def test_spans_outside_a_request_are_not_attributed() -> None:
+    with trace_request("resolve") as trace:
+        pass
+    with span("parse", "tv"):
+        pass
+
+    assert trace.spans == []
+    assert 'endpoint="none",stage="parse",source="tv"' in render_prometheus()
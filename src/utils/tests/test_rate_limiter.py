@@ -7,8 +7,10 @@ from collections.abc import Awaitable
 from typing import Any
 
 import pytest
+from redis.exceptions import RedisError
 
-from utils.rate_limiter import ResilientRateLimiter
+from utils import rate_limiter
+from utils.rate_limiter import DistributedRateLimiter, ResilientRateLimiter
 
 
 class _BaseTestLimiter:
@@ -99,3 +101,110 @@ async def test_resilient_rate_limiter_retries_on_loop_error(
     assert len(created) == 2, "Limiter should recreate after loop mismatch"
     assert created[-1].enter_count == 1, "Second limiter should successfully acquire"
     assert created[-1].exit_count == 1, "Second limiter should release token"
+
+
+class _FakeBucketRedis:
+    """Stands in for the Lua token bucket: grants from a fixed pool, then asks to wait."""
+
+    def __init__(self, tokens: int, fail: Exception | None = None) -> None:
+        self.tokens = tokens
+        self.fail = fail
+        self.calls: list[list[Any]] = []
+        self.keys: list[str] = []
+
+    def register_script(self, script: str) -> Any:
+        def _run(keys: list[str], args: list[Any]) -> list[int]:
+            self.keys.append(keys[0])
+            self.calls.append(args)
+            if self.fail is not None:
+                raise self.fail
+            granted = min(self.tokens, args[2])
+            self.tokens -= granted
+            if granted:
+                return [granted, 0]
+            self.tokens = args[2]  # refill for the next lease
+            return [0, 5]
+
+        return _run
+
+
+@pytest.mark.asyncio
+async def test_distributed_rate_limiter_leases_tokens_in_batches() -> None:
+    redis = _FakeBucketRedis(tokens=3)
+    limiter = DistributedRateLimiter("api.example.com", 100, 1, redis=redis)
+    assert limiter.lease_size == 10
+
+    for _ in range(5):
+        async with limiter:
+            pass
+
+    # One lease of 3, one empty lease (wait), then a refill lease
+    assert len(redis.calls) == 3
+    assert limiter._tokens == 8  # noqa: SLF001 - accessing for test verification
+
+
+@pytest.mark.asyncio
+async def test_distributed_rate_limiter_buckets_are_keyed_by_rate() -> None:
+    redis = _FakeBucketRedis(tokens=100)
+    fast = DistributedRateLimiter("api.example.com", 40, 1, redis=redis)
+    slow = DistributedRateLimiter("api.example.com", 20, 1.0, redis=redis)
+    same = DistributedRateLimiter("api.example.com", 40, 1.0, redis=redis)
+
+    for limiter in (fast, slow, same):
+        async with limiter:
+            pass
+
+    assert redis.keys == [
+        "ratelimit:api.example.com:40/1",
+        "ratelimit:api.example.com:20/1",
+        "ratelimit:api.example.com:40/1",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        RedisError("connection refused"),
+        RuntimeError("Task got Future attached to a different loop"),
+    ],
+)
+async def test_distributed_rate_limiter_falls_back_to_local_limiter(error: Exception) -> None:
+    redis = _FakeBucketRedis(tokens=0, fail=error)
+    limiter = DistributedRateLimiter("api.example.com", 5, 1, redis=redis)
+
+    async with limiter:
+        pass
+    async with limiter:
+        pass
+
+    assert len(redis.calls) == 1, "Redis should not be retried during the fallback window"
+
+
+def test_bucket_client_uses_redis_manager_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("REDIS_PORT", raising=False)
+    monkeypatch.setenv("REDIS_PASSWORD", "")
+    monkeypatch.setattr(rate_limiter, "_bucket_clients", {})
+
+    client = rate_limiter._get_bucket_client()  # noqa: SLF001 - accessing for test verification
+    kwargs = client.connection_pool.connection_kwargs
+
+    assert kwargs["port"] == 6380
+    assert kwargs["password"] is None
+    assert rate_limiter._get_bucket_client() is client  # noqa: SLF001
+
+
+def test_distributed_limiters_of_closed_loops_are_dropped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(rate_limiter, "_distributed_limiters", {})
+    monkeypatch.setattr(rate_limiter, "DISTRIBUTED_RATE_LIMIT_APIS", {"api.example.com"})
+
+    async def _get() -> Any:
+        return rate_limiter.get_rate_limiter(5, 1, api="api.example.com")
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+
+    assert first is not second
+    assert list(rate_limiter._distributed_limiters.values()) == [second]  # noqa: SLF001
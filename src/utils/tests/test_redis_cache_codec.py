@@ -0,0 +1,68 @@
+"""
+Unit tests for the RedisCache payload codec.
+
+Pure encode/decode round-trips; no Redis server is required.
+"""
+
+import pickle
+import time
+from dataclasses import dataclass
+
+from utils import redis_cache as _redis_module
+from utils.redis_cache import CacheEntry, _decode_entry, _encode_entry
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _entry(data: object) -> CacheEntry:
+    entry = CacheEntry()
+    entry.data = data
+    entry.expiry = int(time.time() + 3600)
+    entry.key = "k"
+    entry.function = "fn"
+    entry.args = ["a", 1]
+    entry.version = "1.0.0"
+    return entry
+
+
+def test_json_native_data_uses_msgpack() -> None:
+    entry = _entry({"results": [{"id": 1, "name": "Alien", "score": 8.5}], 42: b"raw"})
+
+    payload = _encode_entry(entry)
+    decoded = _decode_entry(payload)
+
+    assert payload[0] == _redis_module._CODEC_MSGPACK
+    assert decoded == entry
+
+
+def test_non_native_data_falls_back_to_pickle() -> None:
+    entry = _entry({"point": _Point(1, 2), "pair": (1, 2)})
+
+    payload = _encode_entry(entry)
+    decoded = _decode_entry(payload)
+
+    assert payload[0] & _redis_module._SERIALIZER_MASK == _redis_module._CODEC_PICKLE
+    assert decoded.data == {"point": _Point(1, 2), "pair": (1, 2)}
+
+
+def test_large_payload_is_compressed() -> None:
+    entry = _entry([{"overview": "A long synopsis. " * 20, "id": i} for i in range(200)])
+
+    payload = _encode_entry(entry)
+
+    assert payload[0] == _redis_module._CODEC_MSGPACK | _redis_module._CODEC_ZSTD
+    assert len(payload) < len(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)) / 5
+    assert _decode_entry(payload) == entry
+
+
+def test_legacy_pickle_payload_is_readable() -> None:
+    entry = _entry({"legacy": True})
+
+    for protocol in (4, pickle.HIGHEST_PROTOCOL):
+        decoded = _decode_entry(pickle.dumps(entry, protocol=protocol))
+        assert isinstance(decoded, CacheEntry)
+        assert decoded.data == {"legacy": True}
@@ -0,0 +1,109 @@
+"""
+Unit tests for the in-process L1 tier of RedisCache.
+
+Uses an in-memory async Redis stand-in so no server is required.
+"""
+
+import time
+from typing import Any
+
+import pytest
+
+from utils import redis_cache as _redis_module
+from utils.redis_cache import RedisCache, _LocalCache
+from utils.tests.conftest import FakeAsyncRedis, make_cache
+
+
+@pytest.fixture
+def versions(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    registry: dict[str, str] = {}
+
+    def _get_cache_version(prefix: str) -> str:
+        return registry.setdefault(prefix, "1.0.0")
+
+    monkeypatch.setattr(_redis_module, "get_cache_version", _get_cache_version)
+    return registry
+
+
+def _make_cache(max_bytes: int = 1024 * 1024) -> tuple[RedisCache, FakeAsyncRedis]:
+    return make_cache("test_l1", local_cache_max_bytes=max_bytes)
+
+
+@pytest.mark.asyncio
+async def test_hit_is_served_without_redis_get(versions: dict[str, str]) -> None:
+    cache, fake = _make_cache()
+    await cache.add({"a": 1}, "k", "fn", [], time.time() + 60, {})
+
+    first = await cache.read("k")
+    second = await cache.read("k")
+
+    assert first is not None and first.data == {"a": 1}
+    assert second is not None and second.data == {"a": 1}
+    assert first is not second  # each hit decodes a fresh object
+    assert fake.gets == 0
+    stats = cache.local_cache_stats()
+    assert stats is not None and stats["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_populates_local_tier(versions: dict[str, str]) -> None:
+    writer, fake = _make_cache()
+    await writer.add(["x"], "k", "fn", [], time.time() + 60, {})
+
+    reader, _ = _make_cache()
+    reader._redis_instance = fake  # type: ignore[assignment]
+    await reader.read("k")
+    await reader.read("k")
+
+    assert fake.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_version_bump_clears_local_tier(
+    versions: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache, fake = _make_cache()
+    await cache.add({"a": 1}, "k", "fn", [], time.time() + 60, {})
+    assert await cache.read("k") is not None
+
+    versions["test_l1"] = "2.0.0"
+    monkeypatch.setattr(_redis_module, "_LOCAL_VERSION_CHECK_SECONDS", 0)
+
+    assert await cache.read("k") is None
+    assert cache.version == "2.0.0"
+    assert fake.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_remove_drops_local_entry(versions: dict[str, str]) -> None:
+    cache, fake = _make_cache()
+    await cache.add({"a": 1}, "k", "fn", [], time.time() + 60, {})
+    await cache.remove("k")
+
+    assert await cache.read("k") is None
+    assert fake.gets == 1
+
+
+def test_local_cache_evicts_least_recently_used_by_bytes() -> None:
+    local = _LocalCache(max_bytes=10)
+    expiry = time.time() + 60
+    local.put("a", b"12345", expiry, "v")
+    local.put("b", b"12345", expiry, "v")
+    assert local.get("a", "v") == b"12345"  # "a" becomes most recent
+
+    local.put("c", b"12345", expiry, "v")
+
+    assert local.get("b", "v") is None
+    assert local.get("a", "v") is not None
+    assert local.stats()["evictions"] == 1
+    assert local.stats()["bytes"] == 10
+
+
+def test_local_cache_honours_entry_expiry_and_version() -> None:
+    local = _LocalCache(max_bytes=100)
+    local.put("expired", b"x", time.time() - 1, "v")
+    local.put("fresh", b"x", time.time() + 60, "v")
+
+    assert local.get("expired", "v") is None
+    assert local.get("fresh", "other") is None
+    assert local.stats()["entries"] == 0
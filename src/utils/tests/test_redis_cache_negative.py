@@ -0,0 +1,102 @@
+"""
+Unit tests for negative caching of empty / not-found results in RedisCache.use_cache.
+
+Uses an in-memory async Redis stand-in so no server is required.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from utils import redis_cache as _redis_module
+from utils.metrics import render_prometheus
+from utils.redis_cache import RedisCache
+from utils.tests.conftest import FakeAsyncRedis, make_cache
+
+pytestmark = pytest.mark.usefixtures("cache_enabled")
+
+
+@dataclass
+class _SearchResponse:
+    results: list[str] = field(default_factory=list)
+    error: str | None = None
+    status_code: int = 200
+
+
+def _make_cache(**kwargs: Any) -> tuple[RedisCache, FakeAsyncRedis]:
+    return make_cache("test_negative", isClassMethod=False, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_none_result_is_a_negative_hit_not_a_miss() -> None:
+    cache, fake = _make_cache(negative_ttl=60, stale_ttl=600)
+    calls: list[str] = []
+
+    @RedisCache.use_cache(cache, prefix="neg_lookup")
+    async def lookup(query: str) -> list[str] | None:
+        calls.append(query)
+        return None
+
+    assert await lookup("obscure") is None
+    assert await lookup("obscure") is None
+
+    assert calls == ["obscure"]
+    entry_ttls = [ttl for key, ttl in fake.ttls.items() if not key.startswith("__lock__:")]
+    assert entry_ttls == [59], "Short TTL, no stale window"
+    assert 'search_cache_requests_total{cache="neg_lookup",result="negative"} 1' in (
+        render_prometheus()
+    )
+
+
+@pytest.mark.asyncio
+async def test_empty_and_not_found_responses_are_cached_but_errors_are_not() -> None:
+    cache, fake = _make_cache(negative_ttl=60)
+    responses = {
+        "empty": _SearchResponse(),
+        "missing": _SearchResponse(error="not found", status_code=404),
+        "failed": _SearchResponse(error="upstream timeout", status_code=500),
+    }
+    calls: list[str] = []
+
+    @RedisCache.use_cache(cache, prefix="neg_search")
+    async def search(query: str) -> _SearchResponse:
+        calls.append(query)
+        return responses[query]
+
+    for query in ("empty", "missing"):
+        await search(query)
+        assert await search(query) == responses[query]
+    await search("failed")
+
+    assert calls == ["empty", "missing", "failed"]
+    entries = [key for key in fake.store if not key.startswith("__lock__:")]
+    assert len(entries) == 2, "Transient errors are not cached"
+
+
+@pytest.mark.asyncio
+async def test_negative_entry_expires_without_stale_grace() -> None:
+    cache, _ = _make_cache(negative_ttl=60, stale_ttl=600)
+    cache_key = cache.get_cache_key(fn="lookup", prefix="neg_expired", args=["q"])
+    entry = await cache.add(
+        [], cache_key, "lookup", [], int(time.time()) + 3600, {}, stale_ttl=600, negative_ttl=60
+    )
+    assert entry.negative
+    entry.expiry = int(time.time()) - 1
+    await cache._redis.set(cache._full_key(cache_key), _redis_module._encode_entry(entry))
+
+    assert await cache.read(cache_key, stale_ttl=600) is None
+
+
+@pytest.mark.asyncio
+async def test_empty_results_are_skipped_without_negative_ttl() -> None:
+    cache, fake = _make_cache()
+
+    @RedisCache.use_cache(cache, prefix="neg_disabled")
+    async def lookup(query: str) -> list[str]:
+        return []
+
+    await lookup("q")
+
+    assert [key for key in fake.store if not key.startswith("__lock__:")] == []
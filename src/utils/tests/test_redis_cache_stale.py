@@ -0,0 +1,75 @@
+"""
+Unit tests for stale-while-revalidate in RedisCache.use_cache.
+
+Uses an in-memory async Redis stand-in so no server is required.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from utils import redis_cache as _redis_module
+from utils.redis_cache import RedisCache
+from utils.tests.conftest import FakeAsyncRedis, make_cache
+
+pytestmark = pytest.mark.usefixtures("cache_enabled")
+
+
+def _make_lookup(**cache_kwargs: Any) -> tuple[Any, RedisCache, FakeAsyncRedis, list[str]]:
+    cache, fake = make_cache("test_swr", defaultTTL=60, isClassMethod=False, **cache_kwargs)
+    calls: list[str] = []
+
+    @RedisCache.use_cache(cache, prefix="lookup", stale_ttl=300)
+    async def lookup(query: str) -> list[str]:
+        calls.append(query)
+        return [f"{query}-{len(calls)}"]
+
+    return lookup, cache, fake, calls
+
+
+async def _drain_refreshes() -> None:
+    while _redis_module._REFRESH_TASKS:
+        await asyncio.gather(*_redis_module._REFRESH_TASKS)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("local_cache_max_bytes", [0, 1024 * 1024])
+async def test_stale_hit_returns_immediately_and_refreshes_once(local_cache_max_bytes: int) -> None:
+    lookup, _, fake, calls = _make_lookup(local_cache_max_bytes=local_cache_max_bytes)
+    # expiry=0 writes an entry that is already past its soft TTL
+    assert await lookup("a", expiry=0) == ["a-1"]
+    fake.expire_locks()
+
+    assert await lookup("a") == ["a-1"]
+    assert await lookup("a") == ["a-1"]
+    await _drain_refreshes()
+
+    assert calls == ["a", "a"], "Concurrent stale hits share one refresh"
+    assert await lookup("a") == ["a-2"]
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_skipped_while_another_caller_holds_the_lock() -> None:
+    lookup, cache, fake, calls = _make_lookup()
+    await lookup("a", expiry=0)
+    fake.expire_locks()
+    storage_key = cache._full_key(cache.get_cache_key(fn="lookup", prefix="lookup", args=["a"]))
+    fake.store[f"__lock__:{storage_key}"] = "other-process"
+
+    assert await lookup("a") == ["a-1"]
+    await _drain_refreshes()
+
+    assert calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_entry_past_hard_ttl_is_a_miss() -> None:
+    lookup, cache, _, calls = _make_lookup()
+    cache_key = cache.get_cache_key(fn="lookup", prefix="lookup", args=["a"])
+    await cache.add(["old"], cache_key, "lookup", [], int(time.time()) - 400, {}, stale_ttl=300)
+
+    assert await lookup("a") == ["a-1"]
+    assert calls == ["a"]
@@ -14,26 +14,31 @@ from typing import Any, cast
 import httpx
 from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from redis.commands.search.field import Field, NumericField, TagField, TextField
+from redis.commands.search.field import Field, NumericField, TagField, TextField, VectorField
 from redis.commands.search.index_definition import IndexDefinition, IndexType
 from redis.commands.search.query import Query as SearchQuery
 
+from adapters.key_prefix import is_bulk_loaded, resolve_document_key
 from adapters.media_manager_client import MediaManagerClient
 from adapters.redis_client import get_redis
 from adapters.redis_manager import RedisEnvironment, RedisManager
 from adapters.redis_repository import RedisRepository
+from ai.microgenre_document import MICROGENRE_VECTOR_DIM, attach_microgenre_vector
 from api.openlibrary.bulk.load_book_index import mc_book_to_redis_doc
 from api.openlibrary.search import OpenLibrarySearchService
 from api.podcast.core import redis_doc_to_mc_podcast_item
 from api.tmdb.core import TMDBService
 from api.tmdb.wrappers import search_movies_async, search_tv_shows_async
 from contracts.models import MCType
+from core.microgenres import drop_microgenre_vector
 from core.normalize import (
+    CONTENT_HASH_FIELD,
     compact_title,
+    compute_content_hash,
     document_to_redis,
     normalize_document,
     prepare_media_redis_document,
@@ -52,6 +57,7 @@ from services.search_service import (
     MINIMAL_AUTOCOMPLETE_SOURCES,
     MINIMAL_DEFAULT_FIELDS,
     MINIMAL_FIELD_ALLOWLIST,
+    SEARCH_FIELD_ALLOWLIST,
     VALID_SOURCES,
     CastNameSearchRequest,
     CastNameSearchResponse,
@@ -59,15 +65,20 @@ from services.search_service import (
     autocomplete,
     autocomplete_minimal,
     autocomplete_stream,
+    get_autocomplete_cache_stats,
     get_cast_names,
     get_details,
     get_details_batch,
+    get_query_plan_cache_stats,
     reset_repo,
     resolve,
     search,
     search_stream,
+    similar_media,
 )
 from utils.genre_mapping import get_genre_mapping_with_fallback
+from utils.http_session import close_http_sessions
+from utils.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus, trace_request
 from web.routes.openlibrary_etl import router as openlibrary_etl_router
 
 # Project root directory for subprocess cwd
@@ -97,6 +108,24 @@ def _parse_media_date_filters(
     }
 
 
+def _parse_search_fields(fields: str | None) -> list[str] | None:
+    """Parse the comma-separated ``fields`` param of the search endpoints.
+
+    Raises:
+        ValueError: If any field is outside SEARCH_FIELD_ALLOWLIST.
+    """
+    if not fields:
+        return None
+    field_list = [f.strip() for f in fields.split(",") if f.strip()]
+    invalid_fields = set(field_list) - SEARCH_FIELD_ALLOWLIST
+    if invalid_fields:
+        raise ValueError(
+            f"Invalid fields: {', '.join(sorted(invalid_fields))}. "
+            f"Allowed: {', '.join(sorted(SEARCH_FIELD_ALLOWLIST))}"
+        )
+    return field_list or None
+
+
 def require_web_ui_enabled() -> None:
     """
     FastAPI dependency that blocks access when web UI is disabled.
@@ -234,6 +263,13 @@ async def startup_event():
     print("=" * 60 + "\n")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared upstream HTTP sessions and stop the near cache invalidation listeners."""
+    await close_http_sessions()
+    await RedisManager.close_near_caches()
+
+
 # Enable CORS for all origins (allows local dev to hit public API)
 app.add_middleware(
     CORSMiddleware,
@@ -256,6 +292,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Request and per-stage latency histograms in Prometheus text format."""
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/debug/redis-test")
 async def debug_redis_test():
     """Debug endpoint to test Redis connectivity from Cloud Run."""
@@ -427,6 +469,10 @@ async def api_autocomplete(
         default=False,
         description="If true, fetch 250 media candidates instead of 50 for deeper ranking",
     ),
+    debug_timing: bool = Query(
+        default=False,
+        description="If true, include per-stage span timings and cache lookups as debug_timing",
+    ),
 ):
     """JSON API endpoint for autocomplete search."""
     if not q or len(q) < 2:
@@ -445,10 +491,16 @@ async def api_autocomplete(
             source_hint_applied = sorted(hinted)
 
     try:
-        results = await autocomplete(q, sources_set, raw=raw, no_duplicate=no_duplicate, full=full)
+        with trace_request("autocomplete") as trace:
+            results = await autocomplete(
+                q, sources_set, raw=raw, no_duplicate=no_duplicate, full=full
+            )
         if source_hint_applied is not None:
             results = dict(results)
             results["source_hint"] = source_hint_applied
+        if debug_timing:
+            results = dict(results)
+            results["debug_timing"] = trace.to_dict()
         return JSONResponse(content=results)
     except RawQueryError as e:
         return JSONResponse(content={"error": str(e)}, status_code=400)
@@ -566,6 +618,10 @@ async def api_autocomplete_minimal(
         "mc_id and mc_type are always included. "
         "If omitted, returns a default lightweight set.",
     ),
+    debug_timing: bool = Query(
+        default=False,
+        description="If true, include per-stage span timings and cache lookups as debug_timing",
+    ),
 ):
     """
     Lightweight autocomplete endpoint optimised for speed.
@@ -603,8 +659,14 @@ async def api_autocomplete_minimal(
     else:
         field_list = sorted(MINIMAL_DEFAULT_FIELDS)
 
-    results = await autocomplete_minimal(q=q, sources=sources_set, fields=field_list, limit=limit)
-    return JSONResponse(content=results)
+    with trace_request("autocomplete_minimal") as trace:
+        results = await autocomplete_minimal(
+            q=q, sources=sources_set, fields=field_list, limit=limit
+        )
+    content: dict[str, Any] = dict(results)
+    if debug_timing:
+        content["debug_timing"] = trace.to_dict()
+    return JSONResponse(content=content)
 
 
 @app.get("/api/resolve")
@@ -633,6 +695,10 @@ async def api_resolve(
         description="When > 0 and no exact matches are found, return up to this many "
         "best-ranked near-miss candidates. 0 disables (default).",
     ),
+    debug_timing: bool = Query(
+        default=False,
+        description="If true, include per-stage span timings and cache lookups as debug_timing",
+    ),
 ):
     """
     Resolve a fully-formed title to all exact-match entities.
@@ -684,9 +750,12 @@ async def api_resolve(
                 status_code=400,
             )
 
-    result = await resolve(
-        q=q, sources=sources_set, fields=field_list, full=full, near_misses=near_misses
-    )
+    with trace_request("resolve") as trace:
+        result = await resolve(
+            q=q, sources=sources_set, fields=field_list, full=full, near_misses=near_misses
+        )
+    if debug_timing:
+        result["debug_timing"] = trace.to_dict()
     return JSONResponse(content=result)
 
 
@@ -768,6 +837,21 @@ async def api_search(
         default=False,
         description="If true, fetch 250 media candidates instead of 50 for deeper ranking",
     ),
+    media_ranking: str = Query(
+        default="python",
+        description="Media ranking mode: 'python' (default) or 'redis' (exact-match tiers ranked "
+        "server-side with FT.AGGREGATE; only limit*2 documents are fetched)",
+    ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated field names to return per indexed result "
+        "(tv, movie, person, podcast, author, book). mc_id and mc_type are always "
+        "included. Indexed queries are projected to these fields plus ranking inputs.",
+    ),
+    debug_timing: bool = Query(
+        default=False,
+        description="If true, include per-stage span timings and cache lookups as debug_timing",
+    ),
 ):
     """
     Unified search API that returns categorized results from multiple sources.
@@ -832,6 +916,11 @@ async def api_search(
             content={"error": "cast_match must be 'any' or 'all'"},
             status_code=400,
         )
+    if media_ranking not in ("python", "redis"):
+        return JSONResponse(
+            content={"error": "media_ranking must be 'python' or 'redis'"},
+            status_code=400,
+        )
 
     # Parse genre_ids if provided
     genre_id_list: list[str] | None = None
@@ -925,6 +1014,11 @@ async def api_search(
     except ValueError as exc:
         return JSONResponse(content={"error": str(exc)}, status_code=400)
 
+    try:
+        field_list = _parse_search_fields(fields)
+    except ValueError as exc:
+        return JSONResponse(content={"error": str(exc)}, status_code=400)
+
     # Raw mode: validate query syntax before search
     if raw and has_query and q:
         try:
@@ -932,34 +1026,40 @@ async def api_search(
         except RawQueryError as e:
             return JSONResponse(content={"error": str(e)}, status_code=400)
 
-    results = await search(
-        q=q if has_query else None,
-        sources=source_set,
-        limit=limit,
-        genre_ids=genre_id_list,
-        genre_match=genre_match,
-        cast_ids=cast_id_list,
-        cast_match=cast_match,
-        year_min=year_min,
-        year_max=year_max,
-        release_date_min=date_filters["release_date_min"],
-        release_date_max=date_filters["release_date_max"],
-        first_air_date_min=date_filters["first_air_date_min"],
-        first_air_date_max=date_filters["first_air_date_max"],
-        last_air_date_min=date_filters["last_air_date_min"],
-        last_air_date_max=date_filters["last_air_date_max"],
-        rating_min=rating_min,
-        rating_max=rating_max,
-        mc_type=mc_type,
-        ratings_sort=ratings_sort or "popularity",
-        media_sort=media_sort,
-        raw=raw,
-        no_duplicate=no_duplicate,
-        full=full,
-    )
+    with trace_request("search") as trace:
+        results = await search(
+            q=q if has_query else None,
+            sources=source_set,
+            limit=limit,
+            genre_ids=genre_id_list,
+            genre_match=genre_match,
+            cast_ids=cast_id_list,
+            cast_match=cast_match,
+            year_min=year_min,
+            year_max=year_max,
+            release_date_min=date_filters["release_date_min"],
+            release_date_max=date_filters["release_date_max"],
+            first_air_date_min=date_filters["first_air_date_min"],
+            first_air_date_max=date_filters["first_air_date_max"],
+            last_air_date_min=date_filters["last_air_date_min"],
+            last_air_date_max=date_filters["last_air_date_max"],
+            rating_min=rating_min,
+            rating_max=rating_max,
+            mc_type=mc_type,
+            ratings_sort=ratings_sort or "popularity",
+            media_sort=media_sort,
+            raw=raw,
+            no_duplicate=no_duplicate,
+            full=full,
+            media_ranking=media_ranking,
+            fields=field_list,
+        )
     if source_hint_applied is not None:
         results = dict(results)
         results["source_hint"] = source_hint_applied
+    if debug_timing:
+        results = dict(results)
+        results["debug_timing"] = trace.to_dict()
     return JSONResponse(content=results)
 
 
@@ -1306,6 +1406,12 @@ async def api_search_stream(
         default=False,
         description="If true, fetch 250 media candidates instead of 50 for deeper ranking",
     ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated field names to return per indexed result "
+        "(tv, movie, person, podcast, author, book). mc_id and mc_type are always "
+        "included. Indexed queries are projected to these fields plus ranking inputs.",
+    ),
 ):
     """
     Streaming search endpoint using Server-Sent Events (SSE).
@@ -1403,6 +1509,11 @@ async def api_search_stream(
     except ValueError as exc:
         return JSONResponse(content={"error": str(exc)}, status_code=400)
 
+    try:
+        field_list = _parse_search_fields(fields)
+    except ValueError as exc:
+        return JSONResponse(content={"error": str(exc)}, status_code=400)
+
     if raw and has_query and q:
         try:
             validate_raw_query(q)
@@ -1434,6 +1545,7 @@ async def api_search_stream(
             raw=raw,
             no_duplicate=no_duplicate,
             full=full,
+            fields=field_list,
         ):
             if len(event) == 2 and event[0] == "exact_match":
                 _, item = event
@@ -1603,6 +1715,9 @@ async def redis_stats():
                 "author_index_stats": stats.get("author_index_stats", {}),
                 "book_num_docs": stats.get("book_num_docs", 0),
                 "book_index_stats": stats.get("book_index_stats", {}),
+                "autocomplete_cache": get_autocomplete_cache_stats(),
+                "query_plan_cache": get_query_plan_cache_stats(),
+                "near_cache": RedisManager.near_cache_stats(),
             }
         )
     except Exception as e:
@@ -3047,7 +3162,7 @@ async def get_podcasts_related_to_tv(
     """
     redis = get_redis()
 
-    media_key = _redis_key_for_id(mc_id)
+    media_key = await _redis_key_for_id(redis, mc_id)
     try:
         media_doc: dict[str, Any] | None = await redis.json().get(media_key)  # type: ignore[assignment]
     except Exception as e:
@@ -3160,22 +3275,24 @@ _KEY_PREFIX_BY_TYPE: dict[str, str] = {
 _KNOWN_PREFIXES = tuple(_KEY_PREFIX_BY_TYPE.values()) + ("media:",)
 
 
-def _redis_key_for_id(doc_id: str) -> str:
+async def _redis_key_for_id(redis: Any, doc_id: str) -> str:
     """Derive the full Redis key from a bare or prefixed document id.
 
     Checks whether *doc_id* already carries a known prefix (``media:``,
-    ``person:``, ``podcast:``, ``author:``, ``book:``).  If so it is returned
-    as-is.  Otherwise the prefix is inferred from the id's embedded type
-    segment (e.g. ``tmdb_person_31`` → ``person:tmdb_person_31``).
+    ``person:``, ``podcast:``, ``author:``, ``book:``).  Otherwise the prefix
+    is inferred from the id's embedded type segment (e.g. ``tmdb_person_31``
+    → ``person:tmdb_person_31``).  The prefix is then resolved to the live
+    one, since a bulk rebuild moves documents to a new key generation.
     """
-    if doc_id.startswith(_KNOWN_PREFIXES):
-        return doc_id
-
-    for type_segment, prefix in _KEY_PREFIX_BY_TYPE.items():
-        if f"_{type_segment}_" in doc_id or doc_id.startswith(f"{type_segment}_"):
-            return f"{prefix}{doc_id}"
+    base_prefix = next((p for p in _KNOWN_PREFIXES if doc_id.startswith(p)), "media:")
+    if not doc_id.startswith(_KNOWN_PREFIXES):
+        for type_segment, prefix in _KEY_PREFIX_BY_TYPE.items():
+            if f"_{type_segment}_" in doc_id or doc_id.startswith(f"{type_segment}_"):
+                base_prefix = prefix
+                break
 
-    return f"media:{doc_id}"
+    key: str = await resolve_document_key(redis, base_prefix, doc_id)
+    return key
 
 
 @app.get("/api/media/{media_id}")
@@ -3183,15 +3300,69 @@ async def get_media(media_id: str):
     """Get a single media item by ID."""
     redis = get_redis()
     try:
-        key = _redis_key_for_id(media_id)
-        data = await redis.json().get(key)  # type: ignore[misc]
+        key = await _redis_key_for_id(redis, media_id)
+        data: dict[str, Any] | None = await redis.json().get(key)  # type: ignore[assignment]
         if data:
-            return JSONResponse(content={"id": key, **data})
+            return JSONResponse(content={"id": key, **drop_microgenre_vector(data)})
         return JSONResponse(status_code=404, content={"error": "Document not found"})
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+@app.get("/api/similar")
+async def api_similar(
+    mc_id: str = Query(..., description="Media id to match (e.g. tmdb_movie_603)"),
+    limit: int = Query(default=10, ge=1, le=50, description="Maximum similar titles"),
+    mc_type: str | None = Query(default=None, description="Restrict results to: movie, tv"),
+    genre_ids: str | None = Query(
+        default=None, description="Comma-separated TMDB genre IDs (e.g., 35,18 for Comedy,Drama)"
+    ),
+    genre_match: str = Query(
+        default="any", description="Genre matching: 'any' (OR, default) or 'all' (AND)"
+    ),
+    year_min: int | None = Query(default=None, description="Minimum release year"),
+    year_max: int | None = Query(default=None, description="Maximum release year"),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated field names to return per result. "
+        "mc_id and mc_type are always included. "
+        "If omitted, returns a default lightweight set.",
+    ),
+):
+    """
+    "More like this": nearest titles by microgenre vector (one local KNN query).
+
+    Filters are applied before the KNN search, so every result matches them.
+    Each result carries a cosine ``similarity`` (1.0 = identical profile).
+    """
+    if mc_type is not None and mc_type not in ("movie", "tv"):
+        return JSONResponse(
+            content={"error": "mc_type must be 'movie' or 'tv'"},
+            status_code=400,
+        )
+    try:
+        field_list = _parse_search_fields(fields) or sorted(MINIMAL_DEFAULT_FIELDS)
+    except ValueError as e:
+        return JSONResponse(content={"error": str(e)}, status_code=400)
+
+    genre_id_list = [g.strip() for g in genre_ids.split(",") if g.strip()] if genre_ids else None
+
+    with trace_request("similar"):
+        results = await similar_media(
+            mc_id=mc_id.removeprefix("media:"),
+            fields=field_list,
+            limit=limit,
+            mc_type=mc_type,
+            genre_ids=genre_id_list,
+            genre_match=genre_match,
+            year_min=year_min,
+            year_max=year_max,
+        )
+    if results is None:
+        return JSONResponse(status_code=404, content={"error": "Document not found"})
+    return JSONResponse(content=results)
+
+
 _IMMUTABLE_MEDIA_FIELDS = frozenset({"id", "mc_id", "source", "source_id", "mc_type"})
 
 
@@ -3205,7 +3376,7 @@ class MediaDocumentUpdate(BaseModel):
 async def update_media(media_id: str, body: MediaDocumentUpdate) -> JSONResponse:
     """Update a Redis media document and optionally push to Media Manager."""
     redis = get_redis()
-    key = _redis_key_for_id(media_id)
+    key = await _redis_key_for_id(redis, media_id)
 
     try:
         existing: dict[str, Any] | None = await redis.json().get(key)  # type: ignore[assignment]
@@ -3233,8 +3404,14 @@ async def update_media(media_id: str, body: MediaDocumentUpdate) -> JSONResponse
         canonical = merged.get("title") or merged.get("search_title") or ""
         merged["title_compact"] = compact_title(canonical)
 
+    # Keep the KNN vector in step with edited microgenres
+    if merged.get("mc_type") in ("movie", "tv"):
+        attach_microgenre_vector(merged)
+    # The fingerprint must describe the stored document, not the last load
+    merged[CONTENT_HASH_FIELD] = compute_content_hash(merged)
+
     try:
-        await redis.json().set(key, "$", merged)  # type: ignore[misc]
+        await RedisRepository().patch_document(key, existing, merged)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": f"Redis write failed: {e}"})
 
@@ -3270,7 +3447,7 @@ async def update_media(media_id: str, body: MediaDocumentUpdate) -> JSONResponse
             "status": "updated",
             "id": key,
             "media_manager": mm_result,
-            "document": merged,
+            "document": drop_microgenre_vector(dict(merged)),
         }
     )
 
@@ -3486,7 +3663,7 @@ async def api_openlibrary_search(
     # Check which items already exist in Redis
     redis = get_redis()
     mc_ids = [b.get("id", "") for b in books]
-    redis_keys = [f"book:{mc_id}" if not mc_id.startswith("book:") else mc_id for mc_id in mc_ids]
+    redis_keys = [await resolve_document_key(redis, "book:", mc_id) for mc_id in mc_ids]
 
     if redis_keys:
         pipe = redis.pipeline()
@@ -3542,7 +3719,7 @@ async def api_add_openlibrary_to_redis(
 
     redis_doc = mc_book_to_redis_doc(target)
     mc_id = redis_doc.get("id", "")
-    key = f"book:{mc_id}" if not mc_id.startswith("book:") else mc_id
+    key = await resolve_document_key(redis, "book:", mc_id)
 
     existing_doc: dict[str, Any] | None = await redis.json().get(key)  # type: ignore[assignment]
     now_ts = int(datetime.now(UTC).timestamp())
@@ -3642,7 +3819,10 @@ async def api_get_media_details(
             )
         _key, redis_doc = result
 
-        await redis.json().set(key, "$", redis_doc)  # type: ignore[misc]
+        if isinstance(existing_doc, dict):
+            await RedisRepository().patch_document(key, existing_doc, redis_doc)
+        else:
+            await redis.json().set(key, "$", redis_doc)  # type: ignore[misc]
 
         return JSONResponse(content={"id": key, **redis_doc})
     except Exception as e:
@@ -4931,7 +5111,7 @@ async def api_changes(
 
 
 # Index configurations - maps index name to (redis_index_name, prefix, schema)
-INDEX_CONFIGS = {
+INDEX_CONFIGS: dict[str, dict[str, Any]] = {
     "media": {
         "redis_name": "idx:media",
         "prefix": "media:",
@@ -4998,6 +5178,13 @@ INDEX_CONFIGS = {
             NumericField("$.created_at", as_name="created_at", sortable=True),
             NumericField("$.modified_at", as_name="modified_at", sortable=True),
             TagField("$._source", as_name="_source"),
+            # Microgenre score vector for "more like this" KNN (/api/similar)
+            VectorField(
+                "$.microgenre_vector",
+                "HNSW",
+                {"TYPE": "FLOAT32", "DIM": MICROGENRE_VECTOR_DIM, "DISTANCE_METRIC": "COSINE"},
+                as_name="microgenre_vector",
+            ),
         ),
     },
     "people": {
@@ -5116,6 +5303,19 @@ INDEX_CONFIGS = {
 }
 
 
+def _bulk_managed_index_response(redis_index_name: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content={
+            "success": False,
+            "error": (
+                f"Index '{redis_index_name}' is an alias managed by the bulk loader; "
+                "rebuild it with --bulk instead"
+            ),
+        },
+    )
+
+
 @app.delete("/api/index/{index_name}")
 async def delete_index(index_name: str):
     """Delete a Redis search index (keeps the data documents)."""
@@ -5128,6 +5328,9 @@ async def delete_index(index_name: str):
     redis_index_name = config["redis_name"]
     redis = get_redis()
 
+    if await is_bulk_loaded(redis, config["prefix"]):
+        return _bulk_managed_index_response(redis_index_name)
+
     try:
         await redis.ft(redis_index_name).dropindex(delete_documents=False)
         return JSONResponse(
@@ -5162,6 +5365,11 @@ async def create_index(index_name: str):
     schema: list[Field] = cast(list[Field], list(config["schema"]))
     redis = get_redis()
 
+    # The base prefix is empty after a bulk rebuild, and creating the index
+    # again would shadow the alias that points at the live generation
+    if await is_bulk_loaded(redis, prefix):
+        return _bulk_managed_index_response(redis_index_name)
+
     definition = IndexDefinition(prefix=[prefix], index_type=IndexType.JSON)
 
     try: